@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Vira pipeline benchmarks
+
+Builds a synthetic theme corpus (see corpus.py), times each pipeline stage
+on it and records peak memory, then compares the results against a stored
+baseline.
+
+Usage: python bench/bench.py [--variants N] [--attributes N] [--colors N]
+                             [--ui-keys N] [--ui-depth N] [--repeat N]
+                             [--baseline PATH] [--save-baseline]
+
+Results are written to bench/results.json. A stage regresses when it is
+slower (or uses more memory) than the baseline by more than --tolerance;
+the run then prints a per-stage report and exits with status 1. Baselines
+are machine-specific: record one with --save-baseline before comparing.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "jetbrains"))
+sys.path.insert(0, str(ROOT / "nvim"))
+
+import extract  # noqa: E402
+import generate  # noqa: E402
+from corpus import make_corpus  # noqa: E402
+from highlights import GroupTemplate, compile_highlights, compile_mapping  # noqa: E402
+
+RESULTS_PATH = BENCH_DIR / "results.json"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+
+# Differences below these are noise, whatever the relative change
+MIN_SECONDS = 0.001
+MIN_PEAK_KIB = 64
+
+
+def measure(fn, repeat: int) -> dict:
+    """
+    Time fn over repeat runs and trace its peak memory in one more run.
+
+    Timing runs are untraced, as tracemalloc slows allocation-heavy code
+    down considerably. Reports the fastest run, which is the least noisy
+    estimate of the cost of the code itself, alongside the median.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "seconds": min(times),
+        "median_seconds": statistics.median(times),
+        "peak_kib": round(peak / 1024, 1)
+    }
+
+
+def run_stages(corpus_dir: Path, variants: list[str], repeat: int) -> dict:
+    """Benchmark each pipeline stage over every variant of the corpus."""
+    extract.ORIGINAL_DIR = corpus_dir
+    xml_paths = [corpus_dir / f"Vira-{v}.xml" for v in variants]
+    json_paths = [corpus_dir / f"Vira-{v}.theme.json" for v in variants]
+    raw_json = [json.loads(path.read_text(encoding="utf-8")) for path in json_paths]
+
+    variants_data = [extract.extract_variant(v) for v in variants]
+    model, roots = extract.load_model(variants_data)
+    palettes = [generate.extract_palette(data) for data in variants_data]
+    template = GroupTemplate(generate.GROUPS_FILE.read_text())
+    index = compile_mapping(generate.load_json(generate.MAPPINGS_FILE))
+
+    stages = {
+        "parse_xml_file": lambda: [extract.parse_xml_file(path) for path in xml_paths],
+        "parse_json_file": lambda: [extract.parse_json_file(path) for path in json_paths],
+        "normalize_json_colors": lambda: [extract.normalize_json_colors(data) for data in raw_json],
+        "extract_variant": lambda: [extract.extract_variant(v) for v in variants],
+        "compute_diff_matrix": lambda: extract.compute_diff_matrix(variants_data),
+        "load_model": lambda: extract.load_model(variants_data),
+        "compute_analysis": lambda: extract.compute_analysis(model, roots),
+        "extract_palette": lambda: [generate.extract_palette(data) for data in variants_data],
+        "generate_lua_palette": lambda: [
+            generate.generate_lua_palette(v.lower(), palette) for v, palette in zip(variants, palettes)
+        ],
+        "compile_highlights": lambda: [
+            compile_highlights(template, index, data, palette) for data, palette in zip(variants_data, palettes)
+        ],
+    }
+
+    results = {}
+    for name, fn in stages.items():
+        results[name] = measure(fn, repeat)
+        print(f"  {name:<24} {results[name]['seconds'] * 1000:9.2f} ms  {results[name]['peak_kib']:10.1f} KiB")
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare results with a baseline and print a per-stage report.
+
+    Returns a description of each regression.
+    """
+    regressions = []
+    header = f"{'stage':<24} {'ms':>9} {'base ms':>9} {'change':>8}   {'KiB':>10} {'base KiB':>10} {'change':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for name, current in results["stages"].items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            print(f"{name:<24} {current['seconds'] * 1000:9.2f} {'-':>9} {'new':>8}")
+            continue
+
+        time_change = current["seconds"] / base["seconds"] - 1 if base["seconds"] else 0.0
+        peak_change = current["peak_kib"] / base["peak_kib"] - 1 if base["peak_kib"] else 0.0
+        flags = []
+        if time_change > tolerance and current["seconds"] - base["seconds"] > MIN_SECONDS:
+            flags.append("time")
+            regressions.append(f"{name}: {time_change:+.0%} time "
+                               f"({base['seconds'] * 1000:.2f} -> {current['seconds'] * 1000:.2f} ms)")
+        if peak_change > tolerance and current["peak_kib"] - base["peak_kib"] > MIN_PEAK_KIB:
+            flags.append("memory")
+            regressions.append(f"{name}: {peak_change:+.0%} peak memory "
+                               f"({base['peak_kib']:.1f} -> {current['peak_kib']:.1f} KiB)")
+
+        print(f"{name:<24} {current['seconds'] * 1000:9.2f} {base['seconds'] * 1000:9.2f} {time_change:+8.1%}   "
+              f"{current['peak_kib']:10.1f} {base['peak_kib']:10.1f} {peak_change:+8.1%}"
+              + (f"   REGRESSION ({', '.join(flags)})" if flags else ""))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Vira pipeline on a synthetic corpus")
+    parser.add_argument("--variants", type=int, default=6, help="number of variants (default: 6)")
+    parser.add_argument("--attributes", type=int, default=2000, help="XML attributes per variant (default: 2000)")
+    parser.add_argument("--colors", type=int, default=500, help="XML and JSON colors per variant (default: 500)")
+    parser.add_argument("--ui-keys", type=int, default=200, help="top-level ui components (default: 200)")
+    parser.add_argument("--ui-depth", type=int, default=4, help="nesting depth of ui components (default: 4)")
+    parser.add_argument("--seed", type=int, default=0, help="corpus random seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per stage (default: 5)")
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH, help="results file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown or memory growth before failing (default: 0.25)")
+    args = parser.parse_args()
+
+    params = {
+        "variants": args.variants,
+        "attributes": args.attributes,
+        "colors": args.colors,
+        "ui_keys": args.ui_keys,
+        "ui_depth": args.ui_depth,
+        "seed": args.seed
+    }
+
+    with tempfile.TemporaryDirectory(prefix="vira-bench-") as tmp:
+        corpus_dir = Path(tmp)
+        print(f"Building corpus ({', '.join(f'{k}={v}' for k, v in params.items())})...")
+        variants = make_corpus(corpus_dir, **params)
+
+        print(f"Running stages ({args.repeat} runs each)...")
+        stages = run_stages(corpus_dir, variants, args.repeat)
+
+    results = {
+        "params": params,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "stages": stages
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; record one with --save-baseline")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("params") != params:
+        sys.exit(f"Baseline {args.baseline} was recorded with different corpus parameters: {baseline.get('params')}")
+
+    print(f"\nComparing with {args.baseline} (tolerance {args.tolerance:.0%}):\n")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
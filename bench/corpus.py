@@ -0,0 +1,135 @@
+"""
+Synthetic JetBrains theme corpora for the benchmark suite.
+
+Builds Vira-{name}.theme.json / Vira-{name}.xml pairs in the layout of
+jetbrains/original/, at a configurable scale. Attribute and color names
+start with the keys of the Neovim mapping file, so palette extraction and
+highlight compilation hit the same code paths as with the real themes, and
+are padded with synthetic names up to the requested counts. Output is fully
+determined by the parameters and seed.
+"""
+
+import json
+import random
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+ROOT = Path(__file__).parent.parent
+MAPPINGS_FILE = ROOT / "nvim" / "mappings" / "jetbrains-to-nvim.json"
+
+
+def mapped_keys() -> tuple[list[str], list[str]]:
+    """(XML color keys, XML attribute keys) named by the mapping file, in document order."""
+    with open(MAPPINGS_FILE, encoding="utf-8") as f:
+        mapping = json.load(f)
+
+    def keys(section):
+        return [
+            key
+            for category, entries in mapping.get(section, {}).items() if not category.startswith("_")
+            for key in entries
+        ]
+
+    return keys("xml.colors"), keys("xml.attributes")
+
+
+def random_hex(rng: random.Random, alpha: bool = False) -> str:
+    """Uppercase hex without a hash, as in scheme XML."""
+    value = f"{rng.randrange(0x1000000):06X}"
+    if alpha:
+        value += f"{rng.randrange(256):02X}"
+    return value
+
+
+def names(base: list[str], prefix: str, count: int) -> list[str]:
+    """The first count names of base, padded with prefix_NNNNN names."""
+    result = base[:count]
+    result += [f"{prefix}_{i:05d}" for i in range(count - len(result))]
+    return result
+
+
+def make_xml(rng: random.Random, name: str, colors: list[str], attributes: list[str]) -> str:
+    """A color scheme with the given colors and attributes; about a third inherit via baseAttributes."""
+    lines = [
+        f'<scheme name="Vira {name}" version="142" parent_scheme="">',
+        '  <option name="LINE_SPACING" value="1.4" />',
+        '  <option name="EDITOR_LIGATURES" value="true" />',
+        "  <colors>",
+    ]
+    for key in colors:
+        lines.append(f'    <option name={quoteattr(key)} value="{random_hex(rng, alpha=rng.random() < 0.2)}" />')
+    lines += ["  </colors>", "  <attributes>"]
+
+    for i, key in enumerate(attributes):
+        if i and rng.random() < 0.3:
+            base = attributes[rng.randrange(i)]
+            lines.append(f'    <option name={quoteattr(key)} baseAttributes={quoteattr(base)} />')
+            continue
+        lines += [f"    <option name={quoteattr(key)}>", "      <value>"]
+        lines.append(f'        <option name="FOREGROUND" value="{random_hex(rng)}" />')
+        if rng.random() < 0.3:
+            lines.append(f'        <option name="BACKGROUND" value="{random_hex(rng, alpha=rng.random() < 0.5)}" />')
+        if rng.random() < 0.4:
+            lines.append(f'        <option name="FONT_TYPE" value="{rng.randrange(1, 4)}" />')
+        if rng.random() < 0.2:
+            lines.append(f'        <option name="EFFECT_COLOR" value="{random_hex(rng)}" />')
+            lines.append(f'        <option name="EFFECT_TYPE" value="{rng.randrange(0, 6)}" />')
+        lines += ["      </value>", "    </option>"]
+
+    lines += ["  </attributes>", "</scheme>"]
+    return "\n".join(lines)
+
+
+def make_ui_component(rng: random.Random, depth: int) -> dict:
+    """A nested ui component: a few color/number leaves per level, depth levels deep."""
+    node = {
+        "background": "#" + random_hex(rng),
+        "foreground": "#" + random_hex(rng, alpha=rng.random() < 0.3),
+        "borderColor": random_hex(rng).lower(),
+        "arc": rng.randrange(0, 20),
+    }
+    if depth > 1:
+        node["child"] = make_ui_component(rng, depth - 1)
+    return node
+
+
+def make_json(rng: random.Random, name: str, colors: int, ui_keys: int, ui_depth: int) -> dict:
+    """A theme.json with named colors and ui_keys nested ui components."""
+    ui = {"*": {"background": "#" + random_hex(rng), "foreground": "#" + random_hex(rng), "borderColor": "border"}}
+    for i in range(ui_keys):
+        ui[f"Component{i:04d}"] = make_ui_component(rng, ui_depth)
+
+    return {
+        "name": f"Vira {name}",
+        "author": "vira",
+        "dark": True,
+        "nameKey": f"Vira-{name}",
+        "editorScheme": f"/schemes/Vira-{name}.xml",
+        "colors": {f"color{i:04d}": "#" + random_hex(rng, alpha=rng.random() < 0.2) for i in range(colors)},
+        "ui": ui,
+        "icons": {"ColorPalette": {"Actions.Grey": "#" + random_hex(rng)}},
+    }
+
+
+def make_corpus(directory: Path, variants: int, attributes: int, colors: int,
+                ui_keys: int, ui_depth: int, seed: int = 0) -> list[str]:
+    """
+    Write a synthetic corpus to directory.
+
+    Returns the variant names (Bench01, Bench02, ...), usable wherever
+    extract.py expects a variant name once ORIGINAL_DIR points at directory.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    color_base, attribute_base = mapped_keys()
+    color_names = names(color_base, "BENCH_COLOR", colors)
+    attribute_names = names(attribute_base, "BENCH_ATTRIBUTE", attributes)
+
+    variant_names = [f"Bench{i + 1:02d}" for i in range(variants)]
+    for i, name in enumerate(variant_names):
+        rng = random.Random(f"{seed}:{i}")
+        xml = make_xml(rng, name, color_names, attribute_names)
+        (directory / f"Vira-{name}.xml").write_text(xml + "\n", encoding="utf-8")
+        theme = make_json(rng, name, colors, ui_keys, ui_depth)
+        (directory / f"Vira-{name}.theme.json").write_text(json.dumps(theme, indent=2) + "\n", encoding="utf-8")
+
+    return variant_names
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Vira fused build
+
+Runs extraction and Neovim generation in a single process. Each variant is
+extracted from jetbrains/original/ and handed in memory to palette
+extraction and Lua generation, one variant at a time, without the
+jetbrains/extracted/ JSON round trip between extract.py and generate.py.
+
+Usage: python build.py [--extracted] [--seed-cache [DIR]] [--trace out.json]
+
+Output is identical to running extract.py followed by generate.py. Pass
+--extracted to also write jetbrains/extracted/*.json and jetbrains/analysis/
+for anyone using those LLM-queryable artifacts.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+sys.path.insert(0, str(ROOT / "jetbrains"))
+sys.path.insert(0, str(ROOT / "nvim"))
+
+import artifacts  # noqa: E402
+import extract  # noqa: E402
+import generate  # noqa: E402
+import tracing  # noqa: E402
+from highlights import GroupTemplate, compile_mapping, default_cache_dir  # noqa: E402
+from model import Model  # noqa: E402
+
+
+def extracted_variants(write_json: bool):
+    """
+    Yield (variant, data) for each variant, extracting one at a time.
+
+    With write_json, each variant's extracted JSON is written as extract.py
+    would; otherwise the data is never serialized. Variants extracted from
+    theme plugin archives have no sources in original/ and are read back
+    from their extracted JSON instead.
+    """
+    for variant in extract.VARIANTS:
+        print(f"Extracting {variant}...")
+        if write_json:
+            data, text = extract.build_variant(variant)
+            output_path = extract.EXTRACTED_DIR / f"{variant.lower()}.json"
+            with tracing.span("write", file=output_path.name, bytes=len(text)):
+                if extract.write_text(output_path, text):
+                    print(f"  -> {output_path}")
+        else:
+            with tracing.span("extract variant", variant=variant):
+                data = extract.extract_variant(variant)
+        yield variant.lower(), data
+
+    originals = {variant.lower() for variant in extract.VARIANTS}
+    others = [variant for variant in generate.VARIANTS if variant not in originals]
+    yield from generate.load_variants(others).items()
+
+
+def write_analysis(model: Model, roots: list[int]):
+    """Write jetbrains/analysis/ as extract.py does."""
+    extract.ANALYSIS_DIR.mkdir(exist_ok=True)
+    with tracing.span("shared/diff analysis", variants=len(roots)):
+        shared, diff = extract.compute_analysis(model, roots)
+    for name, result in (("shared.json", shared), ("diff-matrix.json", diff)):
+        path = extract.ANALYSIS_DIR / name
+        text = extract.dump_json(result)
+        with tracing.span("write", file=name, bytes=len(text)):
+            if extract.write_text(path, text):
+                print(f"  -> {path}")
+
+
+def build(write_json: bool, seed_cache: Path | None):
+    """Extract and generate every variant."""
+    generate.PALETTE_DIR.mkdir(parents=True, exist_ok=True)
+    generate.HIGHLIGHTS_DIR.mkdir(parents=True, exist_ok=True)
+    if write_json:
+        extract.EXTRACTED_DIR.mkdir(exist_ok=True)
+
+    with tracing.span("compile mapping"):
+        index = compile_mapping(generate.load_json(generate.MAPPINGS_FILE))
+    with tracing.span("load group template"):
+        template = GroupTemplate(generate.GROUPS_FILE.read_text())
+    try:
+        recipes = generate.load_recipes(generate.RECIPES_FILE)
+    except ValueError as e:
+        sys.exit(f"Invalid recipe in {generate.RECIPES_FILE.name}: {e}")
+
+    hashes = {}
+    tables = {}
+    # Only kept for the analysis, which needs every variant at once;
+    # interned, so values the variants share are held once
+    model = Model()
+    analysis_roots = {}
+    with generate.writer_pool() as writers:
+        for variant, data in extracted_variants(write_json):
+            hashes[variant], tables[variant] = generate.generate_variant(
+                variant, data, template, index, writers, seed_cache
+            )
+            generate.generate_derived(variant, data, recipes, template, index, writers, hashes, tables, seed_cache)
+            if write_json:
+                analysis_roots[variant] = model.add(data)
+    generate.remove_stale(set(hashes))
+    generate.write_hashes(hashes)
+    generate.write_deltas(tables)
+    generate.write_variants(sorted(set(hashes) - set(recipes)))
+    generate.write_derived(recipes)
+
+    if write_json:
+        print("Computing shared values and diff matrix...")
+        # In extracted file order, as extract.py has them
+        write_analysis(model, [analysis_roots[variant] for variant in sorted(analysis_roots)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Vira Neovim theme from the JetBrains sources")
+    parser.add_argument("--extracted", action="store_true",
+                        help="also write jetbrains/extracted/*.json and jetbrains/analysis/")
+    parser.add_argument("--seed-cache", nargs="?", const=default_cache_dir(), type=Path, metavar="DIR",
+                        help="pre-seed startup snapshots (default: Neovim's stdpath('cache')/vira)")
+    parser.add_argument("--trace", type=Path, metavar="FILE",
+                        help="write a Chrome trace of the run to FILE")
+    args = parser.parse_args()
+
+    if args.trace:
+        tracing.enable()
+    try:
+        with tracing.span("build.py"):
+            build(args.extracted, args.seed_cache)
+        artifacts.report()
+    finally:
+        if args.trace:
+            tracing.save(args.trace)
+            print(f"Trace written to {args.trace}")
+
+    print("\nBuild complete!")
+
+
+if __name__ == "__main__":
+    main()
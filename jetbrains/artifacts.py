@@ -0,0 +1,86 @@
+"""
+Vira output layer
+
+Every generated file (extracted JSON and stores, analysis, palettes,
+highlights, extras) is written through write(). Content is rendered in
+memory first and compared with the file on disk: identical files are left
+alone, so their mtimes do not change and nothing watching them (lazy.nvim,
+luac caches, editors) reloads. Changed files are written to a temporary
+file next to the target and renamed over it, so an interrupted run never
+leaves a half-written file behind.
+
+write() records what it did; report() prints a summary and starts over.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Paths written and skipped since the last report()
+_written = []
+_skipped = []
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def unchanged(path: Path, data: bytes) -> bool:
+    """True if path already holds exactly data."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return _digest(path.read_bytes()) == _digest(data)
+    except FileNotFoundError:
+        return False
+
+
+def write(path: Path, content: str | bytes) -> bool:
+    """
+    Write content (str is encoded as UTF-8) to path unless it is already there.
+
+    Returns True if the file was written. Safe to call from several
+    threads, for different paths.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if unchanged(path, data):
+        _skipped.append(path)
+        return False
+
+    # Unique per process and thread, writers may race on the same directory
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _written.append(path)
+    return True
+
+
+def _display(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(ROOT))
+    except ValueError:
+        return str(path)
+
+
+def summary() -> tuple[list[Path], list[Path]]:
+    """(written, skipped) paths since the last call, which clears them."""
+    written, skipped = _written[:], _skipped[:]
+    _written.clear()
+    _skipped.clear()
+    return written, skipped
+
+
+def report():
+    """Print which files were written and how many were unchanged, then clear the record."""
+    written, skipped = summary()
+    print(f"\n{len(written)} file(s) written, {len(skipped)} unchanged")
+    for path in sorted(written, key=_display):
+        print(f"  written    {_display(path)}")
@@ -0,0 +1,386 @@
+"""
+Vira color core
+
+Shared color representation for jetbrains/extract.py and nvim/generate.py.
+
+Colors are parsed once into interned Color objects that hold a packed
+0xRRGGBBAA integer. Parsing and formatting go through precomputed lookup
+tables, and later stages (blending, compositing) work on the integers
+instead of slicing hex strings. NumPy is used for batch operations when
+installed, with a pure-Python fallback.
+"""
+
+import functools
+
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+_HEX_CHARS = frozenset(_HEX_DIGITS)
+
+# Two hex digits (any case) -> byte value
+_HEX_PAIR = {a + b: int(a + b, 16) for a in _HEX_DIGITS for b in _HEX_DIGITS}
+
+# Byte value -> two lowercase hex digits
+_BYTE_HEX = [f"{i:02x}" for i in range(256)]
+
+
+class Color:
+    """
+    An sRGB color packed as 0xRRGGBBAA.
+
+    has_alpha records whether the source spelled out an alpha channel, so
+    formatting round-trips "#rrggbb" and "#rrggbbaa" unchanged. Instances are
+    interned: use parse_color() or Color.of() rather than the constructor.
+    """
+
+    __slots__ = ("value", "has_alpha", "hex")
+
+    def __init__(self, value: int, has_alpha: bool):
+        self.value = value
+        self.has_alpha = has_alpha
+        hex_ = "#" + _BYTE_HEX[value >> 24] + _BYTE_HEX[(value >> 16) & 0xFF] + _BYTE_HEX[(value >> 8) & 0xFF]
+        if has_alpha:
+            hex_ += _BYTE_HEX[value & 0xFF]
+        self.hex = hex_
+
+    @classmethod
+    def of(cls, r: int, g: int, b: int, a: int | None = None) -> "Color":
+        """Get the interned color for the given channels (alpha optional)."""
+        has_alpha = a is not None
+        value = (r << 24) | (g << 16) | (b << 8) | (a if has_alpha else 0xFF)
+        key = (value, has_alpha)
+        color = _by_value.get(key)
+        if color is None:
+            color = _by_value[key] = cls(value, has_alpha)
+        return color
+
+    @property
+    def r(self) -> int:
+        return self.value >> 24
+
+    @property
+    def g(self) -> int:
+        return (self.value >> 16) & 0xFF
+
+    @property
+    def b(self) -> int:
+        return (self.value >> 8) & 0xFF
+
+    @property
+    def a(self) -> int:
+        return self.value & 0xFF
+
+    @property
+    def rgb(self) -> int:
+        """The color as 0xRRGGBB, without alpha."""
+        return self.value >> 8
+
+    @property
+    def rgb_hex(self) -> str:
+        """"#rrggbb", dropping any alpha channel."""
+        return self.hex[:7]
+
+    @property
+    def opaque(self) -> bool:
+        return self.value & 0xFF == 0xFF
+
+    @property
+    def lab(self) -> tuple[float, float, float]:
+        """CIELAB coordinates (D65) of the RGB channels, ignoring alpha."""
+        rgb = self.value >> 8
+        lab = _lab_cache.get(rgb)
+        if lab is None:
+            lab = _lab_cache[rgb] = _rgb_to_lab(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+        return lab
+
+    def blend(self, bg: "Color", alpha: float) -> "Color":
+        """Mix with bg, weighting this color by alpha (0.0-1.0). Result is opaque RGB."""
+        inv = 1 - alpha
+        v, w = self.value, bg.value
+        return Color.of(
+            int((v >> 24) * alpha + (w >> 24) * inv),
+            int(((v >> 16) & 0xFF) * alpha + ((w >> 16) & 0xFF) * inv),
+            int(((v >> 8) & 0xFF) * alpha + ((w >> 8) & 0xFF) * inv),
+        )
+
+    def composite(self, bg: "Color") -> "Color":
+        """Composite this color over bg using its own alpha. Result is opaque RGB."""
+        return Color.from_value(_composite_value(self.value, bg.value))
+
+    @classmethod
+    def from_value(cls, value: int) -> "Color":
+        """Get the interned opaque RGB color for a packed 0xRRGGBBAA value."""
+        return cls.of(value >> 24, (value >> 16) & 0xFF, (value >> 8) & 0xFF)
+
+    def __repr__(self) -> str:
+        return f"Color({self.hex!r})"
+
+
+# sRGB byte -> linear light
+_LINEAR = [c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4 for c in (i / 255 for i in range(256))]
+
+# 0xRRGGBB -> CIELAB
+_lab_cache = {}
+
+
+def _lab_f(t: float) -> float:
+    return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+
+
+def _rgb_to_lab(r: int, g: int, b: int) -> tuple[float, float, float]:
+    """sRGB bytes to CIELAB, D65 white point."""
+    rl, gl, bl = _LINEAR[r], _LINEAR[g], _LINEAR[b]
+    fx = _lab_f((0.4124564 * rl + 0.3575761 * gl + 0.1804375 * bl) / 0.95047)
+    fy = _lab_f(0.2126729 * rl + 0.7151522 * gl + 0.0721750 * bl)
+    fz = _lab_f((0.0193339 * rl + 0.1191920 * gl + 0.9503041 * bl) / 1.08883)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+@functools.cache
+def _numpy():
+    """NumPy, imported on first use so that runs without batches skip it; None if not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _composite_value(fg: int, bg: int) -> int:
+    """Source-over composite of packed fg onto packed bg, rounded to nearest."""
+    a = fg & 0xFF
+    inv = 255 - a
+    out = 0xFF
+    for shift in (24, 16, 8):
+        channel = (((fg >> shift) & 0xFF) * a + ((bg >> shift) & 0xFF) * inv + 127) // 255
+        out |= channel << shift
+    return out
+
+
+def composite_many(colors: list[Color], backgrounds: list[Color]) -> list[Color]:
+    """
+    Composite each color over the background at the same index.
+
+    With NumPy available all pairs are composited in one vectorized pass
+    over packed integer arrays; otherwise each pair goes through
+    Color.composite. Both paths use the same integer math and give
+    identical results.
+    """
+    np = _numpy()
+    if np is None:
+        return [fg.composite(bg) for fg, bg in zip(colors, backgrounds)]
+
+    fg = np.fromiter((c.value for c in colors), dtype=np.int64, count=len(colors))
+    bg = np.fromiter((c.value for c in backgrounds), dtype=np.int64, count=len(backgrounds))
+    a = fg & 0xFF
+    inv = 255 - a
+    out = np.full_like(fg, 0xFF)
+    for shift in (24, 16, 8):
+        out |= ((((fg >> shift) & 0xFF) * a + ((bg >> shift) & 0xFF) * inv + 127) // 255) << shift
+    return [Color.from_value(int(v)) for v in out]
+
+
+def _to_hsl(r: float, g: float, b: float) -> tuple[float, float, float]:
+    """RGB in 0-1 to hue (0-1), saturation and lightness."""
+    mx, mn = max(r, g, b), min(r, g, b)
+    l = (mx + mn) / 2
+    d = mx - mn
+    if d == 0:
+        return 0.0, 0.0, l
+    s = d / (1 - abs(2 * l - 1))
+    if mx == r:
+        h = ((g - b) / d) % 6
+    elif mx == g:
+        h = (b - r) / d + 2
+    else:
+        h = (r - g) / d + 4
+    return h / 6, s, l
+
+
+def _from_hsl(h: float, s: float, l: float) -> tuple[int, int, int]:
+    """Hue (0-1), saturation and lightness to RGB bytes."""
+    a = s * min(l, 1 - l)
+    channels = []
+    for n in (0, 8, 4):
+        k = (n + h * 12) % 12
+        channels.append(int((l - a * max(-1.0, min(k - 3, 9 - k, 1.0))) * 255 + 0.5))
+    return channels[0], channels[1], channels[2]
+
+
+def transform_many(colors: list[Color], hue: float = 0.0, saturation: float = 1.0,
+                   lightness: float = 1.0, contrast: float = 1.0) -> list[Color]:
+    """
+    Apply one HSL adjustment to a batch of colors.
+
+    hue rotates by degrees, saturation and lightness scale those channels,
+    and contrast scales lightness away from (or toward) mid-gray before
+    lightness is applied. Results are clamped to the sRGB gamut; alpha is
+    kept as is. With NumPy available the batch is transformed in one
+    vectorized pass; otherwise color by color, with the same formulas.
+    """
+    np = _numpy()
+    if np is None:
+        result = []
+        for color in colors:
+            h, s, l = _to_hsl(color.r / 255, color.g / 255, color.b / 255)
+            h = (h + hue / 360) % 1
+            s = min(max(s * saturation, 0.0), 1.0)
+            l = min(max((l - 0.5) * contrast + 0.5, 0.0), 1.0)
+            l = min(max(l * lightness, 0.0), 1.0)
+            r, g, b = _from_hsl(h, s, l)
+            result.append(Color.of(r, g, b, color.a if color.has_alpha else None))
+        return result
+
+    if not colors:
+        return []
+    values = np.fromiter((c.value for c in colors), dtype=np.int64, count=len(colors))
+    r, g, b = (((values >> shift) & 0xFF) / 255 for shift in (24, 16, 8))
+    mx = np.maximum(np.maximum(r, g), b)
+    mn = np.minimum(np.minimum(r, g), b)
+    l = (mx + mn) / 2
+    d = mx - mn
+    gray = d == 0
+    safe = np.where(gray, 1.0, d)
+    s = np.where(gray, 0.0, d / np.where(gray, 1.0, 1 - np.abs(2 * l - 1)))
+    h = np.where(mx == r, ((g - b) / safe) % 6, np.where(mx == g, (b - r) / safe + 2, (r - g) / safe + 4))
+    h = np.where(gray, 0.0, h / 6)
+
+    h = (h + hue / 360) % 1
+    s = np.clip(s * saturation, 0.0, 1.0)
+    l = np.clip((l - 0.5) * contrast + 0.5, 0.0, 1.0)
+    l = np.clip(l * lightness, 0.0, 1.0)
+
+    a = s * np.minimum(l, 1 - l)
+    out = []
+    for n in (0, 8, 4):
+        k = (n + h * 12) % 12
+        out.append(np.floor((l - a * np.clip(np.minimum(k - 3, 9 - k), -1.0, 1.0)) * 255 + 0.5).astype(np.int64))
+    return [
+        Color.of(int(rv), int(gv), int(bv), c.a if c.has_alpha else None)
+        for c, rv, gv, bv in zip(colors, *out)
+    ]
+
+
+def _xterm_rgb(index: int) -> tuple[int, int, int]:
+    """RGB of an xterm-256 color in the 6x6x6 cube (16-231) or gray ramp (232-255)."""
+    if index >= 232:
+        level = 8 + 10 * (index - 232)
+        return level, level, level
+    index -= 16
+    steps = (0, 95, 135, 175, 215, 255)
+    return steps[index // 36], steps[index // 6 % 6], steps[index % 6]
+
+
+# Candidate xterm colors and their CIELAB coordinates. 0-15 are left out:
+# terminals (and the theme itself, via g:terminal_color_N) redefine them.
+XTERM_INDICES = list(range(16, 256))
+_XTERM_LAB = [_rgb_to_lab(*_xterm_rgb(i)) for i in XTERM_INDICES]
+_xterm_lab_array = None
+
+
+def xterm_256_many(colors: list["Color"]) -> list[int]:
+    """
+    Nearest xterm-256 color index (16-255) of each color, by CIE76 distance.
+
+    With NumPy available the whole batch is matched in one vectorized
+    distance/argmin against the precomputed CIELAB table; otherwise each
+    color is compared against the same table in Python. Ties go to the
+    lower index in both paths.
+    """
+    global _xterm_lab_array
+    np = _numpy()
+    if np is None:
+        result = []
+        for color in colors:
+            l, a, b = color.lab
+            distances = [(l - cl) ** 2 + (a - ca) ** 2 + (b - cb) ** 2 for cl, ca, cb in _XTERM_LAB]
+            result.append(XTERM_INDICES[distances.index(min(distances))])
+        return result
+
+    if _xterm_lab_array is None:
+        _xterm_lab_array = np.array(_XTERM_LAB)
+    if not colors:
+        return []
+    lab = np.array([color.lab for color in colors])
+    distances = ((lab[:, None, :] - _xterm_lab_array[None, :, :]) ** 2).sum(axis=2)
+    return [XTERM_INDICES[i] for i in distances.argmin(axis=1)]
+
+
+# (value, has_alpha) -> Color
+_by_value = {}
+# Source string -> Color, or None for strings that are not a color
+_by_text = {}
+
+
+def parse_color(text: str) -> Color | None:
+    """
+    Parse "rrggbb", "rrggbbaa", "#rrggbb" or "#rrggbbaa" (any case).
+
+    Returns the interned Color, or None if text is not a 6 or 8 digit hex
+    color. Results are cached by source string, so repeated values cost a
+    single dict lookup.
+    """
+    try:
+        return _by_text[text]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable, certainly not a color
+        return None
+
+    color = None
+    if isinstance(text, str):
+        digits = text.strip()
+        if digits.startswith("#"):
+            digits = digits[1:]
+        if len(digits) in (6, 8):
+            pair = _HEX_PAIR
+            try:
+                r, g, b = pair[digits[0:2]], pair[digits[2:4]], pair[digits[4:6]]
+                a = pair[digits[6:8]] if len(digits) == 8 else None
+                color = Color.of(r, g, b, a)
+            except KeyError:
+                color = None
+
+    _by_text[text] = color
+    return color
+
+
+# Source string -> normalize_color() result
+_normalized = {}
+
+
+def normalize_color(color: str) -> str:
+    """
+    Normalize color values to consistent format.
+
+    Input formats:
+        - "RRGGBB" (XML style)
+        - "RRGGBBAA" (XML style with alpha)
+        - "#RRGGBB" (JSON style)
+        - "#RRGGBBAA" (JSON style with alpha)
+        - "" (empty)
+
+    Output format:
+        - "#rrggbb" or "#rrggbbaa" (lowercase, with hash)
+        - "" for empty values
+        - other hex strings lowercased with a hash, anything else
+          (references like "border") returned without its hash
+    """
+    try:
+        return _normalized[color]
+    except KeyError:
+        pass
+
+    parsed = parse_color(color)
+    if parsed is not None:
+        result = parsed.hex
+    else:
+        digits = color.strip() if color else ""
+        if digits.startswith("#"):
+            digits = digits[1:]
+        if digits and all(ch in _HEX_CHARS for ch in digits):
+            result = "#" + digits.lower()
+        else:
+            result = digits
+
+    _normalized[color] = result
+    return result
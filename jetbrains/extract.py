@@ -5,68 +5,89 @@ Vira JetBrains Theme Extractor
 Extracts theme data from JetBrains .theme.json and .xml files into
 a normalized, LLM-queryable JSON format.
 
-Usage: python extract.py
+Usage: python extract.py [--force] [--jobs N] [--store] [--archive PATH] [--trace out.json]
+
+Variants are found as original/Vira-{Variant}.theme.json and .xml pairs.
+--archive reads them from JetBrains theme plugin .jar/.zip files instead
+(or every archive in a directory): each *.theme.json member is paired with
+the .xml member of the same base name, and both are parsed straight from
+the archive in one sequential pass, without unpacking it. When several
+archives hold the same variant, the last one in name order wins.
+
+Variants whose source files are unchanged since the last run are skipped,
+using the content hashes recorded in the build manifest (.cache/manifest.json).
+Pass --force to ignore the manifest and re-extract everything, and --jobs N
+to extract variants in N worker processes (output is identical to a serial run).
+
+Parent schemes named by parent_scheme (Darcula, Default, ...) are looked up
+as original/schemes/{name}.xml. Values a variant does not define are resolved
+through that chain; parsed parents are cached in .cache/schemes/ by content hash.
+
+--store also writes extracted/{variant}.store, a compact memory-mappable
+index of the same data for single-value lookups (see store.py).
+
+--trace out.json records per-variant, per-stage spans in the Chrome trace
+event format (see tracing.py).
 """
 
+import argparse
+import functools
+import hashlib
 import json
+import os
 import re
 import xml.etree.ElementTree as ET
-from pathlib import Path
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO
 
+import artifacts
+import tracing
+from color import normalize_color
+from model import MISSING, Model
+from store import write_store
 
-VARIANTS = ["Carbon", "Deepforest", "Graphene", "Ocean", "Palenight", "Teal"]
 
-ORIGINAL_DIR = Path(__file__).parent / "original"
-EXTRACTED_DIR = Path(__file__).parent / "extracted"
-ANALYSIS_DIR = Path(__file__).parent / "analysis"
+BASE_DIR = Path(__file__).parent
+ORIGINAL_DIR = BASE_DIR / "original"
+SCHEMES_DIR = ORIGINAL_DIR / "schemes"
+EXTRACTED_DIR = BASE_DIR / "extracted"
+ANALYSIS_DIR = BASE_DIR / "analysis"
+CACHE_DIR = BASE_DIR / ".cache"
+MANIFEST_PATH = CACHE_DIR / "manifest.json"
+SCHEME_CACHE_DIR = CACHE_DIR / "schemes"
 
+# Modules whose code affects extracted output
+EXTRACTOR_SOURCES = [Path(__file__), BASE_DIR / "color.py", BASE_DIR / "model.py", BASE_DIR / "store.py"]
 
-def normalize_color(color: str) -> str:
-    """
-    Normalize color values to consistent format.
-
-    Input formats:
-        - "RRGGBB" (XML style)
-        - "RRGGBBAA" (XML style with alpha)
-        - "#RRGGBB" (JSON style)
-        - "#RRGGBBAA" (JSON style with alpha)
-        - "" (empty)
-
-    Output format:
-        - "#rrggbb" or "#rrggbbaa" (lowercase, with hash)
-        - "" for empty values
-    """
-    if not color or color.strip() == "":
-        return ""
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
 
-    color = color.strip()
+# Theme plugin archives accepted by --archive
+ARCHIVE_SUFFIXES = (".jar", ".zip")
 
-    # Remove leading hash if present
-    if color.startswith("#"):
-        color = color[1:]
 
-    # Validate hex characters
-    if not re.match(r'^[0-9a-fA-F]+$', color):
-        # Not a valid hex color, return as-is (might be a reference like "border")
-        return color
+def discover_variants(directory: Path = ORIGINAL_DIR) -> list[str]:
+    """Variants with a Vira-{Variant}.theme.json in directory, in name order."""
+    return sorted(path.name[len("Vira-"):-len(".theme.json")] for path in directory.glob("Vira-*.theme.json"))
 
-    # Normalize to lowercase with hash
-    return f"#{color.lower()}"
 
+# Variants of original/
+VARIANTS = discover_variants()
 
-def parse_xml_colors(colors_elem) -> dict:
-    """Parse the <colors> section of the XML."""
-    result = {}
-    if colors_elem is None:
-        return result
 
-    for option in colors_elem.findall("option"):
-        name = option.get("name")
-        value = option.get("value", "")
-        if name:
-            result[name] = normalize_color(value)
-
-    return result
+def parse_xml_setting(value: str):
+    """Parse a top-level option value (LINE_SPACING, EDITOR_LIGATURES, etc.)."""
+    # Try to parse as number if applicable
+    if value.replace(".", "").isdigit():
+        try:
+            return float(value) if "." in value else int(value)
+        except ValueError:
+            return value
+    elif value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    return value
 
 
 def parse_xml_attribute_value(value_elem) -> dict:
@@ -89,96 +110,166 @@ def parse_xml_attribute_value(value_elem) -> dict:
     return result
 
 
-def parse_xml_attributes(attributes_elem) -> dict:
-    """Parse the <attributes> section of the XML."""
-    result = {}
-    if attributes_elem is None:
-        return result
+def parse_xml_attribute(option) -> dict:
+    """Parse a single <option> of the <attributes> section."""
+    # Check for baseAttributes reference
+    base_attrs = option.get("baseAttributes")
 
-    for option in attributes_elem.findall("option"):
-        name = option.get("name")
-        if not name:
-            continue
+    # Check for direct value attribute (simple case like DEFAULT_IDENTIFIER)
+    direct_value = option.get("value")
 
-        # Check for baseAttributes reference
-        base_attrs = option.get("baseAttributes")
-
-        # Check for direct value attribute (simple case like DEFAULT_IDENTIFIER)
-        direct_value = option.get("value")
-
-        # Check for nested <value> element
-        value_elem = option.find("value")
-
-        if base_attrs is not None:
-            # This attribute inherits from another
-            result[name] = {"baseAttributes": base_attrs}
-        elif direct_value is not None:
-            # Simple value attribute - this is shorthand for FOREGROUND only
-            # Normalize to standard format for consistency
-            result[name] = {"FOREGROUND": normalize_color(direct_value)}
-        elif value_elem is not None:
-            # Complex value with nested options
-            parsed_value = parse_xml_attribute_value(value_elem)
-            result[name] = parsed_value if parsed_value else {}
-        else:
-            # Empty option
-            result[name] = {}
+    # Check for nested <value> element
+    value_elem = option.find("value")
 
-    return result
+    if base_attrs is not None:
+        # This attribute inherits from another
+        return {"baseAttributes": base_attrs}
+    elif direct_value is not None:
+        # Simple value attribute - this is shorthand for FOREGROUND only
+        # Normalize to standard format for consistency
+        return {"FOREGROUND": normalize_color(direct_value)}
+    elif value_elem is not None:
+        # Complex value with nested options
+        return parse_xml_attribute_value(value_elem)
+    else:
+        # Empty option
+        return {}
 
 
-def parse_xml_file(xml_path: Path) -> dict:
-    """Parse a JetBrains color scheme XML file."""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
+def parse_xml_file(xml_file: Path | BinaryIO) -> dict:
+    """
+    Parse a JetBrains color scheme XML file, given its path or an open
+    binary stream.
 
+    The file is read incrementally with iterparse. Each top-level option,
+    color and attribute is converted as soon as its end tag is seen and is
+    then detached from the tree, so memory use does not grow with the size
+    of the scheme.
+    """
     result = {
-        "scheme": {
-            "name": root.get("name", ""),
-            "version": root.get("version", ""),
-            "parent_scheme": root.get("parent_scheme", "")
-        },
+        "scheme": {},
         "settings": {},
         "colors": {},
         "attributes": {}
     }
+    settings = result["settings"]
+    colors = result["colors"]
+    attributes = result["attributes"]
+
+    # Open elements from the root down; stack[0] is <scheme>
+    stack = []
+
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            if not stack:
+                result["scheme"] = {
+                    "name": elem.get("name", ""),
+                    "version": elem.get("version", ""),
+                    "parent_scheme": elem.get("parent_scheme", "")
+                }
+            stack.append(elem)
+            continue
 
-    # Parse top-level options (LINE_SPACING, EDITOR_LIGATURES, etc.)
-    for option in root.findall("option"):
-        name = option.get("name")
-        value = option.get("value", "")
-        if name:
-            # Try to parse as number if applicable
-            if value.replace(".", "").isdigit():
-                try:
-                    result["settings"][name] = float(value) if "." in value else int(value)
-                except ValueError:
-                    result["settings"][name] = value
-            elif value.lower() in ("true", "false"):
-                result["settings"][name] = value.lower() == "true"
-            else:
-                result["settings"][name] = value
-
-    # Parse colors section
-    colors_elem = root.find("colors")
-    result["colors"] = parse_xml_colors(colors_elem)
+        stack.pop()
+        depth = len(stack)
+
+        if depth == 1:
+            # Top-level options (LINE_SPACING, EDITOR_LIGATURES, etc.);
+            # finished sections have already been emptied below
+            name = elem.get("name")
+            if elem.tag == "option" and name:
+                settings[name] = parse_xml_setting(elem.get("value", ""))
+        elif depth == 2:
+            section = stack[1].tag
+            name = elem.get("name")
+            if elem.tag == "option" and name:
+                if section == "colors":
+                    colors[name] = normalize_color(elem.get("value", ""))
+                elif section == "attributes":
+                    attributes[name] = parse_xml_attribute(elem)
+        else:
+            # Nested <value> options, consumed with their attribute
+            continue
 
-    # Parse attributes section
-    attributes_elem = root.find("attributes")
-    result["attributes"] = parse_xml_attributes(attributes_elem)
+        # Earlier siblings were already removed, so this is the first child
+        stack[-1].remove(elem)
 
     return result
 
 
+def resolve_attributes(attributes: dict, inherited: dict | None = None) -> dict:
+    """
+    Resolve baseAttributes inheritance into effective attribute values.
+
+    Returns {name: {"FOREGROUND": ..., "BACKGROUND": ..., ...}} for every
+    attribute, with baseAttributes chains followed to the attribute that
+    actually defines the values. Each attribute is resolved once: a chain
+    stops as soon as it reaches an already resolved attribute. Raises
+    ValueError on a baseAttributes cycle.
+
+    inherited is the raw (unresolved) attribute table of the parent scheme
+    chain. Attributes not defined in this scheme are taken from it, and the
+    child-over-parent table is resolved as a whole: a parent attribute that
+    only links to a base sees this scheme's value of that base, as in
+    JetBrains. Undefined bases resolve to {}.
+    """
+    inherited = inherited or {}
+    resolved = {}
+
+    # Own attributes in section order, then those only the parent defines
+    names = list(attributes) + [name for name in inherited if name not in attributes]
+    for name in names:
+        chain = []
+        current = name
+
+        while current not in resolved:
+            attr = attributes.get(current, inherited.get(current))
+            if attr is None:
+                value = {}
+                break
+            if "baseAttributes" not in attr:
+                # Defines its own values
+                value = resolved[current] = attr
+                break
+            if current in chain:
+                cycle = " -> ".join(chain[chain.index(current):] + [current])
+                raise ValueError(f"baseAttributes cycle: {cycle}")
+            chain.append(current)
+            current = attr["baseAttributes"]
+        else:
+            value = resolved[current]
+
+        for link in chain:
+            resolved[link] = value
+
+    return {name: resolved[name] for name in names}
+
+
+# Object values normalized as colors: "#..." or 6-8 hex digits
+_color_like = re.compile(r"#|[0-9a-fA-F]{6,8}$").match
+
+
+def normalize_json_object(obj: dict) -> dict:
+    """
+    Normalize the color values of one JSON object in place.
+
+    Used as the json object_hook, which sees every object once its values
+    are decoded, so the tree is built already normalized. Like
+    normalize_json_colors, only strings that are object values are
+    touched, not list items.
+    """
+    for key, value in obj.items():
+        if value.__class__ is str and _color_like(value):
+            obj[key] = normalize_color(value)
+    return obj
+
+
 def normalize_json_colors(obj):
-    """Recursively normalize color values in a JSON object."""
+    """Recursively normalize color values in an already decoded JSON object."""
     if isinstance(obj, dict):
         result = {}
         for key, value in obj.items():
-            if isinstance(value, str) and (
-                value.startswith("#") or
-                re.match(r'^[0-9a-fA-F]{6,8}$', value)
-            ):
+            if isinstance(value, str) and _color_like(value):
                 result[key] = normalize_color(value)
             else:
                 result[key] = normalize_json_colors(value)
@@ -189,22 +280,136 @@ def normalize_json_colors(obj):
         return obj
 
 
-def parse_json_file(json_path: Path) -> dict:
-    """Parse a JetBrains theme JSON file."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def count_json_colors(obj) -> int:
+    """Number of normalized color strings in JSON data, for trace counters."""
+    if isinstance(obj, dict):
+        return sum(
+            1 if isinstance(value, str) and value.startswith("#") else count_json_colors(value)
+            for value in obj.values()
+        )
+    if isinstance(obj, list):
+        return sum(count_json_colors(item) for item in obj)
+    return 0
+
+
+def parse_json_file(json_file: Path | BinaryIO) -> dict:
+    """Parse a JetBrains theme JSON file, given its path or an open binary stream."""
+    with tracing.span("read json", file=PurePosixPath(json_file.name).name) as sp:
+        if isinstance(json_file, Path):
+            with open(json_file, "rb") as f:
+                raw = f.read()
+        else:
+            raw = json_file.read()
+        sp.set(bytes=len(raw))
+        # Colors are normalized while decoding, object by object
+        data = json.loads(raw, object_hook=normalize_json_object)
+        if sp:
+            sp.count("colors", count_json_colors(data))
+    return data
+
+
+# Parsed parent schemes by content hash, shared by every variant extracted
+# in this process
+_parsed_schemes = {}
+# Resolved parent scheme chains by scheme name
+_parent_schemes = {}
+
+
+def load_scheme(xml_path: Path) -> dict:
+    """
+    Parse a parent scheme XML file through the on-disk cache.
+
+    Parsed schemes are stored in SCHEME_CACHE_DIR as {sha256}.json, so a
+    parent shared by many variants is parsed once and reused across runs.
+    """
+    digest = hashlib.sha256(xml_path.read_bytes()).hexdigest()
+    if digest in _parsed_schemes:
+        return _parsed_schemes[digest]
+
+    sp = tracing.span("load scheme", file=xml_path.name)
+    cache_path = SCHEME_CACHE_DIR / f"{digest}.json"
+    try:
+        with sp:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("extractor") != extractor_hash():
+                raise ValueError("stale scheme cache entry")
+            data = cached["scheme"]
+            sp.set(cache_hit=True)
+    except (FileNotFoundError, ValueError, KeyError):
+        with tracing.span("parse xml", file=xml_path.name, cache_hit=False):
+            data = parse_xml_file(xml_path)
+        SCHEME_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write under a unique name first, workers may race on the same parent
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"extractor": extractor_hash(), "scheme": data}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+
+    _parsed_schemes[digest] = data
+    return data
+
+
+def resolve_parent_scheme(name: str, _seen: tuple = ()) -> dict:
+    """
+    Resolve the values a scheme inherits from its parent_scheme chain.
+
+    Returns {"colors": {...}, "attributes": {...}} holding the effective
+    colors and the raw attribute table of the named scheme over everything
+    it inherits itself. Attributes are left unresolved so that the
+    variant's own overrides apply to inherited baseAttributes links.
+    Parents missing from SCHEMES_DIR end the chain.
+    """
+    if not name:
+        return {"colors": {}, "attributes": {}}
+    if name in _parent_schemes:
+        return _parent_schemes[name]
+    if name in _seen:
+        raise ValueError(f"parent_scheme cycle: {' -> '.join(_seen + (name,))}")
+
+    xml_path = SCHEMES_DIR / f"{name}.xml"
+    if not xml_path.is_file():
+        print(f"  (parent scheme {name} not found in {SCHEMES_DIR}, not inheriting)")
+        result = {"colors": {}, "attributes": {}}
+    else:
+        scheme = load_scheme(xml_path)
+        parent = resolve_parent_scheme(scheme["scheme"]["parent_scheme"], _seen + (name,))
+        result = {
+            "colors": {**parent["colors"], **scheme["colors"]},
+            "attributes": {**parent["attributes"], **scheme["attributes"]}
+        }
 
-    # Normalize all color values
-    return normalize_json_colors(data)
+    _parent_schemes[name] = result
+    return result
+
+
+def clear_parent_schemes():
+    """Forget resolved parent chains, e.g. after a scheme file changed on disk."""
+    _parent_schemes.clear()
+
+
+def parse_scheme(xml_file: Path | BinaryIO) -> dict:
+    """parse_xml_file() for a variant's own scheme, traced."""
+    with tracing.span("parse xml", file=PurePosixPath(xml_file.name).name) as sp:
+        xml_data = parse_xml_file(xml_file)
+        sp.set(colors=len(xml_data["colors"]), attributes=len(xml_data["attributes"]))
+    return xml_data
 
 
 def extract_variant(variant: str) -> dict:
-    """Extract a single variant's theme data."""
-    json_path = ORIGINAL_DIR / f"Vira-{variant}.theme.json"
-    xml_path = ORIGINAL_DIR / f"Vira-{variant}.xml"
+    """Extract a single variant's theme data from original/."""
+    json_data = parse_json_file(ORIGINAL_DIR / f"Vira-{variant}.theme.json")
+    xml_data = parse_scheme(ORIGINAL_DIR / f"Vira-{variant}.xml")
+    return assemble_variant(variant, json_data, xml_data)
+
 
-    json_data = parse_json_file(json_path)
-    xml_data = parse_xml_file(xml_path)
+def assemble_variant(variant: str, json_data: dict, xml_data: dict) -> dict:
+    """Build a variant's extracted data from its parsed theme JSON and scheme XML."""
+    with tracing.span("resolve parent scheme", parent=xml_data["scheme"]["parent_scheme"]):
+        parent = resolve_parent_scheme(xml_data["scheme"]["parent_scheme"])
+    with tracing.span("resolve attributes") as sp:
+        resolved = resolve_attributes(xml_data["attributes"], parent["attributes"])
+        sp.set(attributes=len(resolved))
 
     return {
         "variant": variant.lower(),
@@ -225,129 +430,543 @@ def extract_variant(variant: str) -> dict:
         },
         "xml": {
             "colors": xml_data["colors"],
-            "attributes": xml_data["attributes"]
+            "attributes": xml_data["attributes"],
+            "resolved": resolved,
+            # Colors only the parent scheme chain defines
+            "inherited_colors": {
+                key: value for key, value in parent["colors"].items()
+                if key not in xml_data["colors"]
+            }
         }
     }
 
 
-def compute_shared(variants_data: list[dict]) -> dict:
-    """Find values that are identical across all variants."""
-    if not variants_data:
-        return {}
+def find_archives(paths: list[Path]) -> list[Path]:
+    """The given archives, and the archives in given directories, in name order."""
+    archives = []
+    for path in paths:
+        if path.is_dir():
+            archives += sorted(p for p in path.iterdir() if p.suffix.lower() in ARCHIVE_SUFFIXES)
+        else:
+            archives.append(path)
+    return archives
 
-    shared = {
-        "json": {"colors": {}, "ui": {}, "icons": {}},
-        "xml": {"colors": {}, "attributes": {}}
-    }
 
-    # Get reference from first variant
-    first = variants_data[0]
+def scan_archive(archive: Path) -> dict[str, tuple[str, str]]:
+    """
+    Find the variants of a theme plugin archive.
+
+    Each *.theme.json member is paired with the .xml member its
+    "editorScheme" names (a path from the archive root); a theme without
+    the field falls back to the .xml member of the same base name
+    (Vira-Carbon.theme.json with Vira-Carbon.xml). The variant is named
+    after the theme, without the "Vira-" prefix. Only the central
+    directory and the theme JSON members are read. Returns
+    {variant: (JSON member, XML member)}.
+    """
+    found = {}
+    with zipfile.ZipFile(archive) as zf:
+        names = zf.namelist()
+        members = set(names)
+        schemes = {
+            PurePosixPath(name).name.lower(): name
+            for name in names if name.lower().endswith(".xml") and not name.startswith("META-INF/")
+        }
+        for name in names:
+            base = PurePosixPath(name).name
+            if not base.lower().endswith(".theme.json"):
+                continue
+            stem = base[:-len(".theme.json")]
+            editor_scheme = json.loads(zf.read(name)).get("editorScheme")
+            if editor_scheme is not None:
+                xml_name = editor_scheme.lstrip("/")
+                if xml_name not in members:
+                    print(f"  ({name} in {archive.name} names missing scheme {editor_scheme}, skipping)")
+                    continue
+            else:
+                xml_name = schemes.get(f"{stem}.xml".lower())
+                if xml_name is None:
+                    print(f"  ({name} in {archive.name} has no {stem}.xml, skipping)")
+                    continue
+            found[stem.removeprefix("Vira-")] = (name, xml_name)
+    return found
+
 
-    # Check JSON colors
-    for key, value in first["json"]["colors"].items():
-        if all(v["json"]["colors"].get(key) == value for v in variants_data):
-            shared["json"]["colors"][key] = value
+def extract_archive(archive: Path, variants: dict[str, tuple[str, str]]):
+    """
+    Yield (variant, data) for the given variants of a theme plugin archive.
 
-    # Check XML colors
-    for key, value in first["xml"]["colors"].items():
-        if all(v["xml"]["colors"].get(key) == value for v in variants_data):
-            shared["xml"]["colors"][key] = value
+    variants maps each variant to its (JSON member, XML member), as
+    scan_archive() finds them. Members are parsed straight from the
+    archive's decompressing streams, in the order they are stored, so the
+    archive is read once front to back and nothing is written to disk.
+    """
+    members = {}
+    for json_name, xml_name in variants.values():
+        members[json_name] = parse_json_file
+        members[xml_name] = parse_scheme
 
-    # Check XML attributes
-    for key, value in first["xml"]["attributes"].items():
-        if all(v["xml"]["attributes"].get(key) == value for v in variants_data):
-            shared["xml"]["attributes"][key] = value
+    parsed = {}
+    with tracing.span("read archive", file=archive.name, members=len(members)):
+        with zipfile.ZipFile(archive) as zf:
+            for info in sorted(map(zf.getinfo, members), key=lambda info: info.header_offset):
+                with zf.open(info) as stream:
+                    parsed[info.filename] = members[info.filename](stream)
 
-    return shared
+    for variant, (json_name, xml_name) in sorted(variants.items()):
+        yield variant, assemble_variant(variant, parsed.pop(json_name), parsed.pop(xml_name))
 
 
-def compute_diff_matrix(variants_data: list[dict]) -> dict:
-    """Find values that differ between variants."""
-    if not variants_data:
-        return {}
+# Sections compared across variants by compute_analysis
+ANALYSIS_SECTIONS = [("json", "colors"), ("xml", "colors"), ("xml", "attributes")]
+
+
+def index_section(model: Model, roots: list[int], group: str, section: str) -> tuple[list, list, dict]:
+    """
+    Build a columnar index of one section across variants.
+
+    Returns (keys, matrix, first):
+        keys   - keys of the section, in first-seen order
+        matrix - one row per variant; matrix[v][k] is the canonical value id
+                 of keys[k] in variant v, MISSING if the variant does not
+                 define it
+        first  - canonical value id -> value id of its first occurrence
 
+    Value ids come from the model, so building the index interns nothing
+    and comparing variants is comparing integers.
+    """
+    columns = {}
+    keys = []
+    first = {}
+    matrix = []
+
+    for root in roots:
+        row = [MISSING] * len(keys)
+        for kid, vid in model.items(model.get(root, group, section)):
+            column = columns.get(kid)
+            if column is None:
+                column = columns[kid] = len(keys)
+                keys.append(model.keys[kid])
+                row.append(MISSING)
+            canonical = model.canonical(vid)
+            first.setdefault(canonical, vid)
+            row[column] = canonical
+        matrix.append(row)
+
+    # Keys first seen in later variants are missing from earlier rows
+    for row in matrix:
+        row.extend([MISSING] * (len(keys) - len(row)))
+
+    return keys, matrix, first
+
+
+def compute_analysis(model: Model, roots: list[int]) -> tuple[dict, dict]:
+    """
+    Find shared and differing values across variants in a single pass.
+
+    roots are the value ids of the variants in model. Each section is
+    indexed into a variant x key matrix of value ids and swept once column
+    by column: a column with a single non-missing id is shared, a column
+    with more than one distinct id (missing counts as None) differs. Cost
+    is linear in variants x keys.
+
+    Returns (shared, diff).
+    """
+    if not roots:
+        return {}, {}
+
+    shared = {
+        "json": {"colors": {}, "ui": {}, "icons": {}},
+        "xml": {"colors": {}, "attributes": {}}
+    }
     diff = {
         "json": {"colors": {}, "ui_background": {}},
         "xml": {"colors": {}, "attributes": {}}
     }
+    names = [model.to_json(model.get(root, "variant")) for root in roots]
+
+    def value(canonical):
+        return model.to_json(first[canonical]) if canonical else None
 
-    # Collect all keys from all variants
-    all_json_color_keys = set()
-    all_xml_color_keys = set()
-    all_xml_attr_keys = set()
-
-    for v in variants_data:
-        all_json_color_keys.update(v["json"]["colors"].keys())
-        all_xml_color_keys.update(v["xml"]["colors"].keys())
-        all_xml_attr_keys.update(v["xml"]["attributes"].keys())
-
-    # Check JSON colors for differences
-    for key in all_json_color_keys:
-        values = {v["variant"]: v["json"]["colors"].get(key, None) for v in variants_data}
-        unique_values = set(values.values())
-        if len(unique_values) > 1:
-            diff["json"]["colors"][key] = values
-
-    # Check XML colors for differences
-    for key in all_xml_color_keys:
-        values = {v["variant"]: v["xml"]["colors"].get(key, None) for v in variants_data}
-        unique_values = set(values.values())
-        if len(unique_values) > 1:
-            diff["xml"]["colors"][key] = values
+    for group, section in ANALYSIS_SECTIONS:
+        keys, matrix, first = index_section(model, roots, group, section)
+        shared_section = shared[group][section]
+        diff_section = diff[group][section]
+
+        for key, column in zip(keys, zip(*matrix)):
+            head = column[0]
+            if column.count(head) == len(column):
+                if head:
+                    shared_section[key] = value(head)
+            else:
+                diff_section[key] = {name: value(vid) for name, vid in zip(names, column)}
 
     # Extract key UI background colors that define each variant
-    for v in variants_data:
-        ui = v["json"].get("ui", {})
-        star = ui.get("*", {})
-        diff["json"]["ui_background"][v["variant"]] = {
+    for name, root in zip(names, roots):
+        star = model.to_json(model.get(root, "json", "ui", "*")) or {}
+        diff["json"]["ui_background"][name] = {
             "background": star.get("background", ""),
             "foreground": star.get("foreground", ""),
             "selectionBackground": star.get("selectionBackground", "")
         }
 
-    return diff
+    return shared, diff
 
 
-def main():
-    """Main extraction routine."""
+def load_model(variants_data: list[dict]) -> tuple[Model, list[int]]:
+    """Add extracted variants to a new Model; returns it and their value ids."""
+    model = Model()
+    return model, [model.add(data) for data in variants_data]
+
+
+def compute_shared(variants_data: list[dict]) -> dict:
+    """Find values that are identical across all variants."""
+    return compute_analysis(*load_model(variants_data))[0]
+
+
+def compute_diff_matrix(variants_data: list[dict]) -> dict:
+    """Find values that differ between variants."""
+    return compute_analysis(*load_model(variants_data))[1]
+
+
+def file_fingerprint(path: Path, previous: dict | None = None) -> dict | None:
+    """
+    Fingerprint a file by content hash.
+
+    The hash from a previous fingerprint is reused when size and mtime are
+    unchanged, so checking an untouched file costs a single stat() call.
+    Returns None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+
+    if (previous and previous.get("size") == st.st_size
+            and previous.get("mtime_ns") == st.st_mtime_ns):
+        return previous
+
+    return {
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns
+    }
+
+
+def fingerprint_files(paths: list[Path], previous: dict | None = None) -> dict:
+    """Fingerprint several files, keyed by path relative to BASE_DIR (absolute outside it)."""
+    previous = previous or {}
+    result = {}
+    for path in paths:
+        key = (path.relative_to(BASE_DIR) if path.is_relative_to(BASE_DIR) else path.resolve()).as_posix()
+        result[key] = file_fingerprint(path, previous.get(key))
+    return result
+
+
+def same_content(a: dict, b: dict) -> bool:
+    """Compare two fingerprint sets by content hash only."""
+    if a.keys() != b.keys():
+        return False
+    for key, fp in a.items():
+        other = b[key]
+        if fp is None or other is None or fp["sha256"] != other["sha256"]:
+            return False
+    return True
+
+
+@functools.cache
+def extractor_hash() -> str:
+    """Hash of the extractor itself; a changed script invalidates the manifest."""
+    digest = hashlib.sha256()
+    for path in EXTRACTOR_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_manifest() -> dict:
+    """Load the build manifest, or return an empty one if missing or stale."""
+    empty = {"version": MANIFEST_VERSION, "extractor": extractor_hash(),
+             "variants": {}, "analysis": {}}
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return empty
+
+    if (manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("extractor") != empty["extractor"]):
+        return empty
+    return manifest
+
+
+def save_manifest(manifest: dict):
+    """Write the build manifest."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def variant_sources(variant: str, archive: Path | None = None) -> list[Path]:
+    """Source files a variant is extracted from, including parent schemes."""
+    if archive is not None:
+        own = [archive]
+    else:
+        own = [ORIGINAL_DIR / f"Vira-{variant}.theme.json", ORIGINAL_DIR / f"Vira-{variant}.xml"]
+    return [*own, *sorted(SCHEMES_DIR.glob("*.xml"))]
+
+
+def dump_json(data: dict) -> str:
+    """Serialize data as pretty-printed JSON."""
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def write_text(path: Path, text: str) -> bool:
+    """Write already-serialized output, unless unchanged; True if written."""
+    return artifacts.write(path, text)
+
+
+def build_variant(variant: str) -> tuple[dict, str]:
+    """
+    Extract and serialize a single variant.
+
+    This is the unit of work handed to worker processes with --jobs, so
+    serialization happens in parallel too. Only the parent writes files.
+    """
+    with tracing.span("extract variant", variant=variant):
+        data = extract_variant(variant)
+    with tracing.span("serialize", variant=variant) as sp:
+        text = dump_json(data)
+        sp.set(bytes=len(text))
+    return data, text
+
+
+def build_variant_traced(variant: str) -> tuple[dict, str, list[dict]]:
+    """build_variant() in a worker process, returning its trace events too."""
+    tracing.enable()
+    # Forked workers inherit the parent's events; report only this task's
+    tracing.drain()
+    data, text = build_variant(variant)
+    return data, text, tracing.drain()
+
+
+def build_variants(variants: list[str], jobs: int):
+    """
+    Yield (variant, data, text) for each variant, in the order given.
+
+    With jobs > 1 the variants are extracted in a process pool; results are
+    still yielded in input order so the output never depends on which
+    worker finishes first.
+    """
+    if jobs <= 1 or len(variants) <= 1:
+        for variant in variants:
+            yield (variant, *build_variant(variant))
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(variants))) as pool:
+        if not tracing.enabled():
+            for variant, (data, text) in zip(variants, pool.map(build_variant, variants)):
+                yield variant, data, text
+            return
+
+        for variant, (data, text, events) in zip(variants, pool.map(build_variant_traced, variants)):
+            tracing.extend(events)
+            yield variant, data, text
+
+
+def discover_archives(paths: list[Path]) -> dict[str, tuple[Path, str, str]]:
+    """
+    Variants of the theme plugin archives in paths.
+
+    Returns {variant: (archive, JSON member, XML member)}; a variant found
+    in several archives is taken from the last one.
+    """
+    sources = {}
+    for archive in find_archives(paths):
+        for variant, members in scan_archive(archive).items():
+            if variant in sources:
+                print(f"  ({variant} in {archive.name} replaces {sources[variant][0].name})")
+            sources[variant] = (archive, *members)
+    return sources
+
+
+def build_archive_variants(sources: dict[str, tuple[Path, str, str]], variants: list[str]):
+    """
+    build_variants() for variants read from archives.
+
+    Variants are grouped by archive, so each archive is opened and read
+    once however many of its variants changed.
+    """
+    by_archive = {}
+    for variant in variants:
+        archive, json_name, xml_name = sources[variant]
+        by_archive.setdefault(archive, {})[variant] = (json_name, xml_name)
+
+    for archive, members in by_archive.items():
+        for variant, data in extract_archive(archive, members):
+            with tracing.span("serialize", variant=variant) as sp:
+                text = dump_json(data)
+                sp.set(bytes=len(text))
+            yield variant, data, text
+
+
+def variant_outputs(variant: str, store: bool) -> list[Path]:
+    """Files written for a variant."""
+    output_path = EXTRACTED_DIR / f"{variant.lower()}.json"
+    return [output_path, output_path.with_suffix(".store")] if store else [output_path]
+
+
+def extract_all(force: bool, jobs: int, store: bool = False, archives: list[Path] | None = None):
+    """
+    Extract changed variants and refresh the analysis.
+
+    With archives, variants are discovered in those theme plugin archives
+    (or directories of them) rather than in original/.
+    """
+    sources = discover_archives(archives) if archives else {}
+    variants = sorted(sources) if archives else VARIANTS
+    if not variants:
+        print(f"No variants found in {', '.join(map(str, archives)) if archives else ORIGINAL_DIR}")
+        return
+
     EXTRACTED_DIR.mkdir(exist_ok=True)
     ANALYSIS_DIR.mkdir(exist_ok=True)
 
-    variants_data = []
+    manifest = load_manifest()
+    if force:
+        manifest["variants"] = {}
+        manifest["analysis"] = {}
+
+    # Variants are kept interned in one model for the analysis, not as dicts
+    model = Model()
+    roots = {}
+    changed = []
+    pending_inputs = {}
+
+    # Find variants whose sources or output changed
+    for variant in variants:
+        entry = manifest["variants"].get(variant, {})
+        archive = sources[variant][0] if variant in sources else None
+
+        with tracing.span("manifest check", variant=variant) as sp:
+            inputs = fingerprint_files(variant_sources(variant, archive), entry.get("inputs"))
+            outputs = fingerprint_files(variant_outputs(variant, store), entry.get("outputs"))
+            unchanged = (bool(entry) and same_content(inputs, entry["inputs"])
+                         and same_content(outputs, entry["outputs"]))
+            sp.set(cache_hit=unchanged)
+        if unchanged:
+            print(f"Skipping {variant} (unchanged)")
+            manifest["variants"][variant] = {"inputs": inputs, "outputs": outputs}
+            continue
+
+        changed.append(variant)
+        pending_inputs[variant] = inputs
 
-    # Extract each variant
-    for variant in VARIANTS:
+    # Extract them: a pass over each archive, or loose files serially or
+    # across worker processes
+    built = build_archive_variants(sources, changed) if archives else build_variants(changed, jobs)
+    for variant, data, text in built:
         print(f"Extracting {variant}...")
-        data = extract_variant(variant)
-        variants_data.append(data)
 
         # Write individual variant file
         output_path = EXTRACTED_DIR / f"{variant.lower()}.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"  -> {output_path}")
+        with tracing.span("write", file=output_path.name, bytes=len(text)):
+            if write_text(output_path, text):
+                print(f"  -> {output_path}")
+        if store:
+            store_path = output_path.with_suffix(".store")
+            with tracing.span("write store", file=store_path.name):
+                if write_store(data, store_path):
+                    print(f"  -> {store_path}")
+
+        manifest["variants"][variant] = {
+            "inputs": pending_inputs[variant],
+            "outputs": fingerprint_files(variant_outputs(variant, store))
+        }
+        with tracing.span("intern", variant=variant):
+            roots[variant.lower()] = model.add(data)
 
-    # Compute and write shared values
-    print("Computing shared values...")
-    shared = compute_shared(variants_data)
     shared_path = ANALYSIS_DIR / "shared.json"
-    with open(shared_path, "w", encoding="utf-8") as f:
-        json.dump(shared, f, indent=2, ensure_ascii=False)
-    print(f"  -> {shared_path}")
-
-    # Compute and write diff matrix
-    print("Computing diff matrix...")
-    diff = compute_diff_matrix(variants_data)
     diff_path = ANALYSIS_DIR / "diff-matrix.json"
-    with open(diff_path, "w", encoding="utf-8") as f:
-        json.dump(diff, f, indent=2, ensure_ascii=False)
-    print(f"  -> {diff_path}")
+
+    # Analysis depends on every variant's extracted output, including those
+    # extracted from other sources (original/ or archives) by earlier runs
+    analysis = manifest["analysis"]
+    extracted_files = sorted(EXTRACTED_DIR.glob("*.json"))
+    analysis_inputs = fingerprint_files(extracted_files, analysis.get("inputs"))
+    analysis_outputs = fingerprint_files([shared_path, diff_path], analysis.get("outputs"))
+    if (not changed and analysis
+            and same_content(analysis_inputs, analysis["inputs"])
+            and same_content(analysis_outputs, analysis["outputs"])):
+        manifest["analysis"] = {"inputs": analysis_inputs, "outputs": analysis_outputs}
+        save_manifest(manifest)
+        print("\nNothing to do, all outputs are up to date.")
+        return
+
+    # Variants not extracted in this run are loaded back from their output
+    for path in extracted_files:
+        if path.stem not in roots:
+            with tracing.span("read extracted", variant=path.stem):
+                with open(path, "r", encoding="utf-8") as f:
+                    roots[path.stem] = model.add(json.load(f))
+
+    # Compute shared values and diff matrix in one pass
+    print("Computing shared values and diff matrix...")
+    with tracing.span("shared/diff analysis", variants=len(roots)) as sp:
+        shared, diff = compute_analysis(model, [roots[path.stem] for path in extracted_files])
+        sp.set(
+            keys=len(model.keys),
+            values=len(model.values),
+            shared=sum(len(section) for group in shared.values() for section in group.values()),
+            differing=sum(len(section) for group in diff.values() for section in group.values())
+        )
+    for path, result in ((shared_path, shared), (diff_path, diff)):
+        with tracing.span("serialize", file=path.name):
+            text = dump_json(result)
+        with tracing.span("write", file=path.name, bytes=len(text)):
+            if write_text(path, text):
+                print(f"  -> {path}")
+
+    manifest["analysis"] = {
+        "inputs": analysis_inputs,
+        "outputs": fingerprint_files([shared_path, diff_path])
+    }
+    save_manifest(manifest)
 
     print("\nExtraction complete!")
-    print(f"  - {len(variants_data)} variants extracted")
+    print(f"  - {len(changed)} of {len(variants)} variants extracted, {len(roots)} analyzed")
     print(f"  - {len(shared['xml']['colors'])} shared XML colors")
     print(f"  - {len(shared['xml']['attributes'])} shared XML attributes")
     print(f"  - {len(diff['xml']['colors'])} differing XML colors")
+    print(f"  - {len(diff['xml']['attributes'])} differing XML attributes")
+
+
+def main():
+    """Main extraction routine."""
+    parser = argparse.ArgumentParser(description="Extract Vira JetBrains theme data")
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the build manifest and re-extract everything")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="extract variants in N worker processes (0 = one per CPU)")
+    parser.add_argument("--store", action="store_true",
+                        help="also write compact extracted/{variant}.store files")
+    parser.add_argument("--archive", action="append", type=Path, metavar="PATH",
+                        help="read variants from a theme plugin .jar/.zip, or every archive in a directory, "
+                             "instead of original/ (repeatable)")
+    parser.add_argument("--trace", type=Path, metavar="FILE",
+                        help="write a Chrome trace of the run to FILE")
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    if args.trace:
+        tracing.enable()
+    try:
+        with tracing.span("extract.py", jobs=jobs):
+            extract_all(args.force, jobs, args.store, args.archive)
+        artifacts.report()
+    finally:
+        if args.trace:
+            tracing.save(args.trace)
+            print(f"Trace written to {args.trace}")
 
 
 if __name__ == "__main__":
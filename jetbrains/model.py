@@ -0,0 +1,126 @@
+"""
+Vira in-memory model
+
+A compact form of extracted variants for work across all of them (the
+shared/diff analysis). Every key and every value is stored once in tables
+shared by all variants loaded into a Model:
+
+    keys    key id -> key string
+    values  value id -> scalar, or a Node for objects and arrays
+
+Nodes are hash-consed: two objects with the same keys and values, in the
+same order, are one Node with one value id, whichever variant they come
+from. An attribute record that six variants share costs one entry, and
+comparing two values is comparing two integers. Size grows with the
+number of distinct values, not with variants x keys.
+
+to_json() rebuilds the extracted JSON shape losslessly, key order and
+value types included.
+"""
+
+# Value id 0: the key is missing
+MISSING = 0
+
+
+class Node:
+    """An interned object (keys is a tuple of key ids) or array (keys is None)."""
+
+    __slots__ = ("keys", "values", "canonical")
+
+    def __init__(self, keys: tuple[int, ...] | None, values: tuple[int, ...]):
+        self.keys = keys
+        self.values = values
+        # Value id of the key-order-insensitive form, set by Model.canonical()
+        self.canonical = None
+
+    def __repr__(self) -> str:
+        kind = "array" if self.keys is None else "object"
+        return f"Node({kind}, {len(self.values)} entries)"
+
+
+class Model:
+    """Key and value tables shared by every document added to them."""
+
+    def __init__(self):
+        self.keys = []
+        self.values = [None]
+        self._key_ids = {}
+        # (type, value) of scalars, (Node, keys, values) of nodes -> value id
+        self._value_ids = {}
+
+    def key(self, text: str) -> int:
+        """Id of a key string, adding it to the table if new."""
+        kid = self._key_ids.get(text)
+        if kid is None:
+            kid = self._key_ids[text] = len(self.keys)
+            self.keys.append(text)
+        return kid
+
+    def _intern(self, token: tuple, make) -> int:
+        vid = self._value_ids.get(token)
+        if vid is None:
+            vid = self._value_ids[token] = len(self.values)
+            self.values.append(make())
+        return vid
+
+    def add(self, value) -> int:
+        """Intern a JSON value (a whole extracted variant, usually); returns its value id."""
+        if isinstance(value, dict):
+            keys = tuple(self.key(k) for k in value)
+            values = tuple(self.add(v) for v in value.values())
+            return self._intern((Node, keys, values), lambda: Node(keys, values))
+        if isinstance(value, list):
+            values = tuple(self.add(v) for v in value)
+            return self._intern((Node, None, values), lambda: Node(None, values))
+        # Typed, so that 1, 1.0 and True stay apart
+        return self._intern((type(value), value), lambda: value)
+
+    def get(self, vid: int, *path: str) -> int:
+        """Value id at a key path below an object, or MISSING."""
+        for name in path:
+            node = self.values[vid]
+            kid = self._key_ids.get(name)
+            if not isinstance(node, Node) or node.keys is None or kid not in node.keys:
+                return MISSING
+            vid = node.values[node.keys.index(kid)]
+        return vid
+
+    def items(self, vid: int) -> list[tuple[int, int]]:
+        """(key id, value id) pairs of an object, in document order."""
+        node = self.values[vid]
+        if not isinstance(node, Node) or node.keys is None:
+            return []
+        return list(zip(node.keys, node.values))
+
+    def canonical(self, vid: int) -> int:
+        """
+        Value id of the value with object keys sorted, recursively.
+
+        Equal canonical ids mean equal values regardless of key order, as
+        the analysis compares them.
+        """
+        node = self.values[vid]
+        if not isinstance(node, Node):
+            return vid
+        if node.canonical is None:
+            values = [self.canonical(v) for v in node.values]
+            if node.keys is None:
+                keys = None
+            else:
+                order = sorted(range(len(values)), key=lambda i: self.keys[node.keys[i]])
+                keys = tuple(node.keys[i] for i in order)
+                values = [values[i] for i in order]
+            values = tuple(values)
+            node.canonical = self._intern((Node, keys, values), lambda: Node(keys, values))
+            self.values[node.canonical].canonical = node.canonical
+        return node.canonical
+
+    def to_json(self, vid: int):
+        """Rebuild the JSON value of a value id."""
+        node = self.values[vid]
+        if not isinstance(node, Node):
+            return node
+        items = [self.to_json(v) for v in node.values]
+        if node.keys is None:
+            return items
+        return dict(zip((self.keys[k] for k in node.keys), items))
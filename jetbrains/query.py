@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Vira color query
+
+Finds where a color, or colors close to it, are used across all variants.
+
+Usage: python query.py COLOR [--radius DELTA_E | --nearest K] [--json]
+
+    python query.py '#80cbc4'               exact uses (any alpha)
+    python query.py '#80cbc4' --radius 5    uses within CIE76 delta E 5
+    python query.py '#80cbc4' --nearest 3   uses of the 3 closest colors
+
+The index covers json.colors, json.ui, xml.colors and xml.attributes of
+every extracted/{variant}.json. An inverted index (color -> variant,
+section, key) is kept in .cache/color-index.json and only the postings of
+variants whose extracted file changed are rebuilt. Radius and nearest
+queries go through a KD-tree over the distinct colors in CIELAB.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from color import parse_color
+from extract import CACHE_DIR, EXTRACTED_DIR, fingerprint_files, same_content
+
+INDEX_PATH = CACHE_DIR / "color-index.json"
+
+# Bump when the index layout changes
+INDEX_VERSION = 2
+
+
+def color_uses(data: dict):
+    """Yield (section, key, hex) for every color value of an extracted variant."""
+    for name, color in data["json"].get("colors", {}).items():
+        yield "json.colors", name, color
+
+    def walk(node, prefix):
+        for name, value in node.items():
+            key = f"{prefix}.{name}" if prefix else name
+            if isinstance(value, dict):
+                yield from walk(value, key)
+            else:
+                yield "json.ui", key, value
+
+    yield from walk(data["json"].get("ui", {}), "")
+
+    for name, color in data["xml"].get("colors", {}).items():
+        yield "xml.colors", name, color
+
+    for name, attr in data["xml"].get("attributes", {}).items():
+        for prop, value in attr.items():
+            yield "xml.attributes", f"{name}.{prop}", value
+
+
+def variant_postings(data: dict) -> dict[str, list]:
+    """Inverted index of one variant: color hex -> [[section, key], ...]."""
+    postings = {}
+    for section, key, value in color_uses(data):
+        color = parse_color(value) if isinstance(value, str) else None
+        if color is not None:
+            postings.setdefault(color.hex, []).append([section, key])
+    return postings
+
+
+def load_index(rebuild: bool = False) -> dict:
+    """
+    Load the persistent index, refreshing variants whose extracted file changed.
+
+    Returns {"version", "variants": {variant: {"inputs", "postings"}}}.
+    """
+    index = {"version": INDEX_VERSION, "variants": {}}
+    if not rebuild:
+        try:
+            with open(INDEX_PATH, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("version") == INDEX_VERSION:
+                index = stored
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    changed = False
+    # Every extracted variant, whether from original/ or a plugin archive
+    variants = sorted(path.stem for path in EXTRACTED_DIR.glob("*.json"))
+    for variant in index["variants"].keys() - set(variants):
+        del index["variants"][variant]
+        changed = True
+    for variant in variants:
+        path = EXTRACTED_DIR / f"{variant}.json"
+        entry = index["variants"].get(variant)
+        inputs = fingerprint_files([path], entry["inputs"] if entry else None)
+        if entry and same_content(inputs, entry["inputs"]):
+            # Touched but identical: only refresh the stat fast path
+            if inputs != entry["inputs"]:
+                entry["inputs"] = inputs
+                changed = True
+            continue
+        if None in inputs.values():
+            changed |= index["variants"].pop(variant, None) is not None
+            continue
+
+        with open(path, "r", encoding="utf-8") as f:
+            index["variants"][variant] = {"inputs": inputs, "postings": variant_postings(json.load(f))}
+        changed = True
+
+    if changed:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(INDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+    return index
+
+
+class KDTree:
+    """Static 3-d tree over (point, item) pairs, for Euclidean queries."""
+
+    def __init__(self, points: list[tuple[tuple[float, float, float], object]]):
+        self.root = self._build(points, 0)
+
+    def _build(self, points, depth):
+        if not points:
+            return None
+        axis = depth % 3
+        points = sorted(points, key=lambda p: p[0][axis])
+        mid = len(points) // 2
+        return (points[mid], axis, self._build(points[:mid], depth + 1), self._build(points[mid + 1:], depth + 1))
+
+    def within(self, target: tuple, radius: float) -> list[tuple[float, object]]:
+        """(distance, item) of every point within radius of target, closest first."""
+        found = []
+        r2 = radius * radius
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            (point, item), axis, left, right = node
+            d2 = sum((p - t) ** 2 for p, t in zip(point, target))
+            if d2 <= r2:
+                found.append((d2 ** 0.5, item))
+            diff = target[axis] - point[axis]
+            stack.append(left if diff < 0 else right)
+            if diff * diff <= r2:
+                stack.append(right if diff < 0 else left)
+        return sorted(found, key=lambda f: f[0])
+
+    def nearest(self, target: tuple, k: int) -> list[tuple[float, object]]:
+        """(distance, item) of the k points closest to target, closest first."""
+        best = []
+
+        def visit(node):
+            if node is None:
+                return
+            (point, item), axis, left, right = node
+            d = sum((p - t) ** 2 for p, t in zip(point, target)) ** 0.5
+            if len(best) < k or d < best[-1][0]:
+                best.append((d, item))
+                best.sort(key=lambda b: b[0])
+                del best[k:]
+            diff = target[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if len(best) < k or abs(diff) < best[-1][0]:
+                visit(far)
+
+        visit(self.root)
+        return best
+
+
+class ColorIndex:
+    """Exact and nearest-color lookups over all variants."""
+
+    def __init__(self, index: dict):
+        # color hex -> [(variant, section, key), ...]
+        self.uses = {}
+        for variant, entry in index["variants"].items():
+            for hex_, postings in entry["postings"].items():
+                self.uses.setdefault(hex_, []).extend((variant.lower(), s, k) for s, k in postings)
+
+        # RGB hex -> color hexes with that RGB (differing only in alpha)
+        self.by_rgb = {}
+        for hex_ in self.uses:
+            self.by_rgb.setdefault(hex_[:7], []).append(hex_)
+        self.tree = KDTree([(parse_color(rgb).lab, rgb) for rgb in self.by_rgb])
+
+    def _expand(self, matches: list[tuple[float, str]], alpha_hex: str | None) -> list[dict]:
+        results = []
+        for distance, rgb in matches:
+            for hex_ in sorted(self.by_rgb[rgb]):
+                if alpha_hex and hex_ != alpha_hex:
+                    continue
+                results.append({"color": hex_, "delta_e": round(distance, 3), "uses": self.uses[hex_]})
+        return results
+
+    def exact(self, query: str) -> list[dict]:
+        """Uses of the color; an alpha channel in the query must match too."""
+        color = parse_color(query)
+        if color is None or color.rgb_hex not in self.by_rgb:
+            return []
+        return self._expand([(0.0, color.rgb_hex)], color.hex if color.has_alpha else None)
+
+    def within(self, query: str, radius: float) -> list[dict]:
+        """Uses of colors within radius (CIE76 delta E) of the query."""
+        color = parse_color(query)
+        if color is None:
+            return []
+        return self._expand(self.tree.within(color.lab, radius), None)
+
+    def nearest(self, query: str, k: int) -> list[dict]:
+        """Uses of the k distinct colors closest to the query."""
+        color = parse_color(query)
+        if color is None:
+            return []
+        return self._expand(self.tree.nearest(color.lab, k), None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find where colors are used across Vira variants")
+    parser.add_argument("color", help="color to look up, e.g. '#80cbc4'")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--radius", type=float, metavar="DELTA_E", help="match colors within this CIE76 distance")
+    group.add_argument("--nearest", type=int, metavar="K", help="match the K closest distinct colors")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the index from scratch")
+    args = parser.parse_args()
+
+    if parse_color(args.color) is None:
+        sys.exit(f"Not a color: {args.color!r} (expected #rrggbb or #rrggbbaa)")
+
+    index = ColorIndex(load_index(args.rebuild))
+
+    start = time.perf_counter()
+    if args.radius is not None:
+        results = index.within(args.color, args.radius)
+    elif args.nearest is not None:
+        results = index.nearest(args.color, args.nearest)
+    else:
+        results = index.exact(args.color)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        distance = "exact" if result["delta_e"] == 0 else f"delta E {result['delta_e']:.2f}"
+        print(f"{result['color']}  ({distance}, {len(result['uses'])} uses)")
+        for variant, section, key in result["uses"]:
+            print(f"  {variant:<12} {section:<16} {key}")
+    uses = sum(len(result["uses"]) for result in results)
+    print(f"\n{len(results)} color(s), {uses} use(s) in {elapsed:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
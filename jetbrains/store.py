@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Vira compact store
+
+A binary, memory-mappable form of an extracted variant (extracted/{variant}.store,
+written by extract.py --store next to the JSON). A lookup such as
+
+    python store.py carbon xml.attributes.DEFAULT_KEYWORD.FOREGROUND
+
+binary-searches its way down the tree through mmap and only touches the
+pages holding the nodes and strings on that path, instead of parsing the
+whole JSON document.
+
+Layout (little-endian):
+
+    header   magic "VIRASTOR", version, string count, string table offset,
+             number table offset, root node offset
+    nodes    u32 count, count entries of (key u32, tag u8, payload u32),
+             and for objects a u32 permutation of the entries sorted by
+             key bytes; entries themselves keep the document order
+    numbers  f64 / i64 values that do not fit an entry payload
+    strings  (count + 1) u32 offsets into the UTF-8 blob that follows;
+             every key and string value is stored once
+
+Colors ("#rrggbb" / "#rrggbbaa") are packed into the payload as 0xRRGGBBAA.
+"""
+
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+import artifacts
+from color import Color, parse_color
+
+MAGIC = b"VIRASTOR"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIIII")
+_ENTRY = struct.Struct("<IB3xI")
+_U32 = struct.Struct("<I")
+_F64 = struct.Struct("<d")
+_I64 = struct.Struct("<q")
+
+# Entry tags
+NULL, FALSE, TRUE, INT, INT64, FLOAT, STRING, RGB, RGBA, OBJECT, ARRAY = range(11)
+
+# Key of array elements
+NO_KEY = 0xFFFFFFFF
+
+
+class _Encoder:
+    """Builds the store sections for one document."""
+
+    def __init__(self):
+        self.strings = {}
+        self.numbers = bytearray()
+        self.nodes = bytearray()
+
+    def string(self, text: str) -> int:
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = self.strings[text] = len(self.strings)
+        return sid
+
+    def number(self, packed: bytes) -> int:
+        offset = len(self.numbers)
+        self.numbers += packed
+        return offset
+
+    def value(self, value) -> tuple[int, int]:
+        """(tag, payload) for a value; containers are encoded first."""
+        if value is None:
+            return NULL, 0
+        if value is True:
+            return TRUE, 0
+        if value is False:
+            return FALSE, 0
+        if isinstance(value, int):
+            if -0x80000000 <= value < 0x80000000:
+                return INT, value & 0xFFFFFFFF
+            return INT64, self.number(_I64.pack(value))
+        if isinstance(value, float):
+            return FLOAT, self.number(_F64.pack(value))
+        if isinstance(value, str):
+            color = parse_color(value)
+            if color is not None and color.hex == value:
+                return (RGBA if color.has_alpha else RGB), color.value
+            return STRING, self.string(value)
+        if isinstance(value, dict):
+            return OBJECT, self.node(list(value.items()), keyed=True)
+        if isinstance(value, (list, tuple)):
+            return ARRAY, self.node([(None, item) for item in value], keyed=False)
+        raise TypeError(f"cannot store {type(value).__name__}")
+
+    def node(self, items: list, keyed: bool) -> int:
+        entries = []
+        for key, value in items:
+            tag, payload = self.value(value)
+            entries.append((NO_KEY if key is None else self.string(key), tag, payload))
+
+        # Nodes directly follow the header
+        offset = _HEADER.size + len(self.nodes)
+        self.nodes += _U32.pack(len(entries))
+        for entry in entries:
+            self.nodes += _ENTRY.pack(*entry)
+        if keyed:
+            order = sorted(range(len(items)), key=lambda i: items[i][0].encode())
+            self.nodes += struct.pack(f"<{len(order)}I", *order)
+        return offset
+
+
+def encode(data: dict) -> bytes:
+    """Encode a JSON-compatible document into the store format."""
+    encoder = _Encoder()
+    root = encoder.node(list(data.items()), keyed=True)
+
+    blob = bytearray()
+    offsets = [0]
+    for text in encoder.strings:
+        blob += text.encode()
+        offsets.append(len(blob))
+    strings = struct.pack(f"<{len(offsets)}I", *offsets) + blob
+
+    numbers_offset = _HEADER.size + len(encoder.nodes)
+    strings_offset = numbers_offset + len(encoder.numbers)
+    header = _HEADER.pack(MAGIC, VERSION, len(encoder.strings), strings_offset, numbers_offset, root)
+    return header + bytes(encoder.nodes) + bytes(encoder.numbers) + strings
+
+
+def write_store(data: dict, path: Path) -> bool:
+    """Write data as a store file, unless unchanged; True if written."""
+    return artifacts.write(path, encode(data))
+
+
+class Store:
+    """
+    A store file opened through mmap.
+
+    Use as a context manager, or call close(). get() decodes only what it
+    visits; load() decodes the whole document.
+    """
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, strings, self._numbers, self._root = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} Vira store")
+        self._offsets = strings
+        self._blob = strings + 4 * (self._count + 1)
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "Store":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _string_bytes(self, sid: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mm, self._offsets + 4 * sid)
+        return self._mm[self._blob + start:self._blob + end]
+
+    def _entry(self, node: int, i: int) -> tuple[int, int, int]:
+        return _ENTRY.unpack_from(self._mm, node + 4 + i * _ENTRY.size)
+
+    def _find(self, node: int, key: bytes) -> tuple[int, int] | None:
+        """Binary search an object node for key; returns (tag, payload)."""
+        (count,) = _U32.unpack_from(self._mm, node)
+        order = node + 4 + count * _ENTRY.size
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (i,) = _U32.unpack_from(self._mm, order + 4 * mid)
+            sid, tag, payload = self._entry(node, i)
+            probe = self._string_bytes(sid)
+            if probe == key:
+                return tag, payload
+            if probe < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _decode(self, tag: int, payload: int):
+        if tag == NULL:
+            return None
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+        if tag == INT:
+            return payload - 0x100000000 if payload & 0x80000000 else payload
+        if tag == INT64:
+            return _I64.unpack_from(self._mm, self._numbers + payload)[0]
+        if tag == FLOAT:
+            return _F64.unpack_from(self._mm, self._numbers + payload)[0]
+        if tag == STRING:
+            return self._string_bytes(payload).decode()
+        if tag == RGB:
+            return Color.from_value(payload).hex
+        if tag == RGBA:
+            return Color.of(payload >> 24, (payload >> 16) & 0xFF, (payload >> 8) & 0xFF, payload & 0xFF).hex
+        if tag in (OBJECT, ARRAY):
+            (count,) = _U32.unpack_from(self._mm, payload)
+            entries = [self._entry(payload, i) for i in range(count)]
+            if tag == ARRAY:
+                return [self._decode(t, p) for _, t, p in entries]
+            return {self._string_bytes(sid).decode(): self._decode(t, p) for sid, t, p in entries}
+        raise ValueError(f"corrupt store: unknown tag {tag}")
+
+    def get(self, path, default=None):
+        """
+        Look up a value by path.
+
+        path is a sequence of keys, or a dotted string. Keys may contain dots
+        themselves ("Adaptive.accent"); the longest key matching at each
+        level is used. Array elements are addressed by index.
+        """
+        parts = path.split(".") if isinstance(path, str) else [str(p) for p in path]
+        tag, payload = OBJECT, self._root
+        i = 0
+        while i < len(parts):
+            if tag == ARRAY:
+                (count,) = _U32.unpack_from(self._mm, payload)
+                if not parts[i].isdigit() or int(parts[i]) >= count:
+                    return default
+                _, tag, payload = self._entry(payload, int(parts[i]))
+                i += 1
+            elif tag == OBJECT:
+                for j in range(len(parts), i, -1):
+                    found = self._find(payload, ".".join(parts[i:j]).encode())
+                    if found is not None:
+                        tag, payload = found
+                        i = j
+                        break
+                else:
+                    return default
+            else:
+                return default
+        return self._decode(tag, payload)
+
+    def load(self) -> dict:
+        """Decode the whole document."""
+        return self._decode(OBJECT, self._root)
+
+
+def main():
+    """Look up values: store.py VARIANT PATH..."""
+    import json
+
+    if len(sys.argv) < 3:
+        sys.exit("Usage: python store.py VARIANT PATH [PATH...]")
+
+    path = Path(__file__).parent / "extracted" / f"{sys.argv[1].lower()}.store"
+    if not path.exists():
+        sys.exit(f"{path} not found; run extract.py --store first")
+
+    with Store(path) as store:
+        for key in sys.argv[2:]:
+            print(json.dumps(store.get(key), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Vira pipeline tracing
+
+Records spans in the Chrome trace event format, viewable in
+chrome://tracing, Perfetto (ui.perfetto.dev) or speedscope. Used by
+extract.py and generate.py behind their --trace flag.
+
+    with tracing.span("parse xml", variant="Carbon") as sp:
+        data = parse(...)
+        sp.count("attributes", len(data))
+
+Tracing is off until enable() is called. While off, span() returns a shared
+no-op span, so instrumented code pays one function call and one global
+lookup per span. Null spans are falsy: guard counters that are costly to
+compute with `if sp:`.
+"""
+
+import json
+import os
+import threading
+import time
+
+# Recorded events; None while tracing is off
+_events = None
+
+
+class Span:
+    """A complete ("X") event, timed from __enter__ to __exit__."""
+
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        _events.append({
+            "name": self.name,
+            "cat": self.cat,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": self.args
+        })
+        return False
+
+    def count(self, name: str, n: int = 1):
+        """Add n to a counter shown in the span's args."""
+        self.args[name] = self.args.get(name, 0) + n
+
+    def set(self, **args):
+        """Attach values to the span's args."""
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Stand-in for Span while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable():
+    """Start recording events."""
+    global _events
+    if _events is None:
+        _events = []
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def span(name: str, cat: str = "pipeline", **args) -> Span | _NullSpan:
+    """A span to use as a context manager; a no-op while tracing is off."""
+    if _events is None:
+        return _NULL_SPAN
+    return Span(name, cat, args)
+
+
+def drain() -> list[dict]:
+    """Remove and return the events recorded so far, e.g. to hand them from a worker process to its parent."""
+    if _events is None:
+        return []
+    events = _events[:]
+    _events.clear()
+    return events
+
+
+def extend(events: list[dict]):
+    """Add events recorded elsewhere (another process)."""
+    if _events is not None:
+        _events.extend(events)
+
+
+def save(path):
+    """Write the recorded events as a Chrome trace JSON file."""
+    events = list(_events or [])
+    # Name processes so workers are told apart in viewers
+    for pid in sorted({e["pid"] for e in events}):
+        label = "main" if pid == os.getpid() else f"worker {pid}"
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}})
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,185 @@
+"""
+Exporters for the targets outside Neovim (extras/).
+
+Each exporter renders one file per variant from what generate.py has
+already resolved for it: the composited palette, the terminal colors of
+the group template and the extracted variant data. Adding a target costs
+a render, not another palette resolution.
+"""
+
+from pathlib import Path
+
+from color import parse_color
+
+ROOT = Path(__file__).parent.parent
+EXTRAS_DIR = ROOT / "extras"
+
+# Plasma shades picked by hand that have no JetBrains counterpart
+PLASMA_SHADES = {
+    "carbon": {
+        "button": "#161616",
+        "button_alt": "#212121",
+        "alternate": "#121212",
+        "selection_inactive": "#b4b4b4",
+        # Every other variant uses its number color
+        "neutral": "#d5b05f",
+    },
+    "deepforest": {
+        "button": "#1b2622",
+        "button_alt": "#23302c",
+        "alternate": "#19221e",
+        "selection_inactive": "#b4c8bc",
+    },
+    "graphene": {
+        "button": "#2a2a2a",
+        "button_alt": "#323232",
+        "alternate": "#292929",
+        "selection_inactive": "#b4b4b4",
+    },
+    "ocean": {
+        "button": "#1b1f2c",
+        "button_alt": "#242838",
+        "alternate": "#181b26",
+        "selection_inactive": "#b4b6c8",
+    },
+    "palenight": {
+        "button": "#303548",
+        "button_alt": "#373c52",
+        "alternate": "#303548",
+        "selection_inactive": "#b4b6c8",
+    },
+    "teal": {
+        "button": "#2d3c43",
+        "button_alt": "#34444c",
+        "alternate": "#2d3c43",
+        "selection_inactive": "#b4bebe",
+    },
+}
+
+# Weight of fg over bg for each shade of variants without hand-picked ones,
+# fitted to the table above
+PLASMA_SHADE_WEIGHTS = {
+    "button": 0.06,
+    "button_alt": 0.11,
+    "alternate": 0.04,
+    "selection_inactive": 0.84,
+}
+
+# Sections that do not depend on the variant's colors
+PLASMA_EFFECTS = """\
+[ColorEffects:Disabled]
+Color=0,0,0
+ColorAmount=0
+ColorEffect=0
+ContrastAmount=0.5
+ContrastEffect=1
+IntensityAmount=0.1
+IntensityEffect=2
+
+[ColorEffects:Inactive]
+ChangeSelectionColor=false
+Color=0,0,0
+ColorAmount=0
+ColorEffect=0
+ContrastAmount=0
+ContrastEffect=0
+Enable=true
+IntensityAmount=0
+IntensityEffect=0"""
+
+
+def rgb(color: str) -> str:
+    """'#rrggbb[aa]' as the 'r,g,b' KDE config files use; alpha is dropped."""
+    parsed = parse_color(color)
+    return f"{parsed.r},{parsed.g},{parsed.b}"
+
+
+def ini(sections: list[tuple[str, dict]]) -> str:
+    """Render [section] blocks of key=value lines, separated by blank lines."""
+    blocks = []
+    for name, values in sections:
+        blocks.append("\n".join([f"[{name}]"] + [f"{key}={value}" for key, value in values.items()]))
+    return "\n\n".join(blocks)
+
+
+def plasma_shades(variant: str, palette: dict) -> dict:
+    """The hand-picked Plasma shades of a variant, or shades mixed from its fg and bg."""
+    if variant in PLASMA_SHADES:
+        return PLASMA_SHADES[variant]
+    fg, bg = parse_color(palette["fg"]), parse_color(palette["bg"])
+    return {name: fg.blend(bg, weight).hex for name, weight in PLASMA_SHADE_WEIGHTS.items()}
+
+
+def konsole(variant: str, palette: dict, terminal: list, data: dict) -> str:
+    """A Konsole .colorscheme: terminal colors 0-7 as normal and faint, 8-15 as intense."""
+    sections = [
+        ("General", {"Description": f"Vira {variant.title()}", "Opacity": 1, "Wallpaper": ""}),
+        ("Background", {"Color": rgb(palette["bg"])}),
+        ("BackgroundIntense", {"Color": rgb(palette["bg"])}),
+        ("Foreground", {"Color": rgb(palette["fg"])}),
+        ("ForegroundIntense", {"Color": rgb(palette["fg"])}),
+    ]
+    sections += [(f"Color{i}", {"Color": rgb(terminal[i])}) for i in range(8)]
+    sections += [(f"Color{i}Intense", {"Color": rgb(terminal[i + 8])}) for i in range(8)]
+    sections += [(f"Color{i}Faint", {"Color": rgb(terminal[i])}) for i in range(8)]
+    return ini(sections)
+
+
+def plasma(variant: str, palette: dict, terminal: list, data: dict) -> str:
+    """A KDE Plasma .colors scheme."""
+    shades = plasma_shades(variant, palette)
+    xml = data.get("xml", {})
+    colors = {**xml.get("inherited_colors", {}), **xml.get("colors", {})}
+    # The editor selection as is, not composited over bg as in the palette
+    selection = colors.get("SELECTION_BACKGROUND", palette["selection"])
+
+    def role(alternate, normal, foreground="fg", inactive="comment"):
+        return {
+            "BackgroundAlternate": rgb(alternate),
+            "BackgroundNormal": rgb(normal),
+            "DecorationFocus": rgb(palette["accent"]),
+            "DecorationHover": rgb(palette["accent"]),
+            "ForegroundActive": rgb(palette["accent"]),
+            "ForegroundInactive": rgb(palette.get(inactive, inactive)),
+            "ForegroundLink": rgb(palette["accent"]),
+            "ForegroundNegative": rgb(palette["error"]),
+            "ForegroundNeutral": rgb(shades.get("neutral", palette["number"])),
+            "ForegroundNormal": rgb(palette[foreground]),
+            "ForegroundPositive": rgb(palette["git_add"]),
+            "ForegroundVisited": rgb(palette["keyword2"]),
+        }
+
+    header = role(shades["alternate"], palette["bg"])
+    sections = [
+        ("Colors:Button", role(shades["button_alt"], shades["button"])),
+        ("Colors:Complementary", role(palette["bg"], palette["bg"])),
+        ("Colors:Header", header),
+        ("Colors:Header][Inactive", header),
+        ("Colors:Selection", role(selection, selection, "selection_fg", shades["selection_inactive"])),
+        ("Colors:Tooltip", role(shades["alternate"], shades["button"])),
+        ("Colors:View", role(shades["alternate"], palette["bg"])),
+        ("Colors:Window", role(shades["alternate"], palette["bg"])),
+        ("General", {
+            "ColorScheme": f"Vira {variant.title()}",
+            "Name": f"Vira {variant.title()}",
+            "TitlebarIsAccentColored": "false",
+            "shadeSortColumn": "true",
+        }),
+        ("KDE", {"contrast": 4}),
+        ("WM", {
+            "activeBackground": rgb(palette["bg"]),
+            "activeBlend": rgb(palette["fg"]),
+            "activeForeground": rgb(palette["fg"]),
+            "inactiveBackground": rgb(palette["bg"]),
+            "inactiveBlend": rgb(palette["comment"]),
+            "inactiveForeground": rgb(palette["comment"]),
+        }),
+    ]
+    return PLASMA_EFFECTS + "\n\n" + ini(sections)
+
+
+# Target name -> (output file of a variant, renderer)
+EXPORTERS = {
+    "konsole": (lambda variant: EXTRAS_DIR / "konsole" / f"Vira {variant.title()}.colorscheme", konsole),
+    "plasma": (lambda variant: EXTRAS_DIR / "plasmacolors" / f"Vira {variant.title()}.colors", plasma),
+}
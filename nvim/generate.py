@@ -2,19 +2,64 @@
 """
 Generate Neovim palette and highlight group files from JetBrains theme data.
 
-Usage: python nvim/generate.py
+Usage: python nvim/generate.py [--seed-cache [DIR]] [--watch [--server ADDR]] [--trace out.json]
+
+Derived variants declared in nvim/variants.json (a base variant, an HSL
+transform of all its colors and palette overrides) are generated alongside
+the built-in ones and listed by vira.variants().
+
+With --watch, changes to jetbrains/original/, the mapping file, the group
+template or the variant recipes re-extract and regenerate the affected
+variants, which are then reloaded in running Neovim instances over RPC.
+
+--trace out.json records per-variant, per-stage spans in the Chrome trace
+event format (see jetbrains/tracing.py).
 """
 
+import argparse
 import json
 import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "jetbrains"))
+
+import artifacts  # noqa: E402
+import extract  # noqa: E402
+import tracing  # noqa: E402
+from color import composite_many, parse_color, transform_many, xterm_256_many  # noqa: E402
+from exporters import EXPORTERS  # noqa: E402
+from highlights import (  # noqa: E402
+    GroupTemplate, compile_highlights, compile_mapping, default_cache_dir, generate_lua_deltas,
+    generate_lua_hashes, generate_lua_highlights, lua_string, seed_snapshots, source_hash, variant_delta
+)
+from watch import find_servers, push_variants, stat_files, wait_for_changes  # noqa: E402
+
 EXTRACTED_DIR = ROOT / "jetbrains" / "extracted"
 MAPPINGS_FILE = ROOT / "nvim" / "mappings" / "jetbrains-to-nvim.json"
 PALETTE_DIR = ROOT / "nvim" / "lua" / "vira" / "palette"
+HIGHLIGHTS_DIR = ROOT / "nvim" / "lua" / "vira" / "highlights"
+DELTAS_DIR = ROOT / "nvim" / "lua" / "vira" / "deltas"
+GROUPS_FILE = ROOT / "nvim" / "lua" / "vira" / "groups" / "init.lua"
+RECIPES_FILE = ROOT / "nvim" / "variants.json"
+DERIVED_FILE = ROOT / "nvim" / "lua" / "vira" / "derived.lua"
+VARIANTS_FILE = ROOT / "nvim" / "lua" / "vira" / "variants.lua"
+
+# Recipe transform -> value that leaves colors unchanged
+TRANSFORMS = {"hue": 0.0, "saturation": 1.0, "lightness": 1.0, "contrast": 1.0}
+
+
+def discover_variants(directory: Path = EXTRACTED_DIR) -> list[str]:
+    """Variants with an extracted {variant}.json in directory, in name order."""
+    return sorted(path.stem for path in directory.glob("*.json"))
 
-VARIANTS = ["carbon", "deepforest", "graphene", "ocean", "palenight", "teal"]
+
+# Variants extracted from original/ and any theme plugin archives
+VARIANTS = discover_variants()
 
 
 def load_json(path: Path) -> dict:
@@ -22,48 +67,16 @@ def load_json(path: Path) -> dict:
         return json.load(f)
 
 
-def normalize_color(color: str) -> str:
-    """Normalize color to 6-digit hex (strip alpha if present)."""
-    if not color or not isinstance(color, str):
-        return color
-    color = color.strip()
-    if not color.startswith("#"):
-        return color
-    # 8-digit hex (#RRGGBBAA) -> 6-digit (#RRGGBB)
-    if len(color) == 9:
-        return color[:7]
-    # 4-digit hex (#RGBA) -> 3-digit (#RGB)
-    if len(color) == 5:
-        return color[:4]
-    return color
-
-
-def blend_with_bg(color: str, bg: str, alpha: float) -> str:
-    """Blend a color with background using alpha."""
-    if not color or not bg:
-        return color
-    try:
-        # Parse hex colors
-        r1 = int(color[1:3], 16)
-        g1 = int(color[3:5], 16)
-        b1 = int(color[5:7], 16)
-        r2 = int(bg[1:3], 16)
-        g2 = int(bg[3:5], 16)
-        b2 = int(bg[5:7], 16)
-        # Blend
-        r = int(r1 * alpha + r2 * (1 - alpha))
-        g = int(g1 * alpha + g2 * (1 - alpha))
-        b = int(b1 * alpha + b2 * (1 - alpha))
-        return f"#{r:02x}{g:02x}{b:02x}"
-    except (ValueError, TypeError):
-        return color
-
-
-def extract_palette(variant_data: dict) -> dict:
-    """Extract a semantic color palette from JetBrains variant data."""
+def palette_entries(variant_data: dict) -> dict:
+    """
+    Every palette key with its color in JetBrains variant data, None where
+    the variant has none; the keys are the same for any variant.
+    """
     xml = variant_data.get("xml", {})
-    colors = xml.get("colors", {})
-    attrs = xml.get("attributes", {})
+    # Own colors over those inherited from the parent scheme chain
+    colors = {**xml.get("inherited_colors", {}), **xml.get("colors", {})}
+    # Effective attribute values with baseAttributes already resolved
+    attrs = xml.get("resolved", xml.get("attributes", {}))
     ui = variant_data.get("json", {}).get("ui", {}).get("*", {})
 
     # Get TEXT attribute for fg/bg base
@@ -248,21 +261,23 @@ def extract_palette(variant_data: dict) -> dict:
         if ft:
             font_types[attr_name] = int(ft)
     palette["_font_types"] = font_types
+    return palette
 
-    # Get base bg for blending
-    base_bg = text.get("BACKGROUND", colors.get("CONSOLE_BACKGROUND_KEY", "#0a0a0a"))
-    base_bg = normalize_color(base_bg)
 
-    # Remove None/empty values and normalize colors
+def extract_palette(variant_data: dict) -> dict:
+    """Extract a semantic color palette from JetBrains variant data."""
+    # Remove None/empty values and normalize colors. Alpha is kept here and
+    # composited for all variants at once by composite_palettes()
     cleaned = {}
-    for k, v in palette.items():
+    for k, v in palette_entries(variant_data).items():
         if v is None or v == "":
             continue
         if k == "_font_types":
             cleaned[k] = v
             continue
-        # Normalize color
-        v = normalize_color(v)
+        color = parse_color(v)
+        if color is not None:
+            v = color.hex
         # Skip empty after normalization
         if not v or v == "#":
             continue
@@ -271,15 +286,99 @@ def extract_palette(variant_data: dict) -> dict:
     return cleaned
 
 
+def composite_palettes(palettes: dict[str, dict]):
+    """
+    Composite alpha-bearing palette colors over their variant's background.
+
+    Colors from every palette are gathered into a single batch and
+    composited in one pass (vectorized when NumPy is installed), so each
+    palette ends up with opaque #rrggbb values only. Palettes are updated
+    in place.
+    """
+    targets = []
+    colors = []
+    backgrounds = []
+
+    for palette in palettes.values():
+        bg = parse_color(palette.get("bg"))
+        if bg is None:
+            continue
+        if not bg.opaque:
+            # A translucent base background has nothing under it but black
+            bg = bg.composite(parse_color("#000000"))
+            palette["bg"] = bg.hex
+        for key, value in palette.items():
+            if key.startswith("_"):
+                continue
+            color = parse_color(value)
+            if color is not None and color.has_alpha:
+                targets.append((palette, key))
+                colors.append(color)
+                backgrounds.append(bg)
+
+    for (palette, key), color in zip(targets, composite_many(colors, backgrounds)):
+        palette[key] = color.hex
+
+
+def cterm_palettes(palettes: dict[str, dict]):
+    """
+    Add xterm-256 fallbacks for every palette color as palette["_cterm"].
+
+    All colors are matched in one batch against the precomputed CIELAB
+    table of the xterm-256 cube and gray ramp (vectorized with NumPy).
+    Run after composite_palettes, so colors are opaque.
+    """
+    targets = []
+    colors = []
+    for palette in palettes.values():
+        palette["_cterm"] = {}
+        for key, value in palette.items():
+            if key.startswith("_"):
+                continue
+            color = parse_color(value)
+            if color is not None:
+                targets.append((palette, key))
+                colors.append(color)
+
+    for (palette, key), index in zip(targets, xterm_256_many(colors)):
+        palette["_cterm"][key] = index
+
+
+def resolve_palettes(variants_data: dict[str, dict],
+                     overrides: dict[str, dict] | None = None) -> dict[str, dict]:
+    """
+    Resolve the palettes of several variants at once.
+
+    Each variant's palette is extracted, composited over its background,
+    given its overrides (from overrides[variant], if any) and matched to
+    xterm-256 colors; compositing and matching are each one batch across
+    all the variants. Returns {variant: palette}.
+    """
+    overrides = overrides or {}
+    with tracing.span("extract palettes", variants=len(variants_data)) as sp:
+        palettes = {variant: extract_palette(data) for variant, data in variants_data.items()}
+        sp.set(colors=sum(len(palette) for palette in palettes.values()))
+    with tracing.span("composite palettes", variants=len(palettes)):
+        composite_palettes(palettes)
+    for variant, palette in palettes.items():
+        palette.update(overrides.get(variant, {}))
+    with tracing.span("cterm palettes", variants=len(palettes)):
+        cterm_palettes(palettes)
+    return palettes
+
+
 def generate_lua_palette(variant: str, palette: dict) -> str:
     """Generate Lua code for a palette."""
     lines = [f"-- Vira {variant.title()} palette", f"-- Auto-generated by generate.py", "", "return {"]
 
-    # Separate font_types from colors
-    font_types = palette.pop("_font_types", {})
+    # Separate font_types and cterm fallbacks from colors
+    font_types = palette.get("_font_types", {})
+    cterm = palette.get("_cterm", {})
 
     # Sort keys for consistent output
     for key in sorted(palette.keys()):
+        if key.startswith("_"):
+            continue
         value = palette[key]
         lines.append(f'  {key} = "{value}",')
 
@@ -292,29 +391,451 @@ def generate_lua_palette(variant: str, palette: dict) -> str:
             lines.append(f'    {attr} = {ft},')
         lines.append("  },")
 
+    # Add xterm-256 fallbacks
+    if cterm:
+        lines.append("")
+        lines.append("  -- Nearest xterm-256 colors, for terminals without termguicolors")
+        lines.append("  _cterm = {")
+        for key, index in sorted(cterm.items()):
+            lines.append(f'    {key} = {index},')
+        lines.append("  },")
+
     lines.append("}")
     return "\n".join(lines)
 
 
-def main():
-    PALETTE_DIR.mkdir(parents=True, exist_ok=True)
+def load_recipes(path: Path) -> dict[str, dict]:
+    """
+    Load and check the derived variant recipes of path, if it exists.
+
+    A recipe maps a new variant name to its base variant, a transform
+    (hue in degrees, saturation/lightness/contrast factors) and palette
+    overrides:
+
+        {"ocean-warm": {"base": "ocean", "transform": {"hue": -20}, "overrides": {"accent": "#ffb86c"}}}
+
+    Returns {name: {"base", "transform", "overrides"}} with every transform
+    filled in; raises ValueError for an invalid recipe.
+    """
+    if not path.exists():
+        return {}
+    palette_keys = {key for key in palette_entries({}) if not key.startswith("_")}
+    recipes = {}
+    for name, recipe in load_json(path).items():
+        if not re.fullmatch(r"[a-z][a-z0-9_-]*", name) or name in VARIANTS:
+            raise ValueError(f"{name!r}: names must be lowercase and not a built-in variant")
+        if recipe.get("base") not in VARIANTS:
+            raise ValueError(f"{name!r}: base must be one of {', '.join(VARIANTS)}")
+        transform = recipe.get("transform", {})
+        unknown = set(transform) - set(TRANSFORMS)
+        if unknown:
+            raise ValueError(f"{name!r}: unknown transform {', '.join(sorted(unknown))}")
+        for key, value in transform.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{name!r}: transform {key} is not a number: {value!r}")
+        overrides = recipe.get("overrides", {})
+        for key, value in overrides.items():
+            if key not in palette_keys:
+                raise ValueError(f"{name!r}: override {key} is not a palette color")
+            if not isinstance(value, str) or parse_color(value) is None:
+                raise ValueError(f"{name!r}: override {key} is not a color: {value!r}")
+        recipes[name] = {
+            "base": recipe["base"],
+            "transform": {**TRANSFORMS, **transform},
+            "overrides": {key: parse_color(value).hex for key, value in overrides.items()},
+        }
+    return recipes
+
+
+def derive_data(data: dict, transform: dict) -> dict:
+    """
+    Apply a recipe transform to every color of a variant's extracted data.
+
+    The distinct colors of the whole document are transformed in one batch
+    (vectorized when NumPy is installed), so palette keys, mapped groups
+    and terminal colors of the derived variant all move together. Returns
+    a new document; data is left untouched.
+    """
+    colors = {}
+
+    def collect(node):
+        if isinstance(node, dict):
+            node = node.values()
+        for value in node:
+            if isinstance(value, (dict, list)):
+                collect(value)
+            elif isinstance(value, str):
+                color = parse_color(value)
+                # Extracted colors are normalized; anything else is not a color
+                if color is not None and color.hex == value:
+                    colors[value] = color
+
+    def rebuild(node):
+        if isinstance(node, dict):
+            return {key: rebuild(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [rebuild(value) for value in node]
+        return mapping.get(node, node) if isinstance(node, str) else node
+
+    collect(data)
+    mapping = {
+        text: color.hex
+        for text, color in zip(colors, transform_many(list(colors.values()), **transform))
+    }
+    return rebuild(data)
+
+
+def generate_lua_derived(recipes: dict[str, dict]) -> str:
+    """Generate Lua code listing the derived variants, for vira.variants()."""
+    lines = [
+        "-- Vira derived variants",
+        "-- Auto-generated by generate.py from variants.json",
+        "",
+        "return {",
+        *(f"  {lua_string(name)}, -- from {recipes[name]['base']}" for name in sorted(recipes)),
+        "}",
+    ]
+    return "\n".join(lines)
+
+
+def generate_lua_variants(variants: list[str]) -> str:
+    """Generate Lua code listing the extracted variants, for vira.variants()."""
+    lines = [
+        "-- Vira variants",
+        "-- Auto-generated by generate.py from jetbrains/extracted/",
+        "",
+        "return {",
+        *(f"  {lua_string(name)}," for name in sorted(variants)),
+        "}",
+    ]
+    return "\n".join(lines)
 
-    for variant in VARIANTS:
+
+def load_variants(variants: list[str]) -> dict[str, dict]:
+    """Load extracted data for the given variants, skipping missing ones."""
+    variants_data = {}
+    for variant in variants:
         variant_file = EXTRACTED_DIR / f"{variant}.json"
         if not variant_file.exists():
             print(f"Warning: {variant_file} not found, skipping")
             continue
+        with tracing.span("read extracted", variant=variant):
+            variants_data[variant] = load_json(variant_file)
+    return variants_data
+
+
+def write_output(path: Path, text: str) -> tuple[Path, bool]:
+    """Write a generated file unless unchanged; returns (path, written)."""
+    with tracing.span("write", file=str(path.relative_to(ROOT)), bytes=len(text)) as sp:
+        written = artifacts.write(path, text + "\n")
+        sp.set(written=written)
+    return path, written
+
+
+def export(target: str, variant: str, palette: dict, terminal: list, data: dict) -> tuple[Path, bool]:
+    """Render and write one variant's file for an extras/ target."""
+    path_of, render = EXPORTERS[target]
+    with tracing.span(f"emit {target}", variant=variant):
+        text = render(variant, palette, terminal, data)
+    path = path_of(variant)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return write_output(path, text)
+
+
+def writer_pool() -> ThreadPoolExecutor:
+    """A pool for generate_variant() to write a variant's files concurrently; use it in a with block."""
+    return ThreadPoolExecutor(max_workers=2 + len(EXPORTERS), thread_name_prefix="vira-write")
+
+
+def generate_variant(variant: str, data: dict, template: GroupTemplate, index: dict,
+                     writers: ThreadPoolExecutor, seed_cache: Path | None = None,
+                     palette: dict | None = None, extras: bool = True) -> tuple[str, dict]:
+    """
+    Write every target of one variant: the Neovim palette and highlight
+    files, and the extras/ exporters.
+
+    palette is the variant's palette from resolve_palettes(), batched with
+    other variants; without it, it is resolved from data alone. It is
+    shared by all targets, whose files are rendered and written
+    concurrently on writers. extras=False skips the extras/ exporters.
+    Returns the source hash of the variant's highlights, for
+    highlights/init.lua, and its compiled tables.
+    """
+    if palette is None:
+        palette = resolve_palettes({variant: data})[variant]
+
+    with tracing.span("emit lua palette", variant=variant):
+        palette_code = generate_lua_palette(variant, palette)
+
+    with tracing.span("compile highlights", variant=variant) as sp:
+        compiled = compile_highlights(template, index, data, palette)
+        sp.set(groups=len(compiled["groups"]))
+    with tracing.span("emit lua highlights", variant=variant):
+        highlights_code = generate_lua_highlights(variant, compiled)
+        hash_ = source_hash(highlights_code)
+
+    writes = [
+        writers.submit(write_output, PALETTE_DIR / f"{variant}.lua", palette_code),
+        writers.submit(write_output, HIGHLIGHTS_DIR / f"{variant}.lua", highlights_code),
+    ]
+    writes += [
+        writers.submit(export, target, variant, palette, compiled["terminal"], data)
+        for target in (EXPORTERS if extras else ())
+    ]
+    for write in writes:
+        path, written = write.result()
+        if written:
+            print(f"Generated {path}")
+
+    if seed_cache:
+        with tracing.span("seed snapshots", variant=variant) as sp:
+            written = seed_snapshots(seed_cache, variant, hash_, compiled)
+            sp.set(written=written)
+        print(f"Seeded {written} snapshot(s) in {seed_cache}")
+
+    return hash_, compiled
+
+
+def write_hashes(hashes: dict[str, str]):
+    """Write the source hashes of every variant's highlights to highlights/init.lua."""
+    output_file, written = write_output(HIGHLIGHTS_DIR / "init.lua", generate_lua_hashes(hashes))
+    if written:
+        print(f"Generated {output_file}")
 
-        data = load_json(variant_file)
-        palette = extract_palette(data)
-        lua_code = generate_lua_palette(variant, palette)
 
-        output_file = PALETTE_DIR / f"{variant}.lua"
-        with open(output_file, "w") as f:
-            f.write(lua_code + "\n")
+def write_deltas(tables: dict[str, dict]):
+    """Write deltas/{variant}.lua, the switch deltas from every other variant, for each variant."""
+    DELTAS_DIR.mkdir(parents=True, exist_ok=True)
+    with tracing.span("variant deltas", variants=len(tables)):
+        for target in sorted(tables):
+            deltas = {
+                source: variant_delta(tables[source], tables[target])
+                for source in tables if source != target
+            }
+            output_file, written = write_output(DELTAS_DIR / f"{target}.lua", generate_lua_deltas(target, deltas))
+            if written:
+                print(f"Generated {output_file}")
+
+
+def write_variants(variants: list[str]):
+    """Write variants.lua, the names of the extracted variants, for vira.variants()."""
+    output_file, written = write_output(VARIANTS_FILE, generate_lua_variants(variants))
+    if written:
+        print(f"Generated {output_file}")
 
+
+def remove_stale(variants: set[str]):
+    """Delete the palette, highlight and delta files of variants not in variants, such as removed recipes."""
+    for directory in (PALETTE_DIR, HIGHLIGHTS_DIR, DELTAS_DIR):
+        for path in directory.glob("*.lua"):
+            if path.stem != "init" and path.stem not in variants:
+                path.unlink()
+                print(f"Removed {path}")
+
+
+def write_derived(recipes: dict[str, dict]):
+    """Write derived.lua, the names of the derived variants, for vira.variants()."""
+    output_file, written = write_output(DERIVED_FILE, generate_lua_derived(recipes))
+    if written:
         print(f"Generated {output_file}")
 
 
+def generate_derived(base: str, data: dict, recipes: dict[str, dict], template: GroupTemplate, index: dict,
+                     writers: ThreadPoolExecutor, hashes: dict[str, str], tables: dict[str, dict],
+                     seed_cache: Path | None = None) -> list[str]:
+    """
+    Write the variants derived from base, given its extracted data.
+
+    Each recipe's transform is applied to the base data offline, and the
+    result goes through the same pipeline as a built-in variant, without
+    extras/; the palettes of base's derived variants are resolved in one
+    batch. Returns the names of the variants written.
+    """
+    derived = {}
+    for name, recipe in sorted(recipes.items()):
+        if recipe["base"] != base:
+            continue
+        with tracing.span("derive variant", variant=name, base=base):
+            derived[name] = derive_data(data, recipe["transform"])
+
+    palettes = resolve_palettes(derived, {name: recipes[name]["overrides"] for name in derived})
+    for name, derived_data in derived.items():
+        hashes[name], tables[name] = generate_variant(
+            name, derived_data, template, index, writers, seed_cache, palettes[name], extras=False
+        )
+    return list(derived)
+
+
+def generate_variants(variants_data: dict[str, dict], template: GroupTemplate, index: dict,
+                      hashes: dict[str, str], tables: dict[str, dict], recipes: dict[str, dict],
+                      seed_cache: Path | None = None) -> list[str]:
+    """
+    Write palette and highlight files for the given variants and the
+    variants derived from them.
+
+    hashes and tables hold the source hash and compiled tables of every
+    variant; entries for the given variants are updated, those of derived
+    variants no longer in recipes dropped with their files, and
+    highlights/init.lua, the switch deltas, variants.lua and derived.lua
+    are rewritten from the whole set. The palettes of the given variants
+    are resolved in one batch. Returns the names of the variants written.
+    """
+    names = []
+    palettes = resolve_palettes(variants_data)
+    with writer_pool() as writers:
+        for variant, data in variants_data.items():
+            hashes[variant], tables[variant] = generate_variant(
+                variant, data, template, index, writers, seed_cache, palettes[variant]
+            )
+            names.append(variant)
+            names += generate_derived(variant, data, recipes, template, index, writers, hashes, tables, seed_cache)
+    for stale in set(hashes) - set(VARIANTS) - set(recipes):
+        del hashes[stale], tables[stale]
+    remove_stale(set(hashes))
+    write_hashes(hashes)
+    write_deltas(tables)
+    write_variants(sorted(set(hashes) - set(recipes)))
+    write_derived(recipes)
+    return names
+
+
+def affected_variants(changes: set[Path]) -> tuple[set[str], set[str]]:
+    """
+    Map changed files to (variants to re-extract, variants to regenerate).
+
+    A variant's own theme files affect only that variant; parent schemes,
+    the mapping file, the group template and the recipes affect all of them.
+    Only variants of original/ are re-extracted; those of theme plugin
+    archives are regenerated from their extracted JSON. Variants derived
+    from a regenerated one are regenerated with it.
+    """
+    originals = [name.lower() for name in extract.VARIANTS]
+    to_extract = set()
+    to_generate = set()
+    for path in changes:
+        if path.parent == extract.SCHEMES_DIR:
+            to_extract.update(originals)
+        elif path.parent == extract.ORIGINAL_DIR:
+            for variant in originals:
+                if path.name.lower() in (f"vira-{variant}.theme.json", f"vira-{variant}.xml"):
+                    to_extract.add(variant)
+        else:
+            to_generate.update(VARIANTS)
+    return to_extract, to_generate | to_extract
+
+
+def watch(args, template: GroupTemplate, index: dict, hashes: dict[str, str], tables: dict[str, dict],
+          recipes: dict[str, dict]):
+    """
+    Rebuild variants as their sources change and reload them in Neovim.
+
+    Extracted JSON is rewritten for changed variants; jetbrains/analysis/ is
+    left to the next extract.py run.
+    """
+    roots = [extract.ORIGINAL_DIR, MAPPINGS_FILE, GROUPS_FILE, RECIPES_FILE]
+    extract_names = {name.lower(): name for name in extract.VARIANTS}
+    state = stat_files(roots)
+    print("\nWatching for changes (Ctrl-C to stop)...")
+
+    while True:
+        changes, state = wait_for_changes(roots, state, args.interval, args.debounce)
+        started = time.perf_counter()
+        to_extract, to_generate = affected_variants(changes)
+        if not to_generate:
+            continue
+
+        try:
+            with tracing.span("rebuild", files=len(changes)):
+                if MAPPINGS_FILE in changes:
+                    index = compile_mapping(load_json(MAPPINGS_FILE))
+                if GROUPS_FILE in changes:
+                    template = GroupTemplate(GROUPS_FILE.read_text())
+                if RECIPES_FILE in changes:
+                    recipes = load_recipes(RECIPES_FILE)
+                if any(path.parent == extract.SCHEMES_DIR for path in changes):
+                    extract.clear_parent_schemes()
+
+                for variant in sorted(to_extract):
+                    print(f"Extracting {extract_names[variant]}...")
+                    _, text = extract.build_variant(extract_names[variant])
+                    extract.write_text(EXTRACTED_DIR / f"{variant}.json", text)
+
+                variants = [variant for variant in VARIANTS if variant in to_generate]
+                variants = generate_variants(load_variants(variants), template, index, hashes, tables, recipes)
+        except Exception as e:
+            # Keep watching; the next save usually fixes it
+            print(f"Rebuild failed: {type(e).__name__}: {e}")
+            artifacts.summary()
+            continue
+
+        # Only reload variants whose Lua output actually changed
+        written, _ = artifacts.summary()
+        written = set(written)
+        variants = [
+            variant for variant in variants
+            if {PALETTE_DIR / f"{variant}.lua", HIGHLIGHTS_DIR / f"{variant}.lua"} & written
+        ]
+        elapsed = (time.perf_counter() - started) * 1000
+        if not variants:
+            print(f"Rebuilt in {elapsed:.0f} ms, output unchanged")
+            continue
+
+        servers = args.server or find_servers()
+        with tracing.span("push", servers=len(servers)):
+            reached = push_variants(servers, variants)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"Rebuilt {', '.join(variants)} in {elapsed:.0f} ms, reloaded {reached} Neovim instance(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Vira Neovim palettes and highlights")
+    parser.add_argument("--seed-cache", nargs="?", const=default_cache_dir(), type=Path, metavar="DIR",
+                        help="pre-seed startup snapshots (default: Neovim's stdpath('cache')/vira)")
+    parser.add_argument("--watch", action="store_true",
+                        help="rebuild on changes to JetBrains sources, mappings or groups and reload Neovim")
+    parser.add_argument("--server", action="append", metavar="ADDR",
+                        help="Neovim --listen address to reload (repeatable; default: all running instances)")
+    parser.add_argument("--interval", type=float, default=0.1, metavar="SECONDS",
+                        help="watch polling interval (default: 0.1)")
+    parser.add_argument("--debounce", type=float, default=0.1, metavar="SECONDS",
+                        help="wait for changes to settle this long before rebuilding (default: 0.1)")
+    parser.add_argument("--trace", type=Path, metavar="FILE",
+                        help="write a Chrome trace of the run to FILE")
+    args = parser.parse_args()
+
+    PALETTE_DIR.mkdir(parents=True, exist_ok=True)
+    HIGHLIGHTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    if args.trace:
+        tracing.enable()
+    try:
+        with tracing.span("generate.py"):
+            # Load the mapping and group template once for all variants
+            with tracing.span("compile mapping") as sp:
+                index = compile_mapping(load_json(MAPPINGS_FILE))
+                sp.set(colors=len(index["colors"]), attributes=len(index["attributes"]))
+            with tracing.span("load group template"):
+                template = GroupTemplate(GROUPS_FILE.read_text())
+
+            try:
+                recipes = load_recipes(RECIPES_FILE)
+            except ValueError as e:
+                sys.exit(f"Invalid recipe in {RECIPES_FILE.name}: {e}")
+
+            hashes = {}
+            tables = {}
+            generate_variants(load_variants(VARIANTS), template, index, hashes, tables, recipes, args.seed_cache)
+        artifacts.report()
+
+        if args.watch:
+            watch(args, template, index, hashes, tables, recipes)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.trace:
+            tracing.save(args.trace)
+            print(f"Trace written to {args.trace}")
+
+
 if __name__ == "__main__":
     main()
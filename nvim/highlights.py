@@ -0,0 +1,852 @@
+"""
+Highlight table compiler for generate.py.
+
+Two sources are combined into fully resolved per-variant highlight tables:
+
+- nvim/lua/vira/groups/init.lua, the hand-tuned group template. Its M.get()
+  and M.terminal_colors() are evaluated here against each palette, using a
+  small interpreter for the subset of Lua the template is written in.
+- nvim/mappings/jetbrains-to-nvim.json, compiled once into an index of
+  JetBrains color/attribute -> Neovim group targets. It supplies every group
+  the template does not define (language-specific captures, terminal and
+  debugger groups, ...).
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from color import composite_many, parse_color, xterm_256_many
+
+
+# ---------------------------------------------------------------------------
+# Mapping compiler
+# ---------------------------------------------------------------------------
+
+# Properties read from an attribute when its mapping entry lists none
+DEFAULT_PROPERTIES = ["FOREGROUND", "FONT_TYPE"]
+
+# Field assumed for an xml.colors target without an explicit ":field"
+DEFAULT_COLOR_FIELD = "fg"
+
+
+def compile_rules(meta: dict) -> dict:
+    """
+    Compile the _meta.notes.special_values rules of the mapping file.
+
+    Returns {"colors": {PROPERTY: field}, "font": {bit: field},
+    "effect": {EFFECT_TYPE: field}}, e.g. FOREGROUND -> fg, bit 1 of
+    FONT_TYPE -> bold, EFFECT_TYPE 2 -> undercurl.
+    """
+    rules = {"colors": {}, "font": {}, "effect": {}}
+    special = meta.get("notes", {}).get("special_values", {})
+
+    for field, text in special.items():
+        if m := re.fullmatch(r"Use (\w+) from attribute", text):
+            rules["colors"][m[1]] = field
+        elif m := re.fullmatch(r"FONT_TYPE contains (\d+)", text):
+            rules["font"][int(m[1])] = field
+        elif m := re.fullmatch(r"EFFECT_TYPE (\d+)", text):
+            rules["effect"][m[1]] = field
+        else:
+            raise ValueError(f"Unrecognized mapping rule for {field!r}: {text!r}")
+
+    return rules
+
+
+def parse_target(target: str) -> tuple[str, str | None]:
+    """Split "Group:field" into (group, field); field is None if absent."""
+    group, _, field = target.partition(":")
+    return group, field or None
+
+
+def compile_mapping(mapping: dict) -> dict:
+    """
+    Compile the JetBrains -> Neovim mapping into an indexed form.
+
+    Returns:
+        {
+          "rules": compile_rules(_meta),
+          "colors": {XML_COLOR: [(group, field, rank), ...]},
+          "attributes": {ATTR: {"targets": [(group, field, rank), ...],
+                                "properties": [...], "inherits": str | None}}
+        }
+
+    rank orders competing sources for the same group field: primary
+    targets (first in their list) before aliases, then document order.
+    """
+    rules = compile_rules(mapping.get("_meta", {}))
+    colors = {}
+    attributes = {}
+    order = 0
+
+    for category, entries in mapping.get("xml.colors", {}).items():
+        if category.startswith("_"):
+            continue
+        for key, targets in entries.items():
+            compiled = colors.setdefault(key, [])
+            for i, target in enumerate(targets):
+                group, field = parse_target(target)
+                compiled.append((group, field or DEFAULT_COLOR_FIELD, (i > 0, order)))
+                order += 1
+
+    for category, entries in mapping.get("xml.attributes", {}).items():
+        if category.startswith("_"):
+            continue
+        for key, entry in entries.items():
+            targets = []
+            for i, target in enumerate(entry["nvim"]):
+                group, field = parse_target(target)
+                targets.append((group, field, (i > 0, order)))
+                order += 1
+            attributes[key] = {
+                "targets": targets,
+                "properties": entry.get("properties"),
+                "inherits": entry.get("inherits")
+            }
+
+    # Entries without properties use those of the entry they inherit from
+    for entry in attributes.values():
+        if entry["properties"] is None:
+            parent = attributes.get(entry["inherits"], {})
+            entry["properties"] = parent.get("properties") or DEFAULT_PROPERTIES
+
+    return {"rules": rules, "colors": colors, "attributes": attributes}
+
+
+def attribute_fields(attr: dict, properties: list[str], rules: dict) -> dict:
+    """Translate resolved attribute values into highlight fields."""
+    fields = {}
+    for prop in properties:
+        if prop in rules["colors"]:
+            value = attr.get(prop)
+            if value:
+                fields[rules["colors"][prop]] = value
+        elif prop == "FONT_TYPE":
+            try:
+                font_type = int(attr.get("FONT_TYPE", 0))
+            except ValueError:
+                continue
+            for bit, field in rules["font"].items():
+                if font_type & bit:
+                    fields[field] = True
+
+    # Effect styles go with the effect color
+    if "EFFECT_COLOR" in properties:
+        effect = rules["effect"].get(attr.get("EFFECT_TYPE"))
+        if effect:
+            fields[effect] = True
+
+    return fields
+
+
+def mapped_groups(index: dict, variant_data: dict, palette: dict, opts: dict) -> dict:
+    """
+    Resolve the compiled mapping against one variant's extracted data.
+
+    Returns {group: fields}. Colors with alpha are composited over the
+    palette background; with opts.transparent, backgrounds equal to the
+    palette background become "NONE" as in the template.
+    """
+    xml = variant_data.get("xml", {})
+    colors = {**xml.get("inherited_colors", {}), **xml.get("colors", {})}
+    resolved = xml.get("resolved", xml.get("attributes", {}))
+    rules = index["rules"]
+
+    # (group, field) -> (rank, value)
+    best = {}
+
+    def offer(group, field, rank, value):
+        current = best.get((group, field))
+        if current is None or rank < current[0]:
+            best[(group, field)] = (rank, value)
+
+    for key, targets in index["colors"].items():
+        value = colors.get(key)
+        if not value:
+            continue
+        for group, field, rank in targets:
+            offer(group, field, rank, value)
+
+    for key, entry in index["attributes"].items():
+        attr = resolved.get(key) or {}
+        if entry["inherits"]:
+            attr = {**resolved.get(entry["inherits"], {}), **attr}
+        fields = attribute_fields(attr, entry["properties"], rules)
+        for group, field, rank in entry["targets"]:
+            if field is None:
+                for name, value in fields.items():
+                    offer(group, name, rank, value)
+            elif field in fields:
+                offer(group, field, rank, fields[field])
+
+    groups = {}
+    for (group, field), (_, value) in sorted(best.items(), key=lambda item: item[1][0]):
+        groups.setdefault(group, {})[field] = value
+
+    # Composite translucent colors over the background in one batch
+    bg = parse_color(palette.get("bg"))
+    if bg is not None:
+        targets = []
+        pending = []
+        for group, fields in groups.items():
+            for field, value in fields.items():
+                color = parse_color(value) if isinstance(value, str) else None
+                if color is not None and color.has_alpha:
+                    targets.append((fields, field))
+                    pending.append(color)
+        for (fields, field), color in zip(targets, composite_many(pending, [bg] * len(pending))):
+            fields[field] = color.hex
+
+    if opts.get("transparent"):
+        for fields in groups.values():
+            if fields.get("bg") == palette.get("bg"):
+                fields["bg"] = "NONE"
+
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Lua template interpreter
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"""
+    (?P<skip>\s+|--[^\n]*)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+  | (?P<number>\d+(?:\.\d+)?)
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<op>==|~=|[{}()\[\]=,.;])
+""", re.VERBOSE)
+
+_KEYWORDS = {"and", "or", "not", "nil", "true", "false", "local", "function", "return", "end"}
+
+_ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"', "'": "'"}
+
+
+def tokenize(source: str) -> list[tuple[str, str, int]]:
+    """Split Lua source into (kind, text, line) tokens."""
+    tokens = []
+    pos = 0
+    line = 1
+    while pos < len(source):
+        m = _TOKEN_RE.match(source, pos)
+        if not m:
+            raise SyntaxError(f"line {line}: unsupported Lua syntax near {source[pos:pos + 20]!r}")
+        kind = m.lastgroup
+        text = m.group()
+        if kind != "skip":
+            if kind == "name" and text in _KEYWORDS:
+                kind = "keyword"
+            tokens.append((kind, text, line))
+        line += text.count("\n")
+        pos = m.end()
+    tokens.append(("eof", "", line))
+    return tokens
+
+
+class LuaFunction:
+    """A function defined in the template."""
+
+    def __init__(self, params: list[str], body: list):
+        self.params = params
+        self.body = body
+
+    def __call__(self, env: dict, *args):
+        scope = dict(env)
+        for i, name in enumerate(self.params):
+            scope[name] = args[i] if i < len(args) else None
+        return run_block(self.body, scope)
+
+
+class _Parser:
+    """Recursive-descent parser for the Lua subset used by groups/init.lua."""
+
+    def __init__(self, source: str):
+        self.tokens = tokenize(source)
+        self.pos = 0
+
+    def peek(self, offset=0):
+        return self.tokens[self.pos + offset]
+
+    def next(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def accept(self, text):
+        if self.peek()[1] == text and self.peek()[0] in ("op", "keyword"):
+            return self.next()
+        return None
+
+    def expect(self, text):
+        token = self.next()
+        if token[1] != text or token[0] not in ("op", "keyword"):
+            raise SyntaxError(f"line {token[2]}: expected {text!r}, got {token[1]!r}")
+        return token
+
+    def name(self):
+        token = self.next()
+        if token[0] != "name":
+            raise SyntaxError(f"line {token[2]}: expected a name, got {token[1]!r}")
+        return token[1]
+
+    def block(self, terminators):
+        stats = []
+        while self.peek()[1] not in terminators or self.peek()[0] == "string":
+            stats.append(self.statement())
+        return stats
+
+    def statement(self):
+        if self.accept("local"):
+            name = self.name()
+            self.expect("=")
+            return ("assign", [name], self.expr())
+        if self.accept("function"):
+            path = [self.name()]
+            while self.accept("."):
+                path.append(self.name())
+            self.expect("(")
+            params = []
+            if not self.accept(")"):
+                params.append(self.name())
+                while self.accept(","):
+                    params.append(self.name())
+                self.expect(")")
+            body = self.block({"end"})
+            self.expect("end")
+            return ("assign", path, ("function", params, body))
+        if self.accept("return"):
+            return ("return", self.expr())
+        path = [self.name()]
+        while self.accept("."):
+            path.append(self.name())
+        self.expect("=")
+        return ("assign", path, self.expr())
+
+    def expr(self):
+        left = self.and_expr()
+        while self.accept("or"):
+            left = ("or", left, self.and_expr())
+        return left
+
+    def and_expr(self):
+        left = self.compare_expr()
+        while self.accept("and"):
+            left = ("and", left, self.compare_expr())
+        return left
+
+    def compare_expr(self):
+        left = self.unary_expr()
+        while self.peek()[1] in ("==", "~="):
+            op = self.next()[1]
+            left = (op, left, self.unary_expr())
+        return left
+
+    def unary_expr(self):
+        if self.accept("not"):
+            return ("not", self.unary_expr())
+        return self.primary()
+
+    def primary(self):
+        kind, text, line = self.next()
+        if kind == "string":
+            node = ("const", re.sub(r"\\(.)", lambda m: _ESCAPES.get(m[1], m[1]), text[1:-1]))
+        elif kind == "number":
+            node = ("const", float(text) if "." in text else int(text))
+        elif kind == "keyword" and text in ("nil", "true", "false"):
+            node = ("const", {"nil": None, "true": True, "false": False}[text])
+        elif kind == "name":
+            node = ("var", text)
+        elif text == "(":
+            node = self.expr()
+            self.expect(")")
+        elif text == "{":
+            node = self.table()
+        else:
+            raise SyntaxError(f"line {line}: unexpected {text!r}")
+
+        # Suffixes: field access and calls
+        while True:
+            if self.accept("."):
+                node = ("index", node, ("const", self.name()))
+            elif self.peek()[1] == "(" and self.peek()[0] == "op":
+                self.next()
+                args = []
+                if not self.accept(")"):
+                    args.append(self.expr())
+                    while self.accept(","):
+                        args.append(self.expr())
+                    self.expect(")")
+                node = ("call", node, args)
+            else:
+                return node
+
+    def table(self):
+        fields = []
+        position = 1
+        while not self.accept("}"):
+            if self.accept("["):
+                key = self.expr()
+                self.expect("]")
+                self.expect("=")
+                fields.append((key, self.expr()))
+            elif self.peek()[0] == "name" and self.peek(1)[1] == "=":
+                key = ("const", self.name())
+                self.expect("=")
+                fields.append((key, self.expr()))
+            else:
+                fields.append((("const", position), self.expr()))
+                position += 1
+            if not (self.accept(",") or self.accept(";")):
+                self.expect("}")
+                break
+        return ("table", fields)
+
+
+def truthy(value) -> bool:
+    """Lua truthiness: only nil and false are false."""
+    return value is not None and value is not False
+
+
+def tbl_extend(behavior: str, *tables) -> dict:
+    """vim.tbl_extend for the "force" and "keep" behaviors."""
+    result = {}
+    for table in tables:
+        for key, value in table.items():
+            if behavior == "force" or key not in result:
+                result[key] = value
+    return result
+
+
+def evaluate(node, scope: dict):
+    """Evaluate an expression node."""
+    op = node[0]
+    if op == "const":
+        return node[1]
+    if op == "var":
+        return scope.get(node[1])
+    if op == "or":
+        left = evaluate(node[1], scope)
+        return left if truthy(left) else evaluate(node[2], scope)
+    if op == "and":
+        left = evaluate(node[1], scope)
+        return evaluate(node[2], scope) if truthy(left) else left
+    if op == "not":
+        return not truthy(evaluate(node[1], scope))
+    if op == "==":
+        return evaluate(node[1], scope) == evaluate(node[2], scope)
+    if op == "~=":
+        return evaluate(node[1], scope) != evaluate(node[2], scope)
+    if op == "index":
+        target = evaluate(node[1], scope)
+        if not isinstance(target, dict):
+            raise TypeError(f"attempt to index a {type(target).__name__} value")
+        return target.get(evaluate(node[2], scope))
+    if op == "table":
+        table = {}
+        for key_node, value_node in node[1]:
+            value = evaluate(value_node, scope)
+            if value is not None:
+                table[evaluate(key_node, scope)] = value
+        return table
+    if op == "call":
+        func = evaluate(node[1], scope)
+        args = [evaluate(arg, scope) for arg in node[2]]
+        if isinstance(func, LuaFunction):
+            return func(scope, *args)
+        return func(*args)
+    if op == "function":
+        return LuaFunction(node[1], node[2])
+    raise ValueError(f"unknown node {op!r}")
+
+
+def run_block(stats: list, scope: dict):
+    """Run statements; returns the value of a return statement, if any."""
+    for stat in stats:
+        if stat[0] == "return":
+            return evaluate(stat[1], scope)
+        _, path, value_node = stat
+        value = evaluate(value_node, scope)
+        if len(path) == 1:
+            scope[path[0]] = value
+        else:
+            target = scope[path[0]]
+            for name in path[1:-1]:
+                target = target[name]
+            target[path[-1]] = value
+    return None
+
+
+class GroupTemplate:
+    """groups/init.lua, loaded once and evaluated per palette."""
+
+    def __init__(self, source: str):
+        self.env = {"vim": {"tbl_extend": tbl_extend}}
+        self.module = run_block(_Parser(source).block({""}), self.env)
+        if not isinstance(self.module, dict):
+            raise ValueError("group template must return its module table")
+
+    def get(self, palette: dict, opts: dict) -> dict:
+        """Evaluate M.get(palette, opts)."""
+        return self.module["get"](self.env, palette, opts)
+
+    def terminal_colors(self, palette: dict) -> list:
+        """Evaluate M.terminal_colors(palette), as a 16-entry list."""
+        colors = self.module["terminal_colors"](self.env, palette)
+        return [colors.get(i) for i in range(1, 17)]
+
+
+# ---------------------------------------------------------------------------
+# Compiled tables
+# ---------------------------------------------------------------------------
+
+# Option sets the compiled tables carry overrides for, relative to defaults
+DEFAULT_OPTS = {"transparent": False, "italic_comments": True}
+OPTION_OVERRIDES = {
+    "transparent": {"transparent": True},
+    "no_italic_comments": {"italic_comments": False},
+}
+
+
+def add_cterm(groups: dict):
+    """Add ctermfg/ctermbg next to each group's fg/bg, matched in one batch."""
+    targets = []
+    colors = []
+    for spec in groups.values():
+        for field, cterm_field in (("fg", "ctermfg"), ("bg", "ctermbg")):
+            value = spec.get(field)
+            if value == "NONE":
+                spec[cterm_field] = "NONE"
+                continue
+            color = parse_color(value) if isinstance(value, str) else None
+            if color is not None:
+                targets.append((spec, cterm_field))
+                colors.append(color)
+
+    for (spec, cterm_field), index in zip(targets, xterm_256_many(colors)):
+        spec[cterm_field] = index
+
+
+def build_groups(template: GroupTemplate, index: dict, variant_data: dict,
+                 palette: dict, opts: dict) -> dict:
+    """
+    Template groups, plus mapped groups for everything the template leaves
+    out, with xterm-256 fallbacks for their colors.
+    """
+    groups = template.get(palette, opts)
+    for group, fields in mapped_groups(index, variant_data, palette, opts).items():
+        groups.setdefault(group, fields)
+    add_cterm(groups)
+    return groups
+
+
+def compile_highlights(template: GroupTemplate, index: dict, variant_data: dict, palette: dict) -> dict:
+    """
+    Compile a variant's final highlight tables.
+
+    Returns {"groups": ..., "terminal": [...], <override>: {...}}, where each
+    override holds only the groups that differ from "groups" when that
+    option is set. Overrides touch disjoint groups, so any combination can be
+    applied on top of "groups"; this is checked here.
+    """
+    base = build_groups(template, index, variant_data, palette, DEFAULT_OPTS)
+    compiled = {"groups": base, "terminal": template.terminal_colors(palette)}
+
+    for name, change in OPTION_OVERRIDES.items():
+        groups = build_groups(template, index, variant_data, palette, {**DEFAULT_OPTS, **change})
+        compiled[name] = {group: spec for group, spec in groups.items() if base.get(group) != spec}
+
+    combined_opts = dict(DEFAULT_OPTS)
+    merged = dict(base)
+    for name, change in OPTION_OVERRIDES.items():
+        combined_opts.update(change)
+        merged.update(compiled[name])
+    if build_groups(template, index, variant_data, palette, combined_opts) != merged:
+        raise ValueError("option overrides overlap; they cannot be applied independently")
+
+    return compiled
+
+
+# Plugin -> names or name prefixes of the groups only that plugin uses. They
+# are emitted apart from the core groups and applied when the plugin loads;
+# keys must match M.modules in lua/vira/lazy.lua.
+PLUGINS = {
+    "cmp": ("Cmp",),
+    "dap": ("Dap",),
+    "flash": ("Flash",),
+    "gitsigns": ("GitSigns",),
+    "headlines": ("Headline", "CodeBlock", "Dash", "Quote"),
+    "ibl": ("Ibl", "IndentBlankline"),
+    "illuminate": ("Illuminated",),
+    "lazy": ("Lazy",),
+    "leap": ("Leap",),
+    "mason": ("Mason",),
+    "mini": ("Mini",),
+    "navic": ("Navic",),
+    "neo-tree": ("NeoTree",),
+    "noice": ("Noice",),
+    "notify": ("Notify",),
+    "nvim-tree": ("NvimTree",),
+    "rainbow-delimiters": ("RainbowDelimiter",),
+    "telescope": ("Telescope",),
+    "trouble": ("Trouble",),
+    "which-key": ("WhichKey",),
+}
+
+
+def plugin_of(group: str) -> str | None:
+    """The plugin a group belongs to, or None for core groups."""
+    for plugin, prefixes in PLUGINS.items():
+        if group.startswith(prefixes):
+            return plugin
+    return None
+
+
+def split_plugins(groups: dict) -> tuple[dict, dict[str, dict]]:
+    """Split groups into (core groups, {plugin: groups})."""
+    core = {}
+    plugins = {}
+    for group, spec in groups.items():
+        plugin = plugin_of(group)
+        if plugin is None:
+            core[group] = spec
+        else:
+            plugins.setdefault(plugin, {})[group] = spec
+    return core, plugins
+
+
+def variant_delta(source: dict, target: dict) -> dict:
+    """
+    What changes when switching from one variant's compiled tables to another's.
+
+    Returns {"groups": [...], "terminal": [...]}: names of the base groups
+    whose spec differs (or that only the source has), and 0-based indices
+    of the terminal colors that differ. Option overrides are not included;
+    vira.switch adds the groups they touch in either variant.
+    """
+    old, new = source["groups"], target["groups"]
+    groups = sorted(name for name in old.keys() | new.keys() if old.get(name) != new.get(name))
+    terminal = [i for i, (a, b) in enumerate(zip(source["terminal"], target["terminal"])) if a != b]
+    return {"groups": groups, "terminal": terminal}
+
+
+_LUA_NAME_RE = re.compile(r"[A-Za-z_]\w*")
+
+# Field order in emitted group specs; other fields follow alphabetically
+_FIELD_ORDER = ["link", "fg", "bg", "sp"]
+
+
+def lua_key(key: str) -> str:
+    """Format a table key, quoting it when it is not a plain identifier."""
+    if _LUA_NAME_RE.fullmatch(key) and key not in _KEYWORDS:
+        return key
+    return "[" + lua_string(key) + "]"
+
+
+def lua_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def lua_value(value) -> str:
+    """Format a scalar or group spec as a Lua literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return lua_string(value)
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        keys = sorted(value, key=lambda k: (_FIELD_ORDER.index(k) if k in _FIELD_ORDER else len(_FIELD_ORDER), k))
+        return "{ " + ", ".join(f"{lua_key(k)} = {lua_value(value[k])}" for k in keys) + " }"
+    raise TypeError(f"cannot emit {type(value).__name__} as Lua")
+
+
+def lua_groups(groups: dict, indent: str = "    ") -> list[str]:
+    """Lines of a group table body, sorted by group name."""
+    return [f"{indent}{lua_key(name)} = {lua_value(groups[name])}," for name in sorted(groups)]
+
+
+def lua_split_groups(groups: dict, indent: str) -> list[str]:
+    """Lines of groups = {...} and plugins = { plugin = {...} } fields for a group table."""
+    core, plugins = split_plugins(groups)
+    lines = [f"{indent}groups = {{", *lua_groups(core, indent + "  "), f"{indent}}},"]
+    lines.append(f"{indent}plugins = {{")
+    for plugin in sorted(plugins):
+        lines += [
+            f"{indent}  {lua_key(plugin)} = {{",
+            *lua_groups(plugins[plugin], indent + "    "),
+            f"{indent}  }},",
+        ]
+    lines.append(f"{indent}}},")
+    return lines
+
+
+def generate_lua_highlights(variant: str, compiled: dict) -> str:
+    """
+    Generate Lua code for a variant's compiled highlight tables.
+
+    Core groups and the groups of each plugin in PLUGINS are kept apart,
+    so that vira.lazy can apply a plugin's groups only once it loads.
+    """
+    lines = [
+        f"-- Vira {variant.title()} highlights",
+        "-- Auto-generated by generate.py from groups/init.lua and mappings/jetbrains-to-nvim.json",
+        "",
+        "return {",
+        "  -- Core groups, and per-plugin groups applied when the plugin loads",
+        *lua_split_groups(compiled["groups"], "  "),
+        "",
+        "  -- Terminal colors 0-15",
+        "  terminal = {",
+        *(f"    {lua_value(color) if color else 'nil'}," for color in compiled["terminal"]),
+        "  },",
+    ]
+    for name in OPTION_OVERRIDES:
+        lines += [
+            "",
+            f"  -- Overrides applied on top of groups with {name.replace('_', ' ')}",
+            f"  {name} = {{",
+            *lua_split_groups(compiled[name], "    "),
+            "  },",
+        ]
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def generate_lua_deltas(variant: str, deltas: dict[str, dict]) -> str:
+    """Generate Lua code for the deltas from every other variant to this one."""
+    lines = [
+        f"-- Vira deltas to {variant.title()}",
+        "-- Auto-generated by generate.py; groups and terminal colors vira.switch sets",
+        "-- when switching to this variant from each other one",
+        "",
+        "return {",
+    ]
+    for source in sorted(deltas):
+        delta = deltas[source]
+        lines += [f"  {lua_key(source)} = {{", "    groups = {"]
+        # Several names per line; these lists run to hundreds of entries
+        line = ""
+        for name in delta["groups"]:
+            item = lua_string(name) + ","
+            if line and len(line) + 1 + len(item) > 100:
+                lines.append(line)
+                line = ""
+            line = f"{line} {item}" if line else f"      {item}"
+        if line:
+            lines.append(line)
+        lines += [
+            "    },",
+            f"    terminal = {{ {', '.join(str(i) for i in delta['terminal'])} }},",
+            "  },",
+        ]
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def generate_lua_hashes(hashes: dict[str, str]) -> str:
+    """Generate Lua code for the source hashes snapshots are keyed by."""
+    lines = [
+        "-- Vira highlight source hashes",
+        "-- Auto-generated by generate.py; keys the startup snapshots of vira.snapshot",
+        "",
+        "return {",
+        *(f"  {lua_key(variant)} = {lua_string(hashes[variant])}," for variant in sorted(hashes)),
+        "}",
+    ]
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+def source_hash(lua_code: str) -> str:
+    """Hash of a variant's generated highlights, as recorded in vira.highlights."""
+    return hashlib.sha256(lua_code.encode()).hexdigest()
+
+
+def default_cache_dir() -> Path:
+    """Neovim's stdpath("cache")/vira."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / os.environ.get("NVIM_APPNAME", "nvim") / "vira"
+
+
+def option_flags(opts: dict) -> str:
+    """Option flags as encoded in snapshot keys by snapshot.lua."""
+    return ("1" if opts.get("transparent") else "0") + ("0" if opts.get("italic_comments") is False else "1")
+
+
+def snapshot_path(cache_dir: Path, variant: str, hash_: str, flags: str) -> Path:
+    """Snapshot path without extension; must match snapshot_path() in snapshot.lua."""
+    key = hashlib.sha256(f"{variant}:{hash_}:{flags}".encode()).hexdigest()
+    return cache_dir / f"{variant}-{key[:16]}"
+
+
+def generate_lua_snapshot(variant: str, compiled: dict, opts: dict) -> str:
+    """
+    Generate a snapshot chunk for opts.
+
+    The chunk applies a variant's core groups and terminal colors, and
+    returns a function per plugin applying that plugin's groups.
+    """
+    groups = dict(compiled["groups"])
+    for name, change in OPTION_OVERRIDES.items():
+        if all(opts.get(k, DEFAULT_OPTS[k]) == v for k, v in change.items()):
+            groups.update(compiled[name])
+    core, plugins = split_plugins(groups)
+
+    lines = [
+        f"-- Vira {variant.title()} snapshot (transparent={str(bool(opts.get('transparent'))).lower()}, "
+        f"italic_comments={str(opts.get('italic_comments') is not False).lower()})",
+        "local hl = vim.api.nvim_set_hl",
+        *(f"hl(0, {lua_string(name)}, {lua_value(core[name])})" for name in sorted(core)),
+    ]
+    for i, color in enumerate(compiled["terminal"]):
+        if not color:
+            break
+        lines.append(f"vim.g.terminal_color_{i} = {lua_string(color)}")
+
+    lines.append("return {")
+    for plugin in sorted(plugins):
+        lines.append(f"  {lua_key(plugin)} = function()")
+        lines += [f"    hl(0, {lua_string(name)}, {lua_value(spec)})" for name, spec in sorted(plugins[plugin].items())]
+        lines.append("  end,")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def seed_snapshots(cache_dir: Path, variant: str, hash_: str, compiled: dict) -> int:
+    """
+    Write source snapshots for every option set of a variant.
+
+    snapshot.lua converts them to bytecode on first load. Existing
+    snapshots for the same key are kept; stale ones for the variant are
+    removed. Returns the number of snapshots written.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    keep = set()
+    written = 0
+
+    for transparent in (False, True):
+        for italic_comments in (False, True):
+            opts = {"transparent": transparent, "italic_comments": italic_comments}
+            path = snapshot_path(cache_dir, variant, hash_, option_flags(opts))
+            keep.add(path.name)
+            if path.with_suffix(".luac").exists() or path.with_suffix(".lua").exists():
+                continue
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(generate_lua_snapshot(variant, compiled, opts) + "\n")
+            os.replace(tmp, path.with_suffix(".lua"))
+            written += 1
+
+    # Exact names only: "ocean-*" would also match the derived "ocean-warm-*"
+    own = re.compile(rf"{re.escape(variant)}-[0-9a-f]{{16}}\.luac?")
+    for file in cache_dir.iterdir():
+        if own.fullmatch(file.name) and file.name.split(".")[0] not in keep:
+            file.unlink()
+
+    return written
@@ -0,0 +1,343 @@
+-- Vira deltas to Teal
+-- Auto-generated by generate.py; groups and terminal colors vira.switch sets
+-- when switching to this variant from each other one
+
+return {
+  carbon = {
+    groups = {
+      "@attribute", "@boolean.json", "@boolean.toml", "@character.special",
+      "@character.special.regexp", "@comment.bash", "@comment.error", "@comment.go",
+      "@comment.note", "@comment.warning", "@constant.builtin", "@constant.builtin.go",
+      "@constant.css", "@constant.kotlin", "@constructor", "@function.builtin",
+      "@function.builtin.go", "@function.call", "@function.call.bash", "@function.call.kotlin",
+      "@function.css", "@function.go", "@function.javascript", "@function.kotlin",
+      "@function.method", "@function.method.call", "@function.method.javascript", "@keyword.bash",
+      "@keyword.conditional.ternary", "@keyword.coroutine", "@keyword.css",
+      "@keyword.directive.bash", "@keyword.modifier", "@keyword.operator", "@keyword.regexp",
+      "@keyword.return", "@label", "@label.json", "@label.yaml", "@lsp.type.interface",
+      "@lsp.type.typeParameter", "@lsp.typemod.function.declaration",
+      "@lsp.typemod.function.defaultLibrary", "@markup.environment", "@markup.heading",
+      "@markup.heading.1", "@markup.heading.2", "@markup.heading.3", "@markup.heading.4",
+      "@markup.heading.5", "@markup.heading.6", "@markup.link.label", "@markup.link.url",
+      "@markup.list", "@markup.list.checked", "@markup.list.unchecked", "@markup.math",
+      "@markup.quote", "@markup.raw", "@markup.raw.block", "@module", "@module.go", "@namespace",
+      "@none", "@number.css", "@property", "@property.css", "@property.json", "@property.yaml",
+      "@punctuation.bracket", "@punctuation.bracket.kotlin", "@punctuation.bracket.regexp",
+      "@punctuation.delimiter", "@punctuation.special", "@punctuation.special.javascript",
+      "@punctuation.special.markdown", "@rainbow.blue", "@rainbow.cyan", "@rainbow.green",
+      "@rainbow.orange", "@rainbow.red", "@rainbow.violet", "@rainbow.yellow", "@string.css",
+      "@string.documentation", "@string.escape", "@string.escape.regexp", "@string.regexp",
+      "@string.regexp.javascript", "@string.special", "@string.special.path",
+      "@string.special.symbol", "@string.special.url.css", "@string.yaml", "@tag", "@tag.attribute",
+      "@tag.attribute.css", "@tag.builtin", "@tag.css", "@tag.delimiter", "@tag.javascript",
+      "@type.builtin", "@type.builtin.go", "@type.css", "@type.definition", "@type.go",
+      "@type.javascript", "@type.kotlin", "@type.qualifier", "@variable", "@variable.builtin",
+      "@variable.builtin.go", "@variable.css", "@variable.go", "@variable.javascript",
+      "@variable.kotlin", "@variable.member", "@variable.parameter", "@variable.parameter.go",
+      "@variable.parameter.kotlin", "Added", "BookmarkSign", "Boolean", "Changed", "Character",
+      "CmpItemAbbr", "CmpItemAbbrDeprecated", "CmpItemKind", "CmpItemKindClass", "CmpItemKindColor",
+      "CmpItemKindConstant", "CmpItemKindConstructor", "CmpItemKindEnum", "CmpItemKindEnumMember",
+      "CmpItemKindEvent", "CmpItemKindField", "CmpItemKindFile", "CmpItemKindFunction",
+      "CmpItemKindInterface", "CmpItemKindKeyword", "CmpItemKindMethod", "CmpItemKindModule",
+      "CmpItemKindOperator", "CmpItemKindProperty", "CmpItemKindReference", "CmpItemKindStruct",
+      "CmpItemKindText", "CmpItemKindTypeParameter", "CmpItemKindUnit", "CmpItemKindValue",
+      "CmpItemKindVariable", "CmpItemMenu", "CodeBlock", "ColorColumn", "Comment", "Constant",
+      "Cursor", "CursorLine", "CursorLineNr", "DapBreakpoint", "DapBreakpointCondition",
+      "DapBreakpointRejected", "DapLogPoint", "DapStopped", "DapStoppedLine",
+      "DapUIBreakpointsDisabledLine", "DapUIBreakpointsInfo", "DapUIFloatBorder", "DapUILineNumber",
+      "DapUIModifiedValue", "DapUISource", "DapUIThread", "DapUIType", "DapUIValue",
+      "DapUIVariable", "DapUIWatchesEmpty", "DapUIWatchesError", "DapUIWatchesValue", "Dash",
+      "Debug", "Define", "Delimiter", "DiagnosticDeprecated", "DiagnosticError",
+      "DiagnosticFloatingError", "DiagnosticFloatingHint", "DiagnosticFloatingInfo",
+      "DiagnosticFloatingOk", "DiagnosticFloatingWarn", "DiagnosticHint", "DiagnosticInfo",
+      "DiagnosticOk", "DiagnosticSignError", "DiagnosticSignHint", "DiagnosticSignInfo",
+      "DiagnosticSignOk", "DiagnosticSignWarn", "DiagnosticUnderlineError",
+      "DiagnosticUnderlineHint", "DiagnosticUnderlineInfo", "DiagnosticUnderlineOk",
+      "DiagnosticUnderlineWarn", "DiagnosticUnnecessary", "DiagnosticVirtualTextError",
+      "DiagnosticVirtualTextHint", "DiagnosticVirtualTextInfo", "DiagnosticVirtualTextOk",
+      "DiagnosticVirtualTextWarn", "DiagnosticWarn", "DiffAdd", "DiffChange", "DiffDelete",
+      "DiffText", "EndOfBuffer", "Error", "ErrorMsg", "Exception", "FlashBackdrop", "FlashCurrent",
+      "FlashLabel", "FlashMatch", "Float", "FloatBorder", "FloatTitle", "FoldColumn", "Folded",
+      "Function", "GitSignsAdd", "GitSignsAddLn", "GitSignsAddNr", "GitSignsChange",
+      "GitSignsChangeLn", "GitSignsChangeNr", "GitSignsDelete", "GitSignsDeleteLn",
+      "GitSignsDeleteNr", "Headline1", "Headline2", "Headline3", "Headline4", "Headline5",
+      "Headline6", "IblIndent", "Identifier", "Ignore", "IlluminatedWordRead",
+      "IlluminatedWordText", "IlluminatedWordWrite", "IncSearch", "Include", "IndentBlanklineChar",
+      "Keyword", "Label", "LazyButton", "LazyButtonActive", "LazyH1", "LazyReasonCmd",
+      "LazyReasonEvent", "LazyReasonFt", "LazyReasonKeys", "LazyReasonStart", "LeapBackdrop",
+      "LeapLabelPrimary", "LeapLabelSecondary", "LineNr", "LspCodeLens", "LspCodeLensSeparator",
+      "LspInlayHint", "LspReferenceRead", "LspReferenceText", "LspReferenceWrite",
+      "LspSignatureActiveParameter", "Macro", "MasonHeader", "MasonHighlightSecondary",
+      "MasonMuted", "MiniCursorword", "MiniCursorwordCurrent", "MiniJump", "MiniStatuslineDevinfo",
+      "MiniStatuslineFileinfo", "MiniStatuslineFilename", "MiniStatuslineInactive",
+      "MiniStatuslineModeCommand", "MiniStatuslineModeInsert", "MiniStatuslineModeNormal",
+      "MiniStatuslineModeOther", "MiniStatuslineModeReplace", "MiniStatuslineModeVisual",
+      "MiniSurround", "MiniTablineCurrent", "MiniTablineFill", "MiniTablineHidden",
+      "MiniTablineModifiedCurrent", "MiniTablineModifiedHidden", "MiniTablineModifiedVisible",
+      "MiniTablineTabpagesection", "MiniTablineVisible", "MiniTestFail", "MiniTestPass",
+      "MiniTrailspace", "ModeMsg", "MsgArea", "NavicIconsArray", "NavicIconsBoolean",
+      "NavicIconsClass", "NavicIconsConstant", "NavicIconsConstructor", "NavicIconsEnum",
+      "NavicIconsEnumMember", "NavicIconsEvent", "NavicIconsField", "NavicIconsFile",
+      "NavicIconsFunction", "NavicIconsInterface", "NavicIconsKey", "NavicIconsMethod",
+      "NavicIconsModule", "NavicIconsNamespace", "NavicIconsNull", "NavicIconsNumber",
+      "NavicIconsObject", "NavicIconsOperator", "NavicIconsPackage", "NavicIconsProperty",
+      "NavicIconsString", "NavicIconsStruct", "NavicIconsTypeParameter", "NavicIconsVariable",
+      "NavicSeparator", "NavicText", "NeoTreeDirectoryName", "NeoTreeFileIcon", "NeoTreeFileName",
+      "NeoTreeGitAdded", "NeoTreeGitDeleted", "NeoTreeGitModified", "NeoTreeGitUntracked",
+      "NeoTreeIndentMarker", "NeoTreeNormal", "NoiceCmdline", "NoiceCmdlinePopup",
+      "NoiceCmdlinePopupBorder", "NoiceConfirm", "NoiceConfirmBorder", "NonText", "Normal",
+      "NormalFloat", "NormalNC", "NotifyBackground", "NotifyDEBUGBorder", "NotifyDEBUGIcon",
+      "NotifyDEBUGTitle", "NotifyERRORBorder", "NotifyERRORIcon", "NotifyERRORTitle",
+      "NotifyINFOBorder", "NotifyINFOIcon", "NotifyINFOTitle", "NotifyTRACEBorder",
+      "NotifyTRACEIcon", "NotifyTRACETitle", "NotifyWARNBorder", "NotifyWARNIcon",
+      "NotifyWARNTitle", "Number", "NvimTreeEmptyFolderName", "NvimTreeFolderName",
+      "NvimTreeGitDeleted", "NvimTreeGitDirty", "NvimTreeGitNew", "NvimTreeGitStaged",
+      "NvimTreeImageFile", "NvimTreeIndentMarker", "NvimTreeNormal", "Operator", "Pmenu",
+      "PmenuExtra", "PmenuExtraSel", "PmenuKind", "PmenuKindSel", "PmenuSbar", "PmenuSel",
+      "PmenuThumb", "PreCondit", "PreProc", "Quote", "RainbowDelimiterBlue", "RainbowDelimiterCyan",
+      "RainbowDelimiterGreen", "RainbowDelimiterOrange", "RainbowDelimiterRed",
+      "RainbowDelimiterViolet", "RainbowDelimiterYellow", "Removed", "ScrollbarSlider", "Search",
+      "SignColumn", "SpecialChar", "SpecialComment", "SpecialKey", "SpellBad", "SpellCap",
+      "SpellLocal", "SpellRare", "Statement", "StatusLine", "StatusLineNC", "StorageClass",
+      "String", "Structure", "Substitute", "TabLine", "TabLineFill", "TabLineSel", "Tag",
+      "TelescopeBorder", "TelescopeNormal", "TelescopePreviewNormal", "TelescopePromptCounter",
+      "TelescopeResultsNormal", "TelescopeSelection", "TelescopeSelectionCaret", "TermCursorNC",
+      "TerminalBlack", "TerminalBlue", "TerminalBrightBlue", "TerminalBrightCyan",
+      "TerminalBrightGreen", "TerminalBrightMagenta", "TerminalBrightRed", "TerminalBrightYellow",
+      "TerminalColor0", "TerminalColor1", "TerminalColor10", "TerminalColor11", "TerminalColor12",
+      "TerminalColor13", "TerminalColor14", "TerminalColor15", "TerminalColor2", "TerminalColor3",
+      "TerminalColor4", "TerminalColor5", "TerminalColor6", "TerminalColor7", "TerminalColor8",
+      "TerminalColor9", "TerminalCyan", "TerminalError", "TerminalGreen", "TerminalMagenta",
+      "TerminalNormal", "TerminalRed", "TerminalWhite", "TerminalYellow", "Todo", "TroubleFile",
+      "TroubleFoldIcon", "TroubleLocation", "TroubleNormal", "TroublePreview", "TroubleSignError",
+      "TroubleSignHint", "TroubleSignInformation", "TroubleSignWarning", "TroubleText", "Type",
+      "Typedef", "Visual", "WarningMsg", "WhichKeyDesc", "WhichKeyFloat", "WhichKeyGroup",
+      "WhichKeySeparator", "WhichKeySeperator", "WhichKeyValue", "Whitespace", "WinBar", "WinBarNC",
+      "WinSeparator", "debugPC",
+    },
+    terminal = { 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15 },
+  },
+  deepforest = {
+    groups = {
+      "@boolean.json", "@character.special", "@character.special.regexp", "@comment.bash",
+      "@comment.go", "@constant.builtin", "@constant.builtin.go", "@constant.css",
+      "@function.builtin", "@function.builtin.go", "@function.call", "@function.call.kotlin",
+      "@function.css", "@function.go", "@function.javascript", "@function.kotlin",
+      "@function.method", "@function.method.call", "@function.method.javascript", "@keyword.bash",
+      "@keyword.conditional.ternary", "@keyword.coroutine", "@keyword.css",
+      "@keyword.directive.bash", "@keyword.modifier", "@keyword.operator", "@keyword.regexp",
+      "@keyword.return", "@label", "@label.json", "@lsp.typemod.function.declaration",
+      "@lsp.typemod.function.defaultLibrary", "@markup.list", "@markup.list.unchecked",
+      "@markup.math", "@markup.quote", "@markup.raw", "@markup.raw.block", "@module.go",
+      "@namespace", "@none", "@number.css", "@property", "@property.css", "@property.json",
+      "@punctuation.bracket", "@punctuation.bracket.kotlin", "@punctuation.bracket.regexp",
+      "@punctuation.delimiter", "@punctuation.special", "@punctuation.special.javascript",
+      "@punctuation.special.markdown", "@rainbow.blue", "@rainbow.cyan", "@rainbow.orange",
+      "@rainbow.violet", "@string.css", "@string.documentation", "@string.escape",
+      "@string.escape.regexp", "@string.regexp", "@string.special", "@string.special.symbol",
+      "@tag", "@tag.attribute", "@tag.attribute.css", "@tag.builtin", "@tag.delimiter",
+      "@type.qualifier", "@variable", "@variable.builtin", "@variable.builtin.go", "@variable.css",
+      "@variable.go", "@variable.javascript", "@variable.kotlin", "@variable.member",
+      "@variable.parameter", "@variable.parameter.go", "@variable.parameter.kotlin", "Boolean",
+      "Changed", "CmpItemAbbr", "CmpItemAbbrDeprecated", "CmpItemKindColor", "CmpItemKindConstant",
+      "CmpItemKindEnumMember", "CmpItemKindField", "CmpItemKindFile", "CmpItemKindFunction",
+      "CmpItemKindKeyword", "CmpItemKindMethod", "CmpItemKindOperator", "CmpItemKindProperty",
+      "CmpItemKindText", "CmpItemKindUnit", "CmpItemKindValue", "CmpItemKindVariable",
+      "CmpItemMenu", "CodeBlock", "ColorColumn", "Comment", "Constant", "Cursor", "CursorLine",
+      "CursorLineNr", "DapBreakpointRejected", "DapStoppedLine", "DapUIBreakpointsDisabledLine",
+      "DapUIFloatBorder", "DapUILineNumber", "DapUIValue", "DapUIVariable", "Dash", "Define",
+      "Delimiter", "DiagnosticSignError", "DiagnosticSignHint", "DiagnosticSignInfo",
+      "DiagnosticSignOk", "DiagnosticSignWarn", "DiagnosticUnnecessary", "DiffAdd", "DiffChange",
+      "DiffDelete", "DiffText", "EndOfBuffer", "Exception", "FlashBackdrop", "FlashCurrent",
+      "FlashLabel", "FlashMatch", "Float", "FloatBorder", "FloatTitle", "FoldColumn", "Folded",
+      "Function", "GitSignsAdd", "GitSignsAddLn", "GitSignsChange", "GitSignsChangeLn",
+      "GitSignsChangeNr", "GitSignsDelete", "GitSignsDeleteLn", "Headline1", "Headline2",
+      "Headline3", "Headline4", "Headline5", "Headline6", "IblIndent", "Identifier", "Ignore",
+      "IlluminatedWordRead", "IlluminatedWordText", "IlluminatedWordWrite", "IncSearch", "Include",
+      "IndentBlanklineChar", "Keyword", "Label", "LazyButton", "LazyButtonActive", "LazyH1",
+      "LazyReasonEvent", "LazyReasonKeys", "LeapBackdrop", "LeapLabelPrimary", "LeapLabelSecondary",
+      "LineNr", "LspCodeLens", "LspCodeLensSeparator", "LspInlayHint", "LspReferenceRead",
+      "LspReferenceText", "LspReferenceWrite", "LspSignatureActiveParameter", "MasonHeader",
+      "MasonHighlightSecondary", "MasonMuted", "MiniCursorword", "MiniCursorwordCurrent",
+      "MiniJump", "MiniStatuslineDevinfo", "MiniStatuslineFileinfo", "MiniStatuslineFilename",
+      "MiniStatuslineInactive", "MiniStatuslineModeCommand", "MiniStatuslineModeInsert",
+      "MiniStatuslineModeNormal", "MiniStatuslineModeOther", "MiniStatuslineModeReplace",
+      "MiniStatuslineModeVisual", "MiniSurround", "MiniTablineCurrent", "MiniTablineFill",
+      "MiniTablineHidden", "MiniTablineModifiedCurrent", "MiniTablineModifiedHidden",
+      "MiniTablineModifiedVisible", "MiniTablineTabpagesection", "MiniTablineVisible", "ModeMsg",
+      "MsgArea", "NavicIconsBoolean", "NavicIconsConstant", "NavicIconsEnumMember",
+      "NavicIconsField", "NavicIconsFile", "NavicIconsFunction", "NavicIconsKey",
+      "NavicIconsMethod", "NavicIconsNull", "NavicIconsNumber", "NavicIconsOperator",
+      "NavicIconsProperty", "NavicIconsVariable", "NavicSeparator", "NavicText",
+      "NeoTreeDirectoryName", "NeoTreeFileIcon", "NeoTreeFileName", "NeoTreeGitModified",
+      "NeoTreeIndentMarker", "NeoTreeNormal", "NoiceCmdline", "NoiceCmdlinePopup",
+      "NoiceCmdlinePopupBorder", "NoiceConfirm", "NoiceConfirmBorder", "NonText", "Normal",
+      "NormalFloat", "NormalNC", "NotifyBackground", "NotifyDEBUGBorder", "NotifyDEBUGIcon",
+      "NotifyDEBUGTitle", "Number", "NvimTreeEmptyFolderName", "NvimTreeFolderName",
+      "NvimTreeGitDirty", "NvimTreeImageFile", "NvimTreeIndentMarker", "NvimTreeNormal", "Operator",
+      "Pmenu", "PmenuExtra", "PmenuExtraSel", "PmenuKindSel", "PmenuSbar", "PmenuSel", "PmenuThumb",
+      "PreCondit", "Quote", "RainbowDelimiterBlue", "RainbowDelimiterCyan",
+      "RainbowDelimiterOrange", "RainbowDelimiterViolet", "ScrollbarSlider", "Search", "SignColumn",
+      "SpecialChar", "SpecialComment", "SpecialKey", "Statement", "StatusLine", "StatusLineNC",
+      "StorageClass", "Substitute", "TabLine", "TabLineFill", "TabLineSel", "Tag",
+      "TelescopeBorder", "TelescopeNormal", "TelescopePreviewNormal", "TelescopePromptCounter",
+      "TelescopeResultsNormal", "TelescopeSelection", "TelescopeSelectionCaret", "TermCursorNC",
+      "TerminalBlack", "TerminalBlue", "TerminalBrightBlue", "TerminalBrightCyan",
+      "TerminalBrightMagenta", "TerminalColor0", "TerminalColor12", "TerminalColor13",
+      "TerminalColor14", "TerminalColor15", "TerminalColor4", "TerminalColor5", "TerminalColor6",
+      "TerminalColor7", "TerminalColor8", "TerminalCyan", "TerminalMagenta", "TerminalNormal",
+      "TerminalWhite", "Todo", "TroubleFile", "TroubleFoldIcon", "TroubleLocation", "TroubleNormal",
+      "TroublePreview", "TroubleText", "Visual", "WhichKeyDesc", "WhichKeyFloat", "WhichKeyGroup",
+      "WhichKeySeparator", "WhichKeySeperator", "WhichKeyValue", "Whitespace", "WinBar", "WinBarNC",
+      "WinSeparator", "debugPC",
+    },
+    terminal = { 0, 4, 5, 6, 7, 8, 12, 13, 14, 15 },
+  },
+  graphene = {
+    groups = {
+      "@comment.bash", "@comment.go", "@constant.css", "@keyword.directive.bash", "@markup.list",
+      "@markup.list.unchecked", "@module.go", "@property", "@punctuation.special.markdown",
+      "@string.css", "@string.documentation", "@string.escape", "@string.escape.regexp",
+      "@variable", "@variable.builtin.go", "@variable.css", "@variable.go", "@variable.javascript",
+      "@variable.member", "@variable.parameter", "@variable.parameter.go",
+      "@variable.parameter.kotlin", "CmpItemAbbr", "CmpItemAbbrDeprecated", "CmpItemKindField",
+      "CmpItemKindFile", "CmpItemKindProperty", "CmpItemKindText", "CmpItemKindVariable",
+      "CmpItemMenu", "CodeBlock", "ColorColumn", "Comment", "Cursor", "CursorLine", "CursorLineNr",
+      "DapBreakpointRejected", "DapStoppedLine", "DapUIBreakpointsDisabledLine", "DapUIFloatBorder",
+      "DapUILineNumber", "DapUIVariable", "Dash", "DiagnosticSignError", "DiagnosticSignHint",
+      "DiagnosticSignInfo", "DiagnosticSignOk", "DiagnosticSignWarn", "DiagnosticUnnecessary",
+      "DiffAdd", "DiffChange", "DiffDelete", "DiffText", "EndOfBuffer", "FlashBackdrop",
+      "FlashCurrent", "FlashLabel", "FlashMatch", "FloatBorder", "FloatTitle", "FoldColumn",
+      "Folded", "GitSignsAdd", "GitSignsAddLn", "GitSignsChange", "GitSignsChangeLn",
+      "GitSignsDelete", "GitSignsDeleteLn", "Headline1", "Headline2", "Headline3", "Headline4",
+      "Headline5", "Headline6", "IblIndent", "Identifier", "Ignore", "IlluminatedWordRead",
+      "IlluminatedWordText", "IlluminatedWordWrite", "IncSearch", "IndentBlanklineChar",
+      "LazyButton", "LazyButtonActive", "LazyH1", "LeapBackdrop", "LeapLabelPrimary",
+      "LeapLabelSecondary", "LineNr", "LspCodeLens", "LspCodeLensSeparator", "LspInlayHint",
+      "LspReferenceRead", "LspReferenceText", "LspReferenceWrite", "LspSignatureActiveParameter",
+      "MasonHeader", "MasonMuted", "MiniCursorword", "MiniCursorwordCurrent", "MiniJump",
+      "MiniStatuslineDevinfo", "MiniStatuslineFileinfo", "MiniStatuslineFilename",
+      "MiniStatuslineInactive", "MiniStatuslineModeCommand", "MiniStatuslineModeInsert",
+      "MiniStatuslineModeNormal", "MiniStatuslineModeOther", "MiniStatuslineModeReplace",
+      "MiniStatuslineModeVisual", "MiniSurround", "MiniTablineCurrent", "MiniTablineFill",
+      "MiniTablineHidden", "MiniTablineModifiedCurrent", "MiniTablineModifiedHidden",
+      "MiniTablineModifiedVisible", "MiniTablineTabpagesection", "MiniTablineVisible", "ModeMsg",
+      "MsgArea", "NavicIconsField", "NavicIconsFile", "NavicIconsProperty", "NavicIconsVariable",
+      "NavicSeparator", "NavicText", "NeoTreeDirectoryName", "NeoTreeFileIcon", "NeoTreeFileName",
+      "NeoTreeIndentMarker", "NeoTreeNormal", "NoiceCmdline", "NoiceCmdlinePopup",
+      "NoiceCmdlinePopupBorder", "NoiceConfirm", "NoiceConfirmBorder", "NonText", "Normal",
+      "NormalFloat", "NormalNC", "NotifyBackground", "NotifyDEBUGBorder", "NotifyDEBUGIcon",
+      "NotifyDEBUGTitle", "NvimTreeEmptyFolderName", "NvimTreeFolderName", "NvimTreeImageFile",
+      "NvimTreeIndentMarker", "NvimTreeNormal", "Pmenu", "PmenuExtra", "PmenuExtraSel",
+      "PmenuKindSel", "PmenuSbar", "PmenuSel", "PmenuThumb", "ScrollbarSlider", "Search",
+      "SignColumn", "SpecialChar", "SpecialComment", "SpecialKey", "StatusLine", "StatusLineNC",
+      "Substitute", "TabLine", "TabLineFill", "TabLineSel", "TelescopeBorder", "TelescopeNormal",
+      "TelescopePreviewNormal", "TelescopePromptCounter", "TelescopeResultsNormal",
+      "TelescopeSelection", "TelescopeSelectionCaret", "TermCursorNC", "TerminalBlack",
+      "TerminalColor0", "TerminalColor15", "TerminalColor7", "TerminalColor8", "TerminalNormal",
+      "TerminalWhite", "TroubleFile", "TroubleFoldIcon", "TroubleLocation", "TroubleNormal",
+      "TroublePreview", "TroubleText", "Visual", "WhichKeyDesc", "WhichKeyFloat",
+      "WhichKeySeparator", "WhichKeySeperator", "WhichKeyValue", "Whitespace", "WinBar", "WinBarNC",
+      "WinSeparator", "debugPC",
+    },
+    terminal = { 0, 7, 8, 15 },
+  },
+  ocean = {
+    groups = {
+      "@comment.bash", "@comment.go", "@constant.css", "@keyword.directive.bash", "@markup.list",
+      "@markup.list.unchecked", "@module.go", "@property", "@punctuation.special.markdown",
+      "@string.css", "@string.documentation", "@string.escape", "@string.escape.regexp",
+      "@variable", "@variable.builtin.go", "@variable.css", "@variable.go", "@variable.javascript",
+      "@variable.member", "@variable.parameter", "@variable.parameter.go",
+      "@variable.parameter.kotlin", "CmpItemAbbr", "CmpItemAbbrDeprecated", "CmpItemKindField",
+      "CmpItemKindFile", "CmpItemKindProperty", "CmpItemKindText", "CmpItemKindVariable",
+      "CmpItemMenu", "CodeBlock", "ColorColumn", "Comment", "Cursor", "CursorLine", "CursorLineNr",
+      "DapBreakpointRejected", "DapStoppedLine", "DapUIBreakpointsDisabledLine", "DapUIFloatBorder",
+      "DapUILineNumber", "DapUIVariable", "Dash", "DiagnosticSignError", "DiagnosticSignHint",
+      "DiagnosticSignInfo", "DiagnosticSignOk", "DiagnosticSignWarn", "DiagnosticUnnecessary",
+      "DiffAdd", "DiffChange", "DiffDelete", "DiffText", "EndOfBuffer", "FlashBackdrop",
+      "FlashCurrent", "FlashLabel", "FlashMatch", "FloatBorder", "FloatTitle", "FoldColumn",
+      "Folded", "GitSignsAdd", "GitSignsAddLn", "GitSignsChange", "GitSignsChangeLn",
+      "GitSignsDelete", "GitSignsDeleteLn", "Headline1", "Headline2", "Headline3", "Headline4",
+      "Headline5", "Headline6", "IblIndent", "Identifier", "Ignore", "IlluminatedWordRead",
+      "IlluminatedWordText", "IlluminatedWordWrite", "IncSearch", "IndentBlanklineChar",
+      "LazyButton", "LazyButtonActive", "LazyH1", "LeapBackdrop", "LeapLabelPrimary",
+      "LeapLabelSecondary", "LineNr", "LspCodeLens", "LspCodeLensSeparator", "LspInlayHint",
+      "LspReferenceRead", "LspReferenceText", "LspReferenceWrite", "LspSignatureActiveParameter",
+      "MasonHeader", "MasonMuted", "MiniCursorword", "MiniCursorwordCurrent", "MiniJump",
+      "MiniStatuslineDevinfo", "MiniStatuslineFileinfo", "MiniStatuslineFilename",
+      "MiniStatuslineInactive", "MiniStatuslineModeCommand", "MiniStatuslineModeInsert",
+      "MiniStatuslineModeNormal", "MiniStatuslineModeOther", "MiniStatuslineModeReplace",
+      "MiniStatuslineModeVisual", "MiniSurround", "MiniTablineCurrent", "MiniTablineFill",
+      "MiniTablineHidden", "MiniTablineModifiedCurrent", "MiniTablineModifiedHidden",
+      "MiniTablineModifiedVisible", "MiniTablineTabpagesection", "MiniTablineVisible", "ModeMsg",
+      "MsgArea", "NavicIconsField", "NavicIconsFile", "NavicIconsProperty", "NavicIconsVariable",
+      "NavicSeparator", "NavicText", "NeoTreeDirectoryName", "NeoTreeFileIcon", "NeoTreeFileName",
+      "NeoTreeIndentMarker", "NeoTreeNormal", "NoiceCmdline", "NoiceCmdlinePopup",
+      "NoiceCmdlinePopupBorder", "NoiceConfirm", "NoiceConfirmBorder", "NonText", "Normal",
+      "NormalFloat", "NormalNC", "NotifyBackground", "NotifyDEBUGBorder", "NotifyDEBUGIcon",
+      "NotifyDEBUGTitle", "NvimTreeEmptyFolderName", "NvimTreeFolderName", "NvimTreeImageFile",
+      "NvimTreeIndentMarker", "NvimTreeNormal", "Pmenu", "PmenuExtra", "PmenuExtraSel",
+      "PmenuKindSel", "PmenuSbar", "PmenuSel", "PmenuThumb", "ScrollbarSlider", "Search",
+      "SignColumn", "SpecialChar", "SpecialComment", "SpecialKey", "StatusLine", "StatusLineNC",
+      "Substitute", "TabLine", "TabLineFill", "TabLineSel", "TelescopeBorder", "TelescopeNormal",
+      "TelescopePreviewNormal", "TelescopePromptCounter", "TelescopeResultsNormal",
+      "TelescopeSelection", "TelescopeSelectionCaret", "TermCursorNC", "TerminalBlack",
+      "TerminalColor0", "TerminalColor15", "TerminalColor7", "TerminalColor8", "TerminalNormal",
+      "TerminalWhite", "TroubleFile", "TroubleFoldIcon", "TroubleLocation", "TroubleNormal",
+      "TroublePreview", "TroubleText", "Visual", "WhichKeyDesc", "WhichKeyFloat",
+      "WhichKeySeparator", "WhichKeySeperator", "WhichKeyValue", "Whitespace", "WinBar", "WinBarNC",
+      "WinSeparator", "debugPC",
+    },
+    terminal = { 0, 7, 8, 15 },
+  },
+  palenight = {
+    groups = {
+      "@comment.bash", "@comment.go", "@constant.css", "@keyword.directive.bash", "@markup.list",
+      "@markup.list.unchecked", "@module.go", "@property", "@punctuation.special.markdown",
+      "@string.css", "@string.documentation", "@string.escape", "@string.escape.regexp",
+      "@variable", "@variable.builtin.go", "@variable.css", "@variable.go", "@variable.javascript",
+      "@variable.member", "@variable.parameter", "@variable.parameter.go",
+      "@variable.parameter.kotlin", "CmpItemAbbr", "CmpItemAbbrDeprecated", "CmpItemKindField",
+      "CmpItemKindFile", "CmpItemKindProperty", "CmpItemKindText", "CmpItemKindVariable",
+      "CmpItemMenu", "CodeBlock", "ColorColumn", "Comment", "Cursor", "CursorLine", "CursorLineNr",
+      "DapBreakpointRejected", "DapStoppedLine", "DapUIBreakpointsDisabledLine", "DapUIFloatBorder",
+      "DapUILineNumber", "DapUIVariable", "Dash", "DiagnosticSignError", "DiagnosticSignHint",
+      "DiagnosticSignInfo", "DiagnosticSignOk", "DiagnosticSignWarn", "DiagnosticUnnecessary",
+      "DiffAdd", "DiffChange", "DiffDelete", "DiffText", "EndOfBuffer", "FlashBackdrop",
+      "FlashCurrent", "FlashLabel", "FlashMatch", "FloatBorder", "FloatTitle", "FoldColumn",
+      "Folded", "GitSignsAdd", "GitSignsAddLn", "GitSignsChange", "GitSignsChangeLn",
+      "GitSignsDelete", "GitSignsDeleteLn", "Headline1", "Headline2", "Headline3", "Headline4",
+      "Headline5", "Headline6", "IblIndent", "Identifier", "Ignore", "IlluminatedWordRead",
+      "IlluminatedWordText", "IlluminatedWordWrite", "IncSearch", "IndentBlanklineChar",
+      "LazyButton", "LazyButtonActive", "LazyH1", "LeapBackdrop", "LeapLabelPrimary",
+      "LeapLabelSecondary", "LineNr", "LspCodeLens", "LspCodeLensSeparator", "LspInlayHint",
+      "LspReferenceRead", "LspReferenceText", "LspReferenceWrite", "LspSignatureActiveParameter",
+      "MasonHeader", "MasonMuted", "MiniCursorword", "MiniCursorwordCurrent", "MiniJump",
+      "MiniStatuslineDevinfo", "MiniStatuslineFileinfo", "MiniStatuslineFilename",
+      "MiniStatuslineInactive", "MiniStatuslineModeCommand", "MiniStatuslineModeInsert",
+      "MiniStatuslineModeNormal", "MiniStatuslineModeOther", "MiniStatuslineModeReplace",
+      "MiniStatuslineModeVisual", "MiniSurround", "MiniTablineCurrent", "MiniTablineFill",
+      "MiniTablineHidden", "MiniTablineModifiedCurrent", "MiniTablineModifiedHidden",
+      "MiniTablineModifiedVisible", "MiniTablineTabpagesection", "MiniTablineVisible", "ModeMsg",
+      "MsgArea", "NavicIconsField", "NavicIconsFile", "NavicIconsProperty", "NavicIconsVariable",
+      "NavicSeparator", "NavicText", "NeoTreeDirectoryName", "NeoTreeFileIcon", "NeoTreeFileName",
+      "NeoTreeIndentMarker", "NeoTreeNormal", "NoiceCmdline", "NoiceCmdlinePopup",
+      "NoiceCmdlinePopupBorder", "NoiceConfirm", "NoiceConfirmBorder", "NonText", "Normal",
+      "NormalFloat", "NormalNC", "NotifyBackground", "NotifyDEBUGBorder", "NotifyDEBUGIcon",
+      "NotifyDEBUGTitle", "NvimTreeEmptyFolderName", "NvimTreeFolderName", "NvimTreeImageFile",
+      "NvimTreeIndentMarker", "NvimTreeNormal", "Pmenu", "PmenuExtra", "PmenuExtraSel",
+      "PmenuKindSel", "PmenuSbar", "PmenuSel", "PmenuThumb", "ScrollbarSlider", "Search",
+      "SignColumn", "SpecialChar", "SpecialComment", "SpecialKey", "StatusLine", "StatusLineNC",
+      "Substitute", "TabLine", "TabLineFill", "TabLineSel", "TelescopeBorder", "TelescopeNormal",
+      "TelescopePreviewNormal", "TelescopePromptCounter", "TelescopeResultsNormal",
+      "TelescopeSelection", "TelescopeSelectionCaret", "TermCursorNC", "TerminalBlack",
+      "TerminalColor0", "TerminalColor15", "TerminalColor7", "TerminalColor8", "TerminalNormal",
+      "TerminalWhite", "TroubleFile", "TroubleFoldIcon", "TroubleLocation", "TroubleNormal",
+      "TroublePreview", "TroubleText", "Visual", "WhichKeyDesc", "WhichKeyFloat",
+      "WhichKeySeparator", "WhichKeySeperator", "WhichKeyValue", "Whitespace", "WinBar", "WinBarNC",
+      "WinSeparator", "debugPC",
+    },
+    terminal = { 0, 7, 8, 15 },
+  },
+}
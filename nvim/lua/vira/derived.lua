@@ -0,0 +1,5 @@
+-- Vira derived variants
+-- Auto-generated by generate.py from variants.json
+
+return {
+}
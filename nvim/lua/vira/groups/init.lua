@@ -1,5 +1,8 @@
 -- Vira highlight groups
 -- Maps palette colors to Neovim highlight groups
+--
+-- generate.py also evaluates this file to precompile highlights/<variant>.lua,
+-- so keep to plain tables and expressions, and re-run it after editing.
 
 local M = {}
 
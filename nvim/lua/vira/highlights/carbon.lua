@@ -0,0 +1,751 @@
+-- Vira Carbon highlights
+-- Auto-generated by generate.py from groups/init.lua and mappings/jetbrains-to-nvim.json
+
+return {
+  -- Core groups, and per-plugin groups applied when the plugin loads
+  groups = {
+    ["@attribute"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@boolean"] = { link = "Boolean" },
+    ["@boolean.json"] = { fg = "#d6808f", ctermfg = 174 },
+    ["@boolean.toml"] = { fg = "#c85e60", ctermfg = 167 },
+    ["@character"] = { link = "Character" },
+    ["@character.special"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@character.special.regexp"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@comment"] = { link = "Comment" },
+    ["@comment.bash"] = { fg = "#45454a", ctermfg = 238, italic = true },
+    ["@comment.documentation"] = { link = "Comment" },
+    ["@comment.error"] = { fg = "#c85e60", bold = true, ctermfg = 167 },
+    ["@comment.go"] = { fg = "#45454a", ctermfg = 238, italic = true },
+    ["@comment.note"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@comment.todo"] = { link = "Todo" },
+    ["@comment.warning"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@constant"] = { link = "Constant" },
+    ["@constant.builtin"] = { fg = "#d6808f", ctermfg = 174, italic = true },
+    ["@constant.builtin.go"] = { fg = "#d6808f", ctermfg = 174, italic = true },
+    ["@constant.css"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@constant.kotlin"] = { fg = "#c85e60", ctermfg = 167 },
+    ["@constant.macro"] = { link = "Macro" },
+    ["@constructor"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@diff.delta"] = { link = "DiffChange" },
+    ["@diff.minus"] = { link = "DiffDelete" },
+    ["@diff.plus"] = { link = "DiffAdd" },
+    ["@function"] = { link = "Function" },
+    ["@function.builtin"] = { fg = "#6a90d0", ctermfg = 68, italic = true },
+    ["@function.builtin.go"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.call"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.call.bash"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@function.call.kotlin"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.css"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.go"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.javascript"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.kotlin"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.macro"] = { link = "Macro" },
+    ["@function.method"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.method.call"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@function.method.javascript"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@keyword"] = { link = "Keyword" },
+    ["@keyword.bash"] = { fg = "#6ebad7", bold = true, ctermfg = 74 },
+    ["@keyword.conditional"] = { link = "Conditional" },
+    ["@keyword.conditional.ternary"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@keyword.coroutine"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@keyword.css"] = { fg = "#cd775c", bold = true, ctermfg = 173 },
+    ["@keyword.debug"] = { link = "Debug" },
+    ["@keyword.directive"] = { link = "PreProc" },
+    ["@keyword.directive.bash"] = { fg = "#45454a", ctermfg = 238, italic = true },
+    ["@keyword.directive.define"] = { link = "Define" },
+    ["@keyword.exception"] = { link = "Exception" },
+    ["@keyword.function"] = { link = "Keyword" },
+    ["@keyword.import"] = { link = "Include" },
+    ["@keyword.modifier"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@keyword.operator"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@keyword.regexp"] = { fg = "#6ebad7", bold = true, ctermfg = 74 },
+    ["@keyword.repeat"] = { link = "Repeat" },
+    ["@keyword.return"] = { fg = "#cd775c", ctermfg = 173 },
+    ["@keyword.storage"] = { link = "StorageClass" },
+    ["@label"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@label.json"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@label.yaml"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@lsp.mod.abstract"] = { italic = true },
+    ["@lsp.mod.async"] = { italic = true },
+    ["@lsp.mod.declaration"] = {},
+    ["@lsp.mod.defaultLibrary"] = { italic = true },
+    ["@lsp.mod.definition"] = {},
+    ["@lsp.mod.deprecated"] = { strikethrough = true },
+    ["@lsp.mod.documentation"] = {},
+    ["@lsp.mod.modification"] = {},
+    ["@lsp.mod.readonly"] = { italic = true },
+    ["@lsp.mod.static"] = { italic = true },
+    ["@lsp.type.class"] = { link = "Type" },
+    ["@lsp.type.comment"] = {},
+    ["@lsp.type.decorator"] = { link = "@attribute" },
+    ["@lsp.type.enum"] = { link = "Type" },
+    ["@lsp.type.enumMember"] = { link = "Constant" },
+    ["@lsp.type.event"] = { link = "Type" },
+    ["@lsp.type.function"] = { link = "Function" },
+    ["@lsp.type.interface"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@lsp.type.keyword"] = { link = "Keyword" },
+    ["@lsp.type.macro"] = { link = "Macro" },
+    ["@lsp.type.method"] = { link = "Function" },
+    ["@lsp.type.modifier"] = { link = "@keyword.modifier" },
+    ["@lsp.type.namespace"] = { link = "@module" },
+    ["@lsp.type.number"] = { link = "Number" },
+    ["@lsp.type.operator"] = { link = "Operator" },
+    ["@lsp.type.parameter"] = { link = "@variable.parameter" },
+    ["@lsp.type.property"] = { link = "@property" },
+    ["@lsp.type.regexp"] = { link = "@string.regexp" },
+    ["@lsp.type.string"] = { link = "String" },
+    ["@lsp.type.struct"] = { link = "Type" },
+    ["@lsp.type.type"] = { link = "Type" },
+    ["@lsp.type.typeParameter"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@lsp.type.variable"] = {},
+    ["@lsp.typemod.function.declaration"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@lsp.typemod.function.defaultLibrary"] = { fg = "#6a90d0", ctermfg = 68, italic = true },
+    ["@lsp.typemod.parameter.declaration"] = { link = "@variable.parameter" },
+    ["@lsp.typemod.variable.defaultLibrary"] = { link = "@variable.builtin" },
+    ["@lsp.typemod.variable.readonly"] = { link = "Constant" },
+    ["@markup.environment"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@markup.heading"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.heading.1"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.heading.2"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.heading.3"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.heading.4"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.heading.5"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.heading.6"] = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    ["@markup.italic"] = { italic = true },
+    ["@markup.link"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@markup.link.label"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@markup.link.url"] = { fg = "#c85e60", ctermfg = 167, underline = true },
+    ["@markup.list"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@markup.list.checked"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@markup.list.unchecked"] = { fg = "#45454a", ctermfg = 238 },
+    ["@markup.math"] = { fg = "#cd775c", ctermfg = 173 },
+    ["@markup.quote"] = { fg = "#6ebad7", ctermfg = 74, italic = true },
+    ["@markup.raw"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@markup.raw.block"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@markup.strikethrough"] = { strikethrough = true },
+    ["@markup.strong"] = { bold = true },
+    ["@markup.underline"] = { underline = true },
+    ["@module"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@module.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@namespace"] = { fg = "#d6808f", ctermfg = 174 },
+    ["@none"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@number"] = { link = "Number" },
+    ["@number.css"] = { fg = "#cd775c", ctermfg = 173 },
+    ["@number.float"] = { link = "Float" },
+    ["@operator"] = { link = "Operator" },
+    ["@property"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@property.css"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@property.json"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@property.yaml"] = { fg = "#c85e60", bold = true, ctermfg = 167 },
+    ["@punctuation.bracket"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@punctuation.bracket.kotlin"] = { fg = "#a178c4", bold = true, ctermfg = 140 },
+    ["@punctuation.bracket.regexp"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@punctuation.delimiter"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@punctuation.special"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@punctuation.special.javascript"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@punctuation.special.markdown"] = { fg = "#45454a", bold = true, ctermfg = 238 },
+    ["@rainbow.blue"] = { fg = "#6a90d0", ctermfg = 68 },
+    ["@rainbow.cyan"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@rainbow.green"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@rainbow.orange"] = { fg = "#d6808f", ctermfg = 174 },
+    ["@rainbow.red"] = { fg = "#c85e60", ctermfg = 167 },
+    ["@rainbow.violet"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@rainbow.yellow"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@string"] = { link = "String" },
+    ["@string.css"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@string.documentation"] = { fg = "#45454a", ctermfg = 238 },
+    ["@string.escape"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@string.escape.regexp"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@string.regexp"] = { fg = "#cd775c", ctermfg = 173 },
+    ["@string.regexp.javascript"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@string.special"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@string.special.path"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@string.special.symbol"] = { fg = "#d6808f", ctermfg = 174 },
+    ["@string.special.url"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@string.special.url.css"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@string.yaml"] = { fg = "#a3c679", ctermfg = 150 },
+    ["@tag"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@tag.attribute"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@tag.attribute.css"] = { fg = "#a178c4", ctermfg = 140 },
+    ["@tag.builtin"] = { fg = "#6ebad7", ctermfg = 74, italic = true },
+    ["@tag.css"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@tag.delimiter"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@tag.javascript"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type"] = { link = "Type" },
+    ["@type.builtin"] = { fg = "#d5b05f", ctermfg = 179, italic = true },
+    ["@type.builtin.go"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type.css"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type.definition"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type.go"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type.javascript"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type.kotlin"] = { fg = "#d5b05f", ctermfg = 179 },
+    ["@type.qualifier"] = { fg = "#6ebad7", ctermfg = 74 },
+    ["@variable"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.builtin"] = { fg = "#cd775c", ctermfg = 173, italic = true },
+    ["@variable.builtin.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.css"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.javascript"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.kotlin"] = { fg = "#90a9bc", ctermfg = 110 },
+    ["@variable.member"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.member.kotlin"] = { bold = true },
+    ["@variable.parameter"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.parameter.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.parameter.kotlin"] = { fg = "#d9d9d9", ctermfg = 253 },
+    Added = { fg = "#a3c679", ctermfg = 150 },
+    BookmarkSign = { fg = "#ffffff", bg = "#d5b05f", ctermbg = 179, ctermfg = 231 },
+    Boolean = { fg = "#d6808f", ctermfg = 174 },
+    Changed = { fg = "#6a90d0", ctermfg = 68 },
+    Character = { fg = "#a3c679", ctermfg = 150 },
+    ColorColumn = { bg = "#161616", ctermbg = 233 },
+    Comment = { fg = "#45454a", ctermfg = 238, italic = true },
+    Conditional = { link = "Statement" },
+    Constant = { fg = "#d6808f", ctermfg = 174, italic = true },
+    CurSearch = { link = "IncSearch" },
+    Cursor = { fg = "#0a0a0a", bg = "#ffcc00", ctermbg = 220, ctermfg = 232 },
+    CursorColumn = { link = "CursorLine" },
+    CursorIM = { link = "Cursor" },
+    CursorLine = { bg = "#191a1c", ctermbg = 234 },
+    CursorLineFold = { link = "CursorLineNr" },
+    CursorLineNr = { fg = "#2f3237", bg = "#191a1c", bold = true, ctermbg = 234, ctermfg = 236 },
+    CursorLineSign = { link = "CursorLine" },
+    Debug = { fg = "#d5b05f", ctermfg = 179 },
+    Define = { fg = "#6ebad7", ctermfg = 74 },
+    Delimiter = { fg = "#6ebad7", ctermfg = 74 },
+    DiagnosticDeprecated = { sp = "#c85e60", strikethrough = true },
+    DiagnosticError = { fg = "#c85e60", ctermfg = 167 },
+    DiagnosticFloatingError = { fg = "#c85e60", ctermfg = 167 },
+    DiagnosticFloatingHint = { fg = "#d5b05f", ctermfg = 179 },
+    DiagnosticFloatingInfo = { fg = "#d5b05f", ctermfg = 179 },
+    DiagnosticFloatingOk = { fg = "#a3c679", ctermfg = 150 },
+    DiagnosticFloatingWarn = { fg = "#d5b05f", ctermfg = 179 },
+    DiagnosticHint = { fg = "#d5b05f", ctermfg = 179 },
+    DiagnosticInfo = { fg = "#d5b05f", ctermfg = 179 },
+    DiagnosticOk = { fg = "#a3c679", ctermfg = 150 },
+    DiagnosticSignError = { fg = "#c85e60", bg = "#0a0a0a", ctermbg = 232, ctermfg = 167 },
+    DiagnosticSignHint = { fg = "#d5b05f", bg = "#0a0a0a", ctermbg = 232, ctermfg = 179 },
+    DiagnosticSignInfo = { fg = "#d5b05f", bg = "#0a0a0a", ctermbg = 232, ctermfg = 179 },
+    DiagnosticSignOk = { fg = "#a3c679", bg = "#0a0a0a", ctermbg = 232, ctermfg = 150 },
+    DiagnosticSignWarn = { fg = "#d5b05f", bg = "#0a0a0a", ctermbg = 232, ctermfg = 179 },
+    DiagnosticUnderlineError = { sp = "#c85e60", undercurl = true },
+    DiagnosticUnderlineHint = { sp = "#d5b05f", undercurl = true },
+    DiagnosticUnderlineInfo = { sp = "#d5b05f", undercurl = true },
+    DiagnosticUnderlineOk = { sp = "#a3c679", undercurl = true },
+    DiagnosticUnderlineWarn = { sp = "#d5b05f", undercurl = true },
+    DiagnosticUnnecessary = { fg = "#45454a", ctermfg = 238, italic = true },
+    DiagnosticVirtualTextError = { fg = "#c85e60", ctermfg = 167, italic = true },
+    DiagnosticVirtualTextHint = { fg = "#d5b05f", ctermfg = 179, italic = true },
+    DiagnosticVirtualTextInfo = { fg = "#d5b05f", ctermfg = 179, italic = true },
+    DiagnosticVirtualTextOk = { fg = "#a3c679", ctermfg = 150, italic = true },
+    DiagnosticVirtualTextWarn = { fg = "#d5b05f", ctermfg = 179, italic = true },
+    DiagnosticWarn = { fg = "#d5b05f", ctermfg = 179 },
+    DiffAdd = { bg = "#3f4c31", ctermbg = 238 },
+    DiffChange = { bg = "#2c394f", ctermbg = 237 },
+    DiffDelete = { bg = "#4c2728", ctermbg = 236 },
+    DiffText = { bg = "#2f3237", bold = true, ctermbg = 236 },
+    EndOfBuffer = { fg = "#0a0a0a", ctermfg = 232 },
+    Error = { fg = "#c85e60", ctermfg = 167 },
+    ErrorMsg = { fg = "#c85e60", bold = true, ctermfg = 167 },
+    Exception = { fg = "#d6808f", ctermfg = 174 },
+    Float = { fg = "#cd775c", ctermfg = 173 },
+    FloatBorder = { fg = "#161616", bg = "#0a0a0a", ctermbg = 232, ctermfg = 233 },
+    FloatTitle = { fg = "#80cbc4", bg = "#0a0a0a", bold = true, ctermbg = 232, ctermfg = 116 },
+    FoldColumn = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+    Folded = { fg = "#90a9bc", bg = "#191a1c", ctermbg = 234, ctermfg = 110 },
+    Function = { fg = "#6a90d0", ctermfg = 68 },
+    Identifier = { fg = "#d9d9d9", ctermfg = 253 },
+    Ignore = { fg = "#45454a", ctermfg = 238 },
+    IncSearch = { bg = "#292929", bold = true, ctermbg = 235 },
+    Include = { fg = "#6ebad7", ctermfg = 74 },
+    Keyword = { fg = "#6ebad7", bold = true, ctermfg = 74 },
+    Label = { fg = "#a178c4", ctermfg = 140 },
+    LineNr = { fg = "#2f3237", bg = "#0a0a0a", ctermbg = 232, ctermfg = 236 },
+    LineNrAbove = { link = "LineNr" },
+    LineNrBelow = { link = "LineNr" },
+    LspCodeLens = { fg = "#45454a", ctermfg = 238 },
+    LspCodeLensSeparator = { fg = "#161616", ctermfg = 233 },
+    LspInlayHint = { fg = "#45454a", ctermfg = 238, italic = true },
+    LspReferenceRead = { bg = "#292929", ctermbg = 235 },
+    LspReferenceText = { bg = "#292929", ctermbg = 235 },
+    LspReferenceWrite = { bg = "#292929", bold = true, ctermbg = 235 },
+    LspSignatureActiveParameter = { bg = "#292929", ctermbg = 235 },
+    Macro = { fg = "#d5b05f", ctermfg = 179 },
+    MatchParen = { fg = "#ffcc00", bold = true, ctermfg = 220 },
+    ModeMsg = { fg = "#d9d9d9", bold = true, ctermfg = 253 },
+    MoreMsg = { fg = "#80cbc4", ctermfg = 116 },
+    MsgArea = { fg = "#d9d9d9", ctermfg = 253 },
+    NonText = { fg = "#1a1a1a", ctermfg = 234 },
+    Normal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+    NormalFloat = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+    NormalNC = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+    Number = { fg = "#cd775c", ctermfg = 173 },
+    Operator = { fg = "#6ebad7", ctermfg = 74 },
+    Pmenu = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+    PmenuExtra = { fg = "#45454a", ctermfg = 238 },
+    PmenuExtraSel = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+    PmenuKind = { fg = "#d5b05f", ctermfg = 179 },
+    PmenuKindSel = { fg = "#d5b05f", bg = "#0a0a0a", ctermbg = 232, ctermfg = 179 },
+    PmenuSbar = { bg = "#0a0a0a", ctermbg = 232 },
+    PmenuSel = { bg = "#0a0a0a", ctermbg = 232 },
+    PmenuThumb = { bg = "#45454a", ctermbg = 238 },
+    PreCondit = { fg = "#6ebad7", ctermfg = 74 },
+    PreProc = { fg = "#d5b05f", ctermfg = 179 },
+    Question = { fg = "#80cbc4", ctermfg = 116 },
+    Removed = { fg = "#c85e60", ctermfg = 167 },
+    Repeat = { link = "Statement" },
+    ScrollbarSlider = { bg = "#212323", ctermbg = 235 },
+    Search = { bg = "#292929", ctermbg = 235 },
+    SignColumn = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+    Special = { fg = "#80cbc4", ctermfg = 116 },
+    SpecialChar = { fg = "#d9d9d9", ctermfg = 253 },
+    SpecialComment = { fg = "#45454a", bold = true, ctermfg = 238 },
+    SpecialKey = { fg = "#1a1a1a", ctermfg = 234 },
+    SpellBad = { sp = "#c85e60", undercurl = true },
+    SpellCap = { sp = "#a3c679", undercurl = true },
+    SpellLocal = { sp = "#d5b05f", undercurl = true },
+    SpellRare = { sp = "#d5b05f", undercurl = true },
+    Statement = { fg = "#6ebad7", bold = true, ctermfg = 74 },
+    StatusLine = { fg = "#d9d9d9", bg = "#191a1c", ctermbg = 234, ctermfg = 253 },
+    StatusLineNC = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+    StorageClass = { fg = "#6ebad7", ctermfg = 74 },
+    String = { fg = "#a3c679", ctermfg = 150 },
+    Structure = { fg = "#d5b05f", ctermfg = 179 },
+    Substitute = { bg = "#273246", bold = true, ctermbg = 236 },
+    TabLine = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+    TabLineFill = { bg = "#0a0a0a", ctermbg = 232 },
+    TabLineSel = { fg = "#d9d9d9", bg = "#191a1c", sp = "#80cbc4", ctermbg = 234, ctermfg = 253, underline = true },
+    Tag = { fg = "#6ebad7", ctermfg = 74 },
+    TermCursor = { link = "Cursor" },
+    TermCursorNC = { bg = "#45454a", ctermbg = 238 },
+    TerminalBlack = { fg = "#45454a", ctermfg = 238 },
+    TerminalBlue = { fg = "#6a90d0", ctermfg = 68 },
+    TerminalBrightBlue = { fg = "#6a90d0", ctermfg = 68 },
+    TerminalBrightCyan = { fg = "#6ebad7", ctermfg = 74 },
+    TerminalBrightGreen = { fg = "#a3c679", ctermfg = 150 },
+    TerminalBrightMagenta = { fg = "#a178c4", ctermfg = 140 },
+    TerminalBrightRed = { fg = "#c85e60", ctermfg = 167 },
+    TerminalBrightYellow = { fg = "#d5b05f", ctermfg = 179 },
+    TerminalColor0 = { fg = "#45454a", ctermfg = 238 },
+    TerminalColor1 = { fg = "#c85e60", ctermfg = 167 },
+    TerminalColor10 = { fg = "#a3c679", ctermfg = 150 },
+    TerminalColor11 = { fg = "#d5b05f", ctermfg = 179 },
+    TerminalColor12 = { fg = "#6a90d0", ctermfg = 68 },
+    TerminalColor13 = { fg = "#a178c4", ctermfg = 140 },
+    TerminalColor14 = { fg = "#6ebad7", ctermfg = 74 },
+    TerminalColor15 = { fg = "#d9d9d9", ctermfg = 253 },
+    TerminalColor2 = { fg = "#a3c679", ctermfg = 150 },
+    TerminalColor3 = { fg = "#d5b05f", ctermfg = 179 },
+    TerminalColor4 = { fg = "#6a90d0", ctermfg = 68 },
+    TerminalColor5 = { fg = "#a178c4", ctermfg = 140 },
+    TerminalColor6 = { fg = "#6ebad7", ctermfg = 74 },
+    TerminalColor7 = { fg = "#d9d9d9", ctermfg = 253 },
+    TerminalColor8 = { fg = "#212121", ctermfg = 235 },
+    TerminalColor9 = { fg = "#c85e60", ctermfg = 167 },
+    TerminalCyan = { fg = "#6ebad7", ctermfg = 74 },
+    TerminalError = { fg = "#c85e60", ctermfg = 167 },
+    TerminalGreen = { fg = "#a3c679", ctermfg = 150 },
+    TerminalMagenta = { fg = "#a178c4", ctermfg = 140 },
+    TerminalNormal = { fg = "#eeffff", bg = "#0a0a0a", ctermbg = 232, ctermfg = 231 },
+    TerminalRed = { fg = "#c85e60", ctermfg = 167 },
+    TerminalWhite = { fg = "#d9d9d9", ctermfg = 253 },
+    TerminalYellow = { fg = "#d5b05f", ctermfg = 179 },
+    Todo = { fg = "#cd775c", bold = true, ctermfg = 173, italic = true },
+    Type = { fg = "#d5b05f", ctermfg = 179 },
+    Typedef = { fg = "#d5b05f", ctermfg = 179 },
+    Underlined = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    VertSplit = { link = "WinSeparator" },
+    Visual = { bg = "#292929", ctermbg = 235 },
+    VisualNOS = { link = "Visual" },
+    WarningMsg = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+    Whitespace = { fg = "#2f3237", ctermfg = 236 },
+    WinBar = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+    WinBarNC = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+    WinSeparator = { fg = "#161616", ctermfg = 233 },
+    debugPC = { bg = "#191a1c", ctermbg = 234 },
+    lCursor = { link = "Cursor" },
+  },
+  plugins = {
+    cmp = {
+      CmpItemAbbr = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemAbbrDeprecated = { fg = "#45454a", ctermfg = 238, strikethrough = true },
+      CmpItemAbbrMatch = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      CmpItemAbbrMatchFuzzy = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKind = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindClass = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindColor = { fg = "#d6808f", ctermfg = 174 },
+      CmpItemKindConstant = { fg = "#d6808f", ctermfg = 174 },
+      CmpItemKindConstructor = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindEnum = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindEnumMember = { fg = "#d6808f", ctermfg = 174 },
+      CmpItemKindEvent = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindField = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindFile = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindFolder = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindFunction = { fg = "#6a90d0", ctermfg = 68 },
+      CmpItemKindInterface = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindKeyword = { fg = "#6ebad7", ctermfg = 74 },
+      CmpItemKindMethod = { fg = "#6a90d0", ctermfg = 68 },
+      CmpItemKindModule = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindOperator = { fg = "#6ebad7", ctermfg = 74 },
+      CmpItemKindProperty = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindReference = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindSnippet = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindStruct = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindText = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindTypeParameter = { fg = "#d5b05f", ctermfg = 179 },
+      CmpItemKindUnit = { fg = "#cd775c", ctermfg = 173 },
+      CmpItemKindValue = { fg = "#d6808f", ctermfg = 174 },
+      CmpItemKindVariable = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemMenu = { fg = "#45454a", ctermfg = 238 },
+    },
+    dap = {
+      DapBreakpoint = { fg = "#c85e60", ctermfg = 167 },
+      DapBreakpointCondition = { fg = "#d5b05f", ctermfg = 179 },
+      DapBreakpointRejected = { fg = "#45454a", ctermfg = 238 },
+      DapLogPoint = { fg = "#d5b05f", ctermfg = 179 },
+      DapStopped = { fg = "#a3c679", ctermfg = 150 },
+      DapStoppedLine = { bg = "#191a1c", ctermbg = 234 },
+      DapUIBreakpointsCurrentLine = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      DapUIBreakpointsDisabledLine = { fg = "#45454a", ctermfg = 238 },
+      DapUIBreakpointsInfo = { fg = "#d5b05f", ctermfg = 179 },
+      DapUIBreakpointsPath = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIDecoration = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIFloatBorder = { fg = "#161616", ctermfg = 233 },
+      DapUILineNumber = { fg = "#2f3237", ctermfg = 236 },
+      DapUIModifiedValue = { fg = "#d5b05f", bold = true, ctermfg = 179 },
+      DapUIScope = { fg = "#80cbc4", ctermfg = 116 },
+      DapUISource = { fg = "#a3c679", ctermfg = 150 },
+      DapUIStoppedThread = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIThread = { fg = "#a3c679", ctermfg = 150 },
+      DapUIType = { fg = "#d5b05f", ctermfg = 179 },
+      DapUIValue = { fg = "#cd775c", ctermfg = 173 },
+      DapUIVariable = { fg = "#d9d9d9", ctermfg = 253 },
+      DapUIWatchesEmpty = { fg = "#c85e60", ctermfg = 167 },
+      DapUIWatchesError = { fg = "#c85e60", ctermfg = 167 },
+      DapUIWatchesValue = { fg = "#a3c679", ctermfg = 150 },
+    },
+    flash = {
+      FlashBackdrop = { fg = "#45454a", ctermfg = 238 },
+      FlashCurrent = { bg = "#292929", bold = true, ctermbg = 235 },
+      FlashLabel = { fg = "#0a0a0a", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 232 },
+      FlashMatch = { bg = "#292929", ctermbg = 235 },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#a3c679", bg = "#0a0a0a", ctermbg = 232, ctermfg = 150 },
+      GitSignsAddLn = { bg = "#38432c", ctermbg = 238 },
+      GitSignsAddNr = { fg = "#a3c679", ctermfg = 150 },
+      GitSignsAddPreview = { link = "DiffAdd" },
+      GitSignsChange = { fg = "#6a90d0", bg = "#0a0a0a", ctermbg = 232, ctermfg = 68 },
+      GitSignsChangeLn = { bg = "#273246", ctermbg = 236 },
+      GitSignsChangeNr = { fg = "#6a90d0", ctermfg = 68 },
+      GitSignsCurrentLineBlame = { fg = "#ffffff", ctermfg = 231, italic = true },
+      GitSignsDelete = { fg = "#c85e60", bg = "#0a0a0a", ctermbg = 232, ctermfg = 167 },
+      GitSignsDeleteLn = { bg = "#432324", ctermbg = 236 },
+      GitSignsDeleteNr = { fg = "#c85e60", ctermfg = 167 },
+      GitSignsDeletePreview = { link = "DiffDelete" },
+    },
+    headlines = {
+      CodeBlock = { bg = "#191a1c", ctermbg = 234 },
+      Dash = { fg = "#45454a", ctermfg = 238 },
+      Headline1 = { bg = "#191a1c", ctermbg = 234 },
+      Headline2 = { bg = "#191a1c", ctermbg = 234 },
+      Headline3 = { bg = "#191a1c", ctermbg = 234 },
+      Headline4 = { bg = "#191a1c", ctermbg = 234 },
+      Headline5 = { bg = "#191a1c", ctermbg = 234 },
+      Headline6 = { bg = "#191a1c", ctermbg = 234 },
+      Quote = { fg = "#6ebad7", ctermfg = 74, italic = true },
+    },
+    ibl = {
+      IblIndent = { fg = "#161616", ctermfg = 233 },
+      IblScope = { fg = "#80cbc4", ctermfg = 116 },
+      IndentBlanklineChar = { fg = "#161616", ctermfg = 233 },
+      IndentBlanklineContextChar = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    illuminate = {
+      IlluminatedWordRead = { bg = "#292929", ctermbg = 235 },
+      IlluminatedWordText = { bg = "#292929", ctermbg = 235 },
+      IlluminatedWordWrite = { bg = "#292929", ctermbg = 235 },
+    },
+    lazy = {
+      LazyButton = { bg = "#191a1c", ctermbg = 234 },
+      LazyButtonActive = { bg = "#292929", ctermbg = 235 },
+      LazyH1 = { fg = "#0a0a0a", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 232 },
+      LazyH2 = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      LazyReasonCmd = { fg = "#d5b05f", ctermfg = 179 },
+      LazyReasonEvent = { fg = "#6ebad7", ctermfg = 74 },
+      LazyReasonFt = { fg = "#a3c679", ctermfg = 150 },
+      LazyReasonKeys = { fg = "#a178c4", ctermfg = 140 },
+      LazyReasonPlugin = { fg = "#80cbc4", ctermfg = 116 },
+      LazyReasonStart = { fg = "#a3c679", ctermfg = 150 },
+    },
+    leap = {
+      LeapBackdrop = { fg = "#45454a", ctermfg = 238 },
+      LeapLabelPrimary = { fg = "#0a0a0a", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 232 },
+      LeapLabelSecondary = { fg = "#0a0a0a", bg = "#a178c4", bold = true, ctermbg = 140, ctermfg = 232 },
+      LeapMatch = { fg = "#80cbc4", bold = true, ctermfg = 116, underline = true },
+    },
+    mason = {
+      MasonHeader = { fg = "#0a0a0a", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 232 },
+      MasonHighlight = { fg = "#80cbc4", ctermfg = 116 },
+      MasonHighlightSecondary = { fg = "#6ebad7", ctermfg = 74 },
+      MasonMuted = { fg = "#45454a", ctermfg = 238 },
+    },
+    mini = {
+      MiniCursorword = { bg = "#292929", ctermbg = 235 },
+      MiniCursorwordCurrent = { bg = "#292929", ctermbg = 235 },
+      MiniIndentscopePrefix = { nocombine = true },
+      MiniIndentscopeSymbol = { fg = "#80cbc4", ctermfg = 116 },
+      MiniJump = { fg = "#0a0a0a", bg = "#80cbc4", ctermbg = 116, ctermfg = 232 },
+      MiniJump2dSpot = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      MiniStatuslineDevinfo = { fg = "#d9d9d9", bg = "#191a1c", ctermbg = 234, ctermfg = 253 },
+      MiniStatuslineFileinfo = { fg = "#d9d9d9", bg = "#191a1c", ctermbg = 234, ctermfg = 253 },
+      MiniStatuslineFilename = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+      MiniStatuslineInactive = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+      MiniStatuslineModeCommand = { fg = "#0a0a0a", bg = "#d5b05f", bold = true, ctermbg = 179, ctermfg = 232 },
+      MiniStatuslineModeInsert = { fg = "#0a0a0a", bg = "#a3c679", bold = true, ctermbg = 150, ctermfg = 232 },
+      MiniStatuslineModeNormal = { fg = "#0a0a0a", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 232 },
+      MiniStatuslineModeOther = { fg = "#0a0a0a", bg = "#a178c4", bold = true, ctermbg = 140, ctermfg = 232 },
+      MiniStatuslineModeReplace = { fg = "#0a0a0a", bg = "#c85e60", bold = true, ctermbg = 167, ctermfg = 232 },
+      MiniStatuslineModeVisual = { fg = "#0a0a0a", bg = "#6ebad7", bold = true, ctermbg = 74, ctermfg = 232 },
+      MiniSurround = { fg = "#0a0a0a", bg = "#80cbc4", ctermbg = 116, ctermfg = 232 },
+      MiniTablineCurrent = { fg = "#d9d9d9", bg = "#191a1c", ctermbg = 234, ctermfg = 253 },
+      MiniTablineFill = { bg = "#0a0a0a", ctermbg = 232 },
+      MiniTablineHidden = { fg = "#45454a", bg = "#0a0a0a", ctermbg = 232, ctermfg = 238 },
+      MiniTablineModifiedCurrent = { fg = "#80cbc4", bg = "#191a1c", ctermbg = 234, ctermfg = 116 },
+      MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "#0a0a0a", ctermbg = 232, ctermfg = 116 },
+      MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "#0a0a0a", ctermbg = 232, ctermfg = 116 },
+      MiniTablineTabpagesection = { fg = "#d9d9d9", bg = "#191a1c", ctermbg = 234, ctermfg = 253 },
+      MiniTablineVisible = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      MiniTestEmphasis = { bold = true },
+      MiniTestFail = { fg = "#c85e60", bold = true, ctermfg = 167 },
+      MiniTestPass = { fg = "#a3c679", bold = true, ctermfg = 150 },
+      MiniTrailspace = { bg = "#c85e60", ctermbg = 167 },
+    },
+    navic = {
+      NavicIconsArray = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsBoolean = { fg = "#d6808f", ctermfg = 174 },
+      NavicIconsClass = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsConstant = { fg = "#d6808f", ctermfg = 174 },
+      NavicIconsConstructor = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsEnum = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsEnumMember = { fg = "#d6808f", ctermfg = 174 },
+      NavicIconsEvent = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsField = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicIconsFile = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicIconsFunction = { fg = "#6a90d0", ctermfg = 68 },
+      NavicIconsInterface = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsKey = { fg = "#6ebad7", ctermfg = 74 },
+      NavicIconsMethod = { fg = "#6a90d0", ctermfg = 68 },
+      NavicIconsModule = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsNamespace = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsNull = { fg = "#d6808f", ctermfg = 174 },
+      NavicIconsNumber = { fg = "#cd775c", ctermfg = 173 },
+      NavicIconsObject = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsOperator = { fg = "#6ebad7", ctermfg = 74 },
+      NavicIconsPackage = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsProperty = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicIconsString = { fg = "#a3c679", ctermfg = 150 },
+      NavicIconsStruct = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsTypeParameter = { fg = "#d5b05f", ctermfg = 179 },
+      NavicIconsVariable = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicSeparator = { fg = "#161616", ctermfg = 233 },
+      NavicText = { fg = "#d9d9d9", ctermfg = 253 },
+    },
+    ["neo-tree"] = {
+      NeoTreeDirectoryIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NeoTreeDirectoryName = { fg = "#d9d9d9", ctermfg = 253 },
+      NeoTreeFileIcon = { fg = "#d9d9d9", ctermfg = 253 },
+      NeoTreeFileName = { fg = "#d9d9d9", ctermfg = 253 },
+      NeoTreeGitAdded = { fg = "#a3c679", ctermfg = 150 },
+      NeoTreeGitDeleted = { fg = "#c85e60", ctermfg = 167 },
+      NeoTreeGitModified = { fg = "#6a90d0", ctermfg = 68 },
+      NeoTreeGitUntracked = { fg = "#a3c679", ctermfg = 150 },
+      NeoTreeIndentMarker = { fg = "#161616", ctermfg = 233 },
+      NeoTreeNormal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      NeoTreeNormalNC = { link = "NeoTreeNormal" },
+      NeoTreeRootName = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NeoTreeSymbolicLinkTarget = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    noice = {
+      NoiceCmdline = { fg = "#d9d9d9", ctermfg = 253 },
+      NoiceCmdlineIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NoiceCmdlinePopup = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      NoiceCmdlinePopupBorder = { fg = "#161616", ctermfg = 233 },
+      NoiceConfirm = { bg = "#0a0a0a", ctermbg = 232 },
+      NoiceConfirmBorder = { fg = "#161616", ctermfg = 233 },
+    },
+    notify = {
+      NotifyBackground = { bg = "#0a0a0a", ctermbg = 232 },
+      NotifyDEBUGBorder = { fg = "#45454a", ctermfg = 238 },
+      NotifyDEBUGIcon = { fg = "#45454a", ctermfg = 238 },
+      NotifyDEBUGTitle = { fg = "#45454a", ctermfg = 238 },
+      NotifyERRORBorder = { fg = "#c85e60", ctermfg = 167 },
+      NotifyERRORIcon = { fg = "#c85e60", ctermfg = 167 },
+      NotifyERRORTitle = { fg = "#c85e60", ctermfg = 167 },
+      NotifyINFOBorder = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyINFOIcon = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyINFOTitle = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyTRACEBorder = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyTRACEIcon = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyTRACETitle = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyWARNBorder = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyWARNIcon = { fg = "#d5b05f", ctermfg = 179 },
+      NotifyWARNTitle = { fg = "#d5b05f", ctermfg = 179 },
+    },
+    ["nvim-tree"] = {
+      NvimTreeEmptyFolderName = { fg = "#45454a", ctermfg = 238 },
+      NvimTreeFolderIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeFolderName = { fg = "#d9d9d9", ctermfg = 253 },
+      NvimTreeGitDeleted = { fg = "#c85e60", ctermfg = 167 },
+      NvimTreeGitDirty = { fg = "#6a90d0", ctermfg = 68 },
+      NvimTreeGitNew = { fg = "#a3c679", ctermfg = 150 },
+      NvimTreeGitStaged = { fg = "#a3c679", ctermfg = 150 },
+      NvimTreeImageFile = { fg = "#d9d9d9", ctermfg = 253 },
+      NvimTreeIndentMarker = { fg = "#161616", ctermfg = 233 },
+      NvimTreeNormal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      NvimTreeNormalNC = { link = "NvimTreeNormal" },
+      NvimTreeOpenedFolderName = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeRootFolder = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NvimTreeSpecialFile = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeSymlink = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    ["rainbow-delimiters"] = {
+      RainbowDelimiterBlue = { fg = "#6a90d0", ctermfg = 68 },
+      RainbowDelimiterCyan = { fg = "#6ebad7", ctermfg = 74 },
+      RainbowDelimiterGreen = { fg = "#a3c679", ctermfg = 150 },
+      RainbowDelimiterOrange = { fg = "#cd775c", ctermfg = 173 },
+      RainbowDelimiterRed = { fg = "#c85e60", ctermfg = 167 },
+      RainbowDelimiterViolet = { fg = "#a178c4", ctermfg = 140 },
+      RainbowDelimiterYellow = { fg = "#d5b05f", ctermfg = 179 },
+    },
+    telescope = {
+      TelescopeBorder = { fg = "#161616", bg = "#0a0a0a", ctermbg = 232, ctermfg = 233 },
+      TelescopeMatching = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TelescopeNormal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      TelescopePreviewNormal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      TelescopePreviewTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopePromptCounter = { fg = "#45454a", ctermfg = 238 },
+      TelescopePromptPrefix = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeResultsNormal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      TelescopeResultsTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeSelection = { bg = "#292929", ctermbg = 235 },
+      TelescopeSelectionCaret = { fg = "#80cbc4", bg = "#292929", ctermbg = 235, ctermfg = 116 },
+      TelescopeTitle = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+    },
+    trouble = {
+      TroubleCount = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TroubleFile = { fg = "#d9d9d9", ctermfg = 253 },
+      TroubleFoldIcon = { fg = "#45454a", ctermfg = 238 },
+      TroubleLocation = { fg = "#45454a", ctermfg = 238 },
+      TroubleNormal = { fg = "#d9d9d9", bg = "#0a0a0a", ctermbg = 232, ctermfg = 253 },
+      TroublePreview = { bg = "#191a1c", ctermbg = 234 },
+      TroubleSignError = { fg = "#c85e60", ctermfg = 167 },
+      TroubleSignHint = { fg = "#d5b05f", ctermfg = 179 },
+      TroubleSignInformation = { fg = "#d5b05f", ctermfg = 179 },
+      TroubleSignWarning = { fg = "#d5b05f", ctermfg = 179 },
+      TroubleText = { fg = "#d9d9d9", ctermfg = 253 },
+    },
+    ["which-key"] = {
+      WhichKey = { fg = "#80cbc4", ctermfg = 116 },
+      WhichKeyDesc = { fg = "#d9d9d9", ctermfg = 253 },
+      WhichKeyFloat = { bg = "#0a0a0a", ctermbg = 232 },
+      WhichKeyGroup = { fg = "#6ebad7", ctermfg = 74 },
+      WhichKeySeparator = { fg = "#45454a", ctermfg = 238 },
+      WhichKeySeperator = { fg = "#45454a", ctermfg = 238 },
+      WhichKeyValue = { fg = "#45454a", ctermfg = 238 },
+    },
+  },
+
+  -- Terminal colors 0-15
+  terminal = {
+    "#45454a",
+    "#c85e60",
+    "#a3c679",
+    "#d5b05f",
+    "#6a90d0",
+    "#a178c4",
+    "#6ebad7",
+    "#d9d9d9",
+    "#212121",
+    "#c85e60",
+    "#a3c679",
+    "#d5b05f",
+    "#6a90d0",
+    "#a178c4",
+    "#6ebad7",
+    "#d9d9d9",
+  },
+
+  -- Overrides applied on top of groups with transparent
+  transparent = {
+    groups = {
+      DiagnosticSignError = { fg = "#c85e60", bg = "NONE", ctermbg = "NONE", ctermfg = 167 },
+      DiagnosticSignHint = { fg = "#d5b05f", bg = "NONE", ctermbg = "NONE", ctermfg = 179 },
+      DiagnosticSignInfo = { fg = "#d5b05f", bg = "NONE", ctermbg = "NONE", ctermfg = 179 },
+      DiagnosticSignOk = { fg = "#a3c679", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+      DiagnosticSignWarn = { fg = "#d5b05f", bg = "NONE", ctermbg = "NONE", ctermfg = 179 },
+      FloatBorder = { fg = "#161616", bg = "NONE", ctermbg = "NONE", ctermfg = 233 },
+      FloatTitle = { fg = "#80cbc4", bg = "NONE", bold = true, ctermbg = "NONE", ctermfg = 116 },
+      FoldColumn = { fg = "#45454a", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+      LineNr = { fg = "#2f3237", bg = "NONE", ctermbg = "NONE", ctermfg = 236 },
+      Normal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      NormalFloat = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      NormalNC = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      SignColumn = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      StatusLineNC = { fg = "#45454a", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+      TabLine = { fg = "#45454a", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+      TabLineFill = { bg = "NONE", ctermbg = "NONE" },
+      TerminalNormal = { fg = "#eeffff", bg = "NONE", ctermbg = "NONE", ctermfg = 231 },
+    },
+    plugins = {
+      gitsigns = {
+        GitSignsAdd = { fg = "#a3c679", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+        GitSignsChange = { fg = "#6a90d0", bg = "NONE", ctermbg = "NONE", ctermfg = 68 },
+        GitSignsDelete = { fg = "#c85e60", bg = "NONE", ctermbg = "NONE", ctermfg = 167 },
+      },
+      mini = {
+        MiniStatuslineFilename = { fg = "#45454a", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+        MiniStatuslineInactive = { fg = "#45454a", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+        MiniTablineFill = { bg = "NONE", ctermbg = "NONE" },
+        MiniTablineHidden = { fg = "#45454a", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+        MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineVisible = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      ["neo-tree"] = {
+        NeoTreeNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      noice = {
+        NoiceCmdlinePopup = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+        NoiceConfirm = { bg = "NONE", ctermbg = "NONE" },
+      },
+      notify = {
+        NotifyBackground = { bg = "NONE", ctermbg = "NONE" },
+      },
+      ["nvim-tree"] = {
+        NvimTreeNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      telescope = {
+        TelescopeBorder = { fg = "#161616", bg = "NONE", ctermbg = "NONE", ctermfg = 233 },
+        TelescopeNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+        TelescopePreviewNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+        TelescopeResultsNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      trouble = {
+        TroubleNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      ["which-key"] = {
+        WhichKeyFloat = { bg = "NONE", ctermbg = "NONE" },
+      },
+    },
+  },
+
+  -- Overrides applied on top of groups with no italic comments
+  no_italic_comments = {
+    groups = {
+      Comment = { fg = "#45454a", ctermfg = 238 },
+    },
+    plugins = {
+    },
+  },
+}
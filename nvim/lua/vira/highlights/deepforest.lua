@@ -0,0 +1,751 @@
+-- Vira Deepforest highlights
+-- Auto-generated by generate.py from groups/init.lua and mappings/jetbrains-to-nvim.json
+
+return {
+  -- Core groups, and per-plugin groups applied when the plugin loads
+  groups = {
+    ["@attribute"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@boolean"] = { link = "Boolean" },
+    ["@boolean.json"] = { fg = "#d3959b", ctermfg = 174 },
+    ["@boolean.toml"] = { fg = "#f07178", ctermfg = 210 },
+    ["@character"] = { link = "Character" },
+    ["@character.special"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@character.special.regexp"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@comment"] = { link = "Comment" },
+    ["@comment.bash"] = { fg = "#3b544d", ctermfg = 239, italic = true },
+    ["@comment.documentation"] = { link = "Comment" },
+    ["@comment.error"] = { fg = "#f07178", bold = true, ctermfg = 210 },
+    ["@comment.go"] = { fg = "#3b544d", ctermfg = 239, italic = true },
+    ["@comment.note"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@comment.todo"] = { link = "Todo" },
+    ["@comment.warning"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@constant"] = { link = "Constant" },
+    ["@constant.builtin"] = { fg = "#d3959b", ctermfg = 174, italic = true },
+    ["@constant.builtin.go"] = { fg = "#d3959b", ctermfg = 174, italic = true },
+    ["@constant.css"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@constant.kotlin"] = { fg = "#f07178", ctermfg = 210 },
+    ["@constant.macro"] = { link = "Macro" },
+    ["@constructor"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@diff.delta"] = { link = "DiffChange" },
+    ["@diff.minus"] = { link = "DiffDelete" },
+    ["@diff.plus"] = { link = "DiffAdd" },
+    ["@function"] = { link = "Function" },
+    ["@function.builtin"] = { fg = "#6fa0de", ctermfg = 75, italic = true },
+    ["@function.builtin.go"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.call"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.call.bash"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@function.call.kotlin"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.css"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.go"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.javascript"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.kotlin"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.macro"] = { link = "Macro" },
+    ["@function.method"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.method.call"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@function.method.javascript"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@keyword"] = { link = "Keyword" },
+    ["@keyword.bash"] = { fg = "#74c9de", bold = true, ctermfg = 81 },
+    ["@keyword.conditional"] = { link = "Conditional" },
+    ["@keyword.conditional.ternary"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@keyword.coroutine"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@keyword.css"] = { fg = "#cc8868", bold = true, ctermfg = 173 },
+    ["@keyword.debug"] = { link = "Debug" },
+    ["@keyword.directive"] = { link = "PreProc" },
+    ["@keyword.directive.bash"] = { fg = "#3b544d", ctermfg = 239, italic = true },
+    ["@keyword.directive.define"] = { link = "Define" },
+    ["@keyword.exception"] = { link = "Exception" },
+    ["@keyword.function"] = { link = "Keyword" },
+    ["@keyword.import"] = { link = "Include" },
+    ["@keyword.modifier"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@keyword.operator"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@keyword.regexp"] = { fg = "#74c9de", bold = true, ctermfg = 81 },
+    ["@keyword.repeat"] = { link = "Repeat" },
+    ["@keyword.return"] = { fg = "#cc8868", ctermfg = 173 },
+    ["@keyword.storage"] = { link = "StorageClass" },
+    ["@label"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@label.json"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@label.yaml"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@lsp.mod.abstract"] = { italic = true },
+    ["@lsp.mod.async"] = { italic = true },
+    ["@lsp.mod.declaration"] = {},
+    ["@lsp.mod.defaultLibrary"] = { italic = true },
+    ["@lsp.mod.definition"] = {},
+    ["@lsp.mod.deprecated"] = { strikethrough = true },
+    ["@lsp.mod.documentation"] = {},
+    ["@lsp.mod.modification"] = {},
+    ["@lsp.mod.readonly"] = { italic = true },
+    ["@lsp.mod.static"] = { italic = true },
+    ["@lsp.type.class"] = { link = "Type" },
+    ["@lsp.type.comment"] = {},
+    ["@lsp.type.decorator"] = { link = "@attribute" },
+    ["@lsp.type.enum"] = { link = "Type" },
+    ["@lsp.type.enumMember"] = { link = "Constant" },
+    ["@lsp.type.event"] = { link = "Type" },
+    ["@lsp.type.function"] = { link = "Function" },
+    ["@lsp.type.interface"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@lsp.type.keyword"] = { link = "Keyword" },
+    ["@lsp.type.macro"] = { link = "Macro" },
+    ["@lsp.type.method"] = { link = "Function" },
+    ["@lsp.type.modifier"] = { link = "@keyword.modifier" },
+    ["@lsp.type.namespace"] = { link = "@module" },
+    ["@lsp.type.number"] = { link = "Number" },
+    ["@lsp.type.operator"] = { link = "Operator" },
+    ["@lsp.type.parameter"] = { link = "@variable.parameter" },
+    ["@lsp.type.property"] = { link = "@property" },
+    ["@lsp.type.regexp"] = { link = "@string.regexp" },
+    ["@lsp.type.string"] = { link = "String" },
+    ["@lsp.type.struct"] = { link = "Type" },
+    ["@lsp.type.type"] = { link = "Type" },
+    ["@lsp.type.typeParameter"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@lsp.type.variable"] = {},
+    ["@lsp.typemod.function.declaration"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@lsp.typemod.function.defaultLibrary"] = { fg = "#6fa0de", ctermfg = 75, italic = true },
+    ["@lsp.typemod.parameter.declaration"] = { link = "@variable.parameter" },
+    ["@lsp.typemod.variable.defaultLibrary"] = { link = "@variable.builtin" },
+    ["@lsp.typemod.variable.readonly"] = { link = "Constant" },
+    ["@markup.environment"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@markup.heading"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.1"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.2"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.3"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.4"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.5"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.6"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.italic"] = { italic = true },
+    ["@markup.link"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@markup.link.label"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@markup.link.url"] = { fg = "#f07178", ctermfg = 210, underline = true },
+    ["@markup.list"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@markup.list.checked"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@markup.list.unchecked"] = { fg = "#3b544d", ctermfg = 239 },
+    ["@markup.math"] = { fg = "#cc8868", ctermfg = 173 },
+    ["@markup.quote"] = { fg = "#74c9de", ctermfg = 81, italic = true },
+    ["@markup.raw"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@markup.raw.block"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@markup.strikethrough"] = { strikethrough = true },
+    ["@markup.strong"] = { bold = true },
+    ["@markup.underline"] = { underline = true },
+    ["@module"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@module.go"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@namespace"] = { fg = "#d3959b", ctermfg = 174 },
+    ["@none"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@number"] = { link = "Number" },
+    ["@number.css"] = { fg = "#cc8868", ctermfg = 173 },
+    ["@number.float"] = { link = "Float" },
+    ["@operator"] = { link = "Operator" },
+    ["@property"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@property.css"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@property.json"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@property.yaml"] = { fg = "#f07178", bold = true, ctermfg = 210 },
+    ["@punctuation.bracket"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@punctuation.bracket.kotlin"] = { fg = "#a68dcd", bold = true, ctermfg = 140 },
+    ["@punctuation.bracket.regexp"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@punctuation.delimiter"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@punctuation.special"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@punctuation.special.javascript"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@punctuation.special.markdown"] = { fg = "#3b544d", bold = true, ctermfg = 239 },
+    ["@rainbow.blue"] = { fg = "#6fa0de", ctermfg = 75 },
+    ["@rainbow.cyan"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@rainbow.green"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@rainbow.orange"] = { fg = "#d3959b", ctermfg = 174 },
+    ["@rainbow.red"] = { fg = "#f07178", ctermfg = 210 },
+    ["@rainbow.violet"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@rainbow.yellow"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@string"] = { link = "String" },
+    ["@string.css"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@string.documentation"] = { fg = "#3b544d", ctermfg = 239 },
+    ["@string.escape"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@string.escape.regexp"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@string.regexp"] = { fg = "#cc8868", ctermfg = 173 },
+    ["@string.regexp.javascript"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.special"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@string.special.path"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.special.symbol"] = { fg = "#d3959b", ctermfg = 174 },
+    ["@string.special.url"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@string.special.url.css"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.yaml"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@tag"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@tag.attribute"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@tag.attribute.css"] = { fg = "#a68dcd", ctermfg = 140 },
+    ["@tag.builtin"] = { fg = "#74c9de", ctermfg = 81, italic = true },
+    ["@tag.css"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@tag.delimiter"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@tag.javascript"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type"] = { link = "Type" },
+    ["@type.builtin"] = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    ["@type.builtin.go"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.css"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.definition"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.go"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.javascript"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.kotlin"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.qualifier"] = { fg = "#74c9de", ctermfg = 81 },
+    ["@variable"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.builtin"] = { fg = "#cc8868", ctermfg = 173, italic = true },
+    ["@variable.builtin.go"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.css"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.go"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.javascript"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.kotlin"] = { fg = "#95bbbd", ctermfg = 109 },
+    ["@variable.member"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.member.kotlin"] = { bold = true },
+    ["@variable.parameter"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.parameter.go"] = { fg = "#cae5d5", ctermfg = 152 },
+    ["@variable.parameter.kotlin"] = { fg = "#cae5d5", ctermfg = 152 },
+    Added = { fg = "#c3e88d", ctermfg = 150 },
+    BookmarkSign = { fg = "#ffffff", bg = "#ffcb6b", ctermbg = 222, ctermfg = 231 },
+    Boolean = { fg = "#d3959b", ctermfg = 174 },
+    Changed = { fg = "#6fa0de", ctermfg = 75 },
+    Character = { fg = "#c3e88d", ctermfg = 150 },
+    ColorColumn = { bg = "#1f2c28", ctermbg = 235 },
+    Comment = { fg = "#3b544d", ctermfg = 239, italic = true },
+    Conditional = { link = "Statement" },
+    Constant = { fg = "#d3959b", ctermfg = 174, italic = true },
+    CurSearch = { link = "IncSearch" },
+    Cursor = { fg = "#111816", bg = "#ffcc00", ctermbg = 220, ctermfg = 233 },
+    CursorColumn = { link = "CursorLine" },
+    CursorIM = { link = "Cursor" },
+    CursorLine = { bg = "#192521", ctermbg = 235 },
+    CursorLineFold = { link = "CursorLineNr" },
+    CursorLineNr = { fg = "#2c3f39", bg = "#192521", bold = true, ctermbg = 235, ctermfg = 237 },
+    CursorLineSign = { link = "CursorLine" },
+    Debug = { fg = "#ffcb6b", ctermfg = 222 },
+    Define = { fg = "#74c9de", ctermfg = 81 },
+    Delimiter = { fg = "#74c9de", ctermfg = 81 },
+    DiagnosticDeprecated = { sp = "#f07178", strikethrough = true },
+    DiagnosticError = { fg = "#f07178", ctermfg = 210 },
+    DiagnosticFloatingError = { fg = "#f07178", ctermfg = 210 },
+    DiagnosticFloatingHint = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticFloatingInfo = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticFloatingOk = { fg = "#c3e88d", ctermfg = 150 },
+    DiagnosticFloatingWarn = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticHint = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticInfo = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticOk = { fg = "#c3e88d", ctermfg = 150 },
+    DiagnosticSignError = { fg = "#f07178", bg = "#111816", ctermbg = 233, ctermfg = 210 },
+    DiagnosticSignHint = { fg = "#ffcb6b", bg = "#111816", ctermbg = 233, ctermfg = 222 },
+    DiagnosticSignInfo = { fg = "#ffcb6b", bg = "#111816", ctermbg = 233, ctermfg = 222 },
+    DiagnosticSignOk = { fg = "#c3e88d", bg = "#111816", ctermbg = 233, ctermfg = 150 },
+    DiagnosticSignWarn = { fg = "#ffcb6b", bg = "#111816", ctermbg = 233, ctermfg = 222 },
+    DiagnosticUnderlineError = { sp = "#f07178", undercurl = true },
+    DiagnosticUnderlineHint = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnderlineInfo = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnderlineOk = { sp = "#c3e88d", undercurl = true },
+    DiagnosticUnderlineWarn = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnnecessary = { fg = "#3b544d", ctermfg = 239, italic = true },
+    DiagnosticVirtualTextError = { fg = "#f07178", ctermfg = 210, italic = true },
+    DiagnosticVirtualTextHint = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticVirtualTextInfo = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticVirtualTextOk = { fg = "#c3e88d", ctermfg = 150, italic = true },
+    DiagnosticVirtualTextWarn = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticWarn = { fg = "#ffcb6b", ctermfg = 222 },
+    DiffAdd = { bg = "#4f6140", ctermbg = 65 },
+    DiffChange = { bg = "#32475c", ctermbg = 238 },
+    DiffDelete = { bg = "#5f3738", ctermbg = 95 },
+    DiffText = { bg = "#2c3f39", bold = true, ctermbg = 237 },
+    EndOfBuffer = { fg = "#111816", ctermfg = 233 },
+    Error = { fg = "#f07178", ctermfg = 210 },
+    ErrorMsg = { fg = "#f07178", bold = true, ctermfg = 210 },
+    Exception = { fg = "#d3959b", ctermfg = 174 },
+    Float = { fg = "#cc8868", ctermfg = 173 },
+    FloatBorder = { fg = "#1f2c28", bg = "#111816", ctermbg = 233, ctermfg = 235 },
+    FloatTitle = { fg = "#80cbc4", bg = "#111816", bold = true, ctermbg = 233, ctermfg = 116 },
+    FoldColumn = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+    Folded = { fg = "#95bbbd", bg = "#192521", ctermbg = 235, ctermfg = 109 },
+    Function = { fg = "#6fa0de", ctermfg = 75 },
+    Identifier = { fg = "#cae5d5", ctermfg = 152 },
+    Ignore = { fg = "#3b544d", ctermfg = 239 },
+    IncSearch = { bg = "#2e4535", bold = true, ctermbg = 238 },
+    Include = { fg = "#74c9de", ctermfg = 81 },
+    Keyword = { fg = "#74c9de", bold = true, ctermfg = 81 },
+    Label = { fg = "#a68dcd", ctermfg = 140 },
+    LineNr = { fg = "#2c3f39", bg = "#111816", ctermbg = 233, ctermfg = 237 },
+    LineNrAbove = { link = "LineNr" },
+    LineNrBelow = { link = "LineNr" },
+    LspCodeLens = { fg = "#3b544d", ctermfg = 239 },
+    LspCodeLensSeparator = { fg = "#1f2c28", ctermfg = 235 },
+    LspInlayHint = { fg = "#3b544d", ctermfg = 239, italic = true },
+    LspReferenceRead = { bg = "#2e4535", ctermbg = 238 },
+    LspReferenceText = { bg = "#2e4535", ctermbg = 238 },
+    LspReferenceWrite = { bg = "#2e4535", bold = true, ctermbg = 238 },
+    LspSignatureActiveParameter = { bg = "#2e4535", ctermbg = 238 },
+    Macro = { fg = "#ffcb6b", ctermfg = 222 },
+    MatchParen = { fg = "#ffcc00", bold = true, ctermfg = 220 },
+    ModeMsg = { fg = "#cae5d5", bold = true, ctermfg = 152 },
+    MoreMsg = { fg = "#80cbc4", ctermfg = 116 },
+    MsgArea = { fg = "#cae5d5", ctermfg = 152 },
+    NonText = { fg = "#24332f", ctermfg = 236 },
+    Normal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+    NormalFloat = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+    NormalNC = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+    Number = { fg = "#cc8868", ctermfg = 173 },
+    Operator = { fg = "#74c9de", ctermfg = 81 },
+    Pmenu = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+    PmenuExtra = { fg = "#3b544d", ctermfg = 239 },
+    PmenuExtraSel = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+    PmenuKind = { fg = "#ffcb6b", ctermfg = 222 },
+    PmenuKindSel = { fg = "#ffcb6b", bg = "#111816", ctermbg = 233, ctermfg = 222 },
+    PmenuSbar = { bg = "#111816", ctermbg = 233 },
+    PmenuSel = { bg = "#111816", ctermbg = 233 },
+    PmenuThumb = { bg = "#3b544d", ctermbg = 239 },
+    PreCondit = { fg = "#74c9de", ctermfg = 81 },
+    PreProc = { fg = "#ffcb6b", ctermfg = 222 },
+    Question = { fg = "#80cbc4", ctermfg = 116 },
+    Removed = { fg = "#f07178", ctermfg = 210 },
+    Repeat = { link = "Statement" },
+    ScrollbarSlider = { bg = "#1e2623", ctermbg = 235 },
+    Search = { bg = "#2e4535", ctermbg = 238 },
+    SignColumn = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+    Special = { fg = "#80cbc4", ctermfg = 116 },
+    SpecialChar = { fg = "#cae5d5", ctermfg = 152 },
+    SpecialComment = { fg = "#3b544d", bold = true, ctermfg = 239 },
+    SpecialKey = { fg = "#24332f", ctermfg = 236 },
+    SpellBad = { sp = "#f07178", undercurl = true },
+    SpellCap = { sp = "#c3e88d", undercurl = true },
+    SpellLocal = { sp = "#ffcb6b", undercurl = true },
+    SpellRare = { sp = "#ffcb6b", undercurl = true },
+    Statement = { fg = "#74c9de", bold = true, ctermfg = 81 },
+    StatusLine = { fg = "#cae5d5", bg = "#192521", ctermbg = 235, ctermfg = 152 },
+    StatusLineNC = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+    StorageClass = { fg = "#74c9de", ctermfg = 81 },
+    String = { fg = "#c3e88d", ctermfg = 150 },
+    Structure = { fg = "#ffcb6b", ctermfg = 222 },
+    Substitute = { bg = "#2d4152", bold = true, ctermbg = 237 },
+    TabLine = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+    TabLineFill = { bg = "#111816", ctermbg = 233 },
+    TabLineSel = { fg = "#cae5d5", bg = "#192521", sp = "#80cbc4", ctermbg = 235, ctermfg = 152, underline = true },
+    Tag = { fg = "#74c9de", ctermfg = 81 },
+    TermCursor = { link = "Cursor" },
+    TermCursorNC = { bg = "#3b544d", ctermbg = 239 },
+    TerminalBlack = { fg = "#3b544d", ctermfg = 239 },
+    TerminalBlue = { fg = "#6fa0de", ctermfg = 75 },
+    TerminalBrightBlue = { fg = "#6fa0de", ctermfg = 75 },
+    TerminalBrightCyan = { fg = "#74c9de", ctermfg = 81 },
+    TerminalBrightGreen = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalBrightMagenta = { fg = "#a68dcd", ctermfg = 140 },
+    TerminalBrightRed = { fg = "#f07178", ctermfg = 210 },
+    TerminalBrightYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor0 = { fg = "#3b544d", ctermfg = 239 },
+    TerminalColor1 = { fg = "#f07178", ctermfg = 210 },
+    TerminalColor10 = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalColor11 = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor12 = { fg = "#6fa0de", ctermfg = 75 },
+    TerminalColor13 = { fg = "#a68dcd", ctermfg = 140 },
+    TerminalColor14 = { fg = "#74c9de", ctermfg = 81 },
+    TerminalColor15 = { fg = "#cae5d5", ctermfg = 152 },
+    TerminalColor2 = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalColor3 = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor4 = { fg = "#6fa0de", ctermfg = 75 },
+    TerminalColor5 = { fg = "#a68dcd", ctermfg = 140 },
+    TerminalColor6 = { fg = "#74c9de", ctermfg = 81 },
+    TerminalColor7 = { fg = "#cae5d5", ctermfg = 152 },
+    TerminalColor8 = { fg = "#2c3f39", ctermfg = 237 },
+    TerminalColor9 = { fg = "#f07178", ctermfg = 210 },
+    TerminalCyan = { fg = "#74c9de", ctermfg = 81 },
+    TerminalError = { fg = "#f07178", ctermfg = 210 },
+    TerminalGreen = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalMagenta = { fg = "#a68dcd", ctermfg = 140 },
+    TerminalNormal = { fg = "#d9ffe3", bg = "#111816", ctermbg = 233, ctermfg = 194 },
+    TerminalRed = { fg = "#f07178", ctermfg = 210 },
+    TerminalWhite = { fg = "#cae5d5", ctermfg = 152 },
+    TerminalYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    Todo = { fg = "#cc8868", bold = true, ctermfg = 173, italic = true },
+    Type = { fg = "#ffcb6b", ctermfg = 222 },
+    Typedef = { fg = "#ffcb6b", ctermfg = 222 },
+    Underlined = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    VertSplit = { link = "WinSeparator" },
+    Visual = { bg = "#2e4535", ctermbg = 238 },
+    VisualNOS = { link = "Visual" },
+    WarningMsg = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    Whitespace = { fg = "#2c3f39", ctermfg = 237 },
+    WinBar = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+    WinBarNC = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+    WinSeparator = { fg = "#1f2c28", ctermfg = 235 },
+    debugPC = { bg = "#192521", ctermbg = 235 },
+    lCursor = { link = "Cursor" },
+  },
+  plugins = {
+    cmp = {
+      CmpItemAbbr = { fg = "#cae5d5", ctermfg = 152 },
+      CmpItemAbbrDeprecated = { fg = "#3b544d", ctermfg = 239, strikethrough = true },
+      CmpItemAbbrMatch = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      CmpItemAbbrMatchFuzzy = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKind = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindClass = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindColor = { fg = "#d3959b", ctermfg = 174 },
+      CmpItemKindConstant = { fg = "#d3959b", ctermfg = 174 },
+      CmpItemKindConstructor = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindEnum = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindEnumMember = { fg = "#d3959b", ctermfg = 174 },
+      CmpItemKindEvent = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindField = { fg = "#cae5d5", ctermfg = 152 },
+      CmpItemKindFile = { fg = "#cae5d5", ctermfg = 152 },
+      CmpItemKindFolder = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindFunction = { fg = "#6fa0de", ctermfg = 75 },
+      CmpItemKindInterface = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindKeyword = { fg = "#74c9de", ctermfg = 81 },
+      CmpItemKindMethod = { fg = "#6fa0de", ctermfg = 75 },
+      CmpItemKindModule = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindOperator = { fg = "#74c9de", ctermfg = 81 },
+      CmpItemKindProperty = { fg = "#cae5d5", ctermfg = 152 },
+      CmpItemKindReference = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindSnippet = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindStruct = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindText = { fg = "#cae5d5", ctermfg = 152 },
+      CmpItemKindTypeParameter = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindUnit = { fg = "#cc8868", ctermfg = 173 },
+      CmpItemKindValue = { fg = "#d3959b", ctermfg = 174 },
+      CmpItemKindVariable = { fg = "#cae5d5", ctermfg = 152 },
+      CmpItemMenu = { fg = "#3b544d", ctermfg = 239 },
+    },
+    dap = {
+      DapBreakpoint = { fg = "#f07178", ctermfg = 210 },
+      DapBreakpointCondition = { fg = "#ffcb6b", ctermfg = 222 },
+      DapBreakpointRejected = { fg = "#3b544d", ctermfg = 239 },
+      DapLogPoint = { fg = "#ffcb6b", ctermfg = 222 },
+      DapStopped = { fg = "#c3e88d", ctermfg = 150 },
+      DapStoppedLine = { bg = "#192521", ctermbg = 235 },
+      DapUIBreakpointsCurrentLine = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      DapUIBreakpointsDisabledLine = { fg = "#3b544d", ctermfg = 239 },
+      DapUIBreakpointsInfo = { fg = "#ffcb6b", ctermfg = 222 },
+      DapUIBreakpointsPath = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIDecoration = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIFloatBorder = { fg = "#1f2c28", ctermfg = 235 },
+      DapUILineNumber = { fg = "#2c3f39", ctermfg = 237 },
+      DapUIModifiedValue = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+      DapUIScope = { fg = "#80cbc4", ctermfg = 116 },
+      DapUISource = { fg = "#c3e88d", ctermfg = 150 },
+      DapUIStoppedThread = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIThread = { fg = "#c3e88d", ctermfg = 150 },
+      DapUIType = { fg = "#ffcb6b", ctermfg = 222 },
+      DapUIValue = { fg = "#cc8868", ctermfg = 173 },
+      DapUIVariable = { fg = "#cae5d5", ctermfg = 152 },
+      DapUIWatchesEmpty = { fg = "#f07178", ctermfg = 210 },
+      DapUIWatchesError = { fg = "#f07178", ctermfg = 210 },
+      DapUIWatchesValue = { fg = "#c3e88d", ctermfg = 150 },
+    },
+    flash = {
+      FlashBackdrop = { fg = "#3b544d", ctermfg = 239 },
+      FlashCurrent = { bg = "#2e4535", bold = true, ctermbg = 238 },
+      FlashLabel = { fg = "#111816", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 233 },
+      FlashMatch = { bg = "#2e4535", ctermbg = 238 },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c3e88d", bg = "#111816", ctermbg = 233, ctermfg = 150 },
+      GitSignsAddLn = { bg = "#47573a", ctermbg = 239 },
+      GitSignsAddNr = { fg = "#c3e88d", ctermfg = 150 },
+      GitSignsAddPreview = { link = "DiffAdd" },
+      GitSignsChange = { fg = "#6fa0de", bg = "#111816", ctermbg = 233, ctermfg = 75 },
+      GitSignsChangeLn = { bg = "#2d4152", ctermbg = 237 },
+      GitSignsChangeNr = { fg = "#6fa0de", ctermfg = 75 },
+      GitSignsCurrentLineBlame = { fg = "#ffffff", ctermfg = 231, italic = true },
+      GitSignsDelete = { fg = "#f07178", bg = "#111816", ctermbg = 233, ctermfg = 210 },
+      GitSignsDeleteLn = { bg = "#543334", ctermbg = 237 },
+      GitSignsDeleteNr = { fg = "#f07178", ctermfg = 210 },
+      GitSignsDeletePreview = { link = "DiffDelete" },
+    },
+    headlines = {
+      CodeBlock = { bg = "#192521", ctermbg = 235 },
+      Dash = { fg = "#3b544d", ctermfg = 239 },
+      Headline1 = { bg = "#192521", ctermbg = 235 },
+      Headline2 = { bg = "#192521", ctermbg = 235 },
+      Headline3 = { bg = "#192521", ctermbg = 235 },
+      Headline4 = { bg = "#192521", ctermbg = 235 },
+      Headline5 = { bg = "#192521", ctermbg = 235 },
+      Headline6 = { bg = "#192521", ctermbg = 235 },
+      Quote = { fg = "#74c9de", ctermfg = 81, italic = true },
+    },
+    ibl = {
+      IblIndent = { fg = "#1f2c28", ctermfg = 235 },
+      IblScope = { fg = "#80cbc4", ctermfg = 116 },
+      IndentBlanklineChar = { fg = "#1f2c28", ctermfg = 235 },
+      IndentBlanklineContextChar = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    illuminate = {
+      IlluminatedWordRead = { bg = "#2e4535", ctermbg = 238 },
+      IlluminatedWordText = { bg = "#2e4535", ctermbg = 238 },
+      IlluminatedWordWrite = { bg = "#2e4535", ctermbg = 238 },
+    },
+    lazy = {
+      LazyButton = { bg = "#192521", ctermbg = 235 },
+      LazyButtonActive = { bg = "#2e4535", ctermbg = 238 },
+      LazyH1 = { fg = "#111816", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 233 },
+      LazyH2 = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      LazyReasonCmd = { fg = "#ffcb6b", ctermfg = 222 },
+      LazyReasonEvent = { fg = "#74c9de", ctermfg = 81 },
+      LazyReasonFt = { fg = "#c3e88d", ctermfg = 150 },
+      LazyReasonKeys = { fg = "#a68dcd", ctermfg = 140 },
+      LazyReasonPlugin = { fg = "#80cbc4", ctermfg = 116 },
+      LazyReasonStart = { fg = "#c3e88d", ctermfg = 150 },
+    },
+    leap = {
+      LeapBackdrop = { fg = "#3b544d", ctermfg = 239 },
+      LeapLabelPrimary = { fg = "#111816", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 233 },
+      LeapLabelSecondary = { fg = "#111816", bg = "#a68dcd", bold = true, ctermbg = 140, ctermfg = 233 },
+      LeapMatch = { fg = "#80cbc4", bold = true, ctermfg = 116, underline = true },
+    },
+    mason = {
+      MasonHeader = { fg = "#111816", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 233 },
+      MasonHighlight = { fg = "#80cbc4", ctermfg = 116 },
+      MasonHighlightSecondary = { fg = "#74c9de", ctermfg = 81 },
+      MasonMuted = { fg = "#3b544d", ctermfg = 239 },
+    },
+    mini = {
+      MiniCursorword = { bg = "#2e4535", ctermbg = 238 },
+      MiniCursorwordCurrent = { bg = "#2e4535", ctermbg = 238 },
+      MiniIndentscopePrefix = { nocombine = true },
+      MiniIndentscopeSymbol = { fg = "#80cbc4", ctermfg = 116 },
+      MiniJump = { fg = "#111816", bg = "#80cbc4", ctermbg = 116, ctermfg = 233 },
+      MiniJump2dSpot = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      MiniStatuslineDevinfo = { fg = "#cae5d5", bg = "#192521", ctermbg = 235, ctermfg = 152 },
+      MiniStatuslineFileinfo = { fg = "#cae5d5", bg = "#192521", ctermbg = 235, ctermfg = 152 },
+      MiniStatuslineFilename = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+      MiniStatuslineInactive = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+      MiniStatuslineModeCommand = { fg = "#111816", bg = "#ffcb6b", bold = true, ctermbg = 222, ctermfg = 233 },
+      MiniStatuslineModeInsert = { fg = "#111816", bg = "#c3e88d", bold = true, ctermbg = 150, ctermfg = 233 },
+      MiniStatuslineModeNormal = { fg = "#111816", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 233 },
+      MiniStatuslineModeOther = { fg = "#111816", bg = "#a68dcd", bold = true, ctermbg = 140, ctermfg = 233 },
+      MiniStatuslineModeReplace = { fg = "#111816", bg = "#f07178", bold = true, ctermbg = 210, ctermfg = 233 },
+      MiniStatuslineModeVisual = { fg = "#111816", bg = "#74c9de", bold = true, ctermbg = 81, ctermfg = 233 },
+      MiniSurround = { fg = "#111816", bg = "#80cbc4", ctermbg = 116, ctermfg = 233 },
+      MiniTablineCurrent = { fg = "#cae5d5", bg = "#192521", ctermbg = 235, ctermfg = 152 },
+      MiniTablineFill = { bg = "#111816", ctermbg = 233 },
+      MiniTablineHidden = { fg = "#3b544d", bg = "#111816", ctermbg = 233, ctermfg = 239 },
+      MiniTablineModifiedCurrent = { fg = "#80cbc4", bg = "#192521", ctermbg = 235, ctermfg = 116 },
+      MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "#111816", ctermbg = 233, ctermfg = 116 },
+      MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "#111816", ctermbg = 233, ctermfg = 116 },
+      MiniTablineTabpagesection = { fg = "#cae5d5", bg = "#192521", ctermbg = 235, ctermfg = 152 },
+      MiniTablineVisible = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      MiniTestEmphasis = { bold = true },
+      MiniTestFail = { fg = "#f07178", bold = true, ctermfg = 210 },
+      MiniTestPass = { fg = "#c3e88d", bold = true, ctermfg = 150 },
+      MiniTrailspace = { bg = "#f07178", ctermbg = 210 },
+    },
+    navic = {
+      NavicIconsArray = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsBoolean = { fg = "#d3959b", ctermfg = 174 },
+      NavicIconsClass = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsConstant = { fg = "#d3959b", ctermfg = 174 },
+      NavicIconsConstructor = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsEnum = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsEnumMember = { fg = "#d3959b", ctermfg = 174 },
+      NavicIconsEvent = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsField = { fg = "#cae5d5", ctermfg = 152 },
+      NavicIconsFile = { fg = "#cae5d5", ctermfg = 152 },
+      NavicIconsFunction = { fg = "#6fa0de", ctermfg = 75 },
+      NavicIconsInterface = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsKey = { fg = "#74c9de", ctermfg = 81 },
+      NavicIconsMethod = { fg = "#6fa0de", ctermfg = 75 },
+      NavicIconsModule = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsNamespace = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsNull = { fg = "#d3959b", ctermfg = 174 },
+      NavicIconsNumber = { fg = "#cc8868", ctermfg = 173 },
+      NavicIconsObject = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsOperator = { fg = "#74c9de", ctermfg = 81 },
+      NavicIconsPackage = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsProperty = { fg = "#cae5d5", ctermfg = 152 },
+      NavicIconsString = { fg = "#c3e88d", ctermfg = 150 },
+      NavicIconsStruct = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsTypeParameter = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsVariable = { fg = "#cae5d5", ctermfg = 152 },
+      NavicSeparator = { fg = "#1f2c28", ctermfg = 235 },
+      NavicText = { fg = "#cae5d5", ctermfg = 152 },
+    },
+    ["neo-tree"] = {
+      NeoTreeDirectoryIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NeoTreeDirectoryName = { fg = "#cae5d5", ctermfg = 152 },
+      NeoTreeFileIcon = { fg = "#cae5d5", ctermfg = 152 },
+      NeoTreeFileName = { fg = "#cae5d5", ctermfg = 152 },
+      NeoTreeGitAdded = { fg = "#c3e88d", ctermfg = 150 },
+      NeoTreeGitDeleted = { fg = "#f07178", ctermfg = 210 },
+      NeoTreeGitModified = { fg = "#6fa0de", ctermfg = 75 },
+      NeoTreeGitUntracked = { fg = "#c3e88d", ctermfg = 150 },
+      NeoTreeIndentMarker = { fg = "#1f2c28", ctermfg = 235 },
+      NeoTreeNormal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      NeoTreeNormalNC = { link = "NeoTreeNormal" },
+      NeoTreeRootName = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NeoTreeSymbolicLinkTarget = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    noice = {
+      NoiceCmdline = { fg = "#cae5d5", ctermfg = 152 },
+      NoiceCmdlineIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NoiceCmdlinePopup = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      NoiceCmdlinePopupBorder = { fg = "#1f2c28", ctermfg = 235 },
+      NoiceConfirm = { bg = "#111816", ctermbg = 233 },
+      NoiceConfirmBorder = { fg = "#1f2c28", ctermfg = 235 },
+    },
+    notify = {
+      NotifyBackground = { bg = "#111816", ctermbg = 233 },
+      NotifyDEBUGBorder = { fg = "#3b544d", ctermfg = 239 },
+      NotifyDEBUGIcon = { fg = "#3b544d", ctermfg = 239 },
+      NotifyDEBUGTitle = { fg = "#3b544d", ctermfg = 239 },
+      NotifyERRORBorder = { fg = "#f07178", ctermfg = 210 },
+      NotifyERRORIcon = { fg = "#f07178", ctermfg = 210 },
+      NotifyERRORTitle = { fg = "#f07178", ctermfg = 210 },
+      NotifyINFOBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyINFOIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyINFOTitle = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACEBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACEIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACETitle = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNTitle = { fg = "#ffcb6b", ctermfg = 222 },
+    },
+    ["nvim-tree"] = {
+      NvimTreeEmptyFolderName = { fg = "#3b544d", ctermfg = 239 },
+      NvimTreeFolderIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeFolderName = { fg = "#cae5d5", ctermfg = 152 },
+      NvimTreeGitDeleted = { fg = "#f07178", ctermfg = 210 },
+      NvimTreeGitDirty = { fg = "#6fa0de", ctermfg = 75 },
+      NvimTreeGitNew = { fg = "#c3e88d", ctermfg = 150 },
+      NvimTreeGitStaged = { fg = "#c3e88d", ctermfg = 150 },
+      NvimTreeImageFile = { fg = "#cae5d5", ctermfg = 152 },
+      NvimTreeIndentMarker = { fg = "#1f2c28", ctermfg = 235 },
+      NvimTreeNormal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      NvimTreeNormalNC = { link = "NvimTreeNormal" },
+      NvimTreeOpenedFolderName = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeRootFolder = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NvimTreeSpecialFile = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeSymlink = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    ["rainbow-delimiters"] = {
+      RainbowDelimiterBlue = { fg = "#6fa0de", ctermfg = 75 },
+      RainbowDelimiterCyan = { fg = "#74c9de", ctermfg = 81 },
+      RainbowDelimiterGreen = { fg = "#c3e88d", ctermfg = 150 },
+      RainbowDelimiterOrange = { fg = "#cc8868", ctermfg = 173 },
+      RainbowDelimiterRed = { fg = "#f07178", ctermfg = 210 },
+      RainbowDelimiterViolet = { fg = "#a68dcd", ctermfg = 140 },
+      RainbowDelimiterYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    },
+    telescope = {
+      TelescopeBorder = { fg = "#1f2c28", bg = "#111816", ctermbg = 233, ctermfg = 235 },
+      TelescopeMatching = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TelescopeNormal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      TelescopePreviewNormal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      TelescopePreviewTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopePromptCounter = { fg = "#3b544d", ctermfg = 239 },
+      TelescopePromptPrefix = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeResultsNormal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      TelescopeResultsTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeSelection = { bg = "#2e4535", ctermbg = 238 },
+      TelescopeSelectionCaret = { fg = "#80cbc4", bg = "#2e4535", ctermbg = 238, ctermfg = 116 },
+      TelescopeTitle = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+    },
+    trouble = {
+      TroubleCount = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TroubleFile = { fg = "#cae5d5", ctermfg = 152 },
+      TroubleFoldIcon = { fg = "#3b544d", ctermfg = 239 },
+      TroubleLocation = { fg = "#3b544d", ctermfg = 239 },
+      TroubleNormal = { fg = "#cae5d5", bg = "#111816", ctermbg = 233, ctermfg = 152 },
+      TroublePreview = { bg = "#192521", ctermbg = 235 },
+      TroubleSignError = { fg = "#f07178", ctermfg = 210 },
+      TroubleSignHint = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleSignInformation = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleSignWarning = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleText = { fg = "#cae5d5", ctermfg = 152 },
+    },
+    ["which-key"] = {
+      WhichKey = { fg = "#80cbc4", ctermfg = 116 },
+      WhichKeyDesc = { fg = "#cae5d5", ctermfg = 152 },
+      WhichKeyFloat = { bg = "#111816", ctermbg = 233 },
+      WhichKeyGroup = { fg = "#74c9de", ctermfg = 81 },
+      WhichKeySeparator = { fg = "#3b544d", ctermfg = 239 },
+      WhichKeySeperator = { fg = "#3b544d", ctermfg = 239 },
+      WhichKeyValue = { fg = "#3b544d", ctermfg = 239 },
+    },
+  },
+
+  -- Terminal colors 0-15
+  terminal = {
+    "#3b544d",
+    "#f07178",
+    "#c3e88d",
+    "#ffcb6b",
+    "#6fa0de",
+    "#a68dcd",
+    "#74c9de",
+    "#cae5d5",
+    "#2c3f39",
+    "#f07178",
+    "#c3e88d",
+    "#ffcb6b",
+    "#6fa0de",
+    "#a68dcd",
+    "#74c9de",
+    "#cae5d5",
+  },
+
+  -- Overrides applied on top of groups with transparent
+  transparent = {
+    groups = {
+      DiagnosticSignError = { fg = "#f07178", bg = "NONE", ctermbg = "NONE", ctermfg = 210 },
+      DiagnosticSignHint = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      DiagnosticSignInfo = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      DiagnosticSignOk = { fg = "#c3e88d", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+      DiagnosticSignWarn = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      FloatBorder = { fg = "#1f2c28", bg = "NONE", ctermbg = "NONE", ctermfg = 235 },
+      FloatTitle = { fg = "#80cbc4", bg = "NONE", bold = true, ctermbg = "NONE", ctermfg = 116 },
+      FoldColumn = { fg = "#3b544d", bg = "NONE", ctermbg = "NONE", ctermfg = 239 },
+      LineNr = { fg = "#2c3f39", bg = "NONE", ctermbg = "NONE", ctermfg = 237 },
+      Normal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      NormalFloat = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      NormalNC = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      SignColumn = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      StatusLineNC = { fg = "#3b544d", bg = "NONE", ctermbg = "NONE", ctermfg = 239 },
+      TabLine = { fg = "#3b544d", bg = "NONE", ctermbg = "NONE", ctermfg = 239 },
+      TabLineFill = { bg = "NONE", ctermbg = "NONE" },
+      TerminalNormal = { fg = "#d9ffe3", bg = "NONE", ctermbg = "NONE", ctermfg = 194 },
+    },
+    plugins = {
+      gitsigns = {
+        GitSignsAdd = { fg = "#c3e88d", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+        GitSignsChange = { fg = "#6fa0de", bg = "NONE", ctermbg = "NONE", ctermfg = 75 },
+        GitSignsDelete = { fg = "#f07178", bg = "NONE", ctermbg = "NONE", ctermfg = 210 },
+      },
+      mini = {
+        MiniStatuslineFilename = { fg = "#3b544d", bg = "NONE", ctermbg = "NONE", ctermfg = 239 },
+        MiniStatuslineInactive = { fg = "#3b544d", bg = "NONE", ctermbg = "NONE", ctermfg = 239 },
+        MiniTablineFill = { bg = "NONE", ctermbg = "NONE" },
+        MiniTablineHidden = { fg = "#3b544d", bg = "NONE", ctermbg = "NONE", ctermfg = 239 },
+        MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineVisible = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      },
+      ["neo-tree"] = {
+        NeoTreeNormal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      },
+      noice = {
+        NoiceCmdlinePopup = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+        NoiceConfirm = { bg = "NONE", ctermbg = "NONE" },
+      },
+      notify = {
+        NotifyBackground = { bg = "NONE", ctermbg = "NONE" },
+      },
+      ["nvim-tree"] = {
+        NvimTreeNormal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      },
+      telescope = {
+        TelescopeBorder = { fg = "#1f2c28", bg = "NONE", ctermbg = "NONE", ctermfg = 235 },
+        TelescopeNormal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+        TelescopePreviewNormal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+        TelescopeResultsNormal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      },
+      trouble = {
+        TroubleNormal = { fg = "#cae5d5", bg = "NONE", ctermbg = "NONE", ctermfg = 152 },
+      },
+      ["which-key"] = {
+        WhichKeyFloat = { bg = "NONE", ctermbg = "NONE" },
+      },
+    },
+  },
+
+  -- Overrides applied on top of groups with no italic comments
+  no_italic_comments = {
+    groups = {
+      Comment = { fg = "#3b544d", ctermfg = 239 },
+    },
+    plugins = {
+    },
+  },
+}
@@ -0,0 +1,751 @@
+-- Vira Graphene highlights
+-- Auto-generated by generate.py from groups/init.lua and mappings/jetbrains-to-nvim.json
+
+return {
+  -- Core groups, and per-plugin groups applied when the plugin loads
+  groups = {
+    ["@attribute"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@boolean"] = { link = "Boolean" },
+    ["@boolean.json"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@boolean.toml"] = { fg = "#f07178", ctermfg = 210 },
+    ["@character"] = { link = "Character" },
+    ["@character.special"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@character.special.regexp"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@comment"] = { link = "Comment" },
+    ["@comment.bash"] = { fg = "#545454", ctermfg = 240, italic = true },
+    ["@comment.documentation"] = { link = "Comment" },
+    ["@comment.error"] = { fg = "#f07178", bold = true, ctermfg = 210 },
+    ["@comment.go"] = { fg = "#545454", ctermfg = 240, italic = true },
+    ["@comment.note"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@comment.todo"] = { link = "Todo" },
+    ["@comment.warning"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@constant"] = { link = "Constant" },
+    ["@constant.builtin"] = { fg = "#ff9cac", ctermfg = 217, italic = true },
+    ["@constant.builtin.go"] = { fg = "#ff9cac", ctermfg = 217, italic = true },
+    ["@constant.css"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@constant.kotlin"] = { fg = "#f07178", ctermfg = 210 },
+    ["@constant.macro"] = { link = "Macro" },
+    ["@constructor"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@diff.delta"] = { link = "DiffChange" },
+    ["@diff.minus"] = { link = "DiffDelete" },
+    ["@diff.plus"] = { link = "DiffAdd" },
+    ["@function"] = { link = "Function" },
+    ["@function.builtin"] = { fg = "#82aaff", ctermfg = 111, italic = true },
+    ["@function.builtin.go"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.call"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.call.bash"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@function.call.kotlin"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.css"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.go"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.javascript"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.kotlin"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.macro"] = { link = "Macro" },
+    ["@function.method"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.method.call"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.method.javascript"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@keyword"] = { link = "Keyword" },
+    ["@keyword.bash"] = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    ["@keyword.conditional"] = { link = "Conditional" },
+    ["@keyword.conditional.ternary"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@keyword.coroutine"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@keyword.css"] = { fg = "#f78c6c", bold = true, ctermfg = 209 },
+    ["@keyword.debug"] = { link = "Debug" },
+    ["@keyword.directive"] = { link = "PreProc" },
+    ["@keyword.directive.bash"] = { fg = "#545454", ctermfg = 240, italic = true },
+    ["@keyword.directive.define"] = { link = "Define" },
+    ["@keyword.exception"] = { link = "Exception" },
+    ["@keyword.function"] = { link = "Keyword" },
+    ["@keyword.import"] = { link = "Include" },
+    ["@keyword.modifier"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@keyword.operator"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@keyword.regexp"] = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    ["@keyword.repeat"] = { link = "Repeat" },
+    ["@keyword.return"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@keyword.storage"] = { link = "StorageClass" },
+    ["@label"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@label.json"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@label.yaml"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@lsp.mod.abstract"] = { italic = true },
+    ["@lsp.mod.async"] = { italic = true },
+    ["@lsp.mod.declaration"] = {},
+    ["@lsp.mod.defaultLibrary"] = { italic = true },
+    ["@lsp.mod.definition"] = {},
+    ["@lsp.mod.deprecated"] = { strikethrough = true },
+    ["@lsp.mod.documentation"] = {},
+    ["@lsp.mod.modification"] = {},
+    ["@lsp.mod.readonly"] = { italic = true },
+    ["@lsp.mod.static"] = { italic = true },
+    ["@lsp.type.class"] = { link = "Type" },
+    ["@lsp.type.comment"] = {},
+    ["@lsp.type.decorator"] = { link = "@attribute" },
+    ["@lsp.type.enum"] = { link = "Type" },
+    ["@lsp.type.enumMember"] = { link = "Constant" },
+    ["@lsp.type.event"] = { link = "Type" },
+    ["@lsp.type.function"] = { link = "Function" },
+    ["@lsp.type.interface"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@lsp.type.keyword"] = { link = "Keyword" },
+    ["@lsp.type.macro"] = { link = "Macro" },
+    ["@lsp.type.method"] = { link = "Function" },
+    ["@lsp.type.modifier"] = { link = "@keyword.modifier" },
+    ["@lsp.type.namespace"] = { link = "@module" },
+    ["@lsp.type.number"] = { link = "Number" },
+    ["@lsp.type.operator"] = { link = "Operator" },
+    ["@lsp.type.parameter"] = { link = "@variable.parameter" },
+    ["@lsp.type.property"] = { link = "@property" },
+    ["@lsp.type.regexp"] = { link = "@string.regexp" },
+    ["@lsp.type.string"] = { link = "String" },
+    ["@lsp.type.struct"] = { link = "Type" },
+    ["@lsp.type.type"] = { link = "Type" },
+    ["@lsp.type.typeParameter"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@lsp.type.variable"] = {},
+    ["@lsp.typemod.function.declaration"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@lsp.typemod.function.defaultLibrary"] = { fg = "#82aaff", ctermfg = 111, italic = true },
+    ["@lsp.typemod.parameter.declaration"] = { link = "@variable.parameter" },
+    ["@lsp.typemod.variable.defaultLibrary"] = { link = "@variable.builtin" },
+    ["@lsp.typemod.variable.readonly"] = { link = "Constant" },
+    ["@markup.environment"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@markup.heading"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.1"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.2"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.3"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.4"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.5"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.6"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.italic"] = { italic = true },
+    ["@markup.link"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@markup.link.label"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@markup.link.url"] = { fg = "#f07178", ctermfg = 210, underline = true },
+    ["@markup.list"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@markup.list.checked"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@markup.list.unchecked"] = { fg = "#545454", ctermfg = 240 },
+    ["@markup.math"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@markup.quote"] = { fg = "#89ddff", ctermfg = 117, italic = true },
+    ["@markup.raw"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@markup.raw.block"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@markup.strikethrough"] = { strikethrough = true },
+    ["@markup.strong"] = { bold = true },
+    ["@markup.underline"] = { underline = true },
+    ["@module"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@module.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@namespace"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@none"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@number"] = { link = "Number" },
+    ["@number.css"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@number.float"] = { link = "Float" },
+    ["@operator"] = { link = "Operator" },
+    ["@property"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@property.css"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@property.json"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@property.yaml"] = { fg = "#f07178", bold = true, ctermfg = 210 },
+    ["@punctuation.bracket"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@punctuation.bracket.kotlin"] = { fg = "#c792ea", bold = true, ctermfg = 140 },
+    ["@punctuation.bracket.regexp"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@punctuation.delimiter"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@punctuation.special"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@punctuation.special.javascript"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@punctuation.special.markdown"] = { fg = "#545454", bold = true, ctermfg = 240 },
+    ["@rainbow.blue"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@rainbow.cyan"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@rainbow.green"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@rainbow.orange"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@rainbow.red"] = { fg = "#f07178", ctermfg = 210 },
+    ["@rainbow.violet"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@rainbow.yellow"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@string"] = { link = "String" },
+    ["@string.css"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@string.documentation"] = { fg = "#545454", ctermfg = 240 },
+    ["@string.escape"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@string.escape.regexp"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@string.regexp"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@string.regexp.javascript"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.special"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@string.special.path"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.special.symbol"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@string.special.url"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@string.special.url.css"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.yaml"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@tag"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@tag.attribute"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@tag.attribute.css"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@tag.builtin"] = { fg = "#89ddff", ctermfg = 117, italic = true },
+    ["@tag.css"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@tag.delimiter"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@tag.javascript"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type"] = { link = "Type" },
+    ["@type.builtin"] = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    ["@type.builtin.go"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.css"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.definition"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.go"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.javascript"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.kotlin"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.qualifier"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@variable"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.builtin"] = { fg = "#f78c6c", ctermfg = 209, italic = true },
+    ["@variable.builtin.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.css"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.javascript"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.kotlin"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@variable.member"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.member.kotlin"] = { bold = true },
+    ["@variable.parameter"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.parameter.go"] = { fg = "#d9d9d9", ctermfg = 253 },
+    ["@variable.parameter.kotlin"] = { fg = "#d9d9d9", ctermfg = 253 },
+    Added = { fg = "#c3e88d", ctermfg = 150 },
+    BookmarkSign = { fg = "#ffffff", bg = "#ffcb6b", ctermbg = 222, ctermfg = 231 },
+    Boolean = { fg = "#ff9cac", ctermfg = 217 },
+    Changed = { fg = "#82aaff", ctermfg = 111 },
+    Character = { fg = "#c3e88d", ctermfg = 150 },
+    ColorColumn = { bg = "#323232", ctermbg = 236 },
+    Comment = { fg = "#545454", ctermfg = 240, italic = true },
+    Conditional = { link = "Statement" },
+    Constant = { fg = "#ff9cac", ctermfg = 217, italic = true },
+    CurSearch = { link = "IncSearch" },
+    Cursor = { fg = "#212121", bg = "#ffcc00", ctermbg = 220, ctermfg = 235 },
+    CursorColumn = { link = "CursorLine" },
+    CursorIM = { link = "Cursor" },
+    CursorLine = { bg = "#2e2e2e", ctermbg = 236 },
+    CursorLineFold = { link = "CursorLineNr" },
+    CursorLineNr = { fg = "#424242", bg = "#2e2e2e", bold = true, ctermbg = 236, ctermfg = 238 },
+    CursorLineSign = { link = "CursorLine" },
+    Debug = { fg = "#ffcb6b", ctermfg = 222 },
+    Define = { fg = "#89ddff", ctermfg = 117 },
+    Delimiter = { fg = "#89ddff", ctermfg = 117 },
+    DiagnosticDeprecated = { sp = "#f07178", strikethrough = true },
+    DiagnosticError = { fg = "#f07178", ctermfg = 210 },
+    DiagnosticFloatingError = { fg = "#f07178", ctermfg = 210 },
+    DiagnosticFloatingHint = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticFloatingInfo = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticFloatingOk = { fg = "#c3e88d", ctermfg = 150 },
+    DiagnosticFloatingWarn = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticHint = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticInfo = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticOk = { fg = "#c3e88d", ctermfg = 150 },
+    DiagnosticSignError = { fg = "#f07178", bg = "#212121", ctermbg = 235, ctermfg = 210 },
+    DiagnosticSignHint = { fg = "#ffcb6b", bg = "#212121", ctermbg = 235, ctermfg = 222 },
+    DiagnosticSignInfo = { fg = "#ffcb6b", bg = "#212121", ctermbg = 235, ctermfg = 222 },
+    DiagnosticSignOk = { fg = "#c3e88d", bg = "#212121", ctermbg = 235, ctermfg = 150 },
+    DiagnosticSignWarn = { fg = "#ffcb6b", bg = "#212121", ctermbg = 235, ctermfg = 222 },
+    DiagnosticUnderlineError = { sp = "#f07178", undercurl = true },
+    DiagnosticUnderlineHint = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnderlineInfo = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnderlineOk = { sp = "#c3e88d", undercurl = true },
+    DiagnosticUnderlineWarn = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnnecessary = { fg = "#545454", ctermfg = 240, italic = true },
+    DiagnosticVirtualTextError = { fg = "#f07178", ctermfg = 210, italic = true },
+    DiagnosticVirtualTextHint = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticVirtualTextInfo = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticVirtualTextOk = { fg = "#c3e88d", ctermfg = 150, italic = true },
+    DiagnosticVirtualTextWarn = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticWarn = { fg = "#ffcb6b", ctermfg = 222 },
+    DiffAdd = { bg = "#5a6647", ctermbg = 101 },
+    DiffChange = { bg = "#43516e", ctermbg = 60 },
+    DiffDelete = { bg = "#693d3f", ctermbg = 95 },
+    DiffText = { bg = "#424242", bold = true, ctermbg = 238 },
+    EndOfBuffer = { fg = "#212121", ctermfg = 235 },
+    Error = { fg = "#f07178", ctermfg = 210 },
+    ErrorMsg = { fg = "#f07178", bold = true, ctermfg = 210 },
+    Exception = { fg = "#ff9cac", ctermfg = 217 },
+    Float = { fg = "#f78c6c", ctermfg = 209 },
+    FloatBorder = { fg = "#323232", bg = "#212121", ctermbg = 235, ctermfg = 236 },
+    FloatTitle = { fg = "#80cbc4", bg = "#212121", bold = true, ctermbg = 235, ctermfg = 116 },
+    FoldColumn = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+    Folded = { fg = "#b2ccd6", bg = "#2e2e2e", ctermbg = 236, ctermfg = 152 },
+    Function = { fg = "#82aaff", ctermfg = 111 },
+    Identifier = { fg = "#d9d9d9", ctermfg = 253 },
+    Ignore = { fg = "#545454", ctermfg = 240 },
+    IncSearch = { bg = "#343434", bold = true, ctermbg = 236 },
+    Include = { fg = "#89ddff", ctermfg = 117 },
+    Keyword = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    Label = { fg = "#c792ea", ctermfg = 140 },
+    LineNr = { fg = "#424242", bg = "#212121", ctermbg = 235, ctermfg = 238 },
+    LineNrAbove = { link = "LineNr" },
+    LineNrBelow = { link = "LineNr" },
+    LspCodeLens = { fg = "#545454", ctermfg = 240 },
+    LspCodeLensSeparator = { fg = "#323232", ctermfg = 236 },
+    LspInlayHint = { fg = "#545454", ctermfg = 240, italic = true },
+    LspReferenceRead = { bg = "#343434", ctermbg = 236 },
+    LspReferenceText = { bg = "#343434", ctermbg = 236 },
+    LspReferenceWrite = { bg = "#343434", bold = true, ctermbg = 236 },
+    LspSignatureActiveParameter = { bg = "#343434", ctermbg = 236 },
+    Macro = { fg = "#ffcb6b", ctermfg = 222 },
+    MatchParen = { fg = "#ffcc00", bold = true, ctermfg = 220 },
+    ModeMsg = { fg = "#d9d9d9", bold = true, ctermfg = 253 },
+    MoreMsg = { fg = "#80cbc4", ctermfg = 116 },
+    MsgArea = { fg = "#d9d9d9", ctermfg = 253 },
+    NonText = { fg = "#383838", ctermfg = 237 },
+    Normal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+    NormalFloat = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+    NormalNC = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+    Number = { fg = "#f78c6c", ctermfg = 209 },
+    Operator = { fg = "#89ddff", ctermfg = 117 },
+    Pmenu = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+    PmenuExtra = { fg = "#545454", ctermfg = 240 },
+    PmenuExtraSel = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+    PmenuKind = { fg = "#ffcb6b", ctermfg = 222 },
+    PmenuKindSel = { fg = "#ffcb6b", bg = "#212121", ctermbg = 235, ctermfg = 222 },
+    PmenuSbar = { bg = "#212121", ctermbg = 235 },
+    PmenuSel = { bg = "#212121", ctermbg = 235 },
+    PmenuThumb = { bg = "#545454", ctermbg = 240 },
+    PreCondit = { fg = "#89ddff", ctermfg = 117 },
+    PreProc = { fg = "#ffcb6b", ctermfg = 222 },
+    Question = { fg = "#80cbc4", ctermfg = 116 },
+    Removed = { fg = "#f07178", ctermfg = 210 },
+    Repeat = { link = "Statement" },
+    ScrollbarSlider = { bg = "#363838", ctermbg = 237 },
+    Search = { bg = "#343434", ctermbg = 236 },
+    SignColumn = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+    Special = { fg = "#80cbc4", ctermfg = 116 },
+    SpecialChar = { fg = "#d9d9d9", ctermfg = 253 },
+    SpecialComment = { fg = "#545454", bold = true, ctermfg = 240 },
+    SpecialKey = { fg = "#383838", ctermfg = 237 },
+    SpellBad = { sp = "#f07178", undercurl = true },
+    SpellCap = { sp = "#c3e88d", undercurl = true },
+    SpellLocal = { sp = "#ffcb6b", undercurl = true },
+    SpellRare = { sp = "#ffcb6b", undercurl = true },
+    Statement = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    StatusLine = { fg = "#d9d9d9", bg = "#2e2e2e", ctermbg = 236, ctermfg = 253 },
+    StatusLineNC = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+    StorageClass = { fg = "#89ddff", ctermfg = 117 },
+    String = { fg = "#c3e88d", ctermfg = 150 },
+    Structure = { fg = "#ffcb6b", ctermfg = 222 },
+    Substitute = { bg = "#3e4a64", bold = true, ctermbg = 60 },
+    TabLine = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+    TabLineFill = { bg = "#212121", ctermbg = 235 },
+    TabLineSel = { fg = "#d9d9d9", bg = "#2e2e2e", sp = "#80cbc4", ctermbg = 236, ctermfg = 253, underline = true },
+    Tag = { fg = "#89ddff", ctermfg = 117 },
+    TermCursor = { link = "Cursor" },
+    TermCursorNC = { bg = "#545454", ctermbg = 240 },
+    TerminalBlack = { fg = "#545454", ctermfg = 240 },
+    TerminalBlue = { fg = "#82aaff", ctermfg = 111 },
+    TerminalBrightBlue = { fg = "#82aaff", ctermfg = 111 },
+    TerminalBrightCyan = { fg = "#89ddff", ctermfg = 117 },
+    TerminalBrightGreen = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalBrightMagenta = { fg = "#c792ea", ctermfg = 140 },
+    TerminalBrightRed = { fg = "#f07178", ctermfg = 210 },
+    TerminalBrightYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor0 = { fg = "#545454", ctermfg = 240 },
+    TerminalColor1 = { fg = "#f07178", ctermfg = 210 },
+    TerminalColor10 = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalColor11 = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor12 = { fg = "#82aaff", ctermfg = 111 },
+    TerminalColor13 = { fg = "#c792ea", ctermfg = 140 },
+    TerminalColor14 = { fg = "#89ddff", ctermfg = 117 },
+    TerminalColor15 = { fg = "#d9d9d9", ctermfg = 253 },
+    TerminalColor2 = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalColor3 = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor4 = { fg = "#82aaff", ctermfg = 111 },
+    TerminalColor5 = { fg = "#c792ea", ctermfg = 140 },
+    TerminalColor6 = { fg = "#89ddff", ctermfg = 117 },
+    TerminalColor7 = { fg = "#d9d9d9", ctermfg = 253 },
+    TerminalColor8 = { fg = "#424242", ctermfg = 238 },
+    TerminalColor9 = { fg = "#f07178", ctermfg = 210 },
+    TerminalCyan = { fg = "#89ddff", ctermfg = 117 },
+    TerminalError = { fg = "#f07178", ctermfg = 210 },
+    TerminalGreen = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalMagenta = { fg = "#c792ea", ctermfg = 140 },
+    TerminalNormal = { fg = "#eeffff", bg = "#212121", ctermbg = 235, ctermfg = 231 },
+    TerminalRed = { fg = "#f07178", ctermfg = 210 },
+    TerminalWhite = { fg = "#d9d9d9", ctermfg = 253 },
+    TerminalYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    Todo = { fg = "#f78c6c", bold = true, ctermfg = 209, italic = true },
+    Type = { fg = "#ffcb6b", ctermfg = 222 },
+    Typedef = { fg = "#ffcb6b", ctermfg = 222 },
+    Underlined = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    VertSplit = { link = "WinSeparator" },
+    Visual = { bg = "#343434", ctermbg = 236 },
+    VisualNOS = { link = "Visual" },
+    WarningMsg = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    Whitespace = { fg = "#424242", ctermfg = 238 },
+    WinBar = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+    WinBarNC = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+    WinSeparator = { fg = "#323232", ctermfg = 236 },
+    debugPC = { bg = "#2e2e2e", ctermbg = 236 },
+    lCursor = { link = "Cursor" },
+  },
+  plugins = {
+    cmp = {
+      CmpItemAbbr = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemAbbrDeprecated = { fg = "#545454", ctermfg = 240, strikethrough = true },
+      CmpItemAbbrMatch = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      CmpItemAbbrMatchFuzzy = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKind = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindClass = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindColor = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindConstant = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindConstructor = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindEnum = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindEnumMember = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindEvent = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindField = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindFile = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindFolder = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindFunction = { fg = "#82aaff", ctermfg = 111 },
+      CmpItemKindInterface = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindKeyword = { fg = "#89ddff", ctermfg = 117 },
+      CmpItemKindMethod = { fg = "#82aaff", ctermfg = 111 },
+      CmpItemKindModule = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindOperator = { fg = "#89ddff", ctermfg = 117 },
+      CmpItemKindProperty = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindReference = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindSnippet = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindStruct = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindText = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemKindTypeParameter = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindUnit = { fg = "#f78c6c", ctermfg = 209 },
+      CmpItemKindValue = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindVariable = { fg = "#d9d9d9", ctermfg = 253 },
+      CmpItemMenu = { fg = "#545454", ctermfg = 240 },
+    },
+    dap = {
+      DapBreakpoint = { fg = "#f07178", ctermfg = 210 },
+      DapBreakpointCondition = { fg = "#ffcb6b", ctermfg = 222 },
+      DapBreakpointRejected = { fg = "#545454", ctermfg = 240 },
+      DapLogPoint = { fg = "#ffcb6b", ctermfg = 222 },
+      DapStopped = { fg = "#c3e88d", ctermfg = 150 },
+      DapStoppedLine = { bg = "#2e2e2e", ctermbg = 236 },
+      DapUIBreakpointsCurrentLine = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      DapUIBreakpointsDisabledLine = { fg = "#545454", ctermfg = 240 },
+      DapUIBreakpointsInfo = { fg = "#ffcb6b", ctermfg = 222 },
+      DapUIBreakpointsPath = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIDecoration = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIFloatBorder = { fg = "#323232", ctermfg = 236 },
+      DapUILineNumber = { fg = "#424242", ctermfg = 238 },
+      DapUIModifiedValue = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+      DapUIScope = { fg = "#80cbc4", ctermfg = 116 },
+      DapUISource = { fg = "#c3e88d", ctermfg = 150 },
+      DapUIStoppedThread = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIThread = { fg = "#c3e88d", ctermfg = 150 },
+      DapUIType = { fg = "#ffcb6b", ctermfg = 222 },
+      DapUIValue = { fg = "#f78c6c", ctermfg = 209 },
+      DapUIVariable = { fg = "#d9d9d9", ctermfg = 253 },
+      DapUIWatchesEmpty = { fg = "#f07178", ctermfg = 210 },
+      DapUIWatchesError = { fg = "#f07178", ctermfg = 210 },
+      DapUIWatchesValue = { fg = "#c3e88d", ctermfg = 150 },
+    },
+    flash = {
+      FlashBackdrop = { fg = "#545454", ctermfg = 240 },
+      FlashCurrent = { bg = "#343434", bold = true, ctermbg = 236 },
+      FlashLabel = { fg = "#212121", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 235 },
+      FlashMatch = { bg = "#343434", ctermbg = 236 },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c3e88d", bg = "#212121", ctermbg = 235, ctermfg = 150 },
+      GitSignsAddLn = { bg = "#525d42", ctermbg = 240 },
+      GitSignsAddNr = { fg = "#c3e88d", ctermfg = 150 },
+      GitSignsAddPreview = { link = "DiffAdd" },
+      GitSignsChange = { fg = "#82aaff", bg = "#212121", ctermbg = 235, ctermfg = 111 },
+      GitSignsChangeLn = { bg = "#3e4a64", ctermbg = 60 },
+      GitSignsChangeNr = { fg = "#82aaff", ctermfg = 111 },
+      GitSignsCurrentLineBlame = { fg = "#ffffff", ctermfg = 231, italic = true },
+      GitSignsDelete = { fg = "#f07178", bg = "#212121", ctermbg = 235, ctermfg = 210 },
+      GitSignsDeleteLn = { bg = "#60393b", ctermbg = 95 },
+      GitSignsDeleteNr = { fg = "#f07178", ctermfg = 210 },
+      GitSignsDeletePreview = { link = "DiffDelete" },
+    },
+    headlines = {
+      CodeBlock = { bg = "#2e2e2e", ctermbg = 236 },
+      Dash = { fg = "#545454", ctermfg = 240 },
+      Headline1 = { bg = "#2e2e2e", ctermbg = 236 },
+      Headline2 = { bg = "#2e2e2e", ctermbg = 236 },
+      Headline3 = { bg = "#2e2e2e", ctermbg = 236 },
+      Headline4 = { bg = "#2e2e2e", ctermbg = 236 },
+      Headline5 = { bg = "#2e2e2e", ctermbg = 236 },
+      Headline6 = { bg = "#2e2e2e", ctermbg = 236 },
+      Quote = { fg = "#89ddff", ctermfg = 117, italic = true },
+    },
+    ibl = {
+      IblIndent = { fg = "#323232", ctermfg = 236 },
+      IblScope = { fg = "#80cbc4", ctermfg = 116 },
+      IndentBlanklineChar = { fg = "#323232", ctermfg = 236 },
+      IndentBlanklineContextChar = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    illuminate = {
+      IlluminatedWordRead = { bg = "#343434", ctermbg = 236 },
+      IlluminatedWordText = { bg = "#343434", ctermbg = 236 },
+      IlluminatedWordWrite = { bg = "#343434", ctermbg = 236 },
+    },
+    lazy = {
+      LazyButton = { bg = "#2e2e2e", ctermbg = 236 },
+      LazyButtonActive = { bg = "#343434", ctermbg = 236 },
+      LazyH1 = { fg = "#212121", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 235 },
+      LazyH2 = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      LazyReasonCmd = { fg = "#ffcb6b", ctermfg = 222 },
+      LazyReasonEvent = { fg = "#89ddff", ctermfg = 117 },
+      LazyReasonFt = { fg = "#c3e88d", ctermfg = 150 },
+      LazyReasonKeys = { fg = "#c792ea", ctermfg = 140 },
+      LazyReasonPlugin = { fg = "#80cbc4", ctermfg = 116 },
+      LazyReasonStart = { fg = "#c3e88d", ctermfg = 150 },
+    },
+    leap = {
+      LeapBackdrop = { fg = "#545454", ctermfg = 240 },
+      LeapLabelPrimary = { fg = "#212121", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 235 },
+      LeapLabelSecondary = { fg = "#212121", bg = "#c792ea", bold = true, ctermbg = 140, ctermfg = 235 },
+      LeapMatch = { fg = "#80cbc4", bold = true, ctermfg = 116, underline = true },
+    },
+    mason = {
+      MasonHeader = { fg = "#212121", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 235 },
+      MasonHighlight = { fg = "#80cbc4", ctermfg = 116 },
+      MasonHighlightSecondary = { fg = "#89ddff", ctermfg = 117 },
+      MasonMuted = { fg = "#545454", ctermfg = 240 },
+    },
+    mini = {
+      MiniCursorword = { bg = "#343434", ctermbg = 236 },
+      MiniCursorwordCurrent = { bg = "#343434", ctermbg = 236 },
+      MiniIndentscopePrefix = { nocombine = true },
+      MiniIndentscopeSymbol = { fg = "#80cbc4", ctermfg = 116 },
+      MiniJump = { fg = "#212121", bg = "#80cbc4", ctermbg = 116, ctermfg = 235 },
+      MiniJump2dSpot = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      MiniStatuslineDevinfo = { fg = "#d9d9d9", bg = "#2e2e2e", ctermbg = 236, ctermfg = 253 },
+      MiniStatuslineFileinfo = { fg = "#d9d9d9", bg = "#2e2e2e", ctermbg = 236, ctermfg = 253 },
+      MiniStatuslineFilename = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+      MiniStatuslineInactive = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+      MiniStatuslineModeCommand = { fg = "#212121", bg = "#ffcb6b", bold = true, ctermbg = 222, ctermfg = 235 },
+      MiniStatuslineModeInsert = { fg = "#212121", bg = "#c3e88d", bold = true, ctermbg = 150, ctermfg = 235 },
+      MiniStatuslineModeNormal = { fg = "#212121", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 235 },
+      MiniStatuslineModeOther = { fg = "#212121", bg = "#c792ea", bold = true, ctermbg = 140, ctermfg = 235 },
+      MiniStatuslineModeReplace = { fg = "#212121", bg = "#f07178", bold = true, ctermbg = 210, ctermfg = 235 },
+      MiniStatuslineModeVisual = { fg = "#212121", bg = "#89ddff", bold = true, ctermbg = 117, ctermfg = 235 },
+      MiniSurround = { fg = "#212121", bg = "#80cbc4", ctermbg = 116, ctermfg = 235 },
+      MiniTablineCurrent = { fg = "#d9d9d9", bg = "#2e2e2e", ctermbg = 236, ctermfg = 253 },
+      MiniTablineFill = { bg = "#212121", ctermbg = 235 },
+      MiniTablineHidden = { fg = "#545454", bg = "#212121", ctermbg = 235, ctermfg = 240 },
+      MiniTablineModifiedCurrent = { fg = "#80cbc4", bg = "#2e2e2e", ctermbg = 236, ctermfg = 116 },
+      MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "#212121", ctermbg = 235, ctermfg = 116 },
+      MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "#212121", ctermbg = 235, ctermfg = 116 },
+      MiniTablineTabpagesection = { fg = "#d9d9d9", bg = "#2e2e2e", ctermbg = 236, ctermfg = 253 },
+      MiniTablineVisible = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      MiniTestEmphasis = { bold = true },
+      MiniTestFail = { fg = "#f07178", bold = true, ctermfg = 210 },
+      MiniTestPass = { fg = "#c3e88d", bold = true, ctermfg = 150 },
+      MiniTrailspace = { bg = "#f07178", ctermbg = 210 },
+    },
+    navic = {
+      NavicIconsArray = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsBoolean = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsClass = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsConstant = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsConstructor = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsEnum = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsEnumMember = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsEvent = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsField = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicIconsFile = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicIconsFunction = { fg = "#82aaff", ctermfg = 111 },
+      NavicIconsInterface = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsKey = { fg = "#89ddff", ctermfg = 117 },
+      NavicIconsMethod = { fg = "#82aaff", ctermfg = 111 },
+      NavicIconsModule = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsNamespace = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsNull = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsNumber = { fg = "#f78c6c", ctermfg = 209 },
+      NavicIconsObject = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsOperator = { fg = "#89ddff", ctermfg = 117 },
+      NavicIconsPackage = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsProperty = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicIconsString = { fg = "#c3e88d", ctermfg = 150 },
+      NavicIconsStruct = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsTypeParameter = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsVariable = { fg = "#d9d9d9", ctermfg = 253 },
+      NavicSeparator = { fg = "#323232", ctermfg = 236 },
+      NavicText = { fg = "#d9d9d9", ctermfg = 253 },
+    },
+    ["neo-tree"] = {
+      NeoTreeDirectoryIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NeoTreeDirectoryName = { fg = "#d9d9d9", ctermfg = 253 },
+      NeoTreeFileIcon = { fg = "#d9d9d9", ctermfg = 253 },
+      NeoTreeFileName = { fg = "#d9d9d9", ctermfg = 253 },
+      NeoTreeGitAdded = { fg = "#c3e88d", ctermfg = 150 },
+      NeoTreeGitDeleted = { fg = "#f07178", ctermfg = 210 },
+      NeoTreeGitModified = { fg = "#82aaff", ctermfg = 111 },
+      NeoTreeGitUntracked = { fg = "#c3e88d", ctermfg = 150 },
+      NeoTreeIndentMarker = { fg = "#323232", ctermfg = 236 },
+      NeoTreeNormal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      NeoTreeNormalNC = { link = "NeoTreeNormal" },
+      NeoTreeRootName = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NeoTreeSymbolicLinkTarget = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    noice = {
+      NoiceCmdline = { fg = "#d9d9d9", ctermfg = 253 },
+      NoiceCmdlineIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NoiceCmdlinePopup = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      NoiceCmdlinePopupBorder = { fg = "#323232", ctermfg = 236 },
+      NoiceConfirm = { bg = "#212121", ctermbg = 235 },
+      NoiceConfirmBorder = { fg = "#323232", ctermfg = 236 },
+    },
+    notify = {
+      NotifyBackground = { bg = "#212121", ctermbg = 235 },
+      NotifyDEBUGBorder = { fg = "#545454", ctermfg = 240 },
+      NotifyDEBUGIcon = { fg = "#545454", ctermfg = 240 },
+      NotifyDEBUGTitle = { fg = "#545454", ctermfg = 240 },
+      NotifyERRORBorder = { fg = "#f07178", ctermfg = 210 },
+      NotifyERRORIcon = { fg = "#f07178", ctermfg = 210 },
+      NotifyERRORTitle = { fg = "#f07178", ctermfg = 210 },
+      NotifyINFOBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyINFOIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyINFOTitle = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACEBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACEIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACETitle = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNTitle = { fg = "#ffcb6b", ctermfg = 222 },
+    },
+    ["nvim-tree"] = {
+      NvimTreeEmptyFolderName = { fg = "#545454", ctermfg = 240 },
+      NvimTreeFolderIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeFolderName = { fg = "#d9d9d9", ctermfg = 253 },
+      NvimTreeGitDeleted = { fg = "#f07178", ctermfg = 210 },
+      NvimTreeGitDirty = { fg = "#82aaff", ctermfg = 111 },
+      NvimTreeGitNew = { fg = "#c3e88d", ctermfg = 150 },
+      NvimTreeGitStaged = { fg = "#c3e88d", ctermfg = 150 },
+      NvimTreeImageFile = { fg = "#d9d9d9", ctermfg = 253 },
+      NvimTreeIndentMarker = { fg = "#323232", ctermfg = 236 },
+      NvimTreeNormal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      NvimTreeNormalNC = { link = "NvimTreeNormal" },
+      NvimTreeOpenedFolderName = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeRootFolder = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NvimTreeSpecialFile = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeSymlink = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    ["rainbow-delimiters"] = {
+      RainbowDelimiterBlue = { fg = "#82aaff", ctermfg = 111 },
+      RainbowDelimiterCyan = { fg = "#89ddff", ctermfg = 117 },
+      RainbowDelimiterGreen = { fg = "#c3e88d", ctermfg = 150 },
+      RainbowDelimiterOrange = { fg = "#f78c6c", ctermfg = 209 },
+      RainbowDelimiterRed = { fg = "#f07178", ctermfg = 210 },
+      RainbowDelimiterViolet = { fg = "#c792ea", ctermfg = 140 },
+      RainbowDelimiterYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    },
+    telescope = {
+      TelescopeBorder = { fg = "#323232", bg = "#212121", ctermbg = 235, ctermfg = 236 },
+      TelescopeMatching = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TelescopeNormal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      TelescopePreviewNormal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      TelescopePreviewTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopePromptCounter = { fg = "#545454", ctermfg = 240 },
+      TelescopePromptPrefix = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeResultsNormal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      TelescopeResultsTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeSelection = { bg = "#343434", ctermbg = 236 },
+      TelescopeSelectionCaret = { fg = "#80cbc4", bg = "#343434", ctermbg = 236, ctermfg = 116 },
+      TelescopeTitle = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+    },
+    trouble = {
+      TroubleCount = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TroubleFile = { fg = "#d9d9d9", ctermfg = 253 },
+      TroubleFoldIcon = { fg = "#545454", ctermfg = 240 },
+      TroubleLocation = { fg = "#545454", ctermfg = 240 },
+      TroubleNormal = { fg = "#d9d9d9", bg = "#212121", ctermbg = 235, ctermfg = 253 },
+      TroublePreview = { bg = "#2e2e2e", ctermbg = 236 },
+      TroubleSignError = { fg = "#f07178", ctermfg = 210 },
+      TroubleSignHint = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleSignInformation = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleSignWarning = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleText = { fg = "#d9d9d9", ctermfg = 253 },
+    },
+    ["which-key"] = {
+      WhichKey = { fg = "#80cbc4", ctermfg = 116 },
+      WhichKeyDesc = { fg = "#d9d9d9", ctermfg = 253 },
+      WhichKeyFloat = { bg = "#212121", ctermbg = 235 },
+      WhichKeyGroup = { fg = "#89ddff", ctermfg = 117 },
+      WhichKeySeparator = { fg = "#545454", ctermfg = 240 },
+      WhichKeySeperator = { fg = "#545454", ctermfg = 240 },
+      WhichKeyValue = { fg = "#545454", ctermfg = 240 },
+    },
+  },
+
+  -- Terminal colors 0-15
+  terminal = {
+    "#545454",
+    "#f07178",
+    "#c3e88d",
+    "#ffcb6b",
+    "#82aaff",
+    "#c792ea",
+    "#89ddff",
+    "#d9d9d9",
+    "#424242",
+    "#f07178",
+    "#c3e88d",
+    "#ffcb6b",
+    "#82aaff",
+    "#c792ea",
+    "#89ddff",
+    "#d9d9d9",
+  },
+
+  -- Overrides applied on top of groups with transparent
+  transparent = {
+    groups = {
+      DiagnosticSignError = { fg = "#f07178", bg = "NONE", ctermbg = "NONE", ctermfg = 210 },
+      DiagnosticSignHint = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      DiagnosticSignInfo = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      DiagnosticSignOk = { fg = "#c3e88d", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+      DiagnosticSignWarn = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      FloatBorder = { fg = "#323232", bg = "NONE", ctermbg = "NONE", ctermfg = 236 },
+      FloatTitle = { fg = "#80cbc4", bg = "NONE", bold = true, ctermbg = "NONE", ctermfg = 116 },
+      FoldColumn = { fg = "#545454", bg = "NONE", ctermbg = "NONE", ctermfg = 240 },
+      LineNr = { fg = "#424242", bg = "NONE", ctermbg = "NONE", ctermfg = 238 },
+      Normal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      NormalFloat = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      NormalNC = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      SignColumn = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      StatusLineNC = { fg = "#545454", bg = "NONE", ctermbg = "NONE", ctermfg = 240 },
+      TabLine = { fg = "#545454", bg = "NONE", ctermbg = "NONE", ctermfg = 240 },
+      TabLineFill = { bg = "NONE", ctermbg = "NONE" },
+      TerminalNormal = { fg = "#eeffff", bg = "NONE", ctermbg = "NONE", ctermfg = 231 },
+    },
+    plugins = {
+      gitsigns = {
+        GitSignsAdd = { fg = "#c3e88d", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+        GitSignsChange = { fg = "#82aaff", bg = "NONE", ctermbg = "NONE", ctermfg = 111 },
+        GitSignsDelete = { fg = "#f07178", bg = "NONE", ctermbg = "NONE", ctermfg = 210 },
+      },
+      mini = {
+        MiniStatuslineFilename = { fg = "#545454", bg = "NONE", ctermbg = "NONE", ctermfg = 240 },
+        MiniStatuslineInactive = { fg = "#545454", bg = "NONE", ctermbg = "NONE", ctermfg = 240 },
+        MiniTablineFill = { bg = "NONE", ctermbg = "NONE" },
+        MiniTablineHidden = { fg = "#545454", bg = "NONE", ctermbg = "NONE", ctermfg = 240 },
+        MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineVisible = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      ["neo-tree"] = {
+        NeoTreeNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      noice = {
+        NoiceCmdlinePopup = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+        NoiceConfirm = { bg = "NONE", ctermbg = "NONE" },
+      },
+      notify = {
+        NotifyBackground = { bg = "NONE", ctermbg = "NONE" },
+      },
+      ["nvim-tree"] = {
+        NvimTreeNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      telescope = {
+        TelescopeBorder = { fg = "#323232", bg = "NONE", ctermbg = "NONE", ctermfg = 236 },
+        TelescopeNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+        TelescopePreviewNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+        TelescopeResultsNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      trouble = {
+        TroubleNormal = { fg = "#d9d9d9", bg = "NONE", ctermbg = "NONE", ctermfg = 253 },
+      },
+      ["which-key"] = {
+        WhichKeyFloat = { bg = "NONE", ctermbg = "NONE" },
+      },
+    },
+  },
+
+  -- Overrides applied on top of groups with no italic comments
+  no_italic_comments = {
+    groups = {
+      Comment = { fg = "#545454", ctermfg = 240 },
+    },
+    plugins = {
+    },
+  },
+}
@@ -0,0 +1,11 @@
+-- Vira highlight source hashes
+-- Auto-generated by generate.py; keys the startup snapshots of vira.snapshot
+
+return {
+  carbon = "53617e3588e5f9360e99ccc822a1001e2fff5938834302e8aeadcad88f26eb68",
+  deepforest = "caadf3a919bd07f3d4f333caf7e27ed507eb0a6555973f31136a7f1fd67ca357",
+  graphene = "910d7f795978a40620d16414e28d7035eab08c5c6fccbc8f011def2f736b088a",
+  ocean = "ee5d84eb0fabc6d87cf2fb7bb83067ae39b3cf1ee820aca59292f89ba5e8a097",
+  palenight = "4a1b0e089d71fc84317682658873cd0c3c1c777a7672ea6e1362273e18c3640e",
+  teal = "4b34d3b661324a4ff2b3f46f4e5b070be45cc2aac6284ecc64b962de85d2479f",
+}
@@ -0,0 +1,751 @@
+-- Vira Palenight highlights
+-- Auto-generated by generate.py from groups/init.lua and mappings/jetbrains-to-nvim.json
+
+return {
+  -- Core groups, and per-plugin groups applied when the plugin loads
+  groups = {
+    ["@attribute"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@boolean"] = { link = "Boolean" },
+    ["@boolean.json"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@boolean.toml"] = { fg = "#f07178", ctermfg = 210 },
+    ["@character"] = { link = "Character" },
+    ["@character.special"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@character.special.regexp"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@comment"] = { link = "Comment" },
+    ["@comment.bash"] = { fg = "#676e95", ctermfg = 60, italic = true },
+    ["@comment.documentation"] = { link = "Comment" },
+    ["@comment.error"] = { fg = "#f07178", bold = true, ctermfg = 210 },
+    ["@comment.go"] = { fg = "#676e95", ctermfg = 60, italic = true },
+    ["@comment.note"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@comment.todo"] = { link = "Todo" },
+    ["@comment.warning"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@constant"] = { link = "Constant" },
+    ["@constant.builtin"] = { fg = "#ff9cac", ctermfg = 217, italic = true },
+    ["@constant.builtin.go"] = { fg = "#ff9cac", ctermfg = 217, italic = true },
+    ["@constant.css"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@constant.kotlin"] = { fg = "#f07178", ctermfg = 210 },
+    ["@constant.macro"] = { link = "Macro" },
+    ["@constructor"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@diff.delta"] = { link = "DiffChange" },
+    ["@diff.minus"] = { link = "DiffDelete" },
+    ["@diff.plus"] = { link = "DiffAdd" },
+    ["@function"] = { link = "Function" },
+    ["@function.builtin"] = { fg = "#82aaff", ctermfg = 111, italic = true },
+    ["@function.builtin.go"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.call"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.call.bash"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@function.call.kotlin"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.css"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.go"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.javascript"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.kotlin"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.macro"] = { link = "Macro" },
+    ["@function.method"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.method.call"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@function.method.javascript"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@keyword"] = { link = "Keyword" },
+    ["@keyword.bash"] = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    ["@keyword.conditional"] = { link = "Conditional" },
+    ["@keyword.conditional.ternary"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@keyword.coroutine"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@keyword.css"] = { fg = "#f78c6c", bold = true, ctermfg = 209 },
+    ["@keyword.debug"] = { link = "Debug" },
+    ["@keyword.directive"] = { link = "PreProc" },
+    ["@keyword.directive.bash"] = { fg = "#676e95", ctermfg = 60, italic = true },
+    ["@keyword.directive.define"] = { link = "Define" },
+    ["@keyword.exception"] = { link = "Exception" },
+    ["@keyword.function"] = { link = "Keyword" },
+    ["@keyword.import"] = { link = "Include" },
+    ["@keyword.modifier"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@keyword.operator"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@keyword.regexp"] = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    ["@keyword.repeat"] = { link = "Repeat" },
+    ["@keyword.return"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@keyword.storage"] = { link = "StorageClass" },
+    ["@label"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@label.json"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@label.yaml"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@lsp.mod.abstract"] = { italic = true },
+    ["@lsp.mod.async"] = { italic = true },
+    ["@lsp.mod.declaration"] = {},
+    ["@lsp.mod.defaultLibrary"] = { italic = true },
+    ["@lsp.mod.definition"] = {},
+    ["@lsp.mod.deprecated"] = { strikethrough = true },
+    ["@lsp.mod.documentation"] = {},
+    ["@lsp.mod.modification"] = {},
+    ["@lsp.mod.readonly"] = { italic = true },
+    ["@lsp.mod.static"] = { italic = true },
+    ["@lsp.type.class"] = { link = "Type" },
+    ["@lsp.type.comment"] = {},
+    ["@lsp.type.decorator"] = { link = "@attribute" },
+    ["@lsp.type.enum"] = { link = "Type" },
+    ["@lsp.type.enumMember"] = { link = "Constant" },
+    ["@lsp.type.event"] = { link = "Type" },
+    ["@lsp.type.function"] = { link = "Function" },
+    ["@lsp.type.interface"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@lsp.type.keyword"] = { link = "Keyword" },
+    ["@lsp.type.macro"] = { link = "Macro" },
+    ["@lsp.type.method"] = { link = "Function" },
+    ["@lsp.type.modifier"] = { link = "@keyword.modifier" },
+    ["@lsp.type.namespace"] = { link = "@module" },
+    ["@lsp.type.number"] = { link = "Number" },
+    ["@lsp.type.operator"] = { link = "Operator" },
+    ["@lsp.type.parameter"] = { link = "@variable.parameter" },
+    ["@lsp.type.property"] = { link = "@property" },
+    ["@lsp.type.regexp"] = { link = "@string.regexp" },
+    ["@lsp.type.string"] = { link = "String" },
+    ["@lsp.type.struct"] = { link = "Type" },
+    ["@lsp.type.type"] = { link = "Type" },
+    ["@lsp.type.typeParameter"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@lsp.type.variable"] = {},
+    ["@lsp.typemod.function.declaration"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@lsp.typemod.function.defaultLibrary"] = { fg = "#82aaff", ctermfg = 111, italic = true },
+    ["@lsp.typemod.parameter.declaration"] = { link = "@variable.parameter" },
+    ["@lsp.typemod.variable.defaultLibrary"] = { link = "@variable.builtin" },
+    ["@lsp.typemod.variable.readonly"] = { link = "Constant" },
+    ["@markup.environment"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@markup.heading"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.1"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.2"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.3"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.4"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.5"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.heading.6"] = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    ["@markup.italic"] = { italic = true },
+    ["@markup.link"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@markup.link.label"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@markup.link.url"] = { fg = "#f07178", ctermfg = 210, underline = true },
+    ["@markup.list"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@markup.list.checked"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@markup.list.unchecked"] = { fg = "#676e95", ctermfg = 60 },
+    ["@markup.math"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@markup.quote"] = { fg = "#89ddff", ctermfg = 117, italic = true },
+    ["@markup.raw"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@markup.raw.block"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@markup.strikethrough"] = { strikethrough = true },
+    ["@markup.strong"] = { bold = true },
+    ["@markup.underline"] = { underline = true },
+    ["@module"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@module.go"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@namespace"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@none"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@number"] = { link = "Number" },
+    ["@number.css"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@number.float"] = { link = "Float" },
+    ["@operator"] = { link = "Operator" },
+    ["@property"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@property.css"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@property.json"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@property.yaml"] = { fg = "#f07178", bold = true, ctermfg = 210 },
+    ["@punctuation.bracket"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@punctuation.bracket.kotlin"] = { fg = "#c792ea", bold = true, ctermfg = 140 },
+    ["@punctuation.bracket.regexp"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@punctuation.delimiter"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@punctuation.special"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@punctuation.special.javascript"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@punctuation.special.markdown"] = { fg = "#676e95", bold = true, ctermfg = 60 },
+    ["@rainbow.blue"] = { fg = "#82aaff", ctermfg = 111 },
+    ["@rainbow.cyan"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@rainbow.green"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@rainbow.orange"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@rainbow.red"] = { fg = "#f07178", ctermfg = 210 },
+    ["@rainbow.violet"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@rainbow.yellow"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@string"] = { link = "String" },
+    ["@string.css"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@string.documentation"] = { fg = "#676e95", ctermfg = 60 },
+    ["@string.escape"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@string.escape.regexp"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@string.regexp"] = { fg = "#f78c6c", ctermfg = 209 },
+    ["@string.regexp.javascript"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.special"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@string.special.path"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.special.symbol"] = { fg = "#ff9cac", ctermfg = 217 },
+    ["@string.special.url"] = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    ["@string.special.url.css"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@string.yaml"] = { fg = "#c3e88d", ctermfg = 150 },
+    ["@tag"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@tag.attribute"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@tag.attribute.css"] = { fg = "#c792ea", ctermfg = 140 },
+    ["@tag.builtin"] = { fg = "#89ddff", ctermfg = 117, italic = true },
+    ["@tag.css"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@tag.delimiter"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@tag.javascript"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type"] = { link = "Type" },
+    ["@type.builtin"] = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    ["@type.builtin.go"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.css"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.definition"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.go"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.javascript"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.kotlin"] = { fg = "#ffcb6b", ctermfg = 222 },
+    ["@type.qualifier"] = { fg = "#89ddff", ctermfg = 117 },
+    ["@variable"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.builtin"] = { fg = "#f78c6c", ctermfg = 209, italic = true },
+    ["@variable.builtin.go"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.css"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.go"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.javascript"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.kotlin"] = { fg = "#b2ccd6", ctermfg = 152 },
+    ["@variable.member"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.member.kotlin"] = { bold = true },
+    ["@variable.parameter"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.parameter.go"] = { fg = "#ced1e3", ctermfg = 252 },
+    ["@variable.parameter.kotlin"] = { fg = "#ced1e3", ctermfg = 252 },
+    Added = { fg = "#c3e88d", ctermfg = 150 },
+    BookmarkSign = { fg = "#ffffff", bg = "#ffcb6b", ctermbg = 222, ctermfg = 231 },
+    Boolean = { fg = "#ff9cac", ctermfg = 217 },
+    Changed = { fg = "#82aaff", ctermfg = 111 },
+    Character = { fg = "#c3e88d", ctermfg = 150 },
+    ColorColumn = { bg = "#3c415c", ctermbg = 60 },
+    Comment = { fg = "#676e95", ctermfg = 60, italic = true },
+    Conditional = { link = "Statement" },
+    Constant = { fg = "#ff9cac", ctermfg = 217, italic = true },
+    CurSearch = { link = "IncSearch" },
+    Cursor = { fg = "#292d3e", bg = "#ffcc00", ctermbg = 220, ctermfg = 236 },
+    CursorColumn = { link = "CursorLine" },
+    CursorIM = { link = "Cursor" },
+    CursorLine = { bg = "#373d53", ctermbg = 237 },
+    CursorLineFold = { link = "CursorLineNr" },
+    CursorLineNr = { fg = "#474d6c", bg = "#373d53", bold = true, ctermbg = 237, ctermfg = 60 },
+    CursorLineSign = { link = "CursorLine" },
+    Debug = { fg = "#ffcb6b", ctermfg = 222 },
+    Define = { fg = "#89ddff", ctermfg = 117 },
+    Delimiter = { fg = "#89ddff", ctermfg = 117 },
+    DiagnosticDeprecated = { sp = "#f07178", strikethrough = true },
+    DiagnosticError = { fg = "#f07178", ctermfg = 210 },
+    DiagnosticFloatingError = { fg = "#f07178", ctermfg = 210 },
+    DiagnosticFloatingHint = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticFloatingInfo = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticFloatingOk = { fg = "#c3e88d", ctermfg = 150 },
+    DiagnosticFloatingWarn = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticHint = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticInfo = { fg = "#ffcb6b", ctermfg = 222 },
+    DiagnosticOk = { fg = "#c3e88d", ctermfg = 150 },
+    DiagnosticSignError = { fg = "#f07178", bg = "#292d3e", ctermbg = 236, ctermfg = 210 },
+    DiagnosticSignHint = { fg = "#ffcb6b", bg = "#292d3e", ctermbg = 236, ctermfg = 222 },
+    DiagnosticSignInfo = { fg = "#ffcb6b", bg = "#292d3e", ctermbg = 236, ctermfg = 222 },
+    DiagnosticSignOk = { fg = "#c3e88d", bg = "#292d3e", ctermbg = 236, ctermfg = 150 },
+    DiagnosticSignWarn = { fg = "#ffcb6b", bg = "#292d3e", ctermbg = 236, ctermfg = 222 },
+    DiagnosticUnderlineError = { sp = "#f07178", undercurl = true },
+    DiagnosticUnderlineHint = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnderlineInfo = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnderlineOk = { sp = "#c3e88d", undercurl = true },
+    DiagnosticUnderlineWarn = { sp = "#ffcb6b", undercurl = true },
+    DiagnosticUnnecessary = { fg = "#676e95", ctermfg = 60, italic = true },
+    DiagnosticVirtualTextError = { fg = "#f07178", ctermfg = 210, italic = true },
+    DiagnosticVirtualTextHint = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticVirtualTextInfo = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticVirtualTextOk = { fg = "#c3e88d", ctermfg = 150, italic = true },
+    DiagnosticVirtualTextWarn = { fg = "#ffcb6b", ctermfg = 222, italic = true },
+    DiagnosticWarn = { fg = "#ffcb6b", ctermfg = 222 },
+    DiffAdd = { bg = "#5f6e5a", ctermbg = 242 },
+    DiffChange = { bg = "#485981", ctermbg = 60 },
+    DiffDelete = { bg = "#6e4552", ctermbg = 95 },
+    DiffText = { bg = "#4e5579", bold = true, ctermbg = 60 },
+    EndOfBuffer = { fg = "#292d3e", ctermfg = 236 },
+    Error = { fg = "#f07178", ctermfg = 210 },
+    ErrorMsg = { fg = "#f07178", bold = true, ctermfg = 210 },
+    Exception = { fg = "#ff9cac", ctermfg = 217 },
+    Float = { fg = "#f78c6c", ctermfg = 209 },
+    FloatBorder = { fg = "#3c415c", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    FloatTitle = { fg = "#80cbc4", bg = "#292d3e", bold = true, ctermbg = 236, ctermfg = 116 },
+    FoldColumn = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    Folded = { fg = "#b2ccd6", bg = "#373d53", ctermbg = 237, ctermfg = 152 },
+    Function = { fg = "#82aaff", ctermfg = 111 },
+    Identifier = { fg = "#ced1e3", ctermfg = 252 },
+    Ignore = { fg = "#676e95", ctermfg = 60 },
+    IncSearch = { bg = "#3f4560", bold = true, ctermbg = 60 },
+    Include = { fg = "#89ddff", ctermfg = 117 },
+    Keyword = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    Label = { fg = "#c792ea", ctermfg = 140 },
+    LineNr = { fg = "#474d6c", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    LineNrAbove = { link = "LineNr" },
+    LineNrBelow = { link = "LineNr" },
+    LspCodeLens = { fg = "#676e95", ctermfg = 60 },
+    LspCodeLensSeparator = { fg = "#3c415c", ctermfg = 60 },
+    LspInlayHint = { fg = "#676e95", ctermfg = 60, italic = true },
+    LspReferenceRead = { bg = "#3f4560", ctermbg = 60 },
+    LspReferenceText = { bg = "#3f4560", ctermbg = 60 },
+    LspReferenceWrite = { bg = "#3f4560", bold = true, ctermbg = 60 },
+    LspSignatureActiveParameter = { bg = "#3f4560", ctermbg = 60 },
+    Macro = { fg = "#ffcb6b", ctermfg = 222 },
+    MatchParen = { fg = "#ffcc00", bold = true, ctermfg = 220 },
+    ModeMsg = { fg = "#ced1e3", bold = true, ctermfg = 252 },
+    MoreMsg = { fg = "#80cbc4", ctermfg = 116 },
+    MsgArea = { fg = "#ced1e3", ctermfg = 252 },
+    NonText = { fg = "#434967", ctermfg = 60 },
+    Normal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+    NormalFloat = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+    NormalNC = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+    Number = { fg = "#f78c6c", ctermfg = 209 },
+    Operator = { fg = "#89ddff", ctermfg = 117 },
+    Pmenu = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+    PmenuExtra = { fg = "#676e95", ctermfg = 60 },
+    PmenuExtraSel = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    PmenuKind = { fg = "#ffcb6b", ctermfg = 222 },
+    PmenuKindSel = { fg = "#ffcb6b", bg = "#292d3e", ctermbg = 236, ctermfg = 222 },
+    PmenuSbar = { bg = "#292d3e", ctermbg = 236 },
+    PmenuSel = { bg = "#292d3e", ctermbg = 236 },
+    PmenuThumb = { bg = "#676e95", ctermbg = 60 },
+    PreCondit = { fg = "#89ddff", ctermfg = 117 },
+    PreProc = { fg = "#ffcb6b", ctermfg = 222 },
+    Question = { fg = "#80cbc4", ctermfg = 116 },
+    Removed = { fg = "#f07178", ctermfg = 210 },
+    Repeat = { link = "Statement" },
+    ScrollbarSlider = { bg = "#363a4d", ctermbg = 237 },
+    Search = { bg = "#3f4560", ctermbg = 60 },
+    SignColumn = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+    Special = { fg = "#80cbc4", ctermfg = 116 },
+    SpecialChar = { fg = "#ced1e3", ctermfg = 252 },
+    SpecialComment = { fg = "#676e95", bold = true, ctermfg = 60 },
+    SpecialKey = { fg = "#434967", ctermfg = 60 },
+    SpellBad = { sp = "#f07178", undercurl = true },
+    SpellCap = { sp = "#c3e88d", undercurl = true },
+    SpellLocal = { sp = "#ffcb6b", undercurl = true },
+    SpellRare = { sp = "#ffcb6b", undercurl = true },
+    Statement = { fg = "#89ddff", bold = true, ctermfg = 117 },
+    StatusLine = { fg = "#ced1e3", bg = "#373d53", ctermbg = 237, ctermfg = 252 },
+    StatusLineNC = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    StorageClass = { fg = "#89ddff", ctermfg = 117 },
+    String = { fg = "#c3e88d", ctermfg = 150 },
+    Structure = { fg = "#ffcb6b", ctermfg = 222 },
+    Substitute = { bg = "#445378", bold = true, ctermbg = 60 },
+    TabLine = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    TabLineFill = { bg = "#292d3e", ctermbg = 236 },
+    TabLineSel = { fg = "#ced1e3", bg = "#373d53", sp = "#80cbc4", ctermbg = 237, ctermfg = 252, underline = true },
+    Tag = { fg = "#89ddff", ctermfg = 117 },
+    TermCursor = { link = "Cursor" },
+    TermCursorNC = { bg = "#676e95", ctermbg = 60 },
+    TerminalBlack = { fg = "#676e95", ctermfg = 60 },
+    TerminalBlue = { fg = "#82aaff", ctermfg = 111 },
+    TerminalBrightBlue = { fg = "#82aaff", ctermfg = 111 },
+    TerminalBrightCyan = { fg = "#89ddff", ctermfg = 117 },
+    TerminalBrightGreen = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalBrightMagenta = { fg = "#c792ea", ctermfg = 140 },
+    TerminalBrightRed = { fg = "#f07178", ctermfg = 210 },
+    TerminalBrightYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor0 = { fg = "#676e95", ctermfg = 60 },
+    TerminalColor1 = { fg = "#f07178", ctermfg = 210 },
+    TerminalColor10 = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalColor11 = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor12 = { fg = "#82aaff", ctermfg = 111 },
+    TerminalColor13 = { fg = "#c792ea", ctermfg = 140 },
+    TerminalColor14 = { fg = "#89ddff", ctermfg = 117 },
+    TerminalColor15 = { fg = "#ced1e3", ctermfg = 252 },
+    TerminalColor2 = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalColor3 = { fg = "#ffcb6b", ctermfg = 222 },
+    TerminalColor4 = { fg = "#82aaff", ctermfg = 111 },
+    TerminalColor5 = { fg = "#c792ea", ctermfg = 140 },
+    TerminalColor6 = { fg = "#89ddff", ctermfg = 117 },
+    TerminalColor7 = { fg = "#ced1e3", ctermfg = 252 },
+    TerminalColor8 = { fg = "#4e5579", ctermfg = 60 },
+    TerminalColor9 = { fg = "#f07178", ctermfg = 210 },
+    TerminalCyan = { fg = "#89ddff", ctermfg = 117 },
+    TerminalError = { fg = "#f07178", ctermfg = 210 },
+    TerminalGreen = { fg = "#c3e88d", ctermfg = 150 },
+    TerminalMagenta = { fg = "#c792ea", ctermfg = 140 },
+    TerminalNormal = { fg = "#eeffff", bg = "#292d3e", ctermbg = 236, ctermfg = 231 },
+    TerminalRed = { fg = "#f07178", ctermfg = 210 },
+    TerminalWhite = { fg = "#ced1e3", ctermfg = 252 },
+    TerminalYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    Todo = { fg = "#f78c6c", bold = true, ctermfg = 209, italic = true },
+    Type = { fg = "#ffcb6b", ctermfg = 222 },
+    Typedef = { fg = "#ffcb6b", ctermfg = 222 },
+    Underlined = { fg = "#80cbc4", ctermfg = 116, underline = true },
+    VertSplit = { link = "WinSeparator" },
+    Visual = { bg = "#3f4560", ctermbg = 60 },
+    VisualNOS = { link = "Visual" },
+    WarningMsg = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+    Whitespace = { fg = "#4e5579", ctermfg = 60 },
+    WinBar = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+    WinBarNC = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+    WinSeparator = { fg = "#3c415c", ctermfg = 60 },
+    debugPC = { bg = "#373d53", ctermbg = 237 },
+    lCursor = { link = "Cursor" },
+  },
+  plugins = {
+    cmp = {
+      CmpItemAbbr = { fg = "#ced1e3", ctermfg = 252 },
+      CmpItemAbbrDeprecated = { fg = "#676e95", ctermfg = 60, strikethrough = true },
+      CmpItemAbbrMatch = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      CmpItemAbbrMatchFuzzy = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKind = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindClass = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindColor = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindConstant = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindConstructor = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindEnum = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindEnumMember = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindEvent = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindField = { fg = "#ced1e3", ctermfg = 252 },
+      CmpItemKindFile = { fg = "#ced1e3", ctermfg = 252 },
+      CmpItemKindFolder = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindFunction = { fg = "#82aaff", ctermfg = 111 },
+      CmpItemKindInterface = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindKeyword = { fg = "#89ddff", ctermfg = 117 },
+      CmpItemKindMethod = { fg = "#82aaff", ctermfg = 111 },
+      CmpItemKindModule = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindOperator = { fg = "#89ddff", ctermfg = 117 },
+      CmpItemKindProperty = { fg = "#ced1e3", ctermfg = 252 },
+      CmpItemKindReference = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindSnippet = { fg = "#80cbc4", ctermfg = 116 },
+      CmpItemKindStruct = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindText = { fg = "#ced1e3", ctermfg = 252 },
+      CmpItemKindTypeParameter = { fg = "#ffcb6b", ctermfg = 222 },
+      CmpItemKindUnit = { fg = "#f78c6c", ctermfg = 209 },
+      CmpItemKindValue = { fg = "#ff9cac", ctermfg = 217 },
+      CmpItemKindVariable = { fg = "#ced1e3", ctermfg = 252 },
+      CmpItemMenu = { fg = "#676e95", ctermfg = 60 },
+    },
+    dap = {
+      DapBreakpoint = { fg = "#f07178", ctermfg = 210 },
+      DapBreakpointCondition = { fg = "#ffcb6b", ctermfg = 222 },
+      DapBreakpointRejected = { fg = "#676e95", ctermfg = 60 },
+      DapLogPoint = { fg = "#ffcb6b", ctermfg = 222 },
+      DapStopped = { fg = "#c3e88d", ctermfg = 150 },
+      DapStoppedLine = { bg = "#373d53", ctermbg = 237 },
+      DapUIBreakpointsCurrentLine = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      DapUIBreakpointsDisabledLine = { fg = "#676e95", ctermfg = 60 },
+      DapUIBreakpointsInfo = { fg = "#ffcb6b", ctermfg = 222 },
+      DapUIBreakpointsPath = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIDecoration = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIFloatBorder = { fg = "#3c415c", ctermfg = 60 },
+      DapUILineNumber = { fg = "#474d6c", ctermfg = 60 },
+      DapUIModifiedValue = { fg = "#ffcb6b", bold = true, ctermfg = 222 },
+      DapUIScope = { fg = "#80cbc4", ctermfg = 116 },
+      DapUISource = { fg = "#c3e88d", ctermfg = 150 },
+      DapUIStoppedThread = { fg = "#80cbc4", ctermfg = 116 },
+      DapUIThread = { fg = "#c3e88d", ctermfg = 150 },
+      DapUIType = { fg = "#ffcb6b", ctermfg = 222 },
+      DapUIValue = { fg = "#f78c6c", ctermfg = 209 },
+      DapUIVariable = { fg = "#ced1e3", ctermfg = 252 },
+      DapUIWatchesEmpty = { fg = "#f07178", ctermfg = 210 },
+      DapUIWatchesError = { fg = "#f07178", ctermfg = 210 },
+      DapUIWatchesValue = { fg = "#c3e88d", ctermfg = 150 },
+    },
+    flash = {
+      FlashBackdrop = { fg = "#676e95", ctermfg = 60 },
+      FlashCurrent = { bg = "#3f4560", bold = true, ctermbg = 60 },
+      FlashLabel = { fg = "#292d3e", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 236 },
+      FlashMatch = { bg = "#3f4560", ctermbg = 60 },
+    },
+    gitsigns = {
+      GitSignsAdd = { fg = "#c3e88d", bg = "#292d3e", ctermbg = 236, ctermfg = 150 },
+      GitSignsAddLn = { bg = "#586556", ctermbg = 241 },
+      GitSignsAddNr = { fg = "#c3e88d", ctermfg = 150 },
+      GitSignsAddPreview = { link = "DiffAdd" },
+      GitSignsChange = { fg = "#82aaff", bg = "#292d3e", ctermbg = 236, ctermfg = 111 },
+      GitSignsChangeLn = { bg = "#445378", ctermbg = 60 },
+      GitSignsChangeNr = { fg = "#82aaff", ctermfg = 111 },
+      GitSignsCurrentLineBlame = { fg = "#ffffff", ctermfg = 231, italic = true },
+      GitSignsDelete = { fg = "#f07178", bg = "#292d3e", ctermbg = 236, ctermfg = 210 },
+      GitSignsDeleteLn = { bg = "#654250", ctermbg = 95 },
+      GitSignsDeleteNr = { fg = "#f07178", ctermfg = 210 },
+      GitSignsDeletePreview = { link = "DiffDelete" },
+    },
+    headlines = {
+      CodeBlock = { bg = "#373d53", ctermbg = 237 },
+      Dash = { fg = "#676e95", ctermfg = 60 },
+      Headline1 = { bg = "#373d53", ctermbg = 237 },
+      Headline2 = { bg = "#373d53", ctermbg = 237 },
+      Headline3 = { bg = "#373d53", ctermbg = 237 },
+      Headline4 = { bg = "#373d53", ctermbg = 237 },
+      Headline5 = { bg = "#373d53", ctermbg = 237 },
+      Headline6 = { bg = "#373d53", ctermbg = 237 },
+      Quote = { fg = "#89ddff", ctermfg = 117, italic = true },
+    },
+    ibl = {
+      IblIndent = { fg = "#3c415c", ctermfg = 60 },
+      IblScope = { fg = "#80cbc4", ctermfg = 116 },
+      IndentBlanklineChar = { fg = "#3c415c", ctermfg = 60 },
+      IndentBlanklineContextChar = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    illuminate = {
+      IlluminatedWordRead = { bg = "#3f4560", ctermbg = 60 },
+      IlluminatedWordText = { bg = "#3f4560", ctermbg = 60 },
+      IlluminatedWordWrite = { bg = "#3f4560", ctermbg = 60 },
+    },
+    lazy = {
+      LazyButton = { bg = "#373d53", ctermbg = 237 },
+      LazyButtonActive = { bg = "#3f4560", ctermbg = 60 },
+      LazyH1 = { fg = "#292d3e", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 236 },
+      LazyH2 = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      LazyReasonCmd = { fg = "#ffcb6b", ctermfg = 222 },
+      LazyReasonEvent = { fg = "#89ddff", ctermfg = 117 },
+      LazyReasonFt = { fg = "#c3e88d", ctermfg = 150 },
+      LazyReasonKeys = { fg = "#c792ea", ctermfg = 140 },
+      LazyReasonPlugin = { fg = "#80cbc4", ctermfg = 116 },
+      LazyReasonStart = { fg = "#c3e88d", ctermfg = 150 },
+    },
+    leap = {
+      LeapBackdrop = { fg = "#676e95", ctermfg = 60 },
+      LeapLabelPrimary = { fg = "#292d3e", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 236 },
+      LeapLabelSecondary = { fg = "#292d3e", bg = "#c792ea", bold = true, ctermbg = 140, ctermfg = 236 },
+      LeapMatch = { fg = "#80cbc4", bold = true, ctermfg = 116, underline = true },
+    },
+    mason = {
+      MasonHeader = { fg = "#292d3e", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 236 },
+      MasonHighlight = { fg = "#80cbc4", ctermfg = 116 },
+      MasonHighlightSecondary = { fg = "#89ddff", ctermfg = 117 },
+      MasonMuted = { fg = "#676e95", ctermfg = 60 },
+    },
+    mini = {
+      MiniCursorword = { bg = "#3f4560", ctermbg = 60 },
+      MiniCursorwordCurrent = { bg = "#3f4560", ctermbg = 60 },
+      MiniIndentscopePrefix = { nocombine = true },
+      MiniIndentscopeSymbol = { fg = "#80cbc4", ctermfg = 116 },
+      MiniJump = { fg = "#292d3e", bg = "#80cbc4", ctermbg = 116, ctermfg = 236 },
+      MiniJump2dSpot = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      MiniStatuslineDevinfo = { fg = "#ced1e3", bg = "#373d53", ctermbg = 237, ctermfg = 252 },
+      MiniStatuslineFileinfo = { fg = "#ced1e3", bg = "#373d53", ctermbg = 237, ctermfg = 252 },
+      MiniStatuslineFilename = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+      MiniStatuslineInactive = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+      MiniStatuslineModeCommand = { fg = "#292d3e", bg = "#ffcb6b", bold = true, ctermbg = 222, ctermfg = 236 },
+      MiniStatuslineModeInsert = { fg = "#292d3e", bg = "#c3e88d", bold = true, ctermbg = 150, ctermfg = 236 },
+      MiniStatuslineModeNormal = { fg = "#292d3e", bg = "#80cbc4", bold = true, ctermbg = 116, ctermfg = 236 },
+      MiniStatuslineModeOther = { fg = "#292d3e", bg = "#c792ea", bold = true, ctermbg = 140, ctermfg = 236 },
+      MiniStatuslineModeReplace = { fg = "#292d3e", bg = "#f07178", bold = true, ctermbg = 210, ctermfg = 236 },
+      MiniStatuslineModeVisual = { fg = "#292d3e", bg = "#89ddff", bold = true, ctermbg = 117, ctermfg = 236 },
+      MiniSurround = { fg = "#292d3e", bg = "#80cbc4", ctermbg = 116, ctermfg = 236 },
+      MiniTablineCurrent = { fg = "#ced1e3", bg = "#373d53", ctermbg = 237, ctermfg = 252 },
+      MiniTablineFill = { bg = "#292d3e", ctermbg = 236 },
+      MiniTablineHidden = { fg = "#676e95", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+      MiniTablineModifiedCurrent = { fg = "#80cbc4", bg = "#373d53", ctermbg = 237, ctermfg = 116 },
+      MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "#292d3e", ctermbg = 236, ctermfg = 116 },
+      MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "#292d3e", ctermbg = 236, ctermfg = 116 },
+      MiniTablineTabpagesection = { fg = "#ced1e3", bg = "#373d53", ctermbg = 237, ctermfg = 252 },
+      MiniTablineVisible = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      MiniTestEmphasis = { bold = true },
+      MiniTestFail = { fg = "#f07178", bold = true, ctermfg = 210 },
+      MiniTestPass = { fg = "#c3e88d", bold = true, ctermfg = 150 },
+      MiniTrailspace = { bg = "#f07178", ctermbg = 210 },
+    },
+    navic = {
+      NavicIconsArray = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsBoolean = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsClass = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsConstant = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsConstructor = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsEnum = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsEnumMember = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsEvent = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsField = { fg = "#ced1e3", ctermfg = 252 },
+      NavicIconsFile = { fg = "#ced1e3", ctermfg = 252 },
+      NavicIconsFunction = { fg = "#82aaff", ctermfg = 111 },
+      NavicIconsInterface = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsKey = { fg = "#89ddff", ctermfg = 117 },
+      NavicIconsMethod = { fg = "#82aaff", ctermfg = 111 },
+      NavicIconsModule = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsNamespace = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsNull = { fg = "#ff9cac", ctermfg = 217 },
+      NavicIconsNumber = { fg = "#f78c6c", ctermfg = 209 },
+      NavicIconsObject = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsOperator = { fg = "#89ddff", ctermfg = 117 },
+      NavicIconsPackage = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsProperty = { fg = "#ced1e3", ctermfg = 252 },
+      NavicIconsString = { fg = "#c3e88d", ctermfg = 150 },
+      NavicIconsStruct = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsTypeParameter = { fg = "#ffcb6b", ctermfg = 222 },
+      NavicIconsVariable = { fg = "#ced1e3", ctermfg = 252 },
+      NavicSeparator = { fg = "#3c415c", ctermfg = 60 },
+      NavicText = { fg = "#ced1e3", ctermfg = 252 },
+    },
+    ["neo-tree"] = {
+      NeoTreeDirectoryIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NeoTreeDirectoryName = { fg = "#ced1e3", ctermfg = 252 },
+      NeoTreeFileIcon = { fg = "#ced1e3", ctermfg = 252 },
+      NeoTreeFileName = { fg = "#ced1e3", ctermfg = 252 },
+      NeoTreeGitAdded = { fg = "#c3e88d", ctermfg = 150 },
+      NeoTreeGitDeleted = { fg = "#f07178", ctermfg = 210 },
+      NeoTreeGitModified = { fg = "#82aaff", ctermfg = 111 },
+      NeoTreeGitUntracked = { fg = "#c3e88d", ctermfg = 150 },
+      NeoTreeIndentMarker = { fg = "#3c415c", ctermfg = 60 },
+      NeoTreeNormal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      NeoTreeNormalNC = { link = "NeoTreeNormal" },
+      NeoTreeRootName = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NeoTreeSymbolicLinkTarget = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    noice = {
+      NoiceCmdline = { fg = "#ced1e3", ctermfg = 252 },
+      NoiceCmdlineIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NoiceCmdlinePopup = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      NoiceCmdlinePopupBorder = { fg = "#3c415c", ctermfg = 60 },
+      NoiceConfirm = { bg = "#292d3e", ctermbg = 236 },
+      NoiceConfirmBorder = { fg = "#3c415c", ctermfg = 60 },
+    },
+    notify = {
+      NotifyBackground = { bg = "#292d3e", ctermbg = 236 },
+      NotifyDEBUGBorder = { fg = "#676e95", ctermfg = 60 },
+      NotifyDEBUGIcon = { fg = "#676e95", ctermfg = 60 },
+      NotifyDEBUGTitle = { fg = "#676e95", ctermfg = 60 },
+      NotifyERRORBorder = { fg = "#f07178", ctermfg = 210 },
+      NotifyERRORIcon = { fg = "#f07178", ctermfg = 210 },
+      NotifyERRORTitle = { fg = "#f07178", ctermfg = 210 },
+      NotifyINFOBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyINFOIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyINFOTitle = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACEBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACEIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyTRACETitle = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNBorder = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNIcon = { fg = "#ffcb6b", ctermfg = 222 },
+      NotifyWARNTitle = { fg = "#ffcb6b", ctermfg = 222 },
+    },
+    ["nvim-tree"] = {
+      NvimTreeEmptyFolderName = { fg = "#676e95", ctermfg = 60 },
+      NvimTreeFolderIcon = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeFolderName = { fg = "#ced1e3", ctermfg = 252 },
+      NvimTreeGitDeleted = { fg = "#f07178", ctermfg = 210 },
+      NvimTreeGitDirty = { fg = "#82aaff", ctermfg = 111 },
+      NvimTreeGitNew = { fg = "#c3e88d", ctermfg = 150 },
+      NvimTreeGitStaged = { fg = "#c3e88d", ctermfg = 150 },
+      NvimTreeImageFile = { fg = "#ced1e3", ctermfg = 252 },
+      NvimTreeIndentMarker = { fg = "#3c415c", ctermfg = 60 },
+      NvimTreeNormal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      NvimTreeNormalNC = { link = "NvimTreeNormal" },
+      NvimTreeOpenedFolderName = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeRootFolder = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      NvimTreeSpecialFile = { fg = "#80cbc4", ctermfg = 116 },
+      NvimTreeSymlink = { fg = "#80cbc4", ctermfg = 116 },
+    },
+    ["rainbow-delimiters"] = {
+      RainbowDelimiterBlue = { fg = "#82aaff", ctermfg = 111 },
+      RainbowDelimiterCyan = { fg = "#89ddff", ctermfg = 117 },
+      RainbowDelimiterGreen = { fg = "#c3e88d", ctermfg = 150 },
+      RainbowDelimiterOrange = { fg = "#f78c6c", ctermfg = 209 },
+      RainbowDelimiterRed = { fg = "#f07178", ctermfg = 210 },
+      RainbowDelimiterViolet = { fg = "#c792ea", ctermfg = 140 },
+      RainbowDelimiterYellow = { fg = "#ffcb6b", ctermfg = 222 },
+    },
+    telescope = {
+      TelescopeBorder = { fg = "#3c415c", bg = "#292d3e", ctermbg = 236, ctermfg = 60 },
+      TelescopeMatching = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TelescopeNormal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      TelescopePreviewNormal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      TelescopePreviewTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopePromptCounter = { fg = "#676e95", ctermfg = 60 },
+      TelescopePromptPrefix = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeResultsNormal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      TelescopeResultsTitle = { fg = "#80cbc4", ctermfg = 116 },
+      TelescopeSelection = { bg = "#3f4560", ctermbg = 60 },
+      TelescopeSelectionCaret = { fg = "#80cbc4", bg = "#3f4560", ctermbg = 60, ctermfg = 116 },
+      TelescopeTitle = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+    },
+    trouble = {
+      TroubleCount = { fg = "#80cbc4", bold = true, ctermfg = 116 },
+      TroubleFile = { fg = "#ced1e3", ctermfg = 252 },
+      TroubleFoldIcon = { fg = "#676e95", ctermfg = 60 },
+      TroubleLocation = { fg = "#676e95", ctermfg = 60 },
+      TroubleNormal = { fg = "#ced1e3", bg = "#292d3e", ctermbg = 236, ctermfg = 252 },
+      TroublePreview = { bg = "#373d53", ctermbg = 237 },
+      TroubleSignError = { fg = "#f07178", ctermfg = 210 },
+      TroubleSignHint = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleSignInformation = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleSignWarning = { fg = "#ffcb6b", ctermfg = 222 },
+      TroubleText = { fg = "#ced1e3", ctermfg = 252 },
+    },
+    ["which-key"] = {
+      WhichKey = { fg = "#80cbc4", ctermfg = 116 },
+      WhichKeyDesc = { fg = "#ced1e3", ctermfg = 252 },
+      WhichKeyFloat = { bg = "#292d3e", ctermbg = 236 },
+      WhichKeyGroup = { fg = "#89ddff", ctermfg = 117 },
+      WhichKeySeparator = { fg = "#676e95", ctermfg = 60 },
+      WhichKeySeperator = { fg = "#676e95", ctermfg = 60 },
+      WhichKeyValue = { fg = "#676e95", ctermfg = 60 },
+    },
+  },
+
+  -- Terminal colors 0-15
+  terminal = {
+    "#676e95",
+    "#f07178",
+    "#c3e88d",
+    "#ffcb6b",
+    "#82aaff",
+    "#c792ea",
+    "#89ddff",
+    "#ced1e3",
+    "#4e5579",
+    "#f07178",
+    "#c3e88d",
+    "#ffcb6b",
+    "#82aaff",
+    "#c792ea",
+    "#89ddff",
+    "#ced1e3",
+  },
+
+  -- Overrides applied on top of groups with transparent
+  transparent = {
+    groups = {
+      DiagnosticSignError = { fg = "#f07178", bg = "NONE", ctermbg = "NONE", ctermfg = 210 },
+      DiagnosticSignHint = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      DiagnosticSignInfo = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      DiagnosticSignOk = { fg = "#c3e88d", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+      DiagnosticSignWarn = { fg = "#ffcb6b", bg = "NONE", ctermbg = "NONE", ctermfg = 222 },
+      FloatBorder = { fg = "#3c415c", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+      FloatTitle = { fg = "#80cbc4", bg = "NONE", bold = true, ctermbg = "NONE", ctermfg = 116 },
+      FoldColumn = { fg = "#676e95", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+      LineNr = { fg = "#474d6c", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+      Normal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      NormalFloat = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      NormalNC = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      SignColumn = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      StatusLineNC = { fg = "#676e95", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+      TabLine = { fg = "#676e95", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+      TabLineFill = { bg = "NONE", ctermbg = "NONE" },
+      TerminalNormal = { fg = "#eeffff", bg = "NONE", ctermbg = "NONE", ctermfg = 231 },
+    },
+    plugins = {
+      gitsigns = {
+        GitSignsAdd = { fg = "#c3e88d", bg = "NONE", ctermbg = "NONE", ctermfg = 150 },
+        GitSignsChange = { fg = "#82aaff", bg = "NONE", ctermbg = "NONE", ctermfg = 111 },
+        GitSignsDelete = { fg = "#f07178", bg = "NONE", ctermbg = "NONE", ctermfg = 210 },
+      },
+      mini = {
+        MiniStatuslineFilename = { fg = "#676e95", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+        MiniStatuslineInactive = { fg = "#676e95", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+        MiniTablineFill = { bg = "NONE", ctermbg = "NONE" },
+        MiniTablineHidden = { fg = "#676e95", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+        MiniTablineModifiedHidden = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineModifiedVisible = { fg = "#80cbc4", bg = "NONE", ctermbg = "NONE", ctermfg = 116 },
+        MiniTablineVisible = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      },
+      ["neo-tree"] = {
+        NeoTreeNormal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      },
+      noice = {
+        NoiceCmdlinePopup = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+        NoiceConfirm = { bg = "NONE", ctermbg = "NONE" },
+      },
+      notify = {
+        NotifyBackground = { bg = "NONE", ctermbg = "NONE" },
+      },
+      ["nvim-tree"] = {
+        NvimTreeNormal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      },
+      telescope = {
+        TelescopeBorder = { fg = "#3c415c", bg = "NONE", ctermbg = "NONE", ctermfg = 60 },
+        TelescopeNormal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+        TelescopePreviewNormal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+        TelescopeResultsNormal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      },
+      trouble = {
+        TroubleNormal = { fg = "#ced1e3", bg = "NONE", ctermbg = "NONE", ctermfg = 252 },
+      },
+      ["which-key"] = {
+        WhichKeyFloat = { bg = "NONE", ctermbg = "NONE" },
+      },
+    },
+  },
+
+  -- Overrides applied on top of groups with no italic comments
+  no_italic_comments = {
+    groups = {
+      Comment = { fg = "#676e95", ctermfg = 60 },
+    },
+    plugins = {
+    },
+  },
+}
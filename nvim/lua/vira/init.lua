@@ -9,6 +9,8 @@ local M = {}
 ---@field italic_comments? boolean Use italic for comments (default: true)
 ---@field on_colors? fun(colors: table): table Callback to modify palette colors
 ---@field on_highlights? fun(highlights: table, colors: table): table Callback to modify highlights
+---@field termguicolors? boolean Enable 'termguicolors'; set to false to use the xterm-256 fallbacks (default: true)
+---@field cache? boolean Cache compiled highlights under stdpath("cache") for faster startup (default: true)
 
 ---@type ViraConfig
 M.config = {
@@ -17,27 +19,22 @@ M.config = {
   italic_comments = true,
   on_colors = nil,
   on_highlights = nil,
+  termguicolors = true,
+  cache = true,
 }
 
-local variants = {
-  "carbon",
-  "deepforest",
-  "graphene",
-  "ocean",
-  "palenight",
-  "teal",
-}
+---Extracted variants followed by those generated from nvim/variants.json
+---@return string[]
+local function all_variants()
+  local ok, derived = pcall(require, "vira.derived")
+  return vim.list_extend(vim.deepcopy(require("vira.variants")), ok and derived or {})
+end
 
 ---Check if variant is valid
 ---@param variant string
 ---@return boolean
 local function is_valid_variant(variant)
-  for _, v in ipairs(variants) do
-    if v == variant then
-      return true
-    end
-  end
-  return false
+  return vim.tbl_contains(all_variants(), variant)
 end
 
 ---Load a palette
@@ -52,6 +49,100 @@ local function load_palette(variant)
   return palette
 end
 
+---Load precompiled highlights
+---@param variant string
+---@return table|nil
+local function load_compiled(variant)
+  local ok, compiled = pcall(require, "vira.highlights." .. variant)
+  if ok then
+    return compiled
+  end
+end
+
+---Get the option overrides of precompiled highlights that apply to the given options
+---@param compiled table
+---@param opts ViraConfig
+---@return table[]
+local function active_overrides(compiled, opts)
+  local overrides = {}
+  if opts.transparent then
+    table.insert(overrides, compiled.transparent)
+  end
+  if opts.italic_comments == false then
+    table.insert(overrides, compiled.no_italic_comments)
+  end
+  return overrides
+end
+
+---Resolve precompiled highlight groups for the given options
+---@param compiled table
+---@param opts ViraConfig
+---@return table<string, table> groups Core groups
+---@return table<string, table<string, table>> plugins Plugin -> groups
+local function compiled_groups(compiled, opts)
+  local groups, plugins = compiled.groups, compiled.plugins
+  local overrides = active_overrides(compiled, opts)
+
+  -- Copy before handing the tables to a callback that may modify them
+  if opts.on_highlights then
+    groups = vim.deepcopy(groups)
+    plugins = vim.deepcopy(plugins)
+    overrides = vim.deepcopy(overrides)
+  elseif #overrides > 0 then
+    groups = vim.tbl_extend("force", {}, groups)
+    plugins = vim.tbl_extend("force", {}, plugins)
+  end
+  for _, override in ipairs(overrides) do
+    for group, settings in pairs(override.groups) do
+      groups[group] = settings
+    end
+    for plugin, plugin_groups in pairs(override.plugins) do
+      plugins[plugin] = vim.tbl_extend("force", plugins[plugin] or {}, plugin_groups)
+    end
+  end
+  return groups, plugins
+end
+
+---Add groups that are not defined yet
+---@param groups table<string, table>
+---@param from table<string, table>
+local function fill_groups(groups, from)
+  for group, settings in pairs(from) do
+    if groups[group] == nil then
+      groups[group] = settings
+    end
+  end
+end
+
+---Map the palette's colors to their precomputed xterm-256 fallbacks
+---@param palette table
+---@return table<string, integer>
+local function cterm_colors(palette)
+  local cterm = {}
+  for key, index in pairs(palette._cterm or {}) do
+    if type(palette[key]) == "string" then
+      cterm[palette[key]:lower()] = index
+    end
+  end
+  return cterm
+end
+
+---Add xterm-256 fallbacks to groups whose colors have one
+---@param groups table<string, table>
+---@param cterm table<string, integer>
+local function add_cterm(groups, cterm)
+  for _, settings in pairs(groups) do
+    for field, cterm_field in pairs({ fg = "ctermfg", bg = "ctermbg" }) do
+      local value = settings[field]
+      if value == "NONE" then
+        settings[cterm_field] = "NONE"
+      elseif type(value) == "string" and settings[cterm_field] == nil then
+        settings[cterm_field] = cterm[value:lower()]
+      end
+    end
+  end
+end
+
 ---Apply highlight groups
 ---@param groups table<string, table>
 local function apply_highlights(groups)
@@ -68,6 +159,100 @@ local function set_terminal_colors(colors)
   end
 end
 
+---Clear existing highlights and set colorscheme options
+---@param variant string
+---@param opts ViraConfig
+local function prepare(variant, opts)
+  if vim.g.colors_name then
+    vim.cmd("hi clear")
+  end
+
+  vim.o.termguicolors = opts.termguicolors
+  vim.o.background = "dark"
+  vim.g.colors_name = "vira"
+  vim.g.vira_variant = variant
+end
+
+---Switch from the variant currently shown by setting only the groups that differ
+---Uses the deltas generate.py precomputes for each pair of variants; skips
+---`hi clear`, so highlights defined by other plugins are kept.
+---@param variant string
+---@return boolean switched False if a full setup is needed instead
+local function switch_delta(variant)
+  local opts = M.config
+  local from = vim.g.colors_name == "vira" and vim.g.vira_variant
+  if not from or from == variant or opts.on_colors or opts.on_highlights then
+    return false
+  end
+
+  local ok, deltas = pcall(require, "vira.deltas." .. variant)
+  local delta = ok and deltas[from]
+  local source, target = load_compiled(from), load_compiled(variant)
+  if not delta or not source or not target then
+    return false
+  end
+
+  -- Groups touched by an active option override in either variant may differ too
+  local changed = {}
+  for _, group in ipairs(delta.groups) do
+    changed[group] = true
+  end
+  for _, compiled in ipairs({ source, target }) do
+    for _, override in ipairs(active_overrides(compiled, opts)) do
+      for group in pairs(override.groups) do
+        changed[group] = true
+      end
+      for _, plugin_groups in pairs(override.plugins) do
+        for group in pairs(plugin_groups) do
+          changed[group] = true
+        end
+      end
+    end
+  end
+
+  local groups, plugins = compiled_groups(target, opts)
+  local owner = {}
+  for plugin, plugin_groups in pairs(plugins) do
+    for group in pairs(plugin_groups) do
+      owner[group] = plugin
+    end
+  end
+
+  -- Set changed core groups now (clearing those the target lacks) and
+  -- collect changed plugin groups for plugins that are already loaded
+  local changed_plugins = {}
+  for group in pairs(changed) do
+    local plugin = owner[group]
+    if plugin then
+      changed_plugins[plugin] = changed_plugins[plugin] or {}
+      changed_plugins[plugin][group] = plugins[plugin][group]
+    else
+      vim.api.nvim_set_hl(0, group, groups[group] or {})
+    end
+  end
+
+  for _, i in ipairs(delta.terminal) do
+    vim.g["terminal_color_" .. i] = target.terminal[i + 1]
+  end
+
+  local appliers, loaded_appliers = {}, {}
+  for plugin, plugin_groups in pairs(plugins) do
+    appliers[plugin] = function()
+      apply_highlights(plugin_groups)
+    end
+  end
+  for plugin, plugin_groups in pairs(changed_plugins) do
+    loaded_appliers[plugin] = function()
+      apply_highlights(plugin_groups)
+    end
+  end
+  require("vira.lazy").register(appliers, loaded_appliers)
+
+  opts.variant = variant
+  vim.g.vira_variant = variant
+  return true
+end
+
 ---Setup the colorscheme
 ---@param opts? ViraConfig
 function M.setup(opts)
@@ -83,43 +268,94 @@ function M.setup(opts)
     opts.variant = "carbon"
   end
 
-  -- Load palette
-  local palette = load_palette(opts.variant)
-  if vim.tbl_isempty(palette) then
-    return
+  -- Replay a cached snapshot when no callback needs the highlight tables
+  local snapshot = opts.cache and not opts.on_colors and not opts.on_highlights and require("vira.snapshot") or nil
+  if snapshot then
+    local chunk = snapshot.load(opts.variant, opts)
+    if chunk then
+      prepare(opts.variant, opts)
+      require("vira.lazy").register(chunk() or {})
+      return
+    end
+  end
+
+  -- Precompiled highlights are exact unless the palette is modified
+  local compiled = load_compiled(opts.variant)
+  local use_compiled = compiled ~= nil and not opts.on_colors
+
+  -- Load palette (only needed by callbacks when using compiled highlights)
+  local palette
+  if not use_compiled or opts.on_highlights then
+    palette = load_palette(opts.variant)
+    if vim.tbl_isempty(palette) then
+      return
+    end
   end
 
+  -- Taken before on_colors, which may replace colors
+  local cterm = not use_compiled and cterm_colors(palette) or nil
+
   -- Allow user to modify colors
   if opts.on_colors then
     palette = opts.on_colors(palette) or palette
   end
 
-  -- Get highlight groups
-  local groups_module = require("vira.groups")
-  local groups = groups_module.get(palette, opts)
+  -- Get highlight groups; plugin groups are kept apart to apply lazily
+  local groups, plugins, term_colors
+  if use_compiled then
+    groups, plugins = compiled_groups(compiled, opts)
+    term_colors = compiled.terminal
+  else
+    local groups_module = require("vira.groups")
+    groups = groups_module.get(palette, opts)
+    term_colors = groups_module.terminal_colors(palette)
+    add_cterm(groups, cterm)
 
-  -- Allow user to modify highlights
-  if opts.on_highlights then
-    groups = opts.on_highlights(groups, palette) or groups
+    -- Fill in mapped groups the template does not define
+    if compiled then
+      local core, compiled_plugins = compiled_groups(compiled, opts)
+      fill_groups(groups, core)
+      for _, plugin_groups in pairs(compiled_plugins) do
+        fill_groups(groups, plugin_groups)
+      end
+    end
   end
+  plugins = plugins or {}
 
-  -- Clear existing highlights
-  if vim.g.colors_name then
-    vim.cmd("hi clear")
+  -- Allow user to modify highlights; the callback sees every group, so
+  -- plugin groups are applied up front
+  if opts.on_highlights then
+    for _, plugin_groups in pairs(plugins) do
+      for group, settings in pairs(plugin_groups) do
+        groups[group] = settings
+      end
+    end
+    plugins = {}
+    groups = opts.on_highlights(groups, palette) or groups
   end
 
-  -- Set vim options
-  vim.o.termguicolors = true
-  vim.o.background = "dark"
-  vim.g.colors_name = "vira"
-  vim.g.vira_variant = opts.variant
+  -- Clear existing highlights and set vim options
+  prepare(opts.variant, opts)
 
   -- Apply highlights
   apply_highlights(groups)
 
   -- Set terminal colors
-  local term_colors = groups_module.terminal_colors(palette)
   set_terminal_colors(term_colors)
+
+  -- Apply plugin groups once their plugin loads
+  local appliers = {}
+  for plugin, plugin_groups in pairs(plugins) do
+    appliers[plugin] = function()
+      apply_highlights(plugin_groups)
+    end
+  end
+  require("vira.lazy").register(appliers)
+
+  -- Save a snapshot for the next startup
+  if snapshot then
+    snapshot.write(opts.variant, opts, groups, term_colors, plugins)
+  end
 end
 
 ---Load theme (for use with :colorscheme)
@@ -130,7 +366,7 @@ end
 ---Get available variants
 ---@return string[]
 function M.variants()
-  return vim.deepcopy(variants)
+  return all_variants()
 end
 
 ---Get current variant
@@ -146,7 +382,9 @@ function M.switch(variant)
     vim.notify("Vira: Invalid variant '" .. variant .. "'", vim.log.levels.ERROR)
     return
   end
-  M.setup({ variant = variant })
+  if not switch_delta(variant) then
+    M.setup({ variant = variant })
+  end
 end
 
 return M
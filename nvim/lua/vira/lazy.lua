@@ -0,0 +1,118 @@
+-- Vira lazy plugin highlights
+-- Applies the highlight groups of a plugin when its Lua module is first
+-- required, instead of setting every plugin's groups at startup
+--
+-- A searcher in front of package.loaders sees the first require of each
+-- module; it applies the matching plugin's groups and lets the regular
+-- loaders find the module. Plugins already loaded get their groups at once.
+-- Pending groups are dropped as soon as another colorscheme is loaded.
+
+local M = {}
+
+---Plugin -> Lua modules whose first require applies its groups
+---Keys must match PLUGINS in nvim/highlights.py
+---@type table<string, string[]>
+M.modules = {
+  cmp = { "cmp" },
+  dap = { "dap", "dapui" },
+  flash = { "flash" },
+  gitsigns = { "gitsigns" },
+  headlines = { "headlines" },
+  ibl = { "ibl", "indent_blankline" },
+  illuminate = { "illuminate" },
+  lazy = { "lazy" },
+  leap = { "leap" },
+  mason = { "mason" },
+  mini = { "mini" },
+  navic = { "nvim-navic" },
+  ["neo-tree"] = { "neo-tree" },
+  noice = { "noice" },
+  notify = { "notify" },
+  ["nvim-tree"] = { "nvim-tree" },
+  ["rainbow-delimiters"] = { "rainbow-delimiters" },
+  telescope = { "telescope" },
+  trouble = { "trouble" },
+  ["which-key"] = { "which-key" },
+}
+
+-- Module -> plugin
+local by_module = {}
+for plugin, modules in pairs(M.modules) do
+  for _, module in ipairs(modules) do
+    by_module[module] = plugin
+  end
+end
+
+-- Plugin -> function applying its groups, until the plugin loads
+---@type table<string, function>
+local pending = {}
+
+local installed = false
+
+---Check if any module of a plugin is loaded
+---@param plugin string
+---@return boolean
+local function is_loaded(plugin)
+  for _, module in ipairs(M.modules[plugin] or {}) do
+    if package.loaded[module] then
+      return true
+    end
+  end
+  return false
+end
+
+---Apply a plugin's groups if they are still pending
+---@param plugin string
+local function apply(plugin)
+  local fn = pending[plugin]
+  if fn then
+    pending[plugin] = nil
+    fn()
+  end
+end
+
+---Loader consulted before the regular ones on every first require
+---@param name string
+local function searcher(name)
+  local plugin = by_module[name] or by_module[name:match("^[^.]+")]
+  -- Never paint Vira's groups over another colorscheme
+  if plugin and vim.g.colors_name == "vira" then
+    apply(plugin)
+  end
+  -- Returning nothing lets the next loader find the module
+end
+
+---Register the group appliers of the current variant
+---Replaces those of a previous variant; loaded plugins are applied now.
+---@param appliers table<string, function> Plugin -> function applying its groups
+---@param loaded_appliers? table<string, function> Used instead for loaded plugins, e.g. to
+---apply only the groups a variant switch changes
+function M.register(appliers, loaded_appliers)
+  pending = {}
+  for plugin, fn in pairs(appliers) do
+    if is_loaded(plugin) then
+      if not loaded_appliers then
+        fn()
+      elseif loaded_appliers[plugin] then
+        loaded_appliers[plugin]()
+      end
+    else
+      pending[plugin] = fn
+    end
+  end
+
+  if not installed then
+    table.insert(package.loaders, 1, searcher)
+    -- Any colorscheme load, Vira's own included, starts over; Vira registers
+    -- its appliers again once it has loaded
+    vim.api.nvim_create_autocmd("ColorSchemePre", {
+      group = vim.api.nvim_create_augroup("vira.lazy", { clear = true }),
+      callback = function()
+        pending = {}
+      end,
+    })
+    installed = true
+  end
+end
+
+return M
@@ -10,24 +10,24 @@ return {
   bookmark_fg = "#ffffff",
   boolean = "#d6808f",
   bracket = "#a178c4",
-  colorcolumn = "#212121",
+  colorcolumn = "#161616",
   comment = "#45454a",
   comment_doc = "#45454a",
   constant = "#d6808f",
   cursor = "#ffcc00",
-  cursorline = "#2f3237",
+  cursorline = "#191a1c",
   delimiter = "#6ebad7",
   deprecated = "#c85e60",
-  diff_add = "#a3c679",
-  diff_add_attr = "#a3c679",
-  diff_change = "#6a90d0",
-  diff_change_attr = "#6a90d0",
-  diff_delete = "#c85e60",
-  diff_delete_attr = "#c85e60",
+  diff_add = "#38432c",
+  diff_add_attr = "#3f4c31",
+  diff_change = "#273246",
+  diff_change_attr = "#2c394f",
+  diff_delete = "#432324",
+  diff_delete_attr = "#4c2728",
   diff_text = "#2f3237",
   entity = "#90a9bc",
   error = "#c85e60",
-  error_stripe = "#c85e60",
+  error_stripe = "#693435",
   fg = "#d9d9d9",
   field = "#d9d9d9",
   float_bg = "#0a0a0a",
@@ -40,8 +40,8 @@ return {
   gutter = "#0a0a0a",
   hint = "#d5b05f",
   identifier = "#d9d9d9",
-  incsearch = "#ffffff",
-  indent_guide = "#212121",
+  incsearch = "#2f2f2f",
+  indent_guide = "#161616",
   info = "#d5b05f",
   inlay_hint = "#45454a",
   interface = "#d5b05f",
@@ -53,8 +53,8 @@ return {
   linenr_cursor = "#2f3237",
   link = "#80cbc4",
   link_visited = "#80cbc4",
-  lsp_ref = "#ffffff",
-  lsp_ref_effect = "#ffffff",
+  lsp_ref = "#2f2f2f",
+  lsp_ref_effect = "#545454",
   match_brace = "#ffcc00",
   md_bold = "#90a9bc",
   md_code = "#90a9bc",
@@ -71,7 +71,7 @@ return {
   md_quote = "#6ebad7",
   md_url = "#c85e60",
   method_static = "#6a90d0",
-  nontext = "#212121",
+  nontext = "#1a1a1a",
   number = "#cd775c",
   operator = "#6ebad7",
   pmenu = "#0a0a0a",
@@ -82,18 +82,18 @@ return {
   rainbow_red = "#c85e60",
   rainbow_violet = "#a178c4",
   rainbow_yellow = "#d5b05f",
-  search = "#ffffff",
+  search = "#2f2f2f",
   search_effect = "#80cbc4",
-  selection = "#474747",
+  selection = "#292929",
   selection_fg = "#ffffff",
-  separator = "#212121",
+  separator = "#161616",
   separator_selected = "#d5b05f",
   spell_bad = "#c85e60",
   spell_cap = "#a3c679",
   string = "#a3c679",
   string_escape = "#d9d9d9",
   tab_underline = "#80cbc4",
-  tab_underline_inactive = "#80cbc4",
+  tab_underline_inactive = "#629b95",
   tag = "#6ebad7",
   tag_attr = "#a178c4",
   template_var = "#9e6fa1",
@@ -134,4 +134,128 @@ return {
     STATIC_METHOD_IMPORTED_ATTRIBUTES = 2,
     TODO_DEFAULT_ATTRIBUTES = 3,
   },
+
+  -- Nearest xterm-256 colors, for terminals without termguicolors
+  _cterm = {
+    accent = 116,
+    attribute = 179,
+    bg = 232,
+    blame = 231,
+    bookmark_bg = 179,
+    bookmark_fg = 231,
+    boolean = 174,
+    bracket = 140,
+    colorcolumn = 233,
+    comment = 238,
+    comment_doc = 238,
+    constant = 174,
+    cursor = 220,
+    cursorline = 234,
+    delimiter = 74,
+    deprecated = 167,
+    diff_add = 238,
+    diff_add_attr = 238,
+    diff_change = 236,
+    diff_change_attr = 237,
+    diff_delete = 236,
+    diff_delete_attr = 236,
+    diff_text = 236,
+    entity = 110,
+    error = 167,
+    error_stripe = 95,
+    fg = 253,
+    field = 253,
+    float_bg = 232,
+    folded = 110,
+    func_call = 68,
+    func_decl = 68,
+    git_add = 150,
+    git_change = 68,
+    git_delete = 167,
+    gutter = 232,
+    hint = 179,
+    identifier = 253,
+    incsearch = 236,
+    indent_guide = 233,
+    info = 179,
+    inlay_hint = 238,
+    interface = 179,
+    keyword = 74,
+    keyword2 = 140,
+    keyword3 = 173,
+    keyword4 = 174,
+    linenr = 236,
+    linenr_cursor = 236,
+    link = 116,
+    link_visited = 116,
+    lsp_ref = 236,
+    lsp_ref_effect = 240,
+    match_brace = 220,
+    md_bold = 110,
+    md_code = 110,
+    md_code_block = 110,
+    md_h1 = 179,
+    md_h2 = 179,
+    md_h3 = 179,
+    md_h4 = 179,
+    md_h5 = 179,
+    md_h6 = 179,
+    md_italic = 110,
+    md_link = 150,
+    md_list = 253,
+    md_quote = 74,
+    md_url = 167,
+    method_static = 68,
+    nontext = 234,
+    number = 173,
+    operator = 74,
+    pmenu = 232,
+    pmenu_sel = 232,
+    rainbow_blue = 68,
+    rainbow_cyan = 74,
+    rainbow_green = 150,
+    rainbow_red = 167,
+    rainbow_violet = 140,
+    rainbow_yellow = 179,
+    search = 236,
+    search_effect = 116,
+    selection = 235,
+    selection_fg = 231,
+    separator = 233,
+    separator_selected = 179,
+    spell_bad = 167,
+    spell_cap = 150,
+    string = 150,
+    string_escape = 253,
+    tab_underline = 116,
+    tab_underline_inactive = 66,
+    tag = 74,
+    tag_attr = 140,
+    template_var = 96,
+    term_black = 238,
+    term_blue = 68,
+    term_bright_black = 235,
+    term_bright_blue = 68,
+    term_bright_cyan = 74,
+    term_bright_green = 150,
+    term_bright_magenta = 140,
+    term_bright_red = 167,
+    term_bright_white = 253,
+    term_bright_yellow = 179,
+    term_cyan = 74,
+    term_green = 150,
+    term_magenta = 140,
+    term_red = 167,
+    term_white = 253,
+    term_yellow = 179,
+    todo = 173,
+    type = 179,
+    type_param = 179,
+    type_ref = 253,
+    unused = 238,
+    variable = 253,
+    warning = 179,
+    whitespace = 236,
+    winbar = 232,
+  },
 }
@@ -10,24 +10,24 @@ return {
   bookmark_fg = "#ffffff",
   boolean = "#d3959b",
   bracket = "#a68dcd",
-  colorcolumn = "#2c3f39",
+  colorcolumn = "#1f2c28",
   comment = "#3b544d",
   comment_doc = "#3b544d",
   constant = "#d3959b",
   cursor = "#ffcc00",
-  cursorline = "#1d2b26",
+  cursorline = "#192521",
   delimiter = "#74c9de",
   deprecated = "#f07178",
-  diff_add = "#c3e88d",
-  diff_add_attr = "#c3e88d",
-  diff_change = "#6fa0de",
-  diff_change_attr = "#6fa0de",
-  diff_delete = "#f07178",
-  diff_delete_attr = "#f07178",
+  diff_add = "#47573a",
+  diff_add_attr = "#4f6140",
+  diff_change = "#2d4152",
+  diff_change_attr = "#32475c",
+  diff_delete = "#543334",
+  diff_delete_attr = "#5f3738",
   diff_text = "#2c3f39",
   entity = "#95bbbd",
   error = "#f07178",
-  error_stripe = "#f07178",
+  error_stripe = "#814547",
   fg = "#cae5d5",
   field = "#cae5d5",
   float_bg = "#111816",
@@ -40,8 +40,8 @@ return {
   gutter = "#111816",
   hint = "#ffcb6b",
   identifier = "#cae5d5",
-  incsearch = "#ffffff",
-  indent_guide = "#2c3f39",
+  incsearch = "#343a39",
+  indent_guide = "#1f2c28",
   info = "#ffcb6b",
   inlay_hint = "#3b544d",
   interface = "#ffcb6b",
@@ -53,8 +53,8 @@ return {
   linenr_cursor = "#2c3f39",
   link = "#80cbc4",
   link_visited = "#80cbc4",
-  lsp_ref = "#ffffff",
-  lsp_ref_effect = "#ffffff",
+  lsp_ref = "#343a39",
+  lsp_ref_effect = "#595e5c",
   match_brace = "#ffcc00",
   md_bold = "#95bbbd",
   md_code = "#95bbbd",
@@ -71,7 +71,7 @@ return {
   md_quote = "#74c9de",
   md_url = "#f07178",
   method_static = "#6fa0de",
-  nontext = "#2c3f39",
+  nontext = "#24332f",
   number = "#cc8868",
   operator = "#74c9de",
   pmenu = "#111816",
@@ -82,18 +82,18 @@ return {
   rainbow_red = "#f07178",
   rainbow_violet = "#a68dcd",
   rainbow_yellow = "#ffcb6b",
-  search = "#ffffff",
+  search = "#343a39",
   search_effect = "#80cbc4",
-  selection = "#4b7253",
+  selection = "#2e4535",
   selection_fg = "#ffffff",
-  separator = "#2c3f39",
+  separator = "#1f2c28",
   separator_selected = "#ffcb6b",
   spell_bad = "#f07178",
   spell_cap = "#c3e88d",
   string = "#c3e88d",
   string_escape = "#cae5d5",
   tab_underline = "#80cbc4",
-  tab_underline_inactive = "#80cbc4",
+  tab_underline_inactive = "#649e98",
   tag = "#74c9de",
   tag_attr = "#a68dcd",
   template_var = "#9c7ea1",
@@ -134,4 +134,128 @@ return {
     STATIC_METHOD_IMPORTED_ATTRIBUTES = 2,
     TODO_DEFAULT_ATTRIBUTES = 3,
   },
+
+  -- Nearest xterm-256 colors, for terminals without termguicolors
+  _cterm = {
+    accent = 116,
+    attribute = 222,
+    bg = 233,
+    blame = 231,
+    bookmark_bg = 222,
+    bookmark_fg = 231,
+    boolean = 174,
+    bracket = 140,
+    colorcolumn = 235,
+    comment = 239,
+    comment_doc = 239,
+    constant = 174,
+    cursor = 220,
+    cursorline = 235,
+    delimiter = 81,
+    deprecated = 210,
+    diff_add = 239,
+    diff_add_attr = 65,
+    diff_change = 237,
+    diff_change_attr = 238,
+    diff_delete = 237,
+    diff_delete_attr = 95,
+    diff_text = 237,
+    entity = 109,
+    error = 210,
+    error_stripe = 95,
+    fg = 152,
+    field = 152,
+    float_bg = 233,
+    folded = 109,
+    func_call = 75,
+    func_decl = 75,
+    git_add = 150,
+    git_change = 75,
+    git_delete = 210,
+    gutter = 233,
+    hint = 222,
+    identifier = 152,
+    incsearch = 237,
+    indent_guide = 235,
+    info = 222,
+    inlay_hint = 239,
+    interface = 222,
+    keyword = 81,
+    keyword2 = 140,
+    keyword3 = 173,
+    keyword4 = 174,
+    linenr = 237,
+    linenr_cursor = 237,
+    link = 116,
+    link_visited = 116,
+    lsp_ref = 237,
+    lsp_ref_effect = 59,
+    match_brace = 220,
+    md_bold = 109,
+    md_code = 109,
+    md_code_block = 109,
+    md_h1 = 222,
+    md_h2 = 222,
+    md_h3 = 222,
+    md_h4 = 222,
+    md_h5 = 222,
+    md_h6 = 222,
+    md_italic = 109,
+    md_link = 150,
+    md_list = 152,
+    md_quote = 81,
+    md_url = 210,
+    method_static = 75,
+    nontext = 236,
+    number = 173,
+    operator = 81,
+    pmenu = 233,
+    pmenu_sel = 233,
+    rainbow_blue = 75,
+    rainbow_cyan = 81,
+    rainbow_green = 150,
+    rainbow_red = 210,
+    rainbow_violet = 140,
+    rainbow_yellow = 222,
+    search = 237,
+    search_effect = 116,
+    selection = 238,
+    selection_fg = 231,
+    separator = 235,
+    separator_selected = 222,
+    spell_bad = 210,
+    spell_cap = 150,
+    string = 150,
+    string_escape = 152,
+    tab_underline = 116,
+    tab_underline_inactive = 73,
+    tag = 81,
+    tag_attr = 140,
+    template_var = 139,
+    term_black = 239,
+    term_blue = 75,
+    term_bright_black = 237,
+    term_bright_blue = 75,
+    term_bright_cyan = 81,
+    term_bright_green = 150,
+    term_bright_magenta = 140,
+    term_bright_red = 210,
+    term_bright_white = 152,
+    term_bright_yellow = 222,
+    term_cyan = 81,
+    term_green = 150,
+    term_magenta = 140,
+    term_red = 210,
+    term_white = 152,
+    term_yellow = 222,
+    todo = 173,
+    type = 222,
+    type_param = 222,
+    type_ref = 152,
+    unused = 239,
+    variable = 152,
+    warning = 222,
+    whitespace = 237,
+    winbar = 233,
+  },
 }
@@ -10,24 +10,24 @@ return {
   bookmark_fg = "#ffffff",
   boolean = "#ff9cac",
   bracket = "#c792ea",
-  colorcolumn = "#424242",
+  colorcolumn = "#323232",
   comment = "#545454",
   comment_doc = "#545454",
   constant = "#ff9cac",
   cursor = "#ffcc00",
-  cursorline = "#363636",
+  cursorline = "#2e2e2e",
   delimiter = "#89ddff",
   deprecated = "#f07178",
-  diff_add = "#c3e88d",
-  diff_add_attr = "#c3e88d",
-  diff_change = "#82aaff",
-  diff_change_attr = "#82aaff",
-  diff_delete = "#f07178",
-  diff_delete_attr = "#f07178",
+  diff_add = "#525d42",
+  diff_add_attr = "#5a6647",
+  diff_change = "#3e4a64",
+  diff_change_attr = "#43516e",
+  diff_delete = "#60393b",
+  diff_delete_attr = "#693d3f",
   diff_text = "#424242",
   entity = "#b2ccd6",
   error = "#f07178",
-  error_stripe = "#f07178",
+  error_stripe = "#89494d",
   fg = "#d9d9d9",
   field = "#d9d9d9",
   float_bg = "#212121",
@@ -41,7 +41,7 @@ return {
   hint = "#ffcb6b",
   identifier = "#d9d9d9",
   incsearch = "#000000",
-  indent_guide = "#424242",
+  indent_guide = "#323232",
   info = "#ffcb6b",
   inlay_hint = "#545454",
   interface = "#ffcb6b",
@@ -54,7 +54,7 @@ return {
   link = "#80cbc4",
   link_visited = "#80cbc4",
   lsp_ref = "#000000",
-  lsp_ref_effect = "#ffffff",
+  lsp_ref_effect = "#646464",
   match_brace = "#ffcc00",
   md_bold = "#b2ccd6",
   md_code = "#b2ccd6",
@@ -71,7 +71,7 @@ return {
   md_quote = "#89ddff",
   md_url = "#f07178",
   method_static = "#82aaff",
-  nontext = "#424242",
+  nontext = "#383838",
   number = "#f78c6c",
   operator = "#89ddff",
   pmenu = "#212121",
@@ -84,16 +84,16 @@ return {
   rainbow_yellow = "#ffcb6b",
   search = "#000000",
   search_effect = "#80cbc4",
-  selection = "#474747",
+  selection = "#343434",
   selection_fg = "#ffffff",
-  separator = "#424242",
+  separator = "#323232",
   separator_selected = "#ffcb6b",
   spell_bad = "#f07178",
   spell_cap = "#c3e88d",
   string = "#c3e88d",
   string_escape = "#d9d9d9",
   tab_underline = "#80cbc4",
-  tab_underline_inactive = "#80cbc4",
+  tab_underline_inactive = "#68a09b",
   tag = "#89ddff",
   tag_attr = "#c792ea",
   template_var = "#bb80b3",
@@ -134,4 +134,128 @@ return {
     STATIC_METHOD_IMPORTED_ATTRIBUTES = 2,
     TODO_DEFAULT_ATTRIBUTES = 3,
   },
+
+  -- Nearest xterm-256 colors, for terminals without termguicolors
+  _cterm = {
+    accent = 116,
+    attribute = 222,
+    bg = 235,
+    blame = 231,
+    bookmark_bg = 222,
+    bookmark_fg = 231,
+    boolean = 217,
+    bracket = 140,
+    colorcolumn = 236,
+    comment = 240,
+    comment_doc = 240,
+    constant = 217,
+    cursor = 220,
+    cursorline = 236,
+    delimiter = 117,
+    deprecated = 210,
+    diff_add = 240,
+    diff_add_attr = 101,
+    diff_change = 60,
+    diff_change_attr = 60,
+    diff_delete = 95,
+    diff_delete_attr = 95,
+    diff_text = 238,
+    entity = 152,
+    error = 210,
+    error_stripe = 131,
+    fg = 253,
+    field = 253,
+    float_bg = 235,
+    folded = 152,
+    func_call = 111,
+    func_decl = 111,
+    git_add = 150,
+    git_change = 111,
+    git_delete = 210,
+    gutter = 235,
+    hint = 222,
+    identifier = 253,
+    incsearch = 16,
+    indent_guide = 236,
+    info = 222,
+    inlay_hint = 240,
+    interface = 222,
+    keyword = 117,
+    keyword2 = 140,
+    keyword3 = 209,
+    keyword4 = 217,
+    linenr = 238,
+    linenr_cursor = 238,
+    link = 116,
+    link_visited = 116,
+    lsp_ref = 16,
+    lsp_ref_effect = 241,
+    match_brace = 220,
+    md_bold = 152,
+    md_code = 152,
+    md_code_block = 152,
+    md_h1 = 222,
+    md_h2 = 222,
+    md_h3 = 222,
+    md_h4 = 222,
+    md_h5 = 222,
+    md_h6 = 222,
+    md_italic = 152,
+    md_link = 150,
+    md_list = 253,
+    md_quote = 117,
+    md_url = 210,
+    method_static = 111,
+    nontext = 237,
+    number = 209,
+    operator = 117,
+    pmenu = 235,
+    pmenu_sel = 235,
+    rainbow_blue = 111,
+    rainbow_cyan = 117,
+    rainbow_green = 150,
+    rainbow_red = 210,
+    rainbow_violet = 140,
+    rainbow_yellow = 222,
+    search = 16,
+    search_effect = 116,
+    selection = 236,
+    selection_fg = 231,
+    separator = 236,
+    separator_selected = 222,
+    spell_bad = 210,
+    spell_cap = 150,
+    string = 150,
+    string_escape = 253,
+    tab_underline = 116,
+    tab_underline_inactive = 73,
+    tag = 117,
+    tag_attr = 140,
+    template_var = 139,
+    term_black = 240,
+    term_blue = 111,
+    term_bright_black = 238,
+    term_bright_blue = 111,
+    term_bright_cyan = 117,
+    term_bright_green = 150,
+    term_bright_magenta = 140,
+    term_bright_red = 210,
+    term_bright_white = 253,
+    term_bright_yellow = 222,
+    term_cyan = 117,
+    term_green = 150,
+    term_magenta = 140,
+    term_red = 210,
+    term_white = 253,
+    term_yellow = 222,
+    todo = 209,
+    type = 222,
+    type_param = 222,
+    type_ref = 253,
+    unused = 240,
+    variable = 253,
+    warning = 222,
+    whitespace = 238,
+    winbar = 235,
+  },
 }
@@ -10,24 +10,24 @@ return {
   bookmark_fg = "#ffffff",
   boolean = "#ff9cac",
   bracket = "#c792ea",
-  colorcolumn = "#3b3f51",
+  colorcolumn = "#252836",
   comment = "#464b5d",
   comment_doc = "#464b5d",
   constant = "#ff9cac",
   cursor = "#ffcc00",
-  cursorline = "#2d3143",
+  cursorline = "#212433",
   delimiter = "#89ddff",
   deprecated = "#f07178",
-  diff_add = "#c3e88d",
-  diff_add_attr = "#c3e88d",
-  diff_change = "#82aaff",
-  diff_change_attr = "#82aaff",
-  diff_delete = "#f07178",
-  diff_delete_attr = "#f07178",
-  diff_text = "#80869e",
+  diff_add = "#45523d",
+  diff_add_attr = "#4e5c42",
+  diff_change = "#323f5f",
+  diff_change_attr = "#37466a",
+  diff_delete = "#532e36",
+  diff_delete_attr = "#5e333b",
+  diff_text = "#484c5c",
   entity = "#b2ccd6",
   error = "#f07178",
-  error_stripe = "#f07178",
+  error_stripe = "#804149",
   fg = "#ced1e3",
   field = "#ced1e3",
   float_bg = "#0f111a",
@@ -40,8 +40,8 @@ return {
   gutter = "#0f111a",
   hint = "#ffcb6b",
   identifier = "#ced1e3",
-  incsearch = "#ffffff",
-  indent_guide = "#3b3f51",
+  incsearch = "#33343c",
+  indent_guide = "#252836",
   info = "#ffcb6b",
   inlay_hint = "#464b5d",
   interface = "#ffcb6b",
@@ -53,8 +53,8 @@ return {
   linenr_cursor = "#36394a",
   link = "#80cbc4",
   link_visited = "#80cbc4",
-  lsp_ref = "#ffffff",
-  lsp_ref_effect = "#ffffff",
+  lsp_ref = "#33343c",
+  lsp_ref_effect = "#3f4148",
   match_brace = "#ffcc00",
   md_bold = "#b2ccd6",
   md_code = "#b2ccd6",
@@ -71,7 +71,7 @@ return {
   md_quote = "#89ddff",
   md_url = "#f07178",
   method_static = "#82aaff",
-  nontext = "#3b3f51",
+  nontext = "#2e3141",
   number = "#f78c6c",
   operator = "#89ddff",
   pmenu = "#0f111a",
@@ -82,18 +82,18 @@ return {
   rainbow_red = "#f07178",
   rainbow_violet = "#c792ea",
   rainbow_yellow = "#ffcb6b",
-  search = "#ffffff",
+  search = "#33343c",
   search_effect = "#80cbc4",
-  selection = "#51587b",
+  selection = "#30354b",
   selection_fg = "#ffffff",
-  separator = "#3b3f51",
+  separator = "#252836",
   separator_selected = "#ffcb6b",
   spell_bad = "#f07178",
   spell_cap = "#c3e88d",
   string = "#c3e88d",
   string_escape = "#ced1e3",
   tab_underline = "#80cbc4",
-  tab_underline_inactive = "#80cbc4",
+  tab_underline_inactive = "#649c99",
   tag = "#89ddff",
   tag_attr = "#c792ea",
   template_var = "#bb80b3",
@@ -120,7 +120,7 @@ return {
   unused = "#464b5d",
   variable = "#ced1e3",
   warning = "#ffcb6b",
-  whitespace = "#80869e",
+  whitespace = "#484c5c",
   winbar = "#0f111a",
 
   -- Font types: 1=bold, 2=italic, 3=bold+italic
@@ -134,4 +134,128 @@ return {
     STATIC_METHOD_IMPORTED_ATTRIBUTES = 2,
     TODO_DEFAULT_ATTRIBUTES = 3,
   },
+
+  -- Nearest xterm-256 colors, for terminals without termguicolors
+  _cterm = {
+    accent = 116,
+    attribute = 222,
+    bg = 233,
+    blame = 231,
+    bookmark_bg = 222,
+    bookmark_fg = 231,
+    boolean = 217,
+    bracket = 140,
+    colorcolumn = 235,
+    comment = 239,
+    comment_doc = 239,
+    constant = 217,
+    cursor = 220,
+    cursorline = 235,
+    delimiter = 117,
+    deprecated = 210,
+    diff_add = 239,
+    diff_add_attr = 240,
+    diff_change = 60,
+    diff_change_attr = 60,
+    diff_delete = 237,
+    diff_delete_attr = 95,
+    diff_text = 239,
+    entity = 152,
+    error = 210,
+    error_stripe = 95,
+    fg = 252,
+    field = 252,
+    float_bg = 233,
+    folded = 152,
+    func_call = 111,
+    func_decl = 111,
+    git_add = 150,
+    git_change = 111,
+    git_delete = 210,
+    gutter = 233,
+    hint = 222,
+    identifier = 252,
+    incsearch = 236,
+    indent_guide = 235,
+    info = 222,
+    inlay_hint = 239,
+    interface = 222,
+    keyword = 117,
+    keyword2 = 140,
+    keyword3 = 209,
+    keyword4 = 217,
+    linenr = 237,
+    linenr_cursor = 237,
+    link = 116,
+    link_visited = 116,
+    lsp_ref = 236,
+    lsp_ref_effect = 238,
+    match_brace = 220,
+    md_bold = 152,
+    md_code = 152,
+    md_code_block = 152,
+    md_h1 = 222,
+    md_h2 = 222,
+    md_h3 = 222,
+    md_h4 = 222,
+    md_h5 = 222,
+    md_h6 = 222,
+    md_italic = 152,
+    md_link = 150,
+    md_list = 252,
+    md_quote = 117,
+    md_url = 210,
+    method_static = 111,
+    nontext = 236,
+    number = 209,
+    operator = 117,
+    pmenu = 233,
+    pmenu_sel = 233,
+    rainbow_blue = 111,
+    rainbow_cyan = 117,
+    rainbow_green = 150,
+    rainbow_red = 210,
+    rainbow_violet = 140,
+    rainbow_yellow = 222,
+    search = 236,
+    search_effect = 116,
+    selection = 237,
+    selection_fg = 231,
+    separator = 235,
+    separator_selected = 222,
+    spell_bad = 210,
+    spell_cap = 150,
+    string = 150,
+    string_escape = 252,
+    tab_underline = 116,
+    tab_underline_inactive = 73,
+    tag = 117,
+    tag_attr = 140,
+    template_var = 139,
+    term_black = 239,
+    term_blue = 111,
+    term_bright_black = 238,
+    term_bright_blue = 111,
+    term_bright_cyan = 117,
+    term_bright_green = 150,
+    term_bright_magenta = 140,
+    term_bright_red = 210,
+    term_bright_white = 252,
+    term_bright_yellow = 222,
+    term_cyan = 117,
+    term_green = 150,
+    term_magenta = 140,
+    term_red = 210,
+    term_white = 252,
+    term_yellow = 222,
+    todo = 209,
+    type = 222,
+    type_param = 222,
+    type_ref = 252,
+    unused = 239,
+    variable = 252,
+    warning = 222,
+    whitespace = 239,
+    winbar = 233,
+  },
 }
@@ -10,7 +10,7 @@ return {
   bookmark_fg = "#ffffff",
   boolean = "#ff9cac",
   bracket = "#c792ea",
-  colorcolumn = "#4e5579",
+  colorcolumn = "#3c415c",
   comment = "#676e95",
   comment_doc = "#676e95",
   constant = "#ff9cac",
@@ -18,16 +18,16 @@ return {
   cursorline = "#373d53",
   delimiter = "#89ddff",
   deprecated = "#f07178",
-  diff_add = "#c3e88d",
-  diff_add_attr = "#c3e88d",
-  diff_change = "#82aaff",
-  diff_change_attr = "#82aaff",
-  diff_delete = "#f07178",
-  diff_delete_attr = "#f07178",
+  diff_add = "#586556",
+  diff_add_attr = "#5f6e5a",
+  diff_change = "#445378",
+  diff_change_attr = "#485981",
+  diff_delete = "#654250",
+  diff_delete_attr = "#6e4552",
   diff_text = "#4e5579",
   entity = "#b2ccd6",
   error = "#f07178",
-  error_stripe = "#f07178",
+  error_stripe = "#8d4f5b",
   fg = "#ced1e3",
   field = "#ced1e3",
   float_bg = "#292d3e",
@@ -41,7 +41,7 @@ return {
   hint = "#ffcb6b",
   identifier = "#ced1e3",
   incsearch = "#000000",
-  indent_guide = "#4e5579",
+  indent_guide = "#3c415c",
   info = "#ffcb6b",
   inlay_hint = "#676e95",
   interface = "#ffcb6b",
@@ -54,7 +54,7 @@ return {
   link = "#80cbc4",
   link_visited = "#80cbc4",
   lsp_ref = "#000000",
-  lsp_ref_effect = "#ffffff",
+  lsp_ref_effect = "#6a6c78",
   match_brace = "#ffcc00",
   md_bold = "#b2ccd6",
   md_code = "#b2ccd6",
@@ -71,7 +71,7 @@ return {
   md_quote = "#89ddff",
   md_url = "#f07178",
   method_static = "#82aaff",
-  nontext = "#4e5579",
+  nontext = "#434967",
   number = "#f78c6c",
   operator = "#89ddff",
   pmenu = "#292d3e",
@@ -84,16 +84,16 @@ return {
   rainbow_yellow = "#ffcb6b",
   search = "#000000",
   search_effect = "#80cbc4",
-  selection = "#555c82",
+  selection = "#3f4560",
   selection_fg = "#ffffff",
-  separator = "#4e5579",
+  separator = "#3c415c",
   separator_selected = "#ffcb6b",
   spell_bad = "#f07178",
   spell_cap = "#c3e88d",
   string = "#c3e88d",
   string_escape = "#ced1e3",
   tab_underline = "#80cbc4",
-  tab_underline_inactive = "#80cbc4",
+  tab_underline_inactive = "#6aa3a2",
   tag = "#89ddff",
   tag_attr = "#c792ea",
   template_var = "#bb80b3",
@@ -134,4 +134,128 @@ return {
     STATIC_METHOD_IMPORTED_ATTRIBUTES = 2,
     TODO_DEFAULT_ATTRIBUTES = 3,
   },
+
+  -- Nearest xterm-256 colors, for terminals without termguicolors
+  _cterm = {
+    accent = 116,
+    attribute = 222,
+    bg = 236,
+    blame = 231,
+    bookmark_bg = 222,
+    bookmark_fg = 231,
+    boolean = 217,
+    bracket = 140,
+    colorcolumn = 60,
+    comment = 60,
+    comment_doc = 60,
+    constant = 217,
+    cursor = 220,
+    cursorline = 237,
+    delimiter = 117,
+    deprecated = 210,
+    diff_add = 241,
+    diff_add_attr = 242,
+    diff_change = 60,
+    diff_change_attr = 60,
+    diff_delete = 95,
+    diff_delete_attr = 95,
+    diff_text = 60,
+    entity = 152,
+    error = 210,
+    error_stripe = 95,
+    fg = 252,
+    field = 252,
+    float_bg = 236,
+    folded = 152,
+    func_call = 111,
+    func_decl = 111,
+    git_add = 150,
+    git_change = 111,
+    git_delete = 210,
+    gutter = 236,
+    hint = 222,
+    identifier = 252,
+    incsearch = 16,
+    indent_guide = 60,
+    info = 222,
+    inlay_hint = 60,
+    interface = 222,
+    keyword = 117,
+    keyword2 = 140,
+    keyword3 = 209,
+    keyword4 = 217,
+    linenr = 60,
+    linenr_cursor = 60,
+    link = 116,
+    link_visited = 116,
+    lsp_ref = 16,
+    lsp_ref_effect = 242,
+    match_brace = 220,
+    md_bold = 152,
+    md_code = 152,
+    md_code_block = 152,
+    md_h1 = 222,
+    md_h2 = 222,
+    md_h3 = 222,
+    md_h4 = 222,
+    md_h5 = 222,
+    md_h6 = 222,
+    md_italic = 152,
+    md_link = 150,
+    md_list = 252,
+    md_quote = 117,
+    md_url = 210,
+    method_static = 111,
+    nontext = 60,
+    number = 209,
+    operator = 117,
+    pmenu = 236,
+    pmenu_sel = 236,
+    rainbow_blue = 111,
+    rainbow_cyan = 117,
+    rainbow_green = 150,
+    rainbow_red = 210,
+    rainbow_violet = 140,
+    rainbow_yellow = 222,
+    search = 16,
+    search_effect = 116,
+    selection = 60,
+    selection_fg = 231,
+    separator = 60,
+    separator_selected = 222,
+    spell_bad = 210,
+    spell_cap = 150,
+    string = 150,
+    string_escape = 252,
+    tab_underline = 116,
+    tab_underline_inactive = 73,
+    tag = 117,
+    tag_attr = 140,
+    template_var = 139,
+    term_black = 60,
+    term_blue = 111,
+    term_bright_black = 60,
+    term_bright_blue = 111,
+    term_bright_cyan = 117,
+    term_bright_green = 150,
+    term_bright_magenta = 140,
+    term_bright_red = 210,
+    term_bright_white = 252,
+    term_bright_yellow = 222,
+    term_cyan = 117,
+    term_green = 150,
+    term_magenta = 140,
+    term_red = 210,
+    term_white = 252,
+    term_yellow = 222,
+    todo = 209,
+    type = 222,
+    type_param = 222,
+    type_ref = 252,
+    unused = 60,
+    variable = 252,
+    warning = 222,
+    whitespace = 60,
+    winbar = 236,
+  },
 }
@@ -10,24 +10,24 @@ return {
   bookmark_fg = "#ffffff",
   boolean = "#ff9cac",
   bracket = "#c792ea",
-  colorcolumn = "#37474f",
+  colorcolumn = "#2f3d44",
   comment = "#546e7a",
   comment_doc = "#546e7a",
   constant = "#ff9cac",
   cursor = "#ffcc00",
-  cursorline = "#3b4a51",
+  cursorline = "#334047",
   delimiter = "#89ddff",
   deprecated = "#f07178",
-  diff_add = "#c3e88d",
-  diff_add_attr = "#c3e88d",
-  diff_change = "#82aaff",
-  diff_change_attr = "#82aaff",
-  diff_delete = "#f07178",
-  diff_delete_attr = "#f07178",
+  diff_add = "#556952",
+  diff_add_attr = "#5d7256",
+  diff_change = "#425674",
+  diff_change_attr = "#465c7d",
+  diff_delete = "#63454b",
+  diff_delete_attr = "#6d484e",
   diff_text = "#65737e",
   entity = "#b2ccd6",
   error = "#f07178",
-  error_stripe = "#f07178",
+  error_stripe = "#8b5258",
   fg = "#d8dfdf",
   field = "#d8dfdf",
   float_bg = "#263238",
@@ -41,7 +41,7 @@ return {
   hint = "#ffcb6b",
   identifier = "#d8dfdf",
   incsearch = "#000000",
-  indent_guide = "#37474f",
+  indent_guide = "#2f3d44",
   info = "#ffcb6b",
   inlay_hint = "#546e7a",
   interface = "#ffcb6b",
@@ -54,7 +54,7 @@ return {
   link = "#80cbc4",
   link_visited = "#80cbc4",
   lsp_ref = "#000000",
-  lsp_ref_effect = "#ffffff",
+  lsp_ref_effect = "#687074",
   match_brace = "#ffcc00",
   md_bold = "#b2ccd6",
   md_code = "#b2ccd6",
@@ -71,7 +71,7 @@ return {
   md_quote = "#89ddff",
   md_url = "#f07178",
   method_static = "#82aaff",
-  nontext = "#37474f",
+  nontext = "#324148",
   number = "#f78c6c",
   operator = "#89ddff",
   pmenu = "#263238",
@@ -84,16 +84,16 @@ return {
   rainbow_yellow = "#ffcb6b",
   search = "#000000",
   search_effect = "#80cbc4",
-  selection = "#2c5450",
+  selection = "#294344",
   selection_fg = "#ffffff",
-  separator = "#37474f",
+  separator = "#2f3d44",
   separator_selected = "#ffcb6b",
   spell_bad = "#f07178",
   spell_cap = "#c3e88d",
   string = "#c3e88d",
   string_escape = "#d8dfdf",
   tab_underline = "#80cbc4",
-  tab_underline_inactive = "#80cbc4",
+  tab_underline_inactive = "#69a5a1",
   tag = "#89ddff",
   tag_attr = "#c792ea",
   template_var = "#bb80b3",
@@ -134,4 +134,128 @@ return {
     STATIC_METHOD_IMPORTED_ATTRIBUTES = 2,
     TODO_DEFAULT_ATTRIBUTES = 3,
   },
+
+  -- Nearest xterm-256 colors, for terminals without termguicolors
+  _cterm = {
+    accent = 116,
+    attribute = 222,
+    bg = 236,
+    blame = 231,
+    bookmark_bg = 222,
+    bookmark_fg = 231,
+    boolean = 217,
+    bracket = 140,
+    colorcolumn = 237,
+    comment = 242,
+    comment_doc = 242,
+    constant = 217,
+    cursor = 220,
+    cursorline = 237,
+    delimiter = 117,
+    deprecated = 210,
+    diff_add = 65,
+    diff_add_attr = 65,
+    diff_change = 60,
+    diff_change_attr = 60,
+    diff_delete = 95,
+    diff_delete_attr = 95,
+    diff_text = 243,
+    entity = 152,
+    error = 210,
+    error_stripe = 95,
+    fg = 253,
+    field = 253,
+    float_bg = 236,
+    folded = 152,
+    func_call = 111,
+    func_decl = 111,
+    git_add = 150,
+    git_change = 111,
+    git_delete = 210,
+    gutter = 236,
+    hint = 222,
+    identifier = 253,
+    incsearch = 16,
+    indent_guide = 237,
+    info = 222,
+    inlay_hint = 242,
+    interface = 222,
+    keyword = 117,
+    keyword2 = 140,
+    keyword3 = 209,
+    keyword4 = 217,
+    linenr = 240,
+    linenr_cursor = 240,
+    link = 116,
+    link_visited = 116,
+    lsp_ref = 16,
+    lsp_ref_effect = 242,
+    match_brace = 220,
+    md_bold = 152,
+    md_code = 152,
+    md_code_block = 152,
+    md_h1 = 222,
+    md_h2 = 222,
+    md_h3 = 222,
+    md_h4 = 222,
+    md_h5 = 222,
+    md_h6 = 222,
+    md_italic = 152,
+    md_link = 150,
+    md_list = 253,
+    md_quote = 117,
+    md_url = 210,
+    method_static = 111,
+    nontext = 237,
+    number = 209,
+    operator = 117,
+    pmenu = 236,
+    pmenu_sel = 236,
+    rainbow_blue = 111,
+    rainbow_cyan = 117,
+    rainbow_green = 150,
+    rainbow_red = 210,
+    rainbow_violet = 140,
+    rainbow_yellow = 222,
+    search = 16,
+    search_effect = 116,
+    selection = 237,
+    selection_fg = 231,
+    separator = 237,
+    separator_selected = 222,
+    spell_bad = 210,
+    spell_cap = 150,
+    string = 150,
+    string_escape = 253,
+    tab_underline = 116,
+    tab_underline_inactive = 73,
+    tag = 117,
+    tag_attr = 140,
+    template_var = 139,
+    term_black = 242,
+    term_blue = 111,
+    term_bright_black = 238,
+    term_bright_blue = 111,
+    term_bright_cyan = 117,
+    term_bright_green = 150,
+    term_bright_magenta = 140,
+    term_bright_red = 210,
+    term_bright_white = 253,
+    term_bright_yellow = 222,
+    term_cyan = 117,
+    term_green = 150,
+    term_magenta = 140,
+    term_red = 210,
+    term_white = 253,
+    term_yellow = 222,
+    todo = 209,
+    type = 222,
+    type_param = 222,
+    type_ref = 253,
+    unused = 242,
+    variable = 253,
+    warning = 222,
+    whitespace = 243,
+    winbar = 236,
+  },
 }
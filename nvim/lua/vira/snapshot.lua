@@ -0,0 +1,155 @@
+-- Vira highlight snapshots
+-- Caches the final highlight list for a variant and option set as a
+-- precompiled chunk under stdpath("cache")/vira
+--
+-- Snapshots are keyed by the source hash generate.py records for each
+-- variant in vira.highlights, so regenerating a variant invalidates them.
+
+local M = {}
+
+---@type string
+M.dir = vim.fn.stdpath("cache") .. "/vira"
+
+---Option flags that select a snapshot
+---@param transparent boolean
+---@param italic_comments boolean
+---@return string
+local function flags(transparent, italic_comments)
+  return (transparent and "1" or "0") .. (italic_comments and "1" or "0")
+end
+
+---Get the source hash of a variant's compiled highlights
+---@param variant string
+---@return string|nil
+local function source_hash(variant)
+  local ok, hashes = pcall(require, "vira.highlights")
+  if ok and type(hashes) == "table" then
+    return hashes[variant]
+  end
+end
+
+---Snapshot file path (without extension) for a variant and option flags
+---@param variant string
+---@param hash string
+---@param opt_flags string
+---@return string
+local function snapshot_path(variant, hash, opt_flags)
+  local key = vim.fn.sha256(variant .. ":" .. hash .. ":" .. opt_flags)
+  return M.dir .. "/" .. variant .. "-" .. key:sub(1, 16)
+end
+
+---Snapshot path for the given options, or nil if the variant has no source hash
+---@param variant string
+---@param opts ViraConfig
+---@return string|nil
+function M.path(variant, opts)
+  local hash = source_hash(variant)
+  if not hash then
+    return nil
+  end
+  return snapshot_path(variant, hash, flags(opts.transparent and true or false, opts.italic_comments ~= false))
+end
+
+---Write a file atomically
+---@param path string
+---@param data string
+---@return boolean
+local function write_file(path, data)
+  local tmp = path .. ".tmp"
+  local file = io.open(tmp, "wb")
+  if not file then
+    return false
+  end
+  file:write(data)
+  file:close()
+  return os.rename(tmp, path) ~= nil
+end
+
+---Remove snapshots of a variant that no current option set maps to
+---@param variant string
+local function prune(variant)
+  local hash = source_hash(variant)
+  if not hash then
+    return
+  end
+  local keep = {}
+  for _, opt_flags in ipairs({ "00", "01", "10", "11" }) do
+    keep[snapshot_path(variant, hash, opt_flags)] = true
+  end
+  -- Exact names only: "ocean-*" would also match the derived "ocean-warm-*"
+  local own = "^" .. vim.pesc(variant) .. "%-%x+%.luac?$"
+  for _, file in ipairs(vim.fn.glob(M.dir .. "/" .. variant .. "-*", false, true)) do
+    if vim.fs.basename(file):match(own) and not keep[file:gsub("%.luac?$", "")] then
+      os.remove(file)
+    end
+  end
+end
+
+---Load the snapshot for a variant and options
+---Source snapshots (as pre-seeded by generate.py) are converted to bytecode on first use.
+---@param variant string
+---@param opts ViraConfig
+---@return function|nil chunk Applies core highlights and terminal colors when called, and
+---returns a function per plugin applying that plugin's groups
+function M.load(variant, opts)
+  local path = M.path(variant, opts)
+  if not path then
+    return nil
+  end
+
+  local chunk = loadfile(path .. ".luac")
+  if chunk then
+    return chunk
+  end
+
+  chunk = loadfile(path .. ".lua")
+  if chunk and write_file(path .. ".luac", string.dump(chunk, true)) then
+    os.remove(path .. ".lua")
+  end
+  return chunk
+end
+
+---Compile highlights and terminal colors into a snapshot
+---@param variant string
+---@param opts ViraConfig
+---@param groups table<string, table> Core groups
+---@param term_colors string[]
+---@param plugins table<string, table<string, table>> Plugin -> groups
+function M.write(variant, opts, groups, term_colors, plugins)
+  local path = M.path(variant, opts)
+  if not path then
+    return
+  end
+
+  local function set_hl(group, settings, indent)
+    return ("%shl(0, %q, %s)"):format(indent, group, vim.inspect(settings, { newline = " ", indent = "" }))
+  end
+
+  local lines = { "local hl = vim.api.nvim_set_hl" }
+  for group, settings in pairs(groups) do
+    lines[#lines + 1] = set_hl(group, settings, "")
+  end
+  for i, color in ipairs(term_colors) do
+    lines[#lines + 1] = ("vim.g.terminal_color_%d = %q"):format(i - 1, color)
+  end
+  lines[#lines + 1] = "return {"
+  for plugin, plugin_groups in pairs(plugins) do
+    lines[#lines + 1] = ("  [%q] = function()"):format(plugin)
+    for group, settings in pairs(plugin_groups) do
+      lines[#lines + 1] = set_hl(group, settings, "    ")
+    end
+    lines[#lines + 1] = "  end,"
+  end
+  lines[#lines + 1] = "}"
+
+  local chunk = load(table.concat(lines, "\n"), "=vira-snapshot")
+  if not chunk then
+    return
+  end
+
+  vim.fn.mkdir(M.dir, "p")
+  prune(variant)
+  write_file(path .. ".luac", string.dump(chunk, true))
+end
+
+return M
@@ -0,0 +1,11 @@
+-- Vira variants
+-- Auto-generated by generate.py from jetbrains/extracted/
+
+return {
+  "carbon",
+  "deepforest",
+  "graphene",
+  "ocean",
+  "palenight",
+  "teal",
+}
@@ -0,0 +1,182 @@
+"""
+Watch mode helpers for generate.py.
+
+Source files are polled with stat() and bursts of writes are debounced into
+a single set of changes. Rebuilt variants are pushed to running Neovim
+instances over their RPC socket (msgpack-RPC, see :h rpc), which reapply
+the theme without a restart.
+"""
+
+import getpass
+import glob
+import os
+import socket
+import stat
+import struct
+import time
+from pathlib import Path
+
+
+def stat_files(roots: list[Path]) -> dict[Path, tuple[int, int]]:
+    """(mtime_ns, size) of every file under roots; roots may be files or directories."""
+    state = {}
+    for root in roots:
+        paths = root.rglob("*") if root.is_dir() else [root]
+        for path in paths:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                state[path] = (st.st_mtime_ns, st.st_size)
+    return state
+
+
+def changed_files(before: dict, after: dict) -> set[Path]:
+    """Files added, removed or modified between two stat_files() results."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def wait_for_changes(roots: list[Path], state: dict, interval: float,
+                     debounce: float) -> tuple[set[Path], dict]:
+    """
+    Block until files under roots change, then until they settle.
+
+    Polls every interval seconds. Once a change is seen, polling continues
+    until nothing has changed for debounce seconds, so an editor writing
+    several files (or one file in several steps) triggers one rebuild.
+    Returns (changed paths, new state).
+    """
+    while True:
+        time.sleep(interval)
+        current = stat_files(roots)
+        changes = changed_files(state, current)
+        if changes:
+            break
+
+    quiet_since = time.monotonic()
+    while time.monotonic() - quiet_since < debounce:
+        time.sleep(min(interval, debounce))
+        latest = stat_files(roots)
+        more = changed_files(current, latest)
+        if more:
+            changes |= more
+            quiet_since = time.monotonic()
+        current = latest
+
+    return changes, current
+
+
+def _container_head(n: int, fixed: int, head16: bytes, head32: bytes) -> bytes:
+    """msgpack header for an array or map of n items."""
+    if n < 0x10:
+        return bytes([fixed | n])
+    if n < 0x10000:
+        return head16 + struct.pack(">H", n)
+    return head32 + struct.pack(">I", n)
+
+
+def pack(obj) -> bytes:
+    """Encode nil, booleans, integers, strings, lists and dicts as msgpack."""
+    if obj is None:
+        return b"\xc0"
+    if obj is True:
+        return b"\xc3"
+    if obj is False:
+        return b"\xc2"
+    if isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            return bytes([obj])
+        if -0x20 <= obj < 0:
+            return struct.pack("b", obj)
+        return b"\xd3" + struct.pack(">q", obj)
+    if isinstance(obj, str):
+        data = obj.encode()
+        n = len(data)
+        if n < 0x20:
+            return bytes([0xa0 | n]) + data
+        if n < 0x100:
+            return b"\xd9" + bytes([n]) + data
+        if n < 0x10000:
+            return b"\xda" + struct.pack(">H", n) + data
+        return b"\xdb" + struct.pack(">I", n) + data
+    if isinstance(obj, (list, tuple)):
+        head = _container_head(len(obj), 0x90, b"\xdc", b"\xdd")
+        return head + b"".join(pack(item) for item in obj)
+    if isinstance(obj, dict):
+        head = _container_head(len(obj), 0x80, b"\xde", b"\xdf")
+        return head + b"".join(pack(k) + pack(v) for k, v in obj.items())
+    raise TypeError(f"cannot pack {type(obj).__name__}")
+
+
+def find_servers() -> list[str]:
+    """
+    Find the RPC sockets of running Neovim instances.
+
+    Neovim 0.9+ listens on stdpath("run")/nvim.<pid>.0 by default, which is
+    under $XDG_RUNTIME_DIR or $TMPDIR/nvim.<user>/.
+    """
+    patterns = [os.path.join(os.environ.get("TMPDIR", "/tmp"), f"nvim.{getpass.getuser()}", "*", "nvim.*")]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        patterns.append(os.path.join(os.environ["XDG_RUNTIME_DIR"], "nvim.*"))
+
+    servers = []
+    for pattern in patterns:
+        for path in glob.glob(pattern):
+            try:
+                if stat.S_ISSOCK(os.stat(path).st_mode):
+                    servers.append(path)
+            except OSError:
+                continue
+    return sorted(servers)
+
+
+def notify(address: str, method: str, args: list, timeout: float = 0.5):
+    """Send a msgpack-RPC notification to a Neovim server (socket path or host:port)."""
+    if os.path.exists(address) or os.sep in address:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        target = address
+    else:
+        host, _, port = address.rpartition(":")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        target = (host or "127.0.0.1", int(port))
+
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(target)
+        sock.sendall(pack([2, method, args]))
+
+
+# Runs inside Neovim with the rebuilt variants as its argument: drops the
+# cached modules and reapplies the theme if one of them is active.
+RELOAD_LUA = """
+local variants = ...
+package.loaded["vira.highlights"] = nil
+package.loaded["vira.derived"] = nil
+for _, variant in ipairs(variants) do
+  package.loaded["vira.palette." .. variant] = nil
+  package.loaded["vira.highlights." .. variant] = nil
+end
+-- Deltas of every variant refer to the regenerated ones
+for name in pairs(package.loaded) do
+  if name:match("^vira%.deltas%.") then
+    package.loaded[name] = nil
+  end
+end
+local vira = package.loaded["vira"]
+if vira and vim.g.colors_name == "vira" and vim.tbl_contains(variants, vira.current()) then
+  vira.switch(vira.current())
+end
+"""
+
+
+def push_variants(servers: list[str], variants: list[str]) -> int:
+    """Ask each server to reload the given variants; returns how many were reached."""
+    reached = 0
+    for server in servers:
+        try:
+            notify(server, "nvim_exec_lua", [RELOAD_LUA, [variants]])
+            reached += 1
+        except OSError as e:
+            print(f"  (could not reach {server}: {e})")
+    return reached